@@ -0,0 +1,10 @@
+"""
+Project Chimera - Core runtime package.
+
+Shared infrastructure used by the runtime skills and the Planner/Worker/Judge
+swarm: transport, caching, queueing and orchestration subsystems.
+
+Reference: research/SRS.md
+"""
+
+__version__ = "0.1.0"
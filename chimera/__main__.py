@@ -0,0 +1,104 @@
+"""
+``python -m chimera``: run a worker node.
+
+Leases tasks from Redis (``--redis-url`` or ``CHIMERA_REDIS_URL``) and runs
+them on a WorkerPool until SIGINT/SIGTERM, then drains in-flight work. If no
+Redis is configured, it falls back to an in-process queue, which is only
+useful for local smoke runs.
+
+``--config`` takes a YAML or JSON file with any of: redis_url, namespace,
+worker_id, concurrency, batch_size, thread_workers, process_workers,
+drain_timeout, visibility_timeout, modes, skill_config, warm. ``warm`` lists
+the hot skills to import and warm before the first task.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+from pathlib import Path
+from typing import Any
+
+from chimera.runtime import ExecutionMode, WorkerPool
+from chimera.tasks import MemoryTaskQueue, RedisTaskQueue, TaskQueue
+
+logger = logging.getLogger("chimera")
+
+
+def load_config(path: str | None) -> dict[str, Any]:
+    if path is None:
+        return {}
+    text = Path(path).read_text()
+    if path.endswith((".yaml", ".yml")):
+        import yaml
+
+        return yaml.safe_load(text) or {}
+    data: dict[str, Any] = json.loads(text)
+    return data
+
+
+def build_queue(config: dict[str, Any]) -> TaskQueue:
+    options: dict[str, Any] = {}
+    if "visibility_timeout" in config:
+        options["visibility_timeout"] = float(config["visibility_timeout"])
+    url = config.get("redis_url")
+    if not url:
+        logger.warning("no redis_url configured; using an in-process queue")
+        return MemoryTaskQueue(**options)
+    import redis.asyncio as redis
+
+    client = redis.from_url(url)
+    return RedisTaskQueue(client, config.get("namespace", "chimera:tasks"), **options)
+
+
+def build_pool(config: dict[str, Any], queue: TaskQueue) -> WorkerPool:
+    options = {
+        key: config[key]
+        for key in (
+            "worker_id",
+            "concurrency",
+            "batch_size",
+            "thread_workers",
+            "process_workers",
+            "drain_timeout",
+            "skill_config",
+            "warm",
+        )
+        if config.get(key) is not None
+    }
+    modes = {name: ExecutionMode(mode) for name, mode in (config.get("modes") or {}).items()}
+    return WorkerPool(queue, modes=modes, **options)
+
+
+async def serve(config: dict[str, Any]) -> dict[str, Any]:
+    pool = build_pool(config, build_queue(config))
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, pool.stop)
+    logger.info("worker %s started (concurrency=%d)", pool.worker_id, pool.concurrency)
+    await pool.run()
+    return pool.report()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="chimera", description="Run a Chimera worker node.")
+    parser.add_argument("--config", help="YAML or JSON runtime config")
+    parser.add_argument("--redis-url", default=os.environ.get("CHIMERA_REDIS_URL"))
+    parser.add_argument("--concurrency", type=int)
+    parser.add_argument("--worker-id")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    config = load_config(args.config)
+    for key in ("redis_url", "concurrency", "worker_id"):
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+
+    report = asyncio.run(serve(config))
+    logger.info("worker stopped: %s", json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
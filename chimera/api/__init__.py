@@ -0,0 +1,41 @@
+"""
+HTTP API for the spec endpoints.
+
+An aiohttp service that exposes the skills behind specs/technical.md §2.
+Requests are validated by compiled pydantic v2 models straight from the
+raw body and encoded with orjson when it is installed. Trend lists are
+streamed. Each endpoint has a concurrency limit and a bounded wait queue,
+and sheds load with 503 + ``Retry-After`` once that is full.
+
+Run it with ``python -m chimera.api``; ``scripts/bench_api.py`` load-tests
+it against the latency targets in specs/functional.md.
+
+Reference: specs/technical.md#2-api-contracts
+"""
+
+from chimera.api.admission import AdmissionControl, Limits, Overloaded
+from chimera.api.app import DEFAULT_LIMITS, create_app
+from chimera.api.jsonio import dumps, orjson_available
+from chimera.api.schemas import (
+    ContentGenerateRequest,
+    EngagementRespondRequest,
+    TrendsFetchRequest,
+)
+from chimera.api.services import ApiError, ApiServices, EngagementGateway, TrendIndex
+
+__all__ = [
+    "DEFAULT_LIMITS",
+    "AdmissionControl",
+    "ApiError",
+    "ApiServices",
+    "ContentGenerateRequest",
+    "EngagementGateway",
+    "EngagementRespondRequest",
+    "Limits",
+    "Overloaded",
+    "TrendIndex",
+    "TrendsFetchRequest",
+    "create_app",
+    "dumps",
+    "orjson_available",
+]
@@ -0,0 +1,42 @@
+"""
+``python -m chimera.api``: serve the spec endpoints.
+
+``--config`` takes a YAML or JSON file with any of: host, port,
+skill_config ({skill name: config}) and limits ({endpoint: {limit, queue,
+queue_timeout_s}} for ``trends``, ``content`` and ``engagement``).
+"""
+
+import argparse
+import logging
+from typing import Any
+
+from aiohttp import web
+
+from chimera.__main__ import load_config
+from chimera.api.admission import Limits
+from chimera.api.app import create_app
+from chimera.api.services import ApiServices
+
+
+def build_app(config: dict[str, Any]) -> web.Application:
+    limits = {name: Limits(**options) for name, options in (config.get("limits") or {}).items()}
+    services = ApiServices(skill_config=config.get("skill_config"))
+    return create_app(services, limits)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="chimera.api", description="Serve the Chimera API.")
+    parser.add_argument("--config", help="YAML or JSON service config")
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    config = load_config(args.config)
+    host = args.host or config.get("host", "127.0.0.1")
+    port = args.port or int(config.get("port", 8080))
+    web.run_app(build_app(config), host=host, port=port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Request admission: concurrency limits and load shedding.
+
+Each endpoint has an ``AdmissionControl``. Up to ``limit`` requests run at
+once; up to ``queue`` more wait for a slot, each for at most
+``queue_timeout_s``. A request that finds the queue full, or waits too
+long, is shed straight away with ``Overloaded`` (HTTP 503 and
+``Retry-After``).
+
+Without this, a burst above capacity queues without bound. Every request
+then slows down together until clients time out, and the work done for
+them is wasted. Shedding keeps admitted requests inside their latency
+target (specs/functional.md: trend fetch < 30 s, content generation
+< 60 s) and tells the rest to come back later.
+"""
+
+import asyncio
+import math
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+class Overloaded(Exception):
+    """The request was shed; retry after ``retry_after`` seconds."""
+
+    def __init__(self, endpoint: str, reason: str, retry_after: float):
+        super().__init__(f"{endpoint} overloaded ({reason})")
+        self.endpoint = endpoint
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Admission settings for one endpoint."""
+
+    limit: int = 64
+    queue: int = 256
+    queue_timeout_s: float = 5.0
+
+
+class AdmissionControl:
+    """Bounded concurrency with a bounded, time-limited wait queue."""
+
+    def __init__(self, endpoint: str, limits: Limits | None = None):
+        self.endpoint = endpoint
+        self.limits = limits or Limits()
+        self.stats: Counter[str] = Counter()
+        self.inflight = 0
+        self.waiting = 0
+        self._slots: asyncio.Semaphore | None = None
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the body of the ``async with``; raises ``Overloaded``."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.limits.limit)
+        slots = self._slots
+        if slots.locked():
+            if self.waiting >= self.limits.queue:
+                self.stats["shed_queue_full"] += 1
+                raise Overloaded(self.endpoint, "queue full", self.retry_after())
+            self.waiting += 1
+            self.stats["queued"] += 1
+            try:
+                await asyncio.wait_for(slots.acquire(), self.limits.queue_timeout_s)
+            except TimeoutError:
+                self.stats["shed_timeout"] += 1
+                raise Overloaded(self.endpoint, "queue timeout", self.retry_after()) from None
+            finally:
+                self.waiting -= 1
+        else:
+            await slots.acquire()
+        self.inflight += 1
+        self.stats["admitted"] += 1
+        try:
+            yield
+        finally:
+            self.inflight -= 1
+            slots.release()
+
+    def retry_after(self) -> float:
+        """Seconds a shed client should wait: one queue timeout, at least 1."""
+        return float(max(1, math.ceil(self.limits.queue_timeout_s)))
+
+    def report(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "inflight": self.inflight,
+            "waiting": self.waiting,
+            "limit": self.limits.limit,
+            "queue": self.limits.queue,
+        }
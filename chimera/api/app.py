@@ -0,0 +1,215 @@
+"""
+aiohttp application for the spec endpoints.
+
+    POST /api/v1/trends/fetch         specs/technical.md §2.1
+    POST /api/v1/content/generate     specs/technical.md §2.2
+    POST /api/v1/engagement/respond   specs/technical.md §2.3
+    GET  /api/v1/status               admission and engagement counters
+
+Each request is admitted by its endpoint's ``AdmissionControl``, then its
+raw body is validated by the endpoint's compiled pydantic model. The
+response is encoded with ``jsonio.dumps``. Bodies are
+``{"status": "success", "data": ..., "timestamp": ...}``. Errors use the
+skills' format (``error_code``, ``message``, ``validation_errors``) with
+422 for invalid input, 404 for unknown ids, 503 plus ``Retry-After`` when
+shed, and 502 when a skill failed upstream.
+
+Trend lists are streamed. A client sending ``Accept: application/x-ndjson``
+gets one trend per line, then a summary line with ``errors`` and
+``timestamp``. A JSON body larger than ``stream_bytes`` is sent with
+chunked encoding, one trend at a time, instead of as one buffer.
+"""
+
+import logging
+from typing import Any
+
+from aiohttp import web
+from pydantic import ValidationError
+
+from chimera.api.admission import AdmissionControl, Limits, Overloaded
+from chimera.api.jsonio import dumps, orjson_available
+from chimera.api.schemas import (
+    ContentGenerateRequest,
+    EngagementRespondRequest,
+    TrendsFetchRequest,
+    parse,
+)
+from chimera.api.services import ApiError, ApiServices
+from skills.base import utc_timestamp
+from skills.contracts import error_messages
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "/api/v1"
+NDJSON = "application/x-ndjson"
+# Largest request body accepted; the spec bodies are a few hundred bytes.
+MAX_BODY_BYTES = 64 * 1024
+STREAM_BYTES = 256 * 1024
+CHUNK_BYTES = 64 * 1024
+
+# Model calls take seconds, so content generation gets fewer slots and a
+# longer wait than the cached, fan-out-bound trend fetch. Engagement
+# requests are cheap to hold: the stream batches them.
+DEFAULT_LIMITS: dict[str, Limits] = {
+    "trends": Limits(limit=128, queue=512, queue_timeout_s=5.0),
+    "content": Limits(limit=32, queue=256, queue_timeout_s=15.0),
+    "engagement": Limits(limit=512, queue=2048, queue_timeout_s=5.0),
+}
+
+SERVICES = web.AppKey("services", ApiServices)
+ADMISSION = web.AppKey("admission", dict)
+STREAM_AT = web.AppKey("stream_bytes", int)
+
+
+def json_response(payload: dict[str, Any], status: int = 200, **headers: str) -> web.Response:
+    return web.Response(
+        body=dumps(payload), status=status, content_type="application/json", headers=headers
+    )
+
+
+def error_response(
+    status: int, error_code: str, message: str, **fields: Any
+) -> web.Response:
+    payload = {
+        "status": "error",
+        "error_code": error_code,
+        "message": message,
+        **fields,
+        "timestamp": utc_timestamp(),
+    }
+    headers = {}
+    if "retry_after" in fields:
+        headers["Retry-After"] = str(int(fields["retry_after"]))
+    return json_response(payload, status, **headers)
+
+
+@web.middleware
+async def errors_middleware(request: web.Request, handler: Any) -> web.StreamResponse:
+    try:
+        response: web.StreamResponse = await handler(request)
+        return response
+    except ValidationError as exc:
+        return error_response(
+            422,
+            "INVALID_INPUT",
+            "invalid request body",
+            validation_errors=error_messages(exc),
+        )
+    except ApiError as exc:
+        return error_response(exc.status, exc.error_code, exc.message, **exc.fields)
+    except Overloaded as exc:
+        return error_response(503, "OVERLOADED", str(exc), retry_after=exc.retry_after)
+    except web.HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception("%s %s failed", request.method, request.path)
+        return error_response(500, "INTERNAL_ERROR", f"{type(exc).__name__}: {exc}")
+
+
+async def _body(request: web.Request) -> bytes:
+    if request.content_length is not None and request.content_length > MAX_BODY_BYTES:
+        raise ApiError(413, "BODY_TOO_LARGE", f"request body exceeds {MAX_BODY_BYTES} bytes")
+    return await request.read()
+
+
+async def fetch_trends(request: web.Request) -> web.StreamResponse:
+    async with request.app[ADMISSION]["trends"].admit():
+        body = parse(TrendsFetchRequest, await _body(request))
+        result = await request.app[SERVICES].fetch_trends(body)
+    trends = [dumps(trend) for trend in result["data"]["trends"]]
+    tail: dict[str, Any] = {"timestamp": result["timestamp"]}
+    if "errors" in result["data"]:
+        tail["errors"] = result["data"]["errors"]
+    if NDJSON in request.headers.get("Accept", ""):
+        return await _stream(request, NDJSON, b"", trends, b"\n", b"\n" + dumps(tail) + b"\n")
+    head = b'{"status":"success","data":{"trends":['
+    errors = b',"errors":' + dumps(tail["errors"]) if "errors" in tail else b""
+    end = b"]" + errors + b'},"timestamp":' + dumps(tail["timestamp"]) + b"}"
+    if sum(map(len, trends)) < request.app[STREAM_AT]:
+        return web.Response(
+            body=head + b",".join(trends) + end, content_type="application/json"
+        )
+    return await _stream(request, "application/json", head, trends, b",", end)
+
+
+async def _stream(
+    request: web.Request,
+    content_type: str,
+    head: bytes,
+    items: list[bytes],
+    separator: bytes,
+    end: bytes,
+) -> web.StreamResponse:
+    """Write ``head``, the items joined by ``separator``, then ``end`` in chunks."""
+    response = web.StreamResponse(headers={"Content-Type": content_type})
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    chunk = bytearray(head)
+    for i, item in enumerate(items):
+        if i:
+            chunk += separator
+        chunk += item
+        if len(chunk) >= CHUNK_BYTES:
+            await response.write(bytes(chunk))
+            chunk.clear()
+    chunk += end
+    await response.write(bytes(chunk))
+    await response.write_eof()
+    return response
+
+
+async def generate_content(request: web.Request) -> web.Response:
+    async with request.app[ADMISSION]["content"].admit():
+        body = parse(ContentGenerateRequest, await _body(request))
+        data = await request.app[SERVICES].generate_content(body)
+    return json_response({"status": "success", "data": data, "timestamp": utc_timestamp()})
+
+
+async def respond(request: web.Request) -> web.Response:
+    async with request.app[ADMISSION]["engagement"].admit():
+        body = parse(EngagementRespondRequest, await _body(request))
+        data = await request.app[SERVICES].respond(body)
+    return json_response({"status": "success", "data": data, "timestamp": utc_timestamp()})
+
+
+async def status(request: web.Request) -> web.Response:
+    data = {
+        "admission": {name: c.report() for name, c in request.app[ADMISSION].items()},
+        "orjson": orjson_available(),
+        **request.app[SERVICES].report(),
+    }
+    return json_response({"status": "success", "data": data, "timestamp": utc_timestamp()})
+
+
+def create_app(
+    services: ApiServices | None = None,
+    limits: dict[str, Limits] | None = None,
+    *,
+    stream_bytes: int = STREAM_BYTES,
+) -> web.Application:
+    """
+    The API application.
+
+    Args:
+        services: Skills behind the endpoints; built with defaults if None.
+        limits: Per-endpoint ``Limits`` overriding ``DEFAULT_LIMITS``
+            (keys ``trends``, ``content``, ``engagement``).
+        stream_bytes: Trend lists at least this large are sent chunked.
+    """
+    app = web.Application(middlewares=[errors_middleware], client_max_size=MAX_BODY_BYTES)
+    app[SERVICES] = services or ApiServices()
+    app[ADMISSION] = {
+        name: AdmissionControl(name, (limits or {}).get(name, default))
+        for name, default in DEFAULT_LIMITS.items()
+    }
+    app[STREAM_AT] = stream_bytes
+    app.router.add_post(f"{PREFIX}/trends/fetch", fetch_trends)
+    app.router.add_post(f"{PREFIX}/content/generate", generate_content)
+    app.router.add_post(f"{PREFIX}/engagement/respond", respond)
+    app.router.add_get(f"{PREFIX}/status", status)
+
+    async def close(app: web.Application) -> None:
+        await app[SERVICES].close()
+
+    app.on_cleanup.append(close)
+    return app
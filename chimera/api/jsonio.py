@@ -0,0 +1,29 @@
+"""
+JSON encoding for responses.
+
+``orjson`` (``pip install chimera[api]``) encodes straight to bytes several
+times faster than the standard library. Without it, ``json`` is used with
+the same compact output.
+"""
+
+import json
+from typing import Any
+
+_orjson: Any
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def orjson_available() -> bool:
+    """True when responses are encoded with orjson."""
+    return _orjson is not None
+
+
+def dumps(value: Any) -> bytes:
+    """Compact UTF-8 JSON."""
+    if _orjson is not None:
+        data: bytes = _orjson.dumps(value)
+        return data
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
@@ -0,0 +1,69 @@
+"""
+Request models for the spec endpoints (specs/technical.md §2).
+
+The models are pydantic v2. Each one's validator is compiled once, in
+pydantic-core, when the class is defined. ``parse()`` hands the raw request
+bytes straight to ``model_validate_json``, so the body is parsed and
+validated in one pass without building an intermediate ``dict``. Unknown
+fields are rejected, so a typo in a client fails loudly instead of being
+ignored.
+"""
+
+from typing import Annotated, Literal, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from skills.skill_fetch_trends.config import MAX_LIMIT, TIME_RANGE_PATTERN
+from skills.skill_generate_caption.config import MAX_VARIATIONS
+
+# Longest engagement message accepted; platforms cap comments well below this.
+MAX_MESSAGE_CHARS = 10_000
+
+Model = TypeVar("Model", bound="Request")
+
+
+class Request(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
+
+class TrendsFetchRequest(Request):
+    """``POST /api/v1/trends/fetch``."""
+
+    platforms: Annotated[list[Literal["tiktok", "youtube", "twitter"]], Field(min_length=1)]
+    category: str = ""
+    limit: Annotated[int, Field(ge=1, le=MAX_LIMIT, strict=True)] = 10
+    time_range: Annotated[str, Field(pattern=TIME_RANGE_PATTERN.pattern)] = "24h"
+
+
+class ContentGenerateRequest(Request):
+    """``POST /api/v1/content/generate``."""
+
+    trend_id: Annotated[str, Field(min_length=1)]
+    content_type: Literal["post", "video", "story"] = "post"
+    persona_id: Annotated[str, Field(min_length=1)]
+    variations: Annotated[int, Field(ge=1, le=MAX_VARIATIONS, strict=True)] = 3
+    safety_check: bool = True
+    # Not in the spec example: defaults to the trend's own platform.
+    platform: Literal["tiktok", "youtube", "twitter", "instagram"] | None = None
+
+
+class EngagementContext(Request):
+    previous_interactions: Annotated[int, Field(ge=0)] = 0
+    user_follower_count: Annotated[int, Field(ge=0)] = 0
+    user_id: str = ""
+    agent_id: str = ""
+    platform: str = ""
+
+
+class EngagementRespondRequest(Request):
+    """``POST /api/v1/engagement/respond``."""
+
+    interaction_id: Annotated[str, Field(min_length=1)]
+    interaction_type: Literal["comment", "mention", "dm"] = "comment"
+    message: Annotated[str, Field(max_length=MAX_MESSAGE_CHARS)]
+    context: EngagementContext = EngagementContext()
+
+
+def parse(model: type[Model], body: bytes) -> Model:
+    """Validate a raw JSON body; raises ``ValidationError``."""
+    return model.model_validate_json(body)
@@ -0,0 +1,266 @@
+"""
+What the API endpoints call: the skills behind specs/technical.md §2.
+
+- ``fetch_trends`` runs ``FetchTrendsSkill`` and remembers the returned
+  trends in a bounded ``TrendIndex``, so ``content/generate`` can look up a
+  ``trend_id`` from an earlier fetch.
+- ``generate_content`` turns the trend into a prompt and runs
+  ``GenerateCaptionSkill``. Concurrent requests share its micro-batched
+  model calls. With ``safety_check``, all variations are scored in one
+  ``SafetyCheckSkill`` batch.
+- ``respond`` feeds the interaction into one shared ``EngagementStream``
+  (see ``EngagementGateway``). Concurrent requests are triaged and batched
+  together, and a request triage drops is answered with the reason.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
+
+from chimera.api.schemas import (
+    ContentGenerateRequest,
+    EngagementRespondRequest,
+    TrendsFetchRequest,
+)
+from chimera.engagement import PENDING, EngagementStream, Interaction, Reply, ReplyModel
+from skills.skill_fetch_trends import FetchTrendsSkill
+from skills.skill_generate_caption import GenerateCaptionSkill
+from skills.skill_generate_caption.config import SUPPORTED_PLATFORMS as CAPTION_PLATFORMS
+from skills.skill_safety_check import SafetyCheckSkill
+
+if TYPE_CHECKING:
+    from chimera.persona import PersonaRegistry
+
+logger = logging.getLogger(__name__)
+
+CHECK_TYPES = ["toxicity", "spam", "policy"]
+# Skill error codes that are the caller's fault; anything else is upstream.
+CLIENT_ERRORS = {"INVALID_INPUT": 422}
+
+
+class ApiError(Exception):
+    """An error response: HTTP status, error code, message and extra fields."""
+
+    def __init__(self, status: int, error_code: str, message: str, **fields: Any):
+        super().__init__(message)
+        self.status = status
+        self.error_code = error_code
+        self.message = message
+        self.fields = fields
+
+    @classmethod
+    def from_skill(cls, result: dict[str, Any]) -> "ApiError":
+        code = result.get("error_code", "EXECUTION_FAILED")
+        fields = {k: result[k] for k in ("validation_errors", "details") if k in result}
+        return cls(CLIENT_ERRORS.get(code, 502), code, result.get("message", code), **fields)
+
+
+class TrendIndex:
+    """The last ``max_size`` trends returned by fetches, by id."""
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._trends: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._trends)
+
+    def add(self, trends: list[dict[str, Any]]) -> None:
+        for trend in trends:
+            self._trends[trend["id"]] = trend
+            self._trends.move_to_end(trend["id"])
+        while len(self._trends) > self.max_size:
+            self._trends.popitem(last=False)
+
+    def get(self, trend_id: str) -> dict[str, Any] | None:
+        return self._trends.get(trend_id)
+
+
+class EngagementGateway:
+    """
+    One-request-at-a-time front end for a shared ``EngagementStream``.
+
+    Interactions are queued into the stream, which runs for the life of the
+    gateway. Each caller gets back its ``Reply``, or the reason triage
+    dropped its interaction (e.g. ``duplicate``, ``low_priority``).
+    """
+
+    def __init__(self, reply: ReplyModel, safety: Any = None, **options: Any):
+        self.stream = EngagementStream(reply, safety, on_drop=self._dropped, **options)
+        self._queue: asyncio.Queue[Interaction] | None = None
+        self._waiters: dict[int, tuple[Interaction, asyncio.Future[Reply | str]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def respond(self, interaction: Interaction) -> Reply | str:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run(self._queue))
+        assert self._queue is not None
+        future: asyncio.Future[Reply | str] = asyncio.get_running_loop().create_future()
+        self._waiters[id(interaction)] = (interaction, future)
+        try:
+            self._queue.put_nowait(interaction)
+            return await future
+        finally:
+            self._waiters.pop(id(interaction), None)
+
+    def _resolve(self, interaction: Interaction, outcome: Reply | str) -> None:
+        entry = self._waiters.get(id(interaction))
+        if entry is not None and entry[0] is interaction and not entry[1].done():
+            entry[1].set_result(outcome)
+
+    def _dropped(self, interaction: Interaction, reason: str) -> None:
+        self._resolve(interaction, reason)
+
+    async def _run(self, queue: asyncio.Queue[Interaction]) -> None:
+        async def source() -> AsyncIterator[Interaction]:
+            while True:
+                yield await queue.get()
+
+        try:
+            async for reply in self.stream.run(source()):
+                self._resolve(reply.interaction, reply)
+        except Exception as exc:
+            logger.exception("engagement stream failed")
+            for _, future in list(self._waiters.values()):
+                if not future.done():
+                    future.set_exception(exc)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+class ApiServices:
+    """
+    The skills behind the endpoints. Each can be injected; defaults are
+    built from ``skill_config`` (``{skill name: config}``) and are
+    ``trusted`` unless that config says otherwise.
+
+    Args:
+        reply: Reply model for ``engagement/respond``; the endpoint answers
+            503 NOT_CONFIGURED without one.
+        personas: ``PersonaRegistry`` whose ids are accepted as
+            ``persona_id``, in addition to the caption skill's built-in
+            persona styles.
+        engagement: Keyword options for the ``EngagementStream``.
+    """
+
+    def __init__(
+        self,
+        *,
+        trends: FetchTrendsSkill | None = None,
+        captions: GenerateCaptionSkill | None = None,
+        safety: SafetyCheckSkill | None = None,
+        personas: "PersonaRegistry | None" = None,
+        reply: ReplyModel | None = None,
+        engagement: dict[str, Any] | None = None,
+        skill_config: dict[str, dict[str, Any]] | None = None,
+        trend_index_size: int = 10_000,
+    ):
+        skill_config = skill_config or {}
+
+        def config(name: str) -> dict[str, Any]:
+            # An internal hop to Chimera's own skills: requests are validated
+            # on the way in, and the skills' output is not re-checked.
+            return {"trusted": True, **skill_config.get(name, {})}
+
+        self.trends = trends or FetchTrendsSkill(config(FetchTrendsSkill.name))
+        self.captions = captions or GenerateCaptionSkill(config(GenerateCaptionSkill.name))
+        self.safety = safety or SafetyCheckSkill(config(SafetyCheckSkill.name))
+        self.personas = personas
+        self.trend_index = TrendIndex(trend_index_size)
+        self.engagement = (
+            EngagementGateway(reply, self.safety, **(engagement or {})) if reply else None
+        )
+
+    async def fetch_trends(self, request: TrendsFetchRequest) -> dict[str, Any]:
+        result = await self.trends.execute_async(request.model_dump())
+        if result["status"] != "success":
+            raise ApiError.from_skill(result)
+        self.trend_index.add(result["data"]["trends"])
+        return result
+
+    def persona(self, persona_id: str) -> str:
+        """Caption-skill persona name for ``persona_id``."""
+        persona = self.personas.get(persona_id) if self.personas is not None else None
+        if persona is not None:
+            self.captions.personas[persona_id] = persona.prompt_prefix
+        elif persona_id not in self.captions.personas:
+            raise ApiError(404, "PERSONA_NOT_FOUND", f"unknown persona_id {persona_id!r}")
+        return persona_id
+
+    async def generate_content(self, request: ContentGenerateRequest) -> dict[str, Any]:
+        trend = self.trend_index.get(request.trend_id)
+        if trend is None:
+            raise ApiError(
+                404, "TREND_NOT_FOUND", f"trend {request.trend_id!r} has not been fetched"
+            )
+        persona = self.persona(request.persona_id)
+        platform = request.platform or (
+            trend["platform"] if trend["platform"] in CAPTION_PLATFORMS else "twitter"
+        )
+        hashtags = trend.get("metadata", {}).get("hashtags") or []
+        result = await self.captions.execute_async(
+            {
+                "transcript": "\n".join([trend["title"], *hashtags]),
+                "persona": persona,
+                "platform": platform,
+                "include_hashtags": True,
+                "variations": request.variations,
+            }
+        )
+        if result["status"] != "success":
+            raise ApiError.from_skill(result)
+        captions = result["captions"]
+        verdicts: list[dict[str, Any] | None] = [None] * len(captions)
+        if request.safety_check:
+            texts = [" ".join([c["text"], *c["hashtags"]]) for c in captions]
+            verdicts = list(
+                await self.safety.execute_batch_async(
+                    [{"content": text, "check_types": CHECK_TYPES} for text in texts]
+                )
+            )
+        content = []
+        for caption, verdict in zip(captions, verdicts, strict=True):
+            score = caption["safety_score"]
+            status = PENDING
+            if verdict is not None:
+                score = min(score, 1.0 - max(verdict["scores"].values(), default=1.0))
+                status = PENDING if verdict["is_safe"] else "rejected"
+            digest = blake2b(
+                "\x1f".join((request.trend_id, persona, caption["text"])).encode(), digest_size=8
+            ).hexdigest()
+            content.append(
+                {
+                    "id": f"content_{digest}",
+                    "text": caption["text"],
+                    "hashtags": caption["hashtags"],
+                    "safety_score": round(score, 4),
+                    "status": status,
+                }
+            )
+        return {"content": content, "best_choice": result["best_choice"]}
+
+    async def respond(self, request: EngagementRespondRequest) -> dict[str, Any]:
+        if self.engagement is None:
+            raise ApiError(503, "NOT_CONFIGURED", "no reply model is configured")
+        outcome = await self.engagement.respond(Interaction.from_request(request.model_dump()))
+        if isinstance(outcome, str):
+            return {"response": None, "skipped": outcome}
+        return outcome.as_response()
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "trend_index": len(self.trend_index),
+            "engagement": None if self.engagement is None else self.engagement.stream.report(),
+        }
+
+    async def close(self) -> None:
+        if self.engagement is not None:
+            await self.engagement.close()
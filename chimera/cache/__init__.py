@@ -0,0 +1,33 @@
+"""
+Result caching for skills.
+
+Two tiers: an in-process LRU bounded by entry count and bytes, and an
+optional Redis tier (the episodic cache in research/SRS.md#2.2) shared
+across workers. ``ResultCache`` adds TTLs, stale-while-revalidate and
+request coalescing on top.
+
+``ArtifactStore`` is separate: a content-addressed, size-bounded store of
+files on local disk for large skill outputs (media, transcripts).
+
+``fingerprint`` keys caches on content rather than exact bytes: canonical
+text for exact matches, MinHash signatures for near duplicates.
+"""
+
+from chimera.cache.artifacts import ArtifactStore
+from chimera.cache.fingerprint import MinHashLSH, canonical_text, minhash
+from chimera.cache.lru import LRUCache
+from chimera.cache.redis_tier import RedisTier
+from chimera.cache.result_cache import ResultCache
+from chimera.cache.stats import ArtifactStats, CacheStats
+
+__all__ = [
+    "ArtifactStats",
+    "ArtifactStore",
+    "CacheStats",
+    "LRUCache",
+    "MinHashLSH",
+    "RedisTier",
+    "ResultCache",
+    "canonical_text",
+    "minhash",
+]
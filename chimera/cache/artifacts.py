@@ -0,0 +1,288 @@
+"""
+Content-addressed artifact store on local disk.
+
+Artifacts are files under ``<root>/<kind>/<key[:2]>/<key>``. Keys are hex
+digests, usually of the media bytes plus whatever else the artifact
+depends on (model, language, ...), so identical inputs map to one file no
+matter which agent or URL produced them.
+
+- Writes go to a temp file in the same directory and are renamed into
+  place, so readers never see a partial artifact. ``put_file`` hard-links
+  instead of copying when it can.
+- Reads ``mmap`` the file. ``view()`` hands out a zero-copy memoryview,
+  which matters for media artifacts.
+- The store is bounded by ``max_bytes``. Least recently used artifacts
+  are evicted first. Recency is the file's mtime, bumped on every hit,
+  so several worker processes sharing one root see each other's hits.
+  Before evicting, a process re-checks the mtime and keeps anything
+  another process touched since. Unlinking a file another process still
+  has mapped is safe on POSIX.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from chimera.cache.stats import ArtifactStats
+
+_KEY = re.compile(r"^[0-9a-f]{16,128}$")
+_KIND = re.compile(r"^[a-z][a-z0-9_]*$")
+_HASH_BLOCK = 1024 * 1024
+# Temp files older than this belong to a crashed writer, not a slow one.
+_STALE_TMP_S = 3600.0
+_MAX_DIGESTS = 4096
+
+
+class ArtifactStore:
+    """
+    Size-bounded, content-addressed files shared by skills on one host.
+
+    Args:
+        root: Directory holding the store; created if missing.
+        max_bytes: Total artifact bytes kept before LRU eviction.
+        fsync: fsync each artifact before renaming it into place.
+    """
+
+    def __init__(self, root: str, max_bytes: int = 10 * 1024**3, fsync: bool = False):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.fsync = fsync
+        self.stats = ArtifactStats()
+        # (kind, key) -> (size, mtime_ns when last seen), oldest first.
+        self._index: OrderedDict[tuple[str, str], tuple[int, int]] = OrderedDict()
+        self._bytes = 0
+        self._digests: dict[tuple[int, int, int, int], str] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+        self._scan()
+
+    # ------------------------------------------------------------------
+    # Keys and paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Stable key for an artifact derived from ``parts``."""
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def file_digest(self, path: str) -> str:
+        """sha256 of a file, remembered until its inode, size or mtime changes."""
+        st = os.stat(path)
+        signature = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(signature)
+        if digest is None:
+            h = hashlib.sha256()
+            buffer = bytearray(_HASH_BLOCK)
+            view = memoryview(buffer)
+            with open(path, "rb", buffering=0) as f:
+                while n := f.readinto(buffer):
+                    h.update(view[:n])
+            digest = h.hexdigest()
+            with self._lock:
+                if len(self._digests) >= _MAX_DIGESTS:
+                    self._digests.clear()
+                self._digests[signature] = digest
+        return digest
+
+    def _path(self, kind: str, key: str) -> str:
+        if not _KIND.match(kind) or not _KEY.match(key):
+            raise ValueError(f"invalid artifact address {kind}/{key}")
+        return os.path.join(self.root, kind, key[:2], key)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def path(self, kind: str, key: str, *, count: bool = True) -> str | None:
+        """
+        Path of a stored artifact, counting a hit or a miss.
+
+        With ``count=False`` the lookup still refreshes the artifact's
+        recency but leaves the stats alone. Use it for pointers read on the
+        way to the artifact that is the real hit or miss.
+        """
+        path = self._path(kind, key)
+        try:
+            size = os.path.getsize(path)
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                if count:
+                    self.stats.misses += 1
+                self._forget((kind, key))
+            return None
+        with self._lock:
+            if count:
+                self.stats.hits += 1
+                self.stats.bytes_saved += size
+            self._track((kind, key), size, time.time_ns())
+        return path
+
+    def miss(self) -> None:
+        """Count a lookup that ended before reaching an artifact (e.g. no pointer)."""
+        with self._lock:
+            self.stats.misses += 1
+
+    @contextmanager
+    def view(self, kind: str, key: str, *, count: bool = True) -> Iterator[memoryview | None]:
+        """
+        Zero-copy, read-only view of an artifact, or None on a miss.
+
+        The view (and any slice of it) is only valid inside the ``with`` block.
+        """
+        path = self.path(kind, key, count=count)
+        if path is None:
+            yield None
+            return
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def read(self, kind: str, key: str, *, count: bool = True) -> bytes | None:
+        with self.view(kind, key, count=count) as view:
+            return None if view is None else bytes(view)
+
+    def read_json(self, kind: str, key: str) -> Any:
+        raw = self.read(kind, key)
+        return None if raw is None else json.loads(raw)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put_bytes(self, kind: str, key: str, data: bytes) -> str:
+        """Store ``data`` atomically and return its path."""
+        target = self._path(kind, key)
+        tmp = self._tmp(target)
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        return self._commit(kind, key, tmp, target)
+
+    def put_json(self, kind: str, key: str, value: Any) -> str:
+        return self.put_bytes(kind, key, json.dumps(value, separators=(",", ":")).encode())
+
+    def put_file(self, kind: str, key: str, source: str) -> str:
+        """
+        Store an existing file, hard-linking it when source and store share a
+        filesystem. A linked source must not be modified in place afterwards.
+        """
+        target = self._path(kind, key)
+        tmp = self._tmp(target)
+        try:
+            os.link(source, tmp)
+        except OSError:
+            shutil.copyfile(source, tmp)
+            if self.fsync:
+                with open(tmp, "rb") as f:
+                    os.fsync(f.fileno())
+        return self._commit(kind, key, tmp, target)
+
+    def delete(self, kind: str, key: str) -> None:
+        path = self._path(kind, key)
+        with self._lock:
+            self._forget((kind, key))
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _tmp(self, target: str) -> str:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        return f"{target}.tmp-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def _commit(self, kind: str, key: str, tmp: str, target: str) -> str:
+        size = os.path.getsize(tmp)
+        os.replace(tmp, target)
+        os.utime(target)
+        with self._lock:
+            self.stats.writes += 1
+            self.stats.bytes_written += size
+            self._track((kind, key), size, time.time_ns())
+            self._evict()
+        return target
+
+    # ------------------------------------------------------------------
+    # Accounting and eviction
+    # ------------------------------------------------------------------
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def report(self) -> dict[str, Any]:
+        """Counters plus current footprint."""
+        return {**self.stats.as_dict(), "artifacts": len(self), "size_bytes": self._bytes}
+
+    def _track(self, address: tuple[str, str], size: int, mtime_ns: int) -> None:
+        self._forget(address)
+        self._index[address] = (size, mtime_ns)
+        self._bytes += size
+
+    def _forget(self, address: tuple[str, str]) -> None:
+        entry = self._index.pop(address, None)
+        if entry is not None:
+            self._bytes -= entry[0]
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and len(self._index) > 1:
+            address, (size, seen_ns) = next(iter(self._index.items()))
+            path = self._path(*address)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._forget(address)
+                continue
+            if st.st_mtime_ns > seen_ns:
+                # Another process used it since we looked; it is not the LRU.
+                self._track(address, st.st_size, st.st_mtime_ns)
+                continue
+            self._forget(address)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.stats.evictions += 1
+
+    def _scan(self) -> None:
+        found = []
+        for kind in os.listdir(self.root):
+            kind_dir = os.path.join(self.root, kind)
+            if not _KIND.match(kind) or not os.path.isdir(kind_dir):
+                continue
+            for dirpath, _, filenames in os.walk(kind_dir):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    st = os.stat(path)
+                    if ".tmp-" in name:
+                        if time.time() - st.st_mtime > _STALE_TMP_S:
+                            os.remove(path)  # left behind by a crashed writer
+                    elif _KEY.match(name):
+                        found.append((st.st_mtime_ns, kind, name, st.st_size))
+        for mtime_ns, kind, key, size in sorted(found):
+            self._track((kind, key), size, mtime_ns)
+        with self._lock:
+            self._evict()
@@ -0,0 +1,168 @@
+"""
+Text fingerprints for content-keyed caches.
+
+``canonical_text`` folds away differences that do not change meaning:
+Unicode compatibility forms, case, emoji and spacing. Two submissions that
+differ only in those ways share an exact cache key.
+
+``minhash`` gives each text a signature whose positions agree with another
+text's in proportion to their shingle Jaccard similarity. Shingles are the
+text's character 4-grams, with punctuation dropped. Character grams keep
+short texts such as captions and replies stable under typos and one-word
+edits. ``minhash_codes`` signs any other shingling, given as integer codes.
+``MinHashLSH`` finds stored signatures above a similarity threshold without
+a linear scan. Signatures are cut into bands, and only texts that
+share a whole band are compared.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Hashable
+
+import numpy as np
+
+SHINGLE = 4
+# Code points are below 2**21, so 4-grams packed base 2**21 fit in 64 bits.
+_GRAM_BASE = np.uint64(1 << 21)
+NUM_PERM = 64
+BANDS = 16
+
+# Emoji, pictographs, dingbats, and the joiners/selectors/tags that build
+# emoji sequences.
+_EMOJI = re.compile(
+    "["
+    "\U0001f000-\U0001faff"
+    "\u2600-\u27bf"
+    "\u2b00-\u2bff"
+    "\ufe0e\ufe0f\u200d\u20e3"
+    "\U000e0020-\U000e007f"
+    "]+"
+)
+_WORD = re.compile(r"\w+")
+
+
+def canonical_text(text: str) -> str:
+    """NFKC, case-folded, emoji removed, whitespace collapsed."""
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(_EMOJI.sub(" ", folded).split())
+
+
+def shingles(text: str, size: int = SHINGLE) -> set[str]:
+    """Character ``size``-grams of the text's words, joined by single spaces."""
+    padded = f" {' '.join(_WORD.findall(text))} "
+    return {padded[i : i + size] for i in range(max(1, len(padded) - size + 1))}
+
+
+def _permutations(num_perm: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+    return a[:, None], b[:, None]
+
+
+def _gram_codes(text: str, size: int = SHINGLE) -> np.ndarray:
+    """One uint64 code per character ``size``-gram of ``shingles(text)``, repeats kept."""
+    padded = f" {' '.join(_WORD.findall(text))} "
+    chars = np.frombuffer(padded.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    width = max(1, len(chars) - size + 1)
+    codes = np.zeros(width, dtype=np.uint64)
+    for offset in range(size):
+        window = chars[offset : offset + width]
+        codes[: len(window)] = codes[: len(window)] * _GRAM_BASE + window
+    return codes
+
+
+def minhash(texts: list[str], num_perm: int = NUM_PERM, seed: int = 1) -> np.ndarray:
+    """(n, num_perm) uint32 MinHash signatures, one row per text."""
+    return minhash_codes([_gram_codes(text) for text in texts], num_perm, seed)
+
+
+def minhash_codes(codes: list[np.ndarray], num_perm: int = NUM_PERM, seed: int = 1) -> np.ndarray:
+    """
+    (n, num_perm) uint32 MinHash signatures of sets given as non-empty
+    arrays of uint64 element codes, for shingles other than character grams.
+    """
+    if not codes:
+        return np.zeros((0, num_perm), dtype=np.uint32)
+    a, b = _permutations(num_perm, seed)
+    # Multiply-shift hashing; uint64 arithmetic wraps modulo 2**64. A
+    # repeated code cannot change a minimum, so codes need no dedup.
+    permuted = ((a * np.concatenate(codes) + b) >> np.uint64(32)).astype(np.uint32)
+    starts = np.cumsum([0] + [len(c) for c in codes[:-1]]).astype(np.intp)
+    return np.ascontiguousarray(np.minimum.reduceat(permuted, starts, axis=1).T)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(a == b))
+
+
+class MinHashLSH:
+    """
+    Banded LSH index of MinHash signatures.
+
+    Args:
+        threshold: Smallest estimated Jaccard similarity ``near()`` reports.
+        num_perm: Signature length; must match ``minhash()``.
+        bands: Bands per signature. With 16 bands of 4 rows, pairs at 0.7
+            similarity become candidates about 99% of the time and pairs
+            at 0.2 about 2.5% of the time.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = NUM_PERM, bands: int = BANDS):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._tables: list[defaultdict[bytes, set[Hashable]]] = [
+            defaultdict(set) for _ in range(bands)
+        ]
+        self._signatures: dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        self.discard(key)
+        self._signatures[key] = signature
+        for table, band_key in zip(self._tables, self._band_keys(signature), strict=True):
+            table[band_key].add(key)
+
+    def discard(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for table, band_key in zip(self._tables, self._band_keys(signature), strict=True):
+            bucket = table[band_key]
+            bucket.discard(key)
+            if not bucket:
+                del table[band_key]
+
+    def near(self, signature: np.ndarray) -> list[tuple[float, Hashable]]:
+        """``(similarity, key)`` for stored signatures at or above threshold, best first."""
+        candidates: set[Hashable] = set()
+        for table, band_key in zip(self._tables, self._band_keys(signature), strict=True):
+            candidates.update(table.get(band_key, ()))
+        if not candidates:
+            return []
+        keys = list(candidates)
+        stacked = np.stack([self._signatures[key] for key in keys])
+        scores = (stacked == signature).mean(axis=1)
+        order = np.argsort(-scores, kind="stable")
+        return [(float(scores[i]), keys[i]) for i in order if scores[i] >= self.threshold]
+
+    def clear(self) -> None:
+        for table in self._tables:
+            table.clear()
+        self._signatures.clear()
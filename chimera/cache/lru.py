@@ -0,0 +1,102 @@
+"""
+In-process LRU tier.
+
+Values are stored as encoded bytes, so the footprint is measurable and
+callers can never mutate a cached result in place. The cache is bounded by
+both entry count and payload bytes; the least recently used entries are
+evicted first.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class CacheEntry(NamedTuple):
+    """A cached payload and its freshness window (wall-clock seconds)."""
+
+    value: bytes
+    fresh_until: float
+    stale_until: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def is_usable(self, now: float) -> bool:
+        return now < self.stale_until
+
+
+class LRUCache:
+    """Thread-safe LRU map of key -> CacheEntry bounded by count and bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        on_evict: Callable[[str], None] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self._data: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(key: str, entry: CacheEntry) -> int:
+        return len(key) + len(entry.value)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by keys and payloads."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Presence check that neither touches recency nor drops expired entries."""
+        return key in self._data
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry and mark it recently used; drop it once unusable."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if not entry.is_usable(time.time()):
+                self._remove(key)
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        size = self._size(key, entry)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._data[key] = entry
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                evicted, old = self._data.popitem(last=False)
+                self._bytes -= self._size(evicted, old)
+                if self.on_evict is not None:
+                    self.on_evict(evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key)
+        self._bytes -= self._size(key, entry)
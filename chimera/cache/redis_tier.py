@@ -0,0 +1,42 @@
+"""
+Optional Redis tier for ``ResultCache``.
+
+Takes any ``redis.asyncio.Redis``-compatible client (including fakeredis),
+so this module never imports redis itself. Entries are stored as
+``b"<fresh_until>|<stale_until>|<payload>"`` and expire in Redis at
+``stale_until``, so one GET is enough to rebuild the entry.
+"""
+
+import time
+from typing import Any
+
+from chimera.cache.lru import CacheEntry
+
+
+class RedisTier:
+    """Shared second-level cache backed by Redis."""
+
+    def __init__(self, client: Any, namespace: str = "chimera:cache:"):
+        self.client = client
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return self.namespace + key
+
+    async def get(self, key: str) -> CacheEntry | None:
+        raw = await self.client.get(self._key(key))
+        if raw is None:
+            return None
+        fresh_until, stale_until, value = bytes(raw).split(b"|", 2)
+        return CacheEntry(value, float(fresh_until), float(stale_until))
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        ttl_ms = int((entry.stale_until - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        header = f"{entry.fresh_until!r}|{entry.stale_until!r}|".encode()
+        payload = header + entry.value
+        await self.client.set(self._key(key), payload, px=ttl_ms)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self._key(key))
@@ -0,0 +1,162 @@
+"""
+Two-tier result cache with TTLs, stale-while-revalidate and coalescing.
+
+Lookup order for ``get_or_fetch(key, fetch, ttl, stale_ttl)``:
+    1. In-process LRU. Fresh entries are returned directly.
+    2. Redis tier (optional). Hits are copied back into the LRU.
+    3. Upstream ``fetch()``. Concurrent callers for the same key share one
+       in-flight call instead of each hitting the upstream API.
+
+An entry past ``ttl`` but within ``ttl + stale_ttl`` is served immediately
+and refreshed in the background (stale-while-revalidate).
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from chimera.cache.lru import CacheEntry, LRUCache
+from chimera.cache.redis_tier import RedisTier
+from chimera.cache.stats import CacheStats
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _decode(raw: bytes) -> Any:
+    return json.loads(raw)
+
+
+class ResultCache:
+    """
+    JSON-serializable result cache shared by skills.
+
+    Args:
+        max_entries: LRU entry bound.
+        max_bytes: LRU payload byte bound.
+        redis: Optional ``redis.asyncio.Redis``-compatible client
+            (``decode_responses=False``) for the shared tier.
+        namespace: Redis key prefix.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        redis: Any = None,
+        namespace: str = "chimera:cache:",
+    ):
+        self.stats = CacheStats()
+        self.memory = LRUCache(max_entries, max_bytes, on_evict=self._count_eviction)
+        self.redis = RedisTier(redis, namespace) if redis is not None else None
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._background: set[asyncio.Task[Any]] = set()
+
+    def _count_eviction(self, key: str) -> None:
+        self.stats.evictions += 1
+
+    async def _lookup(self, key: str) -> CacheEntry | None:
+        entry = self.memory.get(key)
+        if entry is not None:
+            if entry.is_fresh(time.time()):
+                self.stats.hits += 1
+            else:
+                self.stats.stale_hits += 1
+            return entry
+        if self.redis is None:
+            return None
+        entry = await self.redis.get(key)
+        if entry is not None and entry.is_usable(time.time()):
+            self.memory.set(key, entry)
+            self.stats.redis_hits += 1
+            return entry
+        return None
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float = 0.0,
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key`` or fetch, store and return it.
+
+        ``cacheable(value)`` may veto storing a result (e.g. partial failures).
+        """
+        entry = await self._lookup(key)
+        if entry is not None:
+            if not entry.is_fresh(time.time()):
+                self._refresh_in_background(key, fetch, ttl, stale_ttl, cacheable)
+            return _decode(entry.value)
+
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            task = self._start_fetch(key, fetch, ttl, stale_ttl, cacheable)
+        return _decode(await asyncio.shield(task))
+
+    def _start_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float,
+        cacheable: Callable[[Any], bool] | None,
+    ) -> asyncio.Task[bytes]:
+        async def fetch_and_store() -> bytes:
+            try:
+                value = await fetch()
+                raw = _encode(value)
+                if cacheable is None or cacheable(value):
+                    now = time.time()
+                    entry = CacheEntry(raw, now + ttl, now + ttl + stale_ttl)
+                    self.memory.set(key, entry)
+                    if self.redis is not None:
+                        await self.redis.set(key, entry)
+                return raw
+            finally:
+                if self._inflight.get(key) is asyncio.current_task():
+                    del self._inflight[key]
+
+        task = asyncio.get_running_loop().create_task(fetch_and_store())
+        self._inflight[key] = task
+        return task
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float,
+        cacheable: Callable[[Any], bool] | None,
+    ) -> None:
+        if key in self._inflight:
+            return
+        self.stats.refreshes += 1
+        task = self._start_fetch(key, fetch, ttl, stale_ttl, cacheable)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        # A failed refresh keeps serving the stale entry; retrieve the error
+        # so it is not reported as never retrieved.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def invalidate(self, key: str) -> None:
+        """Drop ``key`` from both tiers."""
+        self.memory.delete(key)
+        if self.redis is not None:
+            await self.redis.delete(key)
+
+    def report(self) -> dict[str, Any]:
+        """Hit ratio, counters and memory footprint of the LRU tier."""
+        return {
+            **self.stats.as_dict(),
+            "entries": len(self.memory),
+            "memory_bytes": self.memory.memory_bytes,
+        }
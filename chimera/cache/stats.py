@@ -0,0 +1,66 @@
+"""Counters for ``ResultCache`` and ``ArtifactStore``."""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters. ``stale_hits`` and ``redis_hits`` count as hits."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.stale_hits + self.redis_hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.lookups
+        return (lookups - self.misses) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+@dataclass
+class ArtifactStats:
+    """Counters for ``ArtifactStore``. ``bytes_saved`` is bytes served from hits."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+    bytes_written: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+            "bytes_written": self.bytes_written,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
@@ -0,0 +1,38 @@
+"""
+Engagement: the inbound half of the bi-directional interaction loop.
+
+``EngagementStream`` consumes comments, mentions and DMs as async
+iterators. It dedupes, filters and ranks every interaction as it arrives
+(``triage``), and micro-batches only the worthwhile ones into reply
+generation and safety scoring. Replies come out ``pending_approval`` for
+the Judge, or ``escalated`` for a human.
+
+Reference: research/SRS.md#4.4-action-system-fr-4.0-4.1
+"""
+
+from chimera.engagement.models import ESCALATED, KINDS, PENDING, Interaction, Reply
+from chimera.engagement.stream import (
+    DropHook,
+    EngagementStream,
+    ReplyModel,
+    merge,
+    safety_score,
+)
+from chimera.engagement.triage import DailyBudget, Deduper, TriagePolicy, prefilter
+
+__all__ = [
+    "ESCALATED",
+    "KINDS",
+    "PENDING",
+    "DailyBudget",
+    "Deduper",
+    "DropHook",
+    "EngagementStream",
+    "Interaction",
+    "Reply",
+    "ReplyModel",
+    "TriagePolicy",
+    "merge",
+    "prefilter",
+    "safety_score",
+]
@@ -0,0 +1,76 @@
+"""
+Interactions coming in and replies going out.
+
+``Interaction.from_request`` reads the ``POST /api/v1/engagement/respond``
+body from specs/technical.md §2.3, and ``Reply.as_response`` builds that
+endpoint's ``data``.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+KINDS = ("comment", "mention", "dm")
+
+PENDING = "pending_approval"
+ESCALATED = "escalated"
+
+
+@dataclass(frozen=True, slots=True)
+class Interaction:
+    """One comment, mention or direct message addressed to an agent."""
+
+    id: str
+    message: str
+    kind: str = "comment"
+    agent_id: str = ""
+    platform: str = ""
+    author_id: str = ""
+    follower_count: int = 0
+    previous_interactions: int = 0
+    received_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_request(
+        cls, body: dict[str, Any], agent_id: str = "", platform: str = ""
+    ) -> "Interaction":
+        """Interaction from an engagement/respond request body."""
+        context = body.get("context") or {}
+        return cls(
+            id=str(body["interaction_id"]),
+            message=str(body.get("message", "")),
+            kind=str(body.get("interaction_type", "comment")),
+            agent_id=str(context.get("agent_id", agent_id)),
+            platform=str(context.get("platform", platform)),
+            author_id=str(context.get("user_id", "")),
+            follower_count=int(context.get("user_follower_count", 0)),
+            previous_interactions=int(context.get("previous_interactions", 0)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Reply:
+    """
+    The outcome for one interaction that made it through triage.
+
+    ``status`` is ``pending_approval`` for a safe reply, which then goes to
+    the Judge. It is ``escalated`` when the interaction or the drafted reply
+    failed the safety check; ``text`` is empty if no reply was drafted.
+    """
+
+    interaction: Interaction
+    text: str
+    status: str
+    priority: float
+    safety_score: float
+    flags: tuple[str, ...] = ()
+
+    def as_response(self) -> dict[str, Any]:
+        return {
+            "response": {
+                "id": f"response_{self.interaction.id}",
+                "text": self.text,
+                "safety_score": self.safety_score,
+                "status": self.status,
+            }
+        }
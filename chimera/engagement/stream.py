@@ -0,0 +1,337 @@
+"""
+Streaming engagement processor.
+
+Comments and mentions arrive as async iterators (one per platform feed,
+webhook queue or poller). ``merge()`` interleaves them, and
+``EngagementStream.run()`` turns the merged stream into replies:
+
+    sources -> dedupe -> prefilter -> priority -> pending heap
+            -> micro-batch -> safety(inbound) -> reply model -> safety(replies)
+
+Triage (see ``triage``) runs on each interaction as it arrives and drops
+most of them before they cost anything. Survivors wait in a pending heap.
+When a batch is due, the highest-priority interactions are taken first,
+so under load low-value comments are the ones that wait, and they are
+shed once ``max_pending`` is exceeded. A batch is due when it is full or
+``window_s`` after its first interaction arrived, and it is only taken
+once one of ``concurrency`` batch slots is free.
+
+Each batch then costs three calls, however large it is:
+
+1. A safety pass over the inbound messages. Spam is dropped. A toxic or
+   policy-breaking message is escalated without drafting a reply.
+2. One reply-model call for the rest.
+3. A safety pass over the drafted replies. Safe replies are
+   ``pending_approval`` for the Judge; the others are escalated.
+
+Safety defaults to ``SafetyCheckSkill.execute_batch_async``, which scores
+a whole batch in one vectorised pass.
+
+Reference: research/SRS.md#4.4-action-system-fr-4.0-4.1
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import Any, Protocol
+
+from chimera.engagement.models import ESCALATED, PENDING, Interaction, Reply
+from chimera.engagement.triage import DailyBudget, Deduper, TriagePolicy, prefilter
+
+CHECK_TYPES = ["toxicity", "spam", "policy"]
+
+# Drafts one reply per interaction, in order, in a single model call.
+ReplyModel = Callable[[list[Interaction]], Awaitable[list[str]]]
+# Called with each interaction that triage or the safety pass dropped, and why.
+DropHook = Callable[[Interaction, str], None]
+
+
+class SafetyScorer(Protocol):
+    """The batch interface of ``SafetyCheckSkill``."""
+
+    async def execute_batch_async(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]: ...
+
+
+async def merge(*sources: AsyncIterable[Interaction]) -> AsyncIterator[Interaction]:
+    """Interleave several async sources in arrival order; ends when all do."""
+    queue: asyncio.Queue[tuple[Interaction | None, BaseException | None]] = asyncio.Queue(
+        maxsize=len(sources) * 64
+    )
+
+    async def pump(source: AsyncIterable[Interaction]) -> None:
+        try:
+            async for interaction in source:
+                await queue.put((interaction, None))
+        except Exception as exc:
+            await queue.put((None, exc))
+            return
+        await queue.put((None, None))
+
+    tasks = [asyncio.get_running_loop().create_task(pump(source)) for source in sources]
+    try:
+        live = len(tasks)
+        while live:
+            interaction, error = await queue.get()
+            if error is not None:
+                raise error
+            if interaction is None:
+                live -= 1
+            else:
+                yield interaction
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def safety_score(verdict: dict[str, Any]) -> float:
+    """Spec-style safety score: 1 minus the worst check score."""
+    return round(1.0 - max(verdict.get("scores", {}).values(), default=1.0), 4)
+
+
+class EngagementStream:
+    """
+    Triage and micro-batch interactions into replies.
+
+    Args:
+        reply: Reply model; one call per batch.
+        safety: Batch safety scorer; a ``SafetyCheckSkill`` by default.
+        policy: Priority weights and threshold.
+        batch_size: Most interactions per batch.
+        window_s: Longest the first interaction of a batch waits for company.
+        concurrency: Batches in flight at once.
+        max_pending: Triaged interactions waiting for a batch; beyond this
+            the lowest-priority one is shed.
+        daily_limit: Replies per agent per UTC day.
+        dedupe_size: Interactions remembered for deduplication.
+        on_drop: Called with every dropped interaction and the reason
+            (the ``report()`` counter it was counted under).
+    """
+
+    def __init__(
+        self,
+        reply: ReplyModel,
+        safety: SafetyScorer | None = None,
+        *,
+        policy: TriagePolicy | None = None,
+        batch_size: int = 16,
+        window_s: float = 0.05,
+        concurrency: int = 4,
+        max_pending: int = 1024,
+        daily_limit: int = 1000,
+        dedupe_size: int = 100_000,
+        on_drop: DropHook | None = None,
+    ):
+        if safety is None:
+            from skills.skill_safety_check import SafetyCheckSkill
+
+            safety = SafetyCheckSkill()
+        self.reply = reply
+        self.safety = safety
+        self.policy = policy or TriagePolicy()
+        self.batch_size = batch_size
+        self.window_s = window_s
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self.budget = DailyBudget(daily_limit)
+        self.deduper = Deduper(dedupe_size)
+        self.on_drop = on_drop
+        self.stats: Counter[str] = Counter()
+        # Min-heap of (priority, seq, interaction): the root is shed first.
+        self._pending: list[tuple[float, int, Interaction]] = []
+        self._seq = itertools.count()
+        self._oldest = 0.0
+
+    def triage(self, interaction: Interaction) -> float | None:
+        """Priority of ``interaction``, or None if it was dropped."""
+        self.stats["received"] += 1
+        if self.deduper.seen(interaction):
+            self._drop(interaction, "duplicate")
+            return None
+        reason = prefilter(interaction)
+        if reason is not None:
+            self._drop(interaction, f"filtered_{reason}")
+            return None
+        priority = self.policy.priority(interaction)
+        if priority < self.policy.min_priority:
+            self._drop(interaction, "low_priority")
+            return None
+        return priority
+
+    def _drop(self, interaction: Interaction, reason: str) -> None:
+        self.stats[reason] += 1
+        if self.on_drop is not None:
+            self.on_drop(interaction, reason)
+
+    def _admit(self, interaction: Interaction, now: float) -> None:
+        priority = self.triage(interaction)
+        if priority is None:
+            return
+        if not self._pending:
+            self._oldest = now
+        heapq.heappush(self._pending, (priority, next(self._seq), interaction))
+        if len(self._pending) > self.max_pending:
+            self._drop(heapq.heappop(self._pending)[2], "shed")
+
+    def _take(self) -> list[tuple[float, Interaction]]:
+        """Highest-priority pending interactions that still have budget."""
+        batch: list[tuple[float, Interaction]] = []
+        while self._pending and len(batch) < self.batch_size:
+            chosen = heapq.nlargest(self.batch_size - len(batch), self._pending)
+            taken = {seq for _, seq, _ in chosen}
+            self._pending = [entry for entry in self._pending if entry[1] not in taken]
+            heapq.heapify(self._pending)
+            for priority, _, interaction in chosen:
+                if self.budget.take(interaction.agent_id):
+                    batch.append((priority, interaction))
+                else:
+                    self._drop(interaction, "over_budget")
+        return batch
+
+    async def run(self, *sources: AsyncIterable[Interaction]) -> AsyncIterator[Reply]:
+        """Replies for the worthwhile interactions of ``sources``, batch by batch."""
+        loop = asyncio.get_running_loop()
+        arrived = asyncio.Event()
+        done = False
+        slots = asyncio.Semaphore(self.concurrency)
+        out: asyncio.Queue[list[Reply] | Exception | None] = asyncio.Queue()
+        inflight: set[asyncio.Task[None]] = set()
+
+        async def read() -> None:
+            nonlocal done
+            try:
+                async for interaction in merge(*sources):
+                    self._admit(interaction, loop.time())
+                    arrived.set()
+            finally:
+                done = True
+                arrived.set()
+
+        async def due() -> bool:
+            """Wait until a batch is full or its window is up; False at the end."""
+            while not self._pending:
+                if done:
+                    return False
+                arrived.clear()
+                await arrived.wait()
+            while len(self._pending) < self.batch_size and not done:
+                remaining = self._oldest + self.window_s - loop.time()
+                if remaining <= 0:
+                    break
+                arrived.clear()
+                try:
+                    await asyncio.wait_for(arrived.wait(), remaining)
+                except TimeoutError:
+                    break
+            return True
+
+        async def process(batch: list[tuple[float, Interaction]]) -> None:
+            try:
+                await out.put(await self.process(batch))
+            except Exception as exc:
+                await out.put(exc)
+            finally:
+                slots.release()
+
+        async def dispatch() -> None:
+            try:
+                # A batch is only taken once a slot is free, so interactions
+                # that arrive while every slot is busy still compete on
+                # priority for the next batch.
+                while True:
+                    await slots.acquire()
+                    if not await due():
+                        break
+                    batch = self._take()
+                    if self._pending:
+                        # Leftovers start the next window now.
+                        self._oldest = loop.time()
+                    if not batch:
+                        slots.release()
+                        continue
+                    task = loop.create_task(process(batch))
+                    inflight.add(task)
+                    task.add_done_callback(inflight.discard)
+                await asyncio.gather(*inflight)
+                await reader
+            except Exception as exc:
+                await out.put(exc)
+            finally:
+                await out.put(None)
+
+        reader = loop.create_task(read())
+        dispatcher = loop.create_task(dispatch())
+        try:
+            while (replies := await out.get()) is not None:
+                if isinstance(replies, Exception):
+                    raise replies
+                for reply in replies:
+                    yield reply
+        finally:
+            tasks = [reader, dispatcher, *inflight]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def process(self, batch: list[tuple[float, Interaction]]) -> list[Reply]:
+        """Safety-check, draft and re-check one batch of (priority, interaction)."""
+        self.stats["batches"] += 1
+        inbound = await self.safety.execute_batch_async(
+            [{"content": i.message, "check_types": CHECK_TYPES} for _, i in batch]
+        )
+        replies: list[Reply] = []
+        drafting: list[tuple[float, Interaction]] = []
+        for (priority, interaction), verdict in zip(batch, inbound, strict=True):
+            if verdict.get("is_safe"):
+                drafting.append((priority, interaction))
+                continue
+            scores = verdict.get("scores", {})
+            if scores and max(scores, key=scores.__getitem__) == "spam":
+                self._drop(interaction, "filtered_spam")
+                continue
+            self.stats["escalated_inbound"] += 1
+            replies.append(
+                Reply(
+                    interaction,
+                    "",
+                    ESCALATED,
+                    priority,
+                    safety_score(verdict),
+                    tuple(verdict.get("flags", ())),
+                )
+            )
+        if not drafting:
+            return replies
+        self.stats["model_calls"] += 1
+        self.stats["drafted"] += len(drafting)
+        texts = await self.reply([interaction for _, interaction in drafting])
+        if len(texts) != len(drafting):
+            raise ValueError(f"{len(texts)} replies for a batch of {len(drafting)}")
+        outbound = await self.safety.execute_batch_async(
+            [{"content": text, "check_types": CHECK_TYPES} for text in texts]
+        )
+        for (priority, interaction), text, verdict in zip(drafting, texts, outbound, strict=True):
+            safe = bool(verdict.get("is_safe"))
+            self.stats["pending_approval" if safe else "escalated_reply"] += 1
+            replies.append(
+                Reply(
+                    interaction,
+                    text,
+                    PENDING if safe else ESCALATED,
+                    priority,
+                    safety_score(verdict),
+                    tuple(verdict.get("flags", ())),
+                )
+            )
+        return replies
+
+    def report(self) -> dict[str, Any]:
+        """Counters plus the share of received interactions that got a draft."""
+        received = self.stats["received"]
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "draft_rate": round(self.stats["drafted"] / received, 4) if received else 0.0,
+        }
@@ -0,0 +1,165 @@
+"""
+Cheap triage for incoming interactions.
+
+Each interaction that reaches reply generation costs a model call share
+and a safety pass, and most comments are not worth one. Triage runs on
+every interaction before any of that:
+
+1. ``Deduper``: the same interaction id, or a known author sending the
+   same text to the same agent again, is dropped. Without an author id
+   only the interaction id counts: common comments from different
+   people must not collapse into one.
+2. ``prefilter``: no words left once mentions, links and emoji are
+   removed; the agent's own comments; stock spam phrases.
+3. ``TriagePolicy.priority``: a score in [0, 1] from the author's reach
+   (log follower count), their history with the agent
+   (``previous_interactions``), message substance and kind. Interactions
+   under ``min_priority`` are dropped.
+4. ``DailyBudget``: at most ``limit`` replies per agent per UTC day, the
+   1,000 interactions a day from specs/functional.md §1.3.
+
+All of it is plain Python over one message; nothing here awaits.
+"""
+
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+
+from chimera.cache.fingerprint import canonical_text
+from chimera.engagement.models import Interaction
+
+DAILY_LIMIT = 1000
+# A direct message is addressed to the agent alone; a comment is one of many.
+KIND_SCORES = {"dm": 1.0, "mention": 0.6, "comment": 0.3}
+
+_MENTION = re.compile(r"@\w+")
+_LINK = re.compile(r"(?:https?://|www\.)\S+", re.I)
+_WORD = re.compile(r"\w+")
+_SPAM = re.compile(
+    r"\b(?:f4f|l4l|follow4follow|follow\s+for\s+follow|sub4sub|check\s+(?:out\s+)?my\s+"
+    r"(?:page|profile|channel)|free\s+followers|promo\s+code|dm\s+me\s+for|link\s+in\s+bio)\b",
+    re.I,
+)
+
+
+def words(message: str) -> list[str]:
+    """Words of the message once mentions, links and emoji are removed."""
+    return _WORD.findall(canonical_text(_LINK.sub(" ", _MENTION.sub(" ", message))))
+
+
+def prefilter(interaction: Interaction) -> str | None:
+    """Why ``interaction`` is not worth a reply, or None if it may be."""
+    if interaction.author_id and interaction.author_id == interaction.agent_id:
+        return "self"
+    if not words(interaction.message):
+        return "no_text"
+    if _SPAM.search(interaction.message):
+        return "spam"
+    return None
+
+
+@dataclass(frozen=True)
+class TriagePolicy:
+    """
+    Priority weights. The four weights sum to 1, so a maximal interaction
+    scores 1 before the question bonus, which is capped.
+
+    Args:
+        reach: Weight of log follower count, saturating at ``reach_cap``.
+        history: Weight of ``previous_interactions``, saturating at
+            ``history_cap``.
+        substance: Weight of word count, saturating at ``substance_cap``.
+        kind: Weight of the interaction kind (``KIND_SCORES``).
+        question: Bonus for a message that asks something.
+        min_priority: Interactions scoring below this are dropped.
+    """
+
+    reach: float = 0.4
+    reach_cap: int = 1_000_000
+    history: float = 0.25
+    history_cap: int = 10
+    substance: float = 0.2
+    substance_cap: int = 12
+    kind: float = 0.15
+    question: float = 0.1
+    min_priority: float = 0.2
+
+    def priority(self, interaction: Interaction) -> float:
+        reach = math.log1p(max(interaction.follower_count, 0)) / math.log1p(self.reach_cap)
+        history = interaction.previous_interactions / self.history_cap
+        substance = len(words(interaction.message)) / self.substance_cap
+        score = (
+            self.reach * min(reach, 1.0)
+            + self.history * min(max(history, 0.0), 1.0)
+            + self.substance * min(substance, 1.0)
+            + self.kind * KIND_SCORES.get(interaction.kind, 0.0)
+        )
+        if "?" in interaction.message:
+            score += self.question
+        return round(min(score, 1.0), 4)
+
+
+class Deduper:
+    """Remembers the last ``max_size`` interactions by id and, with an author, by content."""
+
+    def __init__(self, max_size: int = 100_000):
+        self.max_size = max_size
+        self._seen: OrderedDict[str, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def seen(self, interaction: Interaction) -> bool:
+        """True if already seen; otherwise records ``interaction``."""
+        keys = [f"id:{interaction.id}"]
+        if interaction.author_id:
+            content = blake2b(
+                "\x1f".join(
+                    (
+                        interaction.agent_id,
+                        interaction.author_id,
+                        canonical_text(interaction.message),
+                    )
+                ).encode(),
+                digest_size=16,
+            ).hexdigest()
+            keys.append(f"content:{content}")
+        if any(key in self._seen for key in keys):
+            for key in keys:
+                if key in self._seen:
+                    self._seen.move_to_end(key)
+            return True
+        for key in keys:
+            self._seen[key] = None
+        while len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+        return False
+
+
+class DailyBudget:
+    """At most ``limit`` replies per agent per UTC day."""
+
+    def __init__(self, limit: int = DAILY_LIMIT):
+        self.limit = limit
+        self._day = -1
+        self._used: dict[str, int] = {}
+
+    def remaining(self, agent_id: str, now: float | None = None) -> int:
+        self._roll(time.time() if now is None else now)
+        return self.limit - self._used.get(agent_id, 0)
+
+    def take(self, agent_id: str, now: float | None = None) -> bool:
+        """Spend one reply for ``agent_id``; False once the day's budget is gone."""
+        if self.remaining(agent_id, now) <= 0:
+            return False
+        self._used[agent_id] = self._used.get(agent_id, 0) + 1
+        return True
+
+    def _roll(self, now: float) -> None:
+        day = int(now // 86_400)
+        if day != self._day:
+            self._day = day
+            self._used.clear()
@@ -0,0 +1,29 @@
+"""
+Judge: the gatekeeper that approves, rejects or escalates Worker output.
+
+Decisions are committed with optimistic concurrency control against a
+``chimera.state`` store, so many Judges can review in parallel without
+holding locks while they validate.
+
+Reference: research/SRS.md#3.1.3-the-judge-gatekeeper
+"""
+
+from chimera.judge.approvals import (
+    PENDING,
+    ApprovalJudge,
+    Decision,
+    JudgeStats,
+    Outcome,
+    Review,
+    Validator,
+)
+
+__all__ = [
+    "PENDING",
+    "ApprovalJudge",
+    "Decision",
+    "JudgeStats",
+    "Outcome",
+    "Review",
+    "Validator",
+]
@@ -0,0 +1,215 @@
+"""
+Judge approval decisions under optimistic concurrency control.
+
+A review reads a snapshot without taking locks: the content record and,
+optionally, its campaign. It validates the Worker's output against that
+snapshot, then commits the decision in one compare-and-swap. The commit
+moves the content to its new status, inserts an ``approval`` row and
+checks that the campaign is unchanged.
+
+If another writer got there first, the commit fails with ``ConflictError``
+and the Judge retries:
+
+- the content was already decided by another Judge: stop (``decided``);
+- the content or campaign changed (a Worker revised the draft, the
+  Planner re-targeted the campaign): re-read, re-validate, commit again;
+- nothing the review depends on changed: commit the same review again.
+
+Retries back off with full jitter. After ``max_attempts`` conflicts the
+last ``ConflictError`` is raised, so the caller can escalate.
+
+Reference: research/SRS.md#3.1.3-the-judge-gatekeeper, agents/judge/SOUL.md
+"""
+
+import asyncio
+import random
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+
+from chimera.state.store import ConflictError, Record, StateStore, Write
+
+PENDING = "pending_approval"
+DEFAULT_MAX_ATTEMPTS = 8
+BACKOFF_BASE_S = 0.002
+BACKOFF_CAP_S = 0.1
+
+
+class Decision(StrEnum):
+    APPROVE = "approve"
+    REJECT = "reject"
+    ESCALATE = "escalate"
+
+
+# Content status after each decision.
+STATUS_AFTER: dict[Decision, str] = {
+    Decision.APPROVE: "approved",
+    Decision.REJECT: "rejected",
+    Decision.ESCALATE: "escalated",
+}
+
+
+@dataclass(frozen=True)
+class Review:
+    """What a validator concluded about one snapshot of the content."""
+
+    decision: Decision
+    feedback: str = ""
+    safety_score: float | None = None
+
+
+# (content, campaign or None) -> Review. Must not write to the store.
+Validator = Callable[[Record, Record | None], Awaitable[Review]]
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """
+    Result of ``ApprovalJudge.review()``.
+
+    ``decided`` means the content was not pending any more (another Judge
+    decided it first). In that case ``review`` and ``approval_id`` are None.
+    """
+
+    content_id: str
+    status: str
+    attempts: int
+    decided: bool = False
+    review: Review | None = None
+    approval_id: str | None = None
+
+
+@dataclass
+class JudgeStats:
+    """Counters for ``ApprovalJudge``."""
+
+    commits: int = 0
+    conflicts: int = 0
+    revalidations: int = 0
+    decided: int = 0
+    exhausted: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "commits": self.commits,
+            "conflicts": self.conflicts,
+            "revalidations": self.revalidations,
+            "decided": self.decided,
+            "exhausted": self.exhausted,
+        }
+
+
+class ApprovalJudge:
+    """
+    Commits approval decisions for pending content with OCC.
+
+    Args:
+        store: Shared ``StateStore``; any number of Judges may use it at once.
+        validate: Async validator, called again whenever the snapshot it
+            judged has gone stale.
+        judge_id: ``approver_id`` written to approval rows.
+        max_attempts: Commit attempts per review before giving up.
+        backoff_base / backoff_cap: Bounds in seconds for the jittered
+            backoff between attempts.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        validate: Validator,
+        judge_id: str = "judge-0001",
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = BACKOFF_BASE_S,
+        backoff_cap: float = BACKOFF_CAP_S,
+        rng: random.Random | None = None,
+    ):
+        self.store = store
+        self.validate = validate
+        self.judge_id = judge_id
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.rng = rng or random.Random()
+        self.stats = JudgeStats()
+
+    def backoff_delay(self, conflicts: int) -> float:
+        ceiling = min(self.backoff_cap, self.backoff_base * 2 ** (conflicts - 1))
+        return self.rng.uniform(0, ceiling)
+
+    async def review(self, content_id: str, campaign_id: str | None = None) -> Outcome:
+        """
+        Validate pending content and commit the decision.
+
+        Raises ``KeyError`` if the content (or a named campaign) does not
+        exist. Raises ``ConflictError`` if every attempt conflicted.
+        """
+        judged: tuple[int, int] | None = None
+        review: Review | None = None
+        for attempt in range(1, self.max_attempts + 1):
+            content, campaign = await self._snapshot(content_id, campaign_id)
+            if content.data.get("status") != PENDING:
+                self.stats.decided += 1
+                return Outcome(content_id, content.data.get("status", ""), attempt, decided=True)
+
+            seen = (content.version, campaign.version if campaign is not None else 0)
+            if review is None or seen != judged:
+                if review is not None:
+                    self.stats.revalidations += 1
+                review = await self.validate(content, campaign)
+                judged = seen
+
+            approval_id = str(uuid.uuid4())
+            try:
+                await self.store.commit(self._writes(content, campaign, review, approval_id))
+            except ConflictError:
+                self.stats.conflicts += 1
+                if attempt == self.max_attempts:
+                    self.stats.exhausted += 1
+                    raise
+                await asyncio.sleep(self.backoff_delay(attempt))
+                continue
+            self.stats.commits += 1
+            status = STATUS_AFTER[review.decision]
+            return Outcome(content_id, status, attempt, review=review, approval_id=approval_id)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _snapshot(
+        self, content_id: str, campaign_id: str | None
+    ) -> tuple[Record, Record | None]:
+        content = await self.store.get("content", content_id)
+        if content is None:
+            raise KeyError(f"content {content_id} not found")
+        if campaign_id is None:
+            return content, None
+        campaign = await self.store.get("campaign", campaign_id)
+        if campaign is None:
+            raise KeyError(f"campaign {campaign_id} not found")
+        return content, campaign
+
+    def _writes(
+        self, content: Record, campaign: Record | None, review: Review, approval_id: str
+    ) -> list[Write]:
+        changes: dict[str, Any] = {"status": STATUS_AFTER[review.decision]}
+        if review.safety_score is not None:
+            changes["safety_score"] = review.safety_score
+        writes = [
+            Write.update(content, **changes),
+            Write.create(
+                "approval",
+                approval_id,
+                {
+                    "content_id": content.id,
+                    "approver_id": self.judge_id,
+                    "decision": review.decision.value,
+                    "feedback": review.feedback,
+                    "content_version": content.version,
+                    "reviewed_at": datetime.now(UTC),
+                },
+            ),
+        ]
+        if campaign is not None:
+            writes.append(Write.unchanged(campaign))
+        return writes
@@ -0,0 +1,33 @@
+"""
+Agent memory.
+
+``SemanticMemory`` is the long-term tier: each agent's memories are
+embedded and stored in a ``VectorIndex``, and recall is a filtered top-K
+similarity search. ``HierarchicalMemory`` puts the short-term tiers in
+front of it: a per-agent in-process buffer, then Redis, then the vector
+store, with recall prefetched for leased tasks.
+
+Backends:
+    NumpyVectorIndex - in-process int8 vectors with memory-mapped
+                       persistence and optional IVF, the default and the
+                       local stand-in for Weaviate.
+
+Reference: research/SRS.md#4.1-cognitive-core-persona-management-fr-1.0-1.2
+"""
+
+from chimera.memory.embed import Embedder, HashingEmbedder
+from chimera.memory.hierarchy import HierarchicalMemory, MemoryRecord
+from chimera.memory.index import Hit, VectorIndex
+from chimera.memory.numpy_index import NumpyVectorIndex
+from chimera.memory.semantic import SemanticMemory
+
+__all__ = [
+    "Embedder",
+    "HashingEmbedder",
+    "HierarchicalMemory",
+    "Hit",
+    "MemoryRecord",
+    "NumpyVectorIndex",
+    "SemanticMemory",
+    "VectorIndex",
+]
@@ -0,0 +1,68 @@
+"""
+Text embedders for semantic memory.
+
+``Embedder`` is what ``SemanticMemory`` needs: a ``dim`` and an async
+``embed()``. A hosted embedding model plugs in behind it. ``HashingEmbedder``
+is the offline default. It hashes words and word bigrams into signed
+buckets (the hashing trick), so texts that share words land near each
+other, with no model download and no network call. It is good enough for
+tests, benchmarks and single-node runs, but it does not capture synonyms.
+"""
+
+import re
+import zlib
+from collections.abc import Sequence
+from typing import Protocol
+
+import numpy as np
+
+from chimera.cache.fingerprint import canonical_text
+
+DEFAULT_DIM = 256
+_WORD = re.compile(r"\w+")
+
+
+class Embedder(Protocol):
+    dim: int
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """(len(texts), dim) float32 vectors."""
+        ...
+
+
+class HashingEmbedder:
+    """
+    Deterministic bag-of-words embedder.
+
+    Args:
+        dim: Output length.
+        bigrams: Weight of word bigram features relative to words; 0 turns
+            them off.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM, bigrams: float = 0.5):
+        self.dim = dim
+        self.bigrams = bigrams
+
+    def _features(self, text: str) -> tuple[list[int], list[float]]:
+        words = _WORD.findall(canonical_text(text))
+        grams = [(word, 1.0) for word in words]
+        if self.bigrams:
+            grams += [(f"{a} {b}", self.bigrams) for a, b in zip(words, words[1:], strict=False)]
+        hashes = [zlib.crc32(gram.encode()) for gram, _ in grams]
+        # Low bits pick the bucket, bit 31 the sign.
+        signs = [
+            weight if h >> 31 else -weight for h, (_, weight) in zip(hashes, grams, strict=True)
+        ]
+        return [h % self.dim for h in hashes], signs
+
+    def embed_sync(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            buckets, signs = self._features(text)
+            np.add.at(vectors[i], buckets, signs)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        return self.embed_sync(texts)
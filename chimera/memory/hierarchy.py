@@ -0,0 +1,324 @@
+"""
+Hierarchical memory retrieval: short-term and long-term tiers (FR 1.1).
+
+Reads go fastest tier first:
+    1. Episodic buffer. Per agent, in this process: the agent's most recent
+       memories and its recent long-term recall results.
+    2. Redis (optional). The same two things, shared by every worker: a
+       capped list of recent memories per agent and cached recall results.
+    3. ``SemanticMemory``. A vector search over everything the agent has
+       remembered, only when both caches miss.
+
+``context()`` is what a generation call needs: the newest memories plus the
+ones most relevant to the task. ``prefetch_tasks()`` starts the long-term
+lookup when tasks are leased, so by the time a skill asks for context the
+recall is usually already in tier 1 and the vector store is not on the
+critical path.
+
+Consistency: every write bumps the agent's generation, which is part of the
+recall cache key, so the node that wrote never serves a recall result that
+misses the new memory. With Redis the generation lives there next to the
+recent list and other nodes pick it up when they next reload the agent (at
+most ``ttl`` later); until then they still see the new memory through the
+recent list, which ``context()`` always includes.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from chimera.cache import ResultCache, canonical_text
+from chimera.memory.index import Hit
+from chimera.memory.semantic import SemanticMemory
+from chimera.tasks import Task
+
+DEFAULT_RECENT = 20
+DEFAULT_TTL = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryRecord:
+    """
+    One memory as handed to prompt assembly.
+
+    Slotted and flat so thousands of buffered records stay small; the agent
+    is implied by the buffer that holds it. ``score`` is the similarity for
+    recalled memories and 0.0 for recent ones.
+    """
+
+    id: str
+    text: str
+    created_at: float
+    score: float = 0.0
+
+    def to_row(self) -> list[Any]:
+        return [self.id, self.text, self.created_at, self.score]
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "MemoryRecord":
+        return cls(*row)
+
+    @classmethod
+    def from_hit(cls, hit: Hit) -> "MemoryRecord":
+        return cls(
+            hit.id, hit.metadata.get("text", ""), hit.metadata.get("created_at", 0.0), hit.score
+        )
+
+
+@dataclass
+class MemoryStats:
+    """Where reads were served from. Recall tiers are in ``ResultCache.stats``."""
+
+    buffer_hits: int = 0
+    redis_loads: int = 0
+    prefetches: int = 0
+    prefetch_errors: int = 0
+    contexts: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "buffer_hits": self.buffer_hits,
+            "redis_loads": self.redis_loads,
+            "prefetches": self.prefetches,
+            "prefetch_errors": self.prefetch_errors,
+            "contexts": self.contexts,
+        }
+
+
+class _Episodes:
+    """One agent's short-term buffer, newest first."""
+
+    __slots__ = ("records", "loaded_at", "generation")
+
+    def __init__(self, size: int, generation: int):
+        self.records: deque[MemoryRecord] = deque(maxlen=size)
+        # Never loaded: the first read fills the buffer from Redis.
+        self.loaded_at = 0.0
+        self.generation = generation
+
+
+class HierarchicalMemory:
+    """
+    Short-term buffer and cached long-term recall over ``SemanticMemory``.
+
+    Args:
+        semantic: Long-term store; a default ``SemanticMemory`` if omitted.
+        redis: Optional ``redis.asyncio.Redis``-compatible client
+            (``decode_responses=False``) for the shared tier.
+        recent: Recent memories kept per agent.
+        ttl: Seconds a cached recall result, or a local copy of the Redis
+            recent list, is used before going back to the slower tier.
+        max_agents: Agents whose buffers stay in process (LRU).
+        max_entries: Cached recall results kept in process.
+        namespace: Redis key prefix.
+    """
+
+    def __init__(
+        self,
+        semantic: SemanticMemory | None = None,
+        redis: Any = None,
+        *,
+        recent: int = DEFAULT_RECENT,
+        ttl: float = DEFAULT_TTL,
+        max_agents: int = 4096,
+        max_entries: int = 16384,
+        namespace: str = "chimera:memory:",
+    ):
+        self.semantic = semantic or SemanticMemory()
+        self.redis = redis
+        self.recent_size = recent
+        self.ttl = ttl
+        self.max_agents = max_agents
+        self.namespace = namespace
+        self.stats = MemoryStats()
+        self.cache = ResultCache(
+            max_entries=max_entries, redis=redis, namespace=namespace + "recall:"
+        )
+        self._agents: OrderedDict[str, _Episodes] = OrderedDict()
+        # Without Redis, generations are unique per process, so an agent
+        # evicted from the buffer and seen again never matches recall
+        # results cached before.
+        self._generations = itertools.count()
+        self._background: set[asyncio.Task[Any]] = set()
+
+    def _episodes(self, agent_id: str) -> _Episodes:
+        episodes = self._agents.get(agent_id)
+        if episodes is None:
+            episodes = _Episodes(self.recent_size, next(self._generations))
+            self._agents[agent_id] = episodes
+            if len(self._agents) > self.max_agents:
+                self._agents.popitem(last=False)
+        else:
+            self._agents.move_to_end(agent_id)
+        return episodes
+
+    def _recent_key(self, agent_id: str) -> str:
+        return f"{self.namespace}recent:{agent_id}"
+
+    def _generation_key(self, agent_id: str) -> str:
+        return f"{self.namespace}generation:{agent_id}"
+
+    async def _resident(self, agent_id: str) -> _Episodes:
+        """The agent's buffer, reloaded from Redis once it is ``ttl`` old."""
+        episodes = self._episodes(agent_id)
+        now = time.time()
+        if self.redis is None or now - episodes.loaded_at < self.ttl:
+            self.stats.buffer_hits += 1
+            return episodes
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.lrange(self._recent_key(agent_id), 0, self.recent_size - 1)
+        pipe.get(self._generation_key(agent_id))
+        rows, generation = await pipe.execute()
+        # Memories written here since the last load are in Redis too.
+        episodes.records.clear()
+        episodes.records.extend(MemoryRecord.from_row(json.loads(row)) for row in rows)
+        episodes.generation = int(generation or 0)
+        episodes.loaded_at = now
+        self.stats.redis_loads += 1
+        return episodes
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def remember(
+        self,
+        agent_id: str,
+        texts: Sequence[str],
+        metadata: Sequence[dict[str, Any]] | None = None,
+    ) -> list[MemoryRecord]:
+        """Store memories in every tier; returns them oldest first."""
+        now = time.time()
+        extra = metadata if metadata is not None else [{}] * len(texts)
+        ids = await self.semantic.remember(agent_id, texts, extra)
+        records = [
+            MemoryRecord(id_, text, meta.get("created_at", now))
+            for id_, text, meta in zip(ids, texts, extra, strict=True)
+        ]
+        episodes = self._episodes(agent_id)
+        episodes.records.extendleft(records)
+        if self.redis is None:
+            episodes.generation = next(self._generations)
+        elif records:
+            key = self._recent_key(agent_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.lpush(key, *(json.dumps(r.to_row()).encode() for r in records))
+            pipe.ltrim(key, 0, self.recent_size - 1)
+            pipe.incr(self._generation_key(agent_id))
+            *_, episodes.generation = await pipe.execute()
+        return records
+
+    async def forget(self, agent_id: str, ids: Iterable[str]) -> int:
+        """Delete memories from the long-term store and this node's tiers."""
+        ids = set(ids)
+        removed = await self.semantic.forget(ids)
+        episodes = self._episodes(agent_id)
+        kept = [r for r in episodes.records if r.id not in ids]
+        episodes.records.clear()
+        episodes.records.extend(kept)
+        if self.redis is None:
+            episodes.generation = next(self._generations)
+            return removed
+        key = self._recent_key(agent_id)
+        rows = await self.redis.lrange(key, 0, -1)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(key)
+        rows = [row for row in rows if json.loads(row)[0] not in ids]
+        if rows:
+            pipe.rpush(key, *rows)
+        pipe.incr(self._generation_key(agent_id))
+        *_, episodes.generation = await pipe.execute()
+        return removed
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def recent(self, agent_id: str, n: int | None = None) -> list[MemoryRecord]:
+        """The agent's newest memories, newest first."""
+        records = list((await self._resident(agent_id)).records)
+        return records if n is None else records[:n]
+
+    async def recall(self, agent_id: str, query: str, k: int = 5) -> list[MemoryRecord]:
+        """The agent's ``k`` memories most relevant to ``query``, via the caches."""
+
+        async def search() -> list[list[Any]]:
+            hits = await self.semantic.recall(agent_id, query, k)
+            return [MemoryRecord.from_hit(hit).to_row() for hit in hits]
+
+        generation = (await self._resident(agent_id)).generation
+        digest = hashlib.blake2b(canonical_text(query).encode(), digest_size=12).hexdigest()
+        key = f"{agent_id}:{generation}:{k}:{digest}"
+        rows = await self.cache.get_or_fetch(key, search, self.ttl)
+        return [MemoryRecord.from_row(row) for row in rows]
+
+    async def context(
+        self, agent_id: str, query: str, k: int = 5, recent: int | None = None
+    ) -> list[MemoryRecord]:
+        """
+        Memories for one generation call: relevant ones, then recent ones.
+
+        A memory that is both relevant and recent appears once, in the
+        relevant block.
+        """
+        self.stats.contexts += 1
+        # Sequential on purpose: on a buffer hit neither call suspends, and
+        # gather() would hand the loop to other tasks between them.
+        relevant = await self.recall(agent_id, query, k)
+        newest = await self.recent(agent_id, recent)
+        seen = {r.id for r in relevant}
+        return relevant + [r for r in newest if r.id not in seen]
+
+    # ------------------------------------------------------------------
+    # Prefetch
+    # ------------------------------------------------------------------
+
+    def prefetch(self, agent_id: str, query: str, k: int = 5) -> None:
+        """
+        Start ``recall()`` in the background.
+
+        A later ``recall()`` for the same key joins the in-flight search or
+        hits tier 1. Failures are counted and otherwise ignored; the real
+        call retries.
+        """
+        self.stats.prefetches += 1
+        task = asyncio.get_running_loop().create_task(self.recall(agent_id, query, k))
+        self._background.add(task)
+        task.add_done_callback(self._prefetched)
+
+    def _prefetched(self, task: asyncio.Task[Any]) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.stats.prefetch_errors += 1
+
+    def prefetch_tasks(self, tasks: Iterable[Task], k: int = 5) -> None:
+        """
+        Prefetch for tasks whose context names an ``agent_id``.
+
+        The query is the task's ``goal_description``. Pass this as
+        ``WorkerPool(on_lease=...)`` so recall overlaps queueing and skill
+        start-up instead of delaying generation.
+        """
+        for task in tasks:
+            agent_id = task.context.get("agent_id")
+            goal = task.context.get("goal_description")
+            if agent_id and goal:
+                self.prefetch(agent_id, goal, k)
+
+    async def wait_prefetched(self) -> None:
+        """Wait for outstanding prefetches (tests, shutdown)."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            **self.stats.as_dict(),
+            "agents": len(self._agents),
+            "recall": self.cache.report(),
+        }
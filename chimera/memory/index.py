@@ -0,0 +1,72 @@
+"""
+VectorIndex interface shared by the vector backends.
+
+An index stores ``(id, vector, metadata)`` entries and answers top-K
+cosine-similarity queries. Those queries can be restricted by equality
+filters on metadata fields, e.g. ``where={"agent_id": "a1"}``.
+``upsert`` replaces an entry with the same id. Scores are cosine
+similarities in [-1, 1], highest first.
+
+Backends:
+    NumpyVectorIndex - in-process int8 vectors with memory-mapped files.
+    Weaviate (research/SRS.md#2.2) plugs in behind the same methods.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Hit:
+    """One search result."""
+
+    id: str
+    score: float
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class VectorIndex(ABC):
+    """Top-K cosine search over vectors with metadata filters."""
+
+    dim: int
+
+    @abstractmethod
+    async def upsert(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        """Insert or replace entries in one batch; returns how many were written."""
+
+    @abstractmethod
+    async def delete(self, ids: Iterable[str]) -> int:
+        """Remove entries; returns how many existed."""
+
+    @abstractmethod
+    async def search(
+        self, queries: np.ndarray, k: int = 10, where: dict[str, Any] | None = None
+    ) -> list[list[Hit]]:
+        """Best ``k`` hits for each row of ``queries`` (n, dim), filtered by ``where``."""
+
+    @abstractmethod
+    async def count(self, where: dict[str, Any] | None = None) -> int:
+        """Number of entries, optionally only those matching ``where``."""
+
+    async def close(self) -> None:
+        """Release resources. The in-process backend has none to release."""
+
+
+def unit_rows(vectors: np.ndarray, dim: int) -> np.ndarray:
+    """``vectors`` as float32 (n, dim) rows scaled to unit length; zero rows stay zero."""
+    array = np.asarray(vectors, dtype=np.float32)
+    if array.ndim == 1:
+        array = array[None, :]
+    if array.ndim != 2 or array.shape[1] != dim:
+        raise ValueError(f"vectors must have shape (n, {dim}), got {array.shape}")
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    return array / np.where(norms > 0, norms, 1.0)
@@ -0,0 +1,472 @@
+"""
+In-process VectorIndex with int8 vectors and memory-mapped persistence.
+
+Storage
+    Each vector is scaled to unit length and stored as int8 codes, plus
+    one float32 scale per row (``codes * scale`` approximates the vector).
+    That is about a quarter of the float32 footprint. A score is the dot
+    product of the codes with the float32 query, times the scale.
+
+Segments
+    Rows written by ``flush()`` form the base segment, an ``.npy`` file
+    memory-mapped read-only on open. The OS pages codes in as searches touch
+    them and can drop them again under memory pressure. Rows upserted since
+    the last flush live in an in-RAM delta segment. Replacing or deleting a
+    base row only tombstones it. ``flush()`` compacts the live rows of both
+    segments into a new generation directory, then points ``CURRENT`` at it
+    with an atomic rename.
+
+Search
+    ``where`` equality filters on ``filterable`` fields resolve through
+    posting lists to candidate rows. Up to ``exact_below`` candidates are
+    scanned exactly. That covers persona recall, where each agent owns a few
+    thousand memories at most. Larger scans use an IVF partition if one is
+    trained (``nlist`` > 0): vectors are split into spherical k-means cells,
+    and the ``nprobe`` cells nearest each query are scanned. Raising
+    ``nprobe`` buys recall with latency.
+
+No method awaits, so each call is atomic with respect to other coroutines
+on the same event loop. Metadata must be JSON-serializable to be flushed.
+"""
+
+import json
+import os
+import shutil
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+from chimera.memory.index import Hit, VectorIndex, unit_rows
+
+DEFAULT_FILTERABLE: tuple[str, ...] = ("agent_id",)
+DEFAULT_EXACT_BELOW = 8192
+DEFAULT_NPROBE = 8
+DEFAULT_CAPACITY = 1024
+# train() wants at least this many live rows per cell, and samples up to
+# _TRAIN_SAMPLE_PER_CELL rows per cell for k-means.
+MIN_ROWS_PER_CELL = 16
+_TRAIN_SAMPLE_PER_CELL = 64
+_TRAIN_ITERATIONS = 12
+# Rows decoded to float32 at a time while scanning, flushing or training.
+_CHUNK = 32768
+_CURRENT = "CURRENT"
+
+
+def quantize(units: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(int8 codes, float32 scales) for unit rows; ``codes * scale`` ≈ row."""
+    peak = np.abs(units).max(axis=1)
+    scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+    codes = np.rint(units / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+class _Postings:
+    """Row sets per key, with cached sorted arrays for searching."""
+
+    def __init__(self) -> None:
+        self._sets: defaultdict[Hashable, set[int]] = defaultdict(set)
+        self._arrays: dict[Hashable, np.ndarray] = {}
+
+    def add(self, key: Hashable, row: int) -> None:
+        self._sets[key].add(row)
+        self._arrays.pop(key, None)
+
+    def discard(self, key: Hashable, row: int) -> None:
+        rows = self._sets.get(key)
+        if rows is None:
+            return
+        rows.discard(row)
+        self._arrays.pop(key, None)
+        if not rows:
+            del self._sets[key]
+
+    def rows(self, key: Hashable) -> np.ndarray:
+        array = self._arrays.get(key)
+        if array is None:
+            found = self._sets.get(key, ())
+            array = np.sort(np.fromiter(found, dtype=np.int64, count=len(found)))
+            self._arrays[key] = array
+        return array
+
+
+class NumpyVectorIndex(VectorIndex):
+    """
+    Vector index held in this process, optionally persisted under ``path``.
+
+    Args:
+        dim: Vector length.
+        path: Directory for ``flush()``. An existing index there is opened.
+        nlist: IVF cells; 0 scans exactly.
+        nprobe: IVF cells scanned per query.
+        filterable: Metadata fields ``where`` can filter on.
+        exact_below: Filtered searches with at most this many candidates
+            skip IVF and scan exactly.
+        capacity: Initial rows; grows as needed.
+        seed: Seed for IVF training.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        path: str | None = None,
+        *,
+        nlist: int = 0,
+        nprobe: int = DEFAULT_NPROBE,
+        filterable: Iterable[str] = DEFAULT_FILTERABLE,
+        exact_below: int = DEFAULT_EXACT_BELOW,
+        capacity: int = DEFAULT_CAPACITY,
+        seed: int = 0,
+    ):
+        self.dim = dim
+        self.path = os.path.abspath(path) if path is not None else None
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.filterable = frozenset(filterable)
+        self.exact_below = exact_below
+        self._rng = np.random.default_rng(seed)
+        self._generation = 0
+        self._reset(np.zeros((0, dim), dtype=np.int8), capacity)
+        if self.path is not None and os.path.exists(os.path.join(self.path, _CURRENT)):
+            self._load()
+
+    def _reset(self, base: np.ndarray, capacity: int) -> None:
+        """Empty every structure, keeping ``base`` as the base segment."""
+        rows = len(base) + capacity
+        self._base = base
+        self._delta = np.zeros((capacity, self.dim), dtype=np.int8)
+        self._scales = np.zeros(rows, dtype=np.float32)
+        self._alive = np.zeros(rows, dtype=bool)
+        self._cell = np.full(rows, -1, dtype=np.int32)
+        self._centroids: np.ndarray | None = None
+        self._ids: list[str] = []
+        self._meta: list[dict[str, Any] | None] = []
+        self._rows: dict[str, int] = {}
+        self._filters = _Postings()
+        self._cells = _Postings()
+
+    def _grow(self, rows: int) -> None:
+        """Make room for ``rows`` rows in total."""
+        if rows > len(self._scales):
+            size = max(rows, 2 * len(self._scales))
+            for name, fill in (("_scales", 0), ("_alive", False), ("_cell", -1)):
+                old = getattr(self, name)
+                grown = np.full(size, fill, dtype=old.dtype)
+                grown[: len(old)] = old
+                setattr(self, name, grown)
+        needed = rows - len(self._base)
+        if needed > len(self._delta):
+            grown = np.zeros((max(needed, 2 * len(self._delta)), self.dim), dtype=np.int8)
+            grown[: len(self._delta)] = self._delta
+            self._delta = grown
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._rows
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def memory_usage(self) -> dict[str, int]:
+        """Bytes of codes mapped from disk and held in RAM, and of per-row arrays."""
+        return {
+            "codes_mapped": int(self._base.nbytes),
+            "codes_ram": int(self._delta.nbytes),
+            "rows": int(self._scales.nbytes + self._alive.nbytes + self._cell.nbytes),
+        }
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def upsert(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Sequence[dict[str, Any]] | None = None,
+    ) -> int:
+        units = unit_rows(vectors, self.dim)
+        metadata = list(metadata) if metadata is not None else [{}] * len(ids)
+        if not len(ids) == len(units) == len(metadata):
+            raise ValueError("ids, vectors and metadata must have the same length")
+        # The last entry for an id in the batch wins.
+        latest = list({id: i for i, id in enumerate(ids)}.values())
+        units = units[latest]
+        self._remove(ids[i] for i in latest)
+
+        start = len(self._ids)
+        end = start + len(latest)
+        self._grow(end)
+        codes, scales = quantize(units)
+        self._delta[start - len(self._base) : end - len(self._base)] = codes
+        self._scales[start:end] = scales
+        self._alive[start:end] = True
+        if self._centroids is not None:
+            self._cell[start:end] = self._assign(units)
+        for row, i in enumerate(latest, start):
+            self._ids.append(ids[i])
+            self._meta.append(dict(metadata[i]))
+            self._rows[ids[i]] = row
+            self._index(row)
+        return len(latest)
+
+    async def delete(self, ids: Iterable[str]) -> int:
+        return self._remove(ids)
+
+    def _remove(self, ids: Iterable[str]) -> int:
+        removed = 0
+        for id in ids:
+            row = self._rows.pop(id, None)
+            if row is None:
+                continue
+            self._unindex(row)
+            self._alive[row] = False
+            self._meta[row] = None
+            removed += 1
+        return removed
+
+    def _index(self, row: int) -> None:
+        metadata = self._meta[row] or {}
+        for field in self.filterable & metadata.keys():
+            self._filters.add((field, metadata[field]), row)
+        if self._cell[row] >= 0:
+            self._cells.add(int(self._cell[row]), row)
+
+    def _unindex(self, row: int) -> None:
+        metadata = self._meta[row] or {}
+        for field in self.filterable & metadata.keys():
+            self._filters.discard((field, metadata[field]), row)
+        if self._cell[row] >= 0:
+            self._cells.discard(int(self._cell[row]), row)
+
+    # ------------------------------------------------------------------
+    # IVF
+    # ------------------------------------------------------------------
+
+    def train(self) -> None:
+        """
+        Partition the live rows into ``nlist`` cells with spherical k-means.
+        Rows upserted later are assigned to their nearest cell.
+        """
+        live = self._live_rows()
+        if self.nlist <= 0:
+            raise ValueError("train() needs nlist > 0")
+        if len(live) < self.nlist * MIN_ROWS_PER_CELL:
+            raise ValueError(f"train() needs at least {self.nlist * MIN_ROWS_PER_CELL} rows")
+        size = min(len(live), self.nlist * _TRAIN_SAMPLE_PER_CELL)
+        sample = self._decode(np.sort(self._rng.choice(live, size=size, replace=False)))
+        centroids = sample[self._rng.choice(size, size=self.nlist, replace=False)]
+        for _ in range(_TRAIN_ITERATIONS):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            onehot = np.zeros((self.nlist, size), dtype=np.float32)
+            onehot[assign, np.arange(size)] = 1.0
+            sums = onehot @ sample
+            empty = np.flatnonzero(onehot.sum(axis=1) == 0)
+            sums[empty] = sample[self._rng.choice(size, size=len(empty))]
+            centroids = unit_rows(sums, self.dim)
+        self._centroids = centroids
+        self._cells = _Postings()
+        for start in range(0, len(live), _CHUNK):
+            rows = live[start : start + _CHUNK]
+            self._cell[rows] = self._assign(self._decode(rows))
+        for row, cell in zip(live.tolist(), self._cell[live].tolist(), strict=True):
+            self._cells.add(cell, row)
+
+    def _assign(self, units: np.ndarray) -> np.ndarray:
+        assert self._centroids is not None
+        cells: np.ndarray = np.argmax(units @ self._centroids.T, axis=1).astype(np.int32)
+        return cells
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _live_rows(self) -> np.ndarray:
+        return np.flatnonzero(self._alive[: len(self._ids)])
+
+    def _codes(self, rows: np.ndarray) -> np.ndarray:
+        """int8 codes of ``rows`` from whichever segment holds them."""
+        base = len(self._base)
+        in_base = rows < base
+        codes: np.ndarray
+        if in_base.all():
+            codes = self._base[rows]
+            return codes
+        if not in_base.any():
+            codes = self._delta[rows - base]
+            return codes
+        codes = np.empty((len(rows), self.dim), dtype=np.int8)
+        codes[in_base] = self._base[rows[in_base]]
+        codes[~in_base] = self._delta[rows[~in_base] - base]
+        return codes
+
+    def _decode(self, rows: np.ndarray) -> np.ndarray:
+        return self._codes(rows).astype(np.float32) * self._scales[rows, None]
+
+    def _candidates(self, where: dict[str, Any] | None) -> np.ndarray | None:
+        """Rows matching every ``where`` filter; None means every live row."""
+        if not where:
+            return None
+        postings = []
+        for field, value in where.items():
+            if field not in self.filterable:
+                allowed = sorted(self.filterable)
+                raise ValueError(f"cannot filter on {field!r}; filterable fields: {allowed}")
+            postings.append(self._filters.rows((field, value)))
+        postings.sort(key=len)
+        rows = postings[0]
+        for other in postings[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows
+
+    def _scan(self, rows: np.ndarray, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Exact top-``k`` (rows, scores) among ``rows`` per query, best first."""
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, len(rows), _CHUNK):
+            part = rows[start : start + _CHUNK]
+            scores = (self._codes(part).astype(np.float32) @ queries.T).T * self._scales[part]
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            best_rows = np.concatenate([best_rows, np.broadcast_to(part, scores.shape)], axis=1)
+            if best_scores.shape[1] > k:
+                keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_rows = np.take_along_axis(best_rows, keep, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        # Rounding in the int8 codes can push a score just past 1.
+        best_scores = np.clip(np.take_along_axis(best_scores, order, 1), -1.0, 1.0)
+        return np.take_along_axis(best_rows, order, 1), best_scores
+
+    def _probe(
+        self, query: np.ndarray, k: int, allowed: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        assert self._centroids is not None
+        similarity = self._centroids @ query
+        nprobe = min(self.nprobe, len(similarity))
+        cells = np.argpartition(-similarity, nprobe - 1)[:nprobe]
+        rows = np.concatenate([self._cells.rows(int(cell)) for cell in cells])
+        if allowed is not None:
+            rows = rows[allowed[rows]]
+        found, scores = self._scan(rows, query[None, :], k)
+        return found[0], scores[0]
+
+    async def search(
+        self, queries: np.ndarray, k: int = 10, where: dict[str, Any] | None = None
+    ) -> list[list[Hit]]:
+        units = unit_rows(queries, self.dim)
+        if k <= 0:
+            return [[] for _ in units]
+        candidates = self._candidates(where)
+        exact = self._centroids is None or (
+            candidates is not None and len(candidates) <= self.exact_below
+        )
+        if exact:
+            rows = self._live_rows() if candidates is None else candidates
+            found, scores = self._scan(rows, units, k)
+            pairs: Iterable[tuple[list[int], list[float]]]
+            pairs = zip(found.tolist(), scores.tolist(), strict=True)
+        else:
+            allowed = None
+            if candidates is not None:
+                allowed = np.zeros(len(self._ids), dtype=bool)
+                allowed[candidates] = True
+            probes = [self._probe(query, k, allowed) for query in units]
+            pairs = ((rows.tolist(), scores.tolist()) for rows, scores in probes)
+        return [
+            [
+                Hit(self._ids[row], score, dict(self._meta[row] or {}))
+                for row, score in zip(rows, scores, strict=True)
+            ]
+            for rows, scores in pairs
+        ]
+
+    async def count(self, where: dict[str, Any] | None = None) -> int:
+        candidates = self._candidates(where)
+        return len(self._rows) if candidates is None else len(candidates)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    async def flush(self) -> None:
+        """
+        Write the live rows as a new generation under ``path`` and reopen it
+        memory-mapped. Trains IVF first if ``nlist`` is set and enough rows
+        have accumulated.
+        """
+        if self.path is None:
+            raise ValueError("flush() needs a path")
+        if self.nlist and not self.trained and len(self) >= self.nlist * MIN_ROWS_PER_CELL:
+            self.train()
+        live = self._live_rows()
+        generation = self._generation + 1
+        name = f"gen-{generation:06d}"
+        directory = os.path.join(self.path, name)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+
+        codes = np.lib.format.open_memmap(
+            os.path.join(directory, "codes.npy"),
+            mode="w+",
+            dtype=np.int8,
+            shape=(len(live), self.dim),
+        )
+        for start in range(0, len(live), _CHUNK):
+            codes[start : start + _CHUNK] = self._codes(live[start : start + _CHUNK])
+        codes.flush()
+        del codes
+        np.save(os.path.join(directory, "scales.npy"), self._scales[live])
+        np.save(os.path.join(directory, "cells.npy"), self._cell[live])
+        if self._centroids is not None:
+            np.save(os.path.join(directory, "centroids.npy"), self._centroids)
+        with open(os.path.join(directory, "records.jsonl"), "w", encoding="utf-8") as f:
+            for row in live.tolist():
+                f.write(json.dumps([self._ids[row], self._meta[row]]) + "\n")
+        with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "count": len(live)}, f)
+
+        pointer = os.path.join(self.path, _CURRENT)
+        with open(pointer + ".tmp", "w", encoding="utf-8") as f:
+            f.write(name)
+        os.replace(pointer + ".tmp", pointer)
+        for entry in os.listdir(self.path):
+            if entry.startswith("gen-") and entry != name:
+                shutil.rmtree(os.path.join(self.path, entry), ignore_errors=True)
+        self._load()
+
+    def _load(self) -> None:
+        assert self.path is not None
+        with open(os.path.join(self.path, _CURRENT), encoding="utf-8") as f:
+            name = f.read().strip()
+        directory = os.path.join(self.path, name)
+        with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest["dim"] != self.dim:
+            raise ValueError(f"index at {self.path} has dim {manifest['dim']}, not {self.dim}")
+
+        base = np.load(os.path.join(directory, "codes.npy"), mmap_mode="r")
+        self._reset(base, DEFAULT_CAPACITY)
+        self._generation = int(name.split("-")[1])
+        count = len(base)
+        self._scales[:count] = np.load(os.path.join(directory, "scales.npy"))
+        self._cell[:count] = np.load(os.path.join(directory, "cells.npy"))
+        self._alive[:count] = True
+        centroids = os.path.join(directory, "centroids.npy")
+        if os.path.exists(centroids):
+            self._centroids = np.load(centroids)
+            self.nlist = len(self._centroids)
+        with open(os.path.join(directory, "records.jsonl"), encoding="utf-8") as f:
+            for row, line in enumerate(f):
+                id, metadata = json.loads(line)
+                self._ids.append(id)
+                self._meta.append(metadata)
+                self._rows[id] = row
+                self._index(row)
+
+    async def close(self) -> None:
+        self._base = np.zeros((0, self.dim), dtype=np.int8)
+        self._reset(self._base, 0)
@@ -0,0 +1,78 @@
+"""
+Long-term semantic memory for agents (research/SRS.md#2.2, Weaviate in production).
+
+``SemanticMemory`` keeps each agent's memories as embedded text in a
+``VectorIndex``, tagged with ``agent_id``. ``recall()`` searches only that
+agent's memories. With the default ``NumpyVectorIndex`` that is an exact
+scan of a few thousand int8 rows per agent, so one node serves persona
+recall for many agents without an external service.
+"""
+
+import time
+import uuid
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from chimera.memory.embed import Embedder, HashingEmbedder
+from chimera.memory.index import Hit, VectorIndex
+from chimera.memory.numpy_index import NumpyVectorIndex
+
+
+class SemanticMemory:
+    """
+    Per-agent memories over a vector index.
+
+    Args:
+        index: Vector backend; an in-memory ``NumpyVectorIndex`` by default.
+        embedder: Turns text into vectors; ``HashingEmbedder`` by default.
+    """
+
+    def __init__(self, index: VectorIndex | None = None, embedder: Embedder | None = None):
+        self.embedder: Embedder = embedder or HashingEmbedder()
+        self.index: VectorIndex = index or NumpyVectorIndex(self.embedder.dim)
+        if self.index.dim != self.embedder.dim:
+            raise ValueError("index and embedder dimensions differ")
+
+    async def remember(
+        self,
+        agent_id: str,
+        texts: Sequence[str],
+        metadata: Sequence[dict[str, Any]] | None = None,
+        ids: Sequence[str] | None = None,
+    ) -> list[str]:
+        """Store memories for one agent in one batch; returns their ids."""
+        ids = list(ids) if ids is not None else [str(uuid.uuid4()) for _ in texts]
+        extra = metadata if metadata is not None else [{}] * len(texts)
+        now = time.time()
+        records = [
+            {"created_at": now, **meta, "agent_id": agent_id, "text": text}
+            for text, meta in zip(texts, extra, strict=True)
+        ]
+        await self.index.upsert(ids, await self.embedder.embed(texts), records)
+        return ids
+
+    async def recall(
+        self, agent_id: str, query: str, k: int = 5, where: dict[str, Any] | None = None
+    ) -> list[Hit]:
+        """The agent's ``k`` memories most similar to ``query``."""
+        [hits] = await self.recall_many(agent_id, [query], k, where)
+        return hits
+
+    async def recall_many(
+        self,
+        agent_id: str,
+        queries: Sequence[str],
+        k: int = 5,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[Hit]]:
+        """``recall()`` for several queries with one embedding call and one search."""
+        if not queries:
+            return []
+        vectors = await self.embedder.embed(queries)
+        return await self.index.search(vectors, k, {**(where or {}), "agent_id": agent_id})
+
+    async def forget(self, ids: Iterable[str]) -> int:
+        return await self.index.delete(ids)
+
+    async def count(self, agent_id: str) -> int:
+        return await self.index.count({"agent_id": agent_id})
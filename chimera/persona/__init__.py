@@ -0,0 +1,21 @@
+"""
+Agent personas from SOUL.md files.
+
+``compile_soul()`` turns one SOUL.md into an immutable ``Persona`` with its
+system prompt prefix and constraint set precomputed. ``PersonaRegistry``
+holds every persona under a directory as a ``PersonaSnapshot``, reloads
+changed files by mtime, and can persist the snapshot for other processes.
+
+Reference: research/SRS.md#4.1-cognitive-core-persona-management-fr-1.0-1.2
+"""
+
+from chimera.persona.registry import PersonaRegistry, PersonaSnapshot
+from chimera.persona.soul import Persona, PersonaError, compile_soul
+
+__all__ = [
+    "Persona",
+    "PersonaError",
+    "PersonaRegistry",
+    "PersonaSnapshot",
+    "compile_soul",
+]
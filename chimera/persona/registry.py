@@ -0,0 +1,225 @@
+"""
+Persona registry: every SOUL.md under one directory, compiled once.
+
+``PersonaRegistry.snapshot`` is an immutable ``PersonaSnapshot``. Readers
+take it without locking and keep using whatever snapshot they hold.
+``refresh()`` re-stats the files and recompiles only those whose mtime or
+size changed, then swaps in a new snapshot (copy-on-write). ``watch()``
+runs ``refresh()`` on an interval for hot reload.
+
+Sharing across processes: snapshots pickle, file stamps included. With
+``cache_path`` set, the registry writes the snapshot there after every
+change. A new process (a spawned worker or a restarted node) loads it and
+re-parses only the files that changed since, so startup costs a directory
+scan rather than one YAML parse per persona. The cache is unpickled, so
+treat it like code: keep it somewhere only the service can write.
+"""
+
+import asyncio
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections.abc import Iterator
+
+from chimera.persona.soul import Persona, PersonaError, compile_soul
+
+logger = logging.getLogger(__name__)
+
+SOUL_FILE = "SOUL.md"
+# Bump when Persona or PersonaSnapshot change shape; older caches are ignored.
+CACHE_VERSION = 1
+
+Stamp = tuple[int, int]  # (mtime_ns, size)
+
+
+def _index(files: dict[str, tuple[Stamp, Persona]]) -> tuple[dict[str, Persona], dict[str, str]]:
+    """id -> persona, first path in sorted order winning; and the losers' errors."""
+    by_id: dict[str, Persona] = {}
+    duplicates = {}
+    for path in sorted(files):
+        persona = files[path][1]
+        owner = by_id.setdefault(persona.id, persona)
+        if owner is not persona:
+            duplicates[path] = f"duplicate id {persona.id!r} (also in {owner.source})"
+    return by_id, duplicates
+
+
+class PersonaSnapshot:
+    """An immutable id -> ``Persona`` view of the registry at one version."""
+
+    __slots__ = ("version", "_files", "_by_id")
+
+    def __init__(
+        self,
+        version: int = 0,
+        files: dict[str, tuple[Stamp, Persona]] | None = None,
+        by_id: dict[str, Persona] | None = None,
+    ):
+        self.version = version
+        self._files = files or {}
+        self._by_id = by_id or {}
+
+    def get(self, persona_id: str) -> Persona | None:
+        return self._by_id.get(persona_id)
+
+    def __getitem__(self, persona_id: str) -> Persona:
+        return self._by_id[persona_id]
+
+    def __contains__(self, persona_id: object) -> bool:
+        return persona_id in self._by_id
+
+    def __iter__(self) -> Iterator[Persona]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __getstate__(self) -> tuple[int, int, dict[str, tuple[Stamp, Persona]]]:
+        # The id index is rebuilt on load; only the files are stored.
+        return CACHE_VERSION, self.version, self._files
+
+    def __setstate__(self, state: tuple[int, int, dict[str, tuple[Stamp, Persona]]]) -> None:
+        cache_version, self.version, self._files = state
+        if cache_version != CACHE_VERSION:
+            raise ValueError(f"persona snapshot version {cache_version} != {CACHE_VERSION}")
+        self._by_id, _ = _index(self._files)
+
+
+class PersonaRegistry:
+    """
+    Compiled personas for ``<root>/<agent>/SOUL.md``.
+
+    Args:
+        root: Directory holding one sub-directory per agent.
+        cache_path: Optional pickled snapshot to start from and keep current.
+
+    A file that fails to parse keeps its last good persona (or is left out
+    if it never parsed) and is listed in ``errors``. When two files declare
+    the same id, the first path in sorted order wins.
+    """
+
+    def __init__(self, root: str, cache_path: str | None = None):
+        self.root = root
+        self.cache_path = cache_path
+        self.errors: dict[str, str] = {}
+        # path -> (stamp, message) of files whose current version fails to parse.
+        self._failed: dict[str, tuple[Stamp, str]] = {}
+        self._duplicates: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._snapshot = self._load_cache() or PersonaSnapshot()
+        _, self._duplicates = _index(self._snapshot._files)
+        self.refresh()
+
+    @property
+    def snapshot(self) -> PersonaSnapshot:
+        return self._snapshot
+
+    def get(self, persona_id: str) -> Persona | None:
+        return self._snapshot.get(persona_id)
+
+    def __getitem__(self, persona_id: str) -> Persona:
+        return self._snapshot[persona_id]
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> dict[str, Stamp]:
+        stamps = {}
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                path = os.path.join(entry.path, SOUL_FILE)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def refresh(self) -> bool:
+        """Recompile changed SOUL.md files; True if a new snapshot was published."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> bool:
+        old = self._snapshot._files
+        stamps = self._scan()
+        files: dict[str, tuple[Stamp, Persona]] = {}
+        changed = False
+        for path, stamp in stamps.items():
+            previous = old.get(path)
+            if previous is not None and previous[0] == stamp:
+                files[path] = previous
+                continue
+            failed = self._failed.get(path)
+            if failed is not None and failed[0] == stamp:
+                if previous is not None:
+                    files[path] = previous
+                continue
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    persona = compile_soul(handle.read(), path)
+            except (OSError, UnicodeDecodeError, PersonaError) as exc:
+                logger.warning("keeping previous persona for %s: %s", path, exc)
+                self._failed[path] = (stamp, str(exc))
+                if previous is not None:
+                    files[path] = previous
+                continue
+            self._failed.pop(path, None)
+            files[path] = (stamp, persona)
+            changed = True
+        for path in self._failed.keys() - stamps.keys():
+            del self._failed[path]
+        changed = changed or old.keys() != files.keys()
+        if changed:
+            by_id, self._duplicates = _index(files)
+            self._snapshot = PersonaSnapshot(self._snapshot.version + 1, files, by_id)
+            self._save_cache()
+        self.errors = {path: message for path, (_, message) in self._failed.items()}
+        self.errors.update(self._duplicates)
+        return changed
+
+    async def watch(self, interval: float = 2.0) -> None:
+        """Hot reload: ``refresh()`` every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await asyncio.to_thread(self.refresh):
+                    logger.info("personas reloaded (version %d)", self._snapshot.version)
+            except OSError as exc:
+                logger.warning("persona refresh failed: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Snapshot cache
+    # ------------------------------------------------------------------
+
+    def _load_cache(self) -> PersonaSnapshot | None:
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "rb") as handle:
+                snapshot = pickle.load(handle)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError) as exc:
+            logger.warning("ignoring persona cache %s: %s", self.cache_path, exc)
+            return None
+        return snapshot if isinstance(snapshot, PersonaSnapshot) else None
+
+    def _save_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".personas-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(self._snapshot, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
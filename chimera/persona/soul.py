@@ -0,0 +1,126 @@
+"""
+SOUL.md parsing and compilation.
+
+A SOUL.md starts with YAML front matter between ``---`` lines (see
+agents/README.md); the markdown after it is notes for humans and is not
+part of the persona. ``compile_soul()`` validates the front matter and
+turns it into a ``Persona``: the fields, plus the two things every task
+needs from them, the system prompt prefix and the canonical constraint set.
+Both are computed once here, not per task.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import yaml
+
+from chimera.cache.fingerprint import canonical_text
+
+# libyaml's loader is several times faster than the pure Python one.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+FENCE = "---"
+
+
+class PersonaError(ValueError):
+    """A SOUL.md that cannot be turned into a persona."""
+
+    def __init__(self, source: str, message: str):
+        super().__init__(f"{source}: {message}")
+        self.source = source
+
+
+@dataclass(frozen=True, slots=True)
+class Persona:
+    """
+    One compiled persona. Immutable and picklable, so snapshots can be
+    shared between threads as-is and sent to worker processes.
+
+    ``prompt_prefix`` is the stable head of every system prompt for this
+    persona; callers append task-specific instructions after it.
+    ``constraints`` holds the directives in canonical form for membership
+    checks against a task's ``persona_constraints``.
+    """
+
+    id: str
+    name: str
+    voice_traits: tuple[str, ...]
+    directives: tuple[str, ...]
+    backstory: str
+    prompt_prefix: str
+    constraints: frozenset[str]
+    source: str = ""
+
+    def requires(self, constraint: str) -> bool:
+        return canonical_text(constraint) in self.constraints
+
+
+def front_matter(text: str, source: str = "<string>") -> dict[str, Any]:
+    """The YAML front matter of a SOUL.md as a dict."""
+    lines = text.lstrip("\ufeff").splitlines()
+    if not lines or lines[0].strip() != FENCE:
+        raise PersonaError(source, "missing front matter")
+    try:
+        end = next(i for i in range(1, len(lines)) if lines[i].strip() == FENCE)
+    except StopIteration:
+        raise PersonaError(source, "front matter is not closed") from None
+    try:
+        data = yaml.load("\n".join(lines[1:end]), Loader=_Loader)
+    except yaml.YAMLError as exc:
+        raise PersonaError(source, f"invalid YAML: {exc}") from None
+    if not isinstance(data, dict):
+        raise PersonaError(source, "front matter must be a mapping")
+    return data
+
+
+def _strings(data: dict[str, Any], field: str, source: str) -> tuple[str, ...]:
+    value = data.get(field)
+    if not isinstance(value, list) or not value:
+        raise PersonaError(source, f"{field} must be a non-empty list")
+    if not all(isinstance(item, str) and item.strip() for item in value):
+        raise PersonaError(source, f"{field} entries must be non-empty strings")
+    return tuple(item.strip() for item in value)
+
+
+def prompt_prefix(
+    name: str,
+    persona_id: str,
+    voice_traits: tuple[str, ...],
+    directives: tuple[str, ...],
+    backstory: str,
+) -> str:
+    """The system prompt head for a persona."""
+    lines = [
+        f"You are {name} (agent {persona_id}).",
+        f"Voice: {', '.join(voice_traits)}.",
+        "Directives (never break these):",
+        *(f"- {directive}" for directive in directives),
+    ]
+    if backstory:
+        lines += ["Backstory:", backstory]
+    return "\n".join(lines) + "\n"
+
+
+def compile_soul(text: str, source: str = "<string>") -> Persona:
+    """Parse and validate a SOUL.md and compile it into a ``Persona``."""
+    data = front_matter(text, source)
+    for field in ("name", "id"):
+        if not isinstance(data.get(field), str) or not data[field].strip():
+            raise PersonaError(source, f"{field} must be a non-empty string")
+    backstory = data.get("backstory") or ""
+    if not isinstance(backstory, str):
+        raise PersonaError(source, "backstory must be a string")
+    name, persona_id = data["name"].strip(), data["id"].strip()
+    voice_traits = _strings(data, "voice_traits", source)
+    directives = _strings(data, "directives", source)
+    backstory = backstory.strip()
+    return Persona(
+        id=persona_id,
+        name=name,
+        voice_traits=voice_traits,
+        directives=directives,
+        backstory=backstory,
+        prompt_prefix=prompt_prefix(name, persona_id, voice_traits, directives, backstory),
+        constraints=frozenset(canonical_text(d) for d in directives),
+        source=source,
+    )
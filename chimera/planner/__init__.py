@@ -0,0 +1,26 @@
+"""
+Planner: decomposes goals into task DAGs and executes them.
+
+Independent branches run in parallel, ready nodes are ordered by critical
+path, and re-running a plan after ``TaskGraph.update()`` only re-executes
+the changed node's downstream subgraph.
+
+Reference: research/SRS.md#3.1.1-the-planner-strategist
+"""
+
+from chimera.planner.graph import GraphError, Ref, TaskGraph, TaskNode
+from chimera.planner.pipeline import content_pipeline
+from chimera.planner.scheduler import DagScheduler, NodeResult, NodeStatus, PlanRun, skill_runner
+
+__all__ = [
+    "DagScheduler",
+    "GraphError",
+    "NodeResult",
+    "NodeStatus",
+    "PlanRun",
+    "Ref",
+    "TaskGraph",
+    "TaskNode",
+    "content_pipeline",
+    "skill_runner",
+]
@@ -0,0 +1,219 @@
+"""
+Task DAG built by the Planner.
+
+A node is one skill call. Inputs can contain ``Ref(node_id, path)``
+placeholders, which are replaced with a field of an upstream node's result
+when the node is dispatched. Refs also add the dependency edge, so
+``after=`` is only needed for ordering-only edges.
+
+Every node carries a version. ``update()`` bumps it, and the scheduler
+reuses a previous result only when the node and all of its upstream nodes
+still have the versions that produced it. Changing one node therefore
+re-runs just that node and its downstream subgraph.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+# Rough per-skill durations (seconds) used to rank the critical path before
+# any real timings are observed.
+DEFAULT_ESTIMATES_S: dict[str, float] = {
+    "fetch_trends": 2.0,
+    "download_video": 5.0,
+    "transcribe_audio": 8.0,
+    "generate_caption": 1.5,
+    "safety_check": 0.5,
+    "post_content": 1.0,
+}
+FALLBACK_ESTIMATE_S = 1.0
+
+
+class GraphError(ValueError):
+    """The graph has a cycle, a duplicate id or a dangling dependency."""
+
+
+@dataclass(frozen=True)
+class Ref:
+    """
+    The value at ``path`` (dotted; list indexes allowed) in a node's result.
+
+    A ``{field}`` part is replaced by that field of the same result, so
+    ``captions.{best_choice}.text`` follows the caption the skill chose.
+    """
+
+    node_id: str
+    path: str = ""
+
+    def resolve(self, result: dict[str, Any]) -> Any:
+        value: Any = result
+        for part in self.path.split(".") if self.path else ():
+            if part.startswith("{") and part.endswith("}"):
+                part = str(Ref(self.node_id, part[1:-1]).resolve(result))
+            value = value[int(part)] if isinstance(value, list) else value[part]
+        return value
+
+
+def _refs(value: Any) -> Iterator[Ref]:
+    if isinstance(value, Ref):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _refs(item)
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from _refs(item)
+
+
+def resolve_refs(value: Any, results: dict[str, dict[str, Any]]) -> Any:
+    """Copy of ``value`` with every Ref replaced by the referenced result."""
+    if isinstance(value, Ref):
+        return value.resolve(results[value.node_id])
+    if isinstance(value, dict):
+        return {key: resolve_refs(item, results) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [resolve_refs(item, results) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class TaskNode:
+    """
+    One skill call in the DAG.
+
+    ``when`` is an optional Ref to a boolean; the node is skipped when it
+    resolves falsy (e.g. post only if the safety check passed).
+    """
+
+    node_id: str
+    task_type: str
+    input: dict[str, Any] = field(default_factory=dict)
+    after: tuple[str, ...] = ()
+    when: Ref | None = None
+    estimate: float | None = None
+    version: int = 0
+
+    @property
+    def depends_on(self) -> frozenset[str]:
+        refs = {ref.node_id for ref in _refs(self.input)}
+        if self.when is not None:
+            refs.add(self.when.node_id)
+        return frozenset(refs).union(self.after)
+
+
+class TaskGraph:
+    """Mutable DAG of TaskNodes."""
+
+    def __init__(self, nodes: Iterable[TaskNode] = ()):
+        self.nodes: dict[str, TaskNode] = {}
+        for node in nodes:
+            self.add_node(node)
+
+    def add(
+        self,
+        node_id: str,
+        task_type: str,
+        input: dict[str, Any] | None = None,
+        *,
+        after: Iterable[str] = (),
+        when: Ref | None = None,
+        estimate: float | None = None,
+    ) -> TaskNode:
+        node = TaskNode(node_id, task_type, dict(input or {}), tuple(after), when, estimate)
+        return self.add_node(node)
+
+    def add_node(self, node: TaskNode) -> TaskNode:
+        if node.node_id in self.nodes:
+            raise GraphError(f"duplicate node id {node.node_id!r}")
+        self.nodes[node.node_id] = node
+        return node
+
+    def update(self, node_id: str, **changes: Any) -> set[str]:
+        """
+        Change a node's fields and bump its version.
+
+        Returns the ids that will re-run: the node and everything downstream.
+        """
+        node = self.nodes[node_id]
+        if "after" in changes:
+            changes["after"] = tuple(changes["after"])
+        self.nodes[node_id] = replace(node, **changes, version=node.version + 1)
+        return {node_id} | self.downstream(node_id)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+
+    def children(self) -> dict[str, list[str]]:
+        out: dict[str, list[str]] = {node_id: [] for node_id in self.nodes}
+        for node in self.nodes.values():
+            for parent in node.depends_on:
+                if parent not in self.nodes:
+                    raise GraphError(f"{node.node_id!r} depends on unknown node {parent!r}")
+                out[parent].append(node.node_id)
+        return out
+
+    def topological_order(self) -> list[str]:
+        """Kahn's algorithm; raises GraphError on a cycle."""
+        children = self.children()
+        indegree = {node_id: len(node.depends_on) for node_id, node in self.nodes.items()}
+        ready = [node_id for node_id, n in indegree.items() if n == 0]
+        order = []
+        while ready:
+            node_id = ready.pop()
+            order.append(node_id)
+            for child in children[node_id]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        if len(order) != len(self.nodes):
+            stuck = sorted(set(self.nodes) - set(order))
+            raise GraphError(f"cycle among {stuck}")
+        return order
+
+    def downstream(self, node_id: str) -> set[str]:
+        """Every node reachable from ``node_id`` (excluding itself)."""
+        children = self.children()
+        seen: set[str] = set()
+        stack = list(children[node_id])
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(children[current])
+        return seen
+
+    def rank(self, estimates: dict[str, float] | None = None) -> dict[str, float]:
+        """
+        Length of the longest path from each node to a sink, including the
+        node's own estimate. The ready node with the highest rank sits on the
+        critical path and is started first.
+        """
+        estimates = {**DEFAULT_ESTIMATES_S, **(estimates or {})}
+        children = self.children()
+        rank: dict[str, float] = {}
+        for node_id in reversed(self.topological_order()):
+            node = self.nodes[node_id]
+            own = node.estimate
+            if own is None:
+                own = estimates.get(node.task_type, FALLBACK_ESTIMATE_S)
+            rank[node_id] = own + max((rank[c] for c in children[node_id]), default=0.0)
+        return rank
+
+    def critical_path(self, estimates: dict[str, float] | None = None) -> list[str]:
+        """Node ids along the longest estimated path from a source to a sink."""
+        rank = self.rank(estimates)
+        children = self.children()
+        roots = [n for n, node in self.nodes.items() if not node.depends_on]
+        if not roots:
+            return []
+        path = [max(roots, key=rank.__getitem__)]
+        while children[path[-1]]:
+            path.append(max(children[path[-1]], key=rank.__getitem__))
+        return path
@@ -0,0 +1,90 @@
+"""
+Canonical content DAG: fetch -> caption -> safety -> post, per trend.
+
+With ``video_urls``, branch ``i`` captions the transcript of video ``i``
+(download -> transcribe) instead of the trend title. Every branch is
+independent, so downloads, transcriptions and caption variations for
+different trends all run at the same time. Safety and post use the caption
+the caption skill ranked best (``best_choice``), not the first variation.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from chimera.planner.graph import Ref, TaskGraph
+
+
+def content_pipeline(
+    trends_request: dict[str, Any],
+    *,
+    persona: str,
+    platform: str,
+    branches: int = 1,
+    variations: int = 1,
+    video_urls: Sequence[str] = (),
+    output_dir: str = "/tmp/chimera",
+) -> TaskGraph:
+    """Build the per-trend content DAG; node ids are ``<stage>:<i>``."""
+    graph = TaskGraph()
+    graph.add("trends", "fetch_trends", {**trends_request, "limit": max(branches, 1)})
+    for i in range(branches):
+        if i < len(video_urls):
+            graph.add(
+                f"download:{i}",
+                "download_video",
+                {
+                    "url": video_urls[i],
+                    "platform": platform,
+                    "output_path": f"{output_dir}/video-{i}.mp4",
+                },
+            )
+            graph.add(
+                f"transcribe:{i}",
+                "transcribe_audio",
+                {
+                    "filepath": Ref(f"download:{i}", "filepath"),
+                    "language": "en-US",
+                    "model": "base",
+                },
+            )
+            transcript = Ref(f"transcribe:{i}", "transcript")
+            media: list[Any] = [Ref(f"download:{i}", "filepath")]
+        else:
+            transcript = Ref("trends", f"trends.{i}.title")
+            media = []
+        caption = f"caption:{i}"
+        graph.add(
+            caption,
+            "generate_caption",
+            {
+                "transcript": transcript,
+                "persona": persona,
+                "platform": platform,
+                "include_hashtags": True,
+                "variations": variations,
+            },
+        )
+        graph.add(
+            f"safety:{i}",
+            "safety_check",
+            {
+                "content": Ref(caption, "captions.{best_choice}.text"),
+                "context": {},
+                "check_types": ["toxicity", "spam"],
+            },
+        )
+        graph.add(
+            f"post:{i}",
+            "post_content",
+            {
+                "content": {
+                    "text": Ref(caption, "captions.{best_choice}.text"),
+                    "media": media,
+                    "hashtags": Ref(caption, "captions.{best_choice}.hashtags"),
+                },
+                "platform": platform,
+                "schedule": None,
+            },
+            when=Ref(f"safety:{i}", "is_safe"),
+        )
+    return graph
@@ -0,0 +1,195 @@
+"""
+DAG execution for the Planner.
+
+Nodes start as soon as all their upstream nodes finish, up to
+``max_parallel`` at once. When more nodes are ready than there are slots,
+the one with the longest estimated path to the end of the graph goes first
+(critical-path list scheduling). Starting the long chain early is what
+bounds end-to-end latency; short branches fill the gaps around it.
+
+Estimates start from ``DEFAULT_ESTIMATES_S``. After each run they move
+towards the observed durations per task_type (exponential moving average).
+
+A failed node does not stop the run. Its downstream subgraph is skipped and
+independent branches carry on. Passing the previous ``PlanRun`` back in
+re-uses every result whose node (and upstream) version is unchanged.
+"""
+
+import asyncio
+import heapq
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
+from typing import Any
+
+from chimera.planner.graph import TaskGraph, TaskNode, resolve_refs
+from chimera.runtime import SkillDispatcher
+from skills.base import BaseSkill
+
+Runner = Callable[[TaskNode, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+DEFAULT_MAX_PARALLEL = 16
+ESTIMATE_SMOOTHING = 0.3
+
+
+class NodeStatus(StrEnum):
+    SUCCESS = "success"
+    ERROR = "error"
+    SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class NodeResult:
+    node_id: str
+    status: NodeStatus
+    result: dict[str, Any]
+    version: int
+    elapsed: float = 0.0
+    reused: bool = False
+
+
+@dataclass
+class PlanRun:
+    """Outcome of one ``DagScheduler.run()``."""
+
+    nodes: dict[str, NodeResult]
+    elapsed: float
+    executed: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(node.status is not NodeStatus.ERROR for node in self.nodes.values())
+
+    def result(self, node_id: str) -> dict[str, Any]:
+        return self.nodes[node_id].result
+
+    def failed(self) -> list[str]:
+        return [n for n, node in self.nodes.items() if node.status is NodeStatus.ERROR]
+
+
+def skill_runner(dispatcher: SkillDispatcher | None = None) -> Runner:
+    """Runner that executes each node's skill in-process."""
+    dispatcher = dispatcher or SkillDispatcher()
+
+    async def run(node: TaskNode, input_data: dict[str, Any]) -> dict[str, Any]:
+        return await dispatcher.run(node.task_type, input_data)
+
+    return run
+
+
+class DagScheduler:
+    """
+    Executes TaskGraphs.
+
+    Args:
+        runner: Awaited with ``(node, resolved_input)``; returns the node's
+            result dict. Defaults to running skills in-process.
+        max_parallel: Most nodes in flight at once.
+        estimates: task_type -> seconds, seeding the critical-path ranks.
+    """
+
+    def __init__(
+        self,
+        runner: Runner | None = None,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+        estimates: dict[str, float] | None = None,
+    ):
+        self.runner = runner or skill_runner()
+        self.max_parallel = max_parallel
+        self.estimates: dict[str, float] = dict(estimates or {})
+
+    async def run(self, graph: TaskGraph, previous: PlanRun | None = None) -> PlanRun:
+        start = time.monotonic()
+        order = graph.topological_order()
+        children = graph.children()
+        rank = graph.rank(self.estimates)
+
+        results: dict[str, NodeResult] = {}
+        for node_id in order:
+            reusable = self._reusable(graph.nodes[node_id], previous, results)
+            if reusable is not None:
+                results[node_id] = reusable
+
+        waiting = {
+            node_id: sum(1 for p in graph.nodes[node_id].depends_on if p not in results)
+            for node_id in order
+            if node_id not in results
+        }
+        ready: list[tuple[float, str]] = []
+        for node_id, count in waiting.items():
+            if count == 0:
+                heapq.heappush(ready, (-rank[node_id], node_id))
+
+        run = PlanRun(results, 0.0)
+        running: dict[asyncio.Task[NodeResult], str] = {}
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_parallel:
+                    _, node_id = heapq.heappop(ready)
+                    run.executed.append(node_id)
+                    job = asyncio.create_task(self._run_node(graph.nodes[node_id], results))
+                    running[job] = node_id
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for job in done:
+                    node_id = running.pop(job)
+                    results[node_id] = job.result()
+                    self._observe(graph.nodes[node_id], results[node_id])
+                    for child in children[node_id]:
+                        waiting[child] -= 1
+                        if waiting[child] == 0:
+                            heapq.heappush(ready, (-rank[child], child))
+        finally:
+            for job in running:
+                job.cancel()
+        run.elapsed = time.monotonic() - start
+        return run
+
+    @staticmethod
+    def _reusable(
+        node: TaskNode, previous: PlanRun | None, results: dict[str, NodeResult]
+    ) -> NodeResult | None:
+        if previous is None:
+            return None
+        old = previous.nodes.get(node.node_id)
+        if old is None or old.version != node.version or old.status is NodeStatus.ERROR:
+            return None
+        # Every upstream result must itself be reused, or its output may differ.
+        if not all(p in results and results[p].reused for p in node.depends_on):
+            return None
+        return replace(old, reused=True)
+
+    async def _run_node(self, node: TaskNode, results: dict[str, NodeResult]) -> NodeResult:
+        upstream = {p: results[p] for p in node.depends_on}
+        blocked = sorted(p for p, r in upstream.items() if r.status is not NodeStatus.SUCCESS)
+        if blocked:
+            return self._skipped(node, f"upstream did not succeed: {', '.join(blocked)}")
+        outputs = {p: r.result for p, r in upstream.items()}
+        started = time.monotonic()
+        try:
+            if node.when is not None and not node.when.resolve(outputs[node.when.node_id]):
+                return self._skipped(node, f"condition {node.when.node_id}.{node.when.path} false")
+            result = await self.runner(node, resolve_refs(node.input, outputs))
+        except Exception as exc:
+            result = BaseSkill.error_response(
+                "EXECUTION_FAILED",
+                f"{node.node_id} failed: {exc}",
+                details={"exception": type(exc).__name__},
+            )
+        status = NodeStatus.ERROR if result.get("status") == "error" else NodeStatus.SUCCESS
+        return NodeResult(node.node_id, status, result, node.version, time.monotonic() - started)
+
+    @staticmethod
+    def _skipped(node: TaskNode, reason: str) -> NodeResult:
+        return NodeResult(node.node_id, NodeStatus.SKIPPED, {"reason": reason}, node.version)
+
+    def _observe(self, node: TaskNode, outcome: NodeResult) -> None:
+        if outcome.status is not NodeStatus.SUCCESS or node.estimate is not None:
+            return
+        old = self.estimates.get(node.task_type)
+        if old is None:
+            self.estimates[node.task_type] = outcome.elapsed
+        else:
+            self.estimates[node.task_type] = (
+                1 - ESTIMATE_SMOOTHING
+            ) * old + ESTIMATE_SMOOTHING * outcome.elapsed
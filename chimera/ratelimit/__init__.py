@@ -0,0 +1,30 @@
+"""
+Rate limiting for outbound platform APIs.
+
+Token buckets keyed per platform and per API key, with adaptive backoff on
+429/503 responses. Bucket state lives in a backend: ``LocalBackend`` for a
+single process, ``RedisBackend`` to share quota across processes and nodes.
+
+Reference: specs/functional.md#3.3-security ("Rate limiting on all external APIs")
+"""
+
+from chimera.ratelimit.backends import LocalBackend, RedisBackend
+from chimera.ratelimit.limiter import (
+    DEFAULT_LIMITS,
+    RateLimit,
+    RateLimiter,
+    RateLimitExceeded,
+    default_limiter,
+    set_default_limiter,
+)
+
+__all__ = [
+    "DEFAULT_LIMITS",
+    "LocalBackend",
+    "RateLimit",
+    "RateLimitExceeded",
+    "RateLimiter",
+    "RedisBackend",
+    "default_limiter",
+    "set_default_limiter",
+]
@@ -0,0 +1,106 @@
+"""
+Token-bucket state backends.
+
+Both backends implement the same reservation model. ``reserve()`` always
+takes the tokens, letting the balance go negative, and returns how long the
+caller must wait before its reservation is due. Callers then sleep exactly
+that long instead of polling, and concurrent callers are spaced out at the
+bucket rate in arrival order.
+
+``block()`` pushes the bucket's clock forward to honour a Retry-After or
+backoff window. Later reservations are paced from the end of the window, so
+they do not all fire at once when it ends.
+"""
+
+import threading
+import time
+from typing import Any
+
+
+def _reserve(
+    tokens: float, ts: float, now: float, rate: float, capacity: float, cost: float
+) -> tuple[float, float, float]:
+    """Pure bucket update. Returns (tokens, ts, wait_seconds)."""
+    elapsed = max(0.0, now - ts)
+    base = max(now, ts)
+    tokens = min(capacity, tokens + elapsed * rate) - cost
+    wait = (base - now) + max(0.0, -tokens / rate)
+    return tokens, base, wait
+
+
+class LocalBackend:
+    """In-process bucket state, shared by every limiter in this process."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    async def reserve(self, key: str, rate: float, capacity: float, cost: float) -> float:
+        now = time.time()
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (capacity, now))
+            tokens, ts, wait = _reserve(tokens, ts, now, rate, capacity, cost)
+            self._buckets[key] = (tokens, ts)
+        return wait
+
+    async def block(self, key: str, until: float, capacity: float) -> None:
+        now = time.time()
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (capacity, now))
+            if until > ts:
+                self._buckets[key] = (min(tokens, 0.0), until)
+
+
+# KEYS[1] = bucket hash; ARGV = rate, capacity, cost, now
+_RESERVE_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+local base = math.max(now, ts)
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - cost
+local wait = (base - now) + math.max(0, -tokens / rate)
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(base))
+redis.call('PEXPIRE', KEYS[1], math.ceil((wait + capacity / rate) * 1000) + 1000)
+return tostring(wait)
+"""
+
+# KEYS[1] = bucket hash; ARGV = until, capacity, now
+_BLOCK_LUA = """
+local untl = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+if untl > ts then
+  redis.call('HSET', KEYS[1], 'tokens', tostring(math.min(tokens, 0)), 'ts', tostring(untl))
+  redis.call('PEXPIRE', KEYS[1], math.ceil((untl - now) * 1000) + 60000)
+end
+return 1
+"""
+
+
+class RedisBackend:
+    """
+    Bucket state in Redis, shared across processes and nodes.
+
+    Each reservation is one atomic Lua call. Takes any
+    ``redis.asyncio.Redis``-compatible client.
+    """
+
+    def __init__(self, client: Any, namespace: str = "chimera:ratelimit:"):
+        self.client = client
+        self.namespace = namespace
+
+    async def reserve(self, key: str, rate: float, capacity: float, cost: float) -> float:
+        wait = await self.client.eval(
+            _RESERVE_LUA, 1, self.namespace + key, rate, capacity, cost, time.time()
+        )
+        return float(wait)
+
+    async def block(self, key: str, until: float, capacity: float) -> None:
+        await self.client.eval(_BLOCK_LUA, 1, self.namespace + key, until, capacity, time.time())
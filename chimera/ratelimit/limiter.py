@@ -0,0 +1,219 @@
+"""
+Per-platform, per-API-key rate limiter with adaptive backoff.
+
+``acquire()`` reserves tokens from the bucket for ``(platform, api_key)`` and
+sleeps until the reservation is due. Waiters are released in arrival order at
+the bucket rate. API keys are hashed before they become bucket keys, so no
+secret ever reaches Redis.
+
+``call()`` wraps one HTTP exchange. On 429/503 it blocks the bucket for the
+server's Retry-After, or for an exponential backoff with full jitter when the
+server gives no hint, then retries. The block is stored in the backend, so
+every process sharing the bucket backs off together. Without that, 1,000
+agents would each retry on their own schedule and the retries would cascade.
+"""
+
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Protocol, TypeVar
+
+from chimera.ratelimit.backends import LocalBackend
+
+R = TypeVar("R")
+
+# Statuses that mean "slow down" rather than "this request is wrong".
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained ``rate`` (requests/second) with bursts up to ``burst``."""
+
+    rate: float
+    burst: float
+
+
+# Conservative defaults; deployments pass their real quotas via ``limits``.
+DEFAULT_LIMITS: dict[str, RateLimit] = {
+    "tiktok": RateLimit(rate=5.0, burst=20),
+    "youtube": RateLimit(rate=10.0, burst=50),
+    "twitter": RateLimit(rate=2.0, burst=15),
+}
+FALLBACK_LIMIT = RateLimit(rate=5.0, burst=10)
+
+
+class Backend(Protocol):
+    async def reserve(self, key: str, rate: float, capacity: float, cost: float) -> float: ...
+
+    async def block(self, key: str, until: float, capacity: float) -> None: ...
+
+
+class RateLimitExceeded(Exception):
+    """The wait for a token would exceed the limiter's ``max_wait``."""
+
+    def __init__(self, platform: str, wait: float):
+        super().__init__(f"rate limit for {platform} would need a {wait:.1f}s wait")
+        self.platform = platform
+        self.wait = wait
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After as seconds; accepts delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter shared by every skill that calls a platform API.
+
+    Args:
+        backend: ``LocalBackend`` (default) or ``RedisBackend``.
+        limits: {platform: RateLimit} overriding ``DEFAULT_LIMITS``.
+        max_wait: longest queueing delay accepted before failing fast.
+        max_attempts: tries per ``call()`` including the first.
+        backoff_base / backoff_cap: exponential backoff bounds in seconds.
+    """
+
+    def __init__(
+        self,
+        backend: Backend | None = None,
+        limits: dict[str, RateLimit] | None = None,
+        max_wait: float = 30.0,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 60.0,
+        rng: random.Random | None = None,
+    ):
+        self.backend = backend or LocalBackend()
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.max_wait = max_wait
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.rng = rng or random.Random()
+        self.stats: Counter[str] = Counter()
+        self._strikes: Counter[str] = Counter()
+
+    def limit_for(self, platform: str) -> RateLimit:
+        return self.limits.get(platform, FALLBACK_LIMIT)
+
+    @staticmethod
+    def bucket_key(platform: str, api_key: str | None) -> str:
+        """Bucket id for a platform and key; the key itself is never stored."""
+        if not api_key:
+            return f"{platform}:anonymous"
+        return f"{platform}:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+
+    async def acquire(self, platform: str, api_key: str | None = None, cost: float = 1.0) -> float:
+        """Wait for ``cost`` tokens; returns the seconds spent waiting."""
+        limit = self.limit_for(platform)
+        key = self.bucket_key(platform, api_key)
+        wait = await self.backend.reserve(key, limit.rate, limit.burst, cost)
+        if wait > self.max_wait:
+            # Hand the reservation back so queued callers are not delayed by it.
+            await self.backend.reserve(key, limit.rate, limit.burst, -cost)
+            self.stats["rejected"] += 1
+            raise RateLimitExceeded(platform, wait)
+        self.stats["acquired"] += 1
+        if wait > 0:
+            self.stats["waits"] += 1
+            self.stats["waiting"] += 1
+            slept = False
+            try:
+                await asyncio.sleep(wait)
+                slept = True
+            finally:
+                self.stats["waiting"] -= 1
+                if not slept:
+                    # Cancelled while queued: the tokens were never used.
+                    await self.backend.reserve(key, limit.rate, limit.burst, -cost)
+        return wait
+
+    def backoff_delay(self, strikes: int, retry_after: float | None) -> float:
+        """Delay after the ``strikes``-th consecutive throttle."""
+        if retry_after is not None:
+            # Honour the server, with a little spread so agents do not stampede.
+            return retry_after + self.rng.uniform(0, min(1.0, 0.1 * retry_after + 0.1))
+        ceiling = min(self.backoff_cap, self.backoff_base * 2 ** (strikes - 1))
+        return self.rng.uniform(0, ceiling)
+
+    async def throttled(
+        self, platform: str, api_key: str | None = None, retry_after: float | None = None
+    ) -> float:
+        """Record a 429/503 and block the bucket; returns the backoff delay."""
+        key = self.bucket_key(platform, api_key)
+        self._strikes[key] += 1
+        self.stats["throttled"] += 1
+        delay = self.backoff_delay(self._strikes[key], retry_after)
+        await self.backend.block(key, time.time() + delay, self.limit_for(platform).burst)
+        return delay
+
+    def succeeded(self, platform: str, api_key: str | None = None) -> None:
+        """Reset the backoff after a successful call."""
+        self._strikes.pop(self.bucket_key(platform, api_key), None)
+
+    async def call(
+        self,
+        platform: str,
+        api_key: str | None,
+        send: Callable[[], Awaitable[R]],
+    ) -> R:
+        """
+        Rate-limit and retry one request.
+
+        ``send()`` returns a response with ``status_code`` and ``headers``
+        (httpx-style). The last response is returned once attempts run out.
+        """
+        last: R | None = None
+        for attempt in range(max(1, self.max_attempts)):
+            await self.acquire(platform, api_key)
+            last = await send()
+            response: Any = last
+            if response.status_code not in THROTTLE_STATUSES:
+                self.succeeded(platform, api_key)
+                return last
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            await self.throttled(platform, api_key, retry_after)
+            if attempt + 1 < self.max_attempts:
+                self.stats["retries"] += 1
+        assert last is not None
+        return last
+
+    def report(self) -> dict[str, Any]:
+        return dict(self.stats)
+
+
+_default_limiter: RateLimiter | None = None
+_default_lock = threading.Lock()
+
+
+def default_limiter() -> RateLimiter:
+    """The process-wide limiter shared by every skill without its own."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
+
+
+def set_default_limiter(limiter: RateLimiter | None) -> None:
+    """Replace the process-wide limiter (``None`` resets to a fresh default)."""
+    global _default_limiter
+    with _default_lock:
+        _default_limiter = limiter
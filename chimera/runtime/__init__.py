@@ -0,0 +1,34 @@
+"""
+Worker runtime: leases tasks from the TaskQueue and executes skills.
+
+I/O-bound skills run on asyncio, blocking SDKs on a thread pool and CPU-bound
+skills on a process pool. Skills are discovered from their manifests and
+imported on first use. ``python -m chimera`` starts one ``WorkerPool``.
+
+Reference: research/SRS.md#3.1.2-the-worker-executor
+"""
+
+from chimera.runtime.dispatch import SkillDispatcher
+from chimera.runtime.executors import (
+    DEFAULT_MODES,
+    ExecutionMode,
+    Executors,
+    execute_skill,
+    load_skill,
+)
+from chimera.runtime.pool import WorkerPool
+from chimera.runtime.registry import SkillRegistry, SkillSpec, UnknownSkill, default_registry
+
+__all__ = [
+    "DEFAULT_MODES",
+    "ExecutionMode",
+    "Executors",
+    "SkillDispatcher",
+    "SkillRegistry",
+    "SkillSpec",
+    "UnknownSkill",
+    "WorkerPool",
+    "default_registry",
+    "execute_skill",
+    "load_skill",
+]
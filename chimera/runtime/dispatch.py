@@ -0,0 +1,97 @@
+"""
+Run a skill by task_type, in its execution mode.
+
+Shared by the WorkerPool (tasks leased from the queue) and the Planner's DAG
+scheduler (nodes run in-process).
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from chimera.runtime.executors import (
+    DEFAULT_MODES,
+    FALLBACK_MODE,
+    ExecutionMode,
+    Executors,
+    HotSkill,
+    load_skill,
+)
+from chimera.runtime.registry import UnknownSkill
+from skills.base import BaseSkill
+
+
+class SkillDispatcher:
+    """
+    Resolves task_types to skills and runs them.
+
+    Args:
+        modes: task_type -> ExecutionMode overrides on top of DEFAULT_MODES.
+        skills: task_type -> skill class overrides on top of ``load_skill``.
+        skill_config: task_type -> config dict for the skill. Configs for
+            PROCESS skills must be picklable.
+    """
+
+    def __init__(
+        self,
+        *,
+        modes: dict[str, ExecutionMode] | None = None,
+        skills: dict[str, type[BaseSkill]] | None = None,
+        skill_config: dict[str, dict[str, Any]] | None = None,
+        executors: Executors | None = None,
+    ):
+        self.modes = {**DEFAULT_MODES, **(modes or {})}
+        self.skills = dict(skills or {})
+        self.skill_config = dict(skill_config or {})
+        self.executors = executors or Executors()
+        self._instances: dict[str, BaseSkill] = {}
+
+    def mode_for(self, task_type: str) -> ExecutionMode:
+        return self.modes.get(task_type.removeprefix("skill_"), FALLBACK_MODE)
+
+    def skill_class(self, task_type: str) -> type[BaseSkill]:
+        cls = self.skills.get(task_type)
+        if cls is None:
+            cls = self.skills[task_type] = load_skill(task_type)
+        return cls
+
+    async def warm(self, task_types: Iterable[str]) -> None:
+        """
+        Import, build and warm ``task_types`` before their first task arrives.
+
+        ASYNC skills are warmed here and kept. PROCESS skills are preloaded
+        by the fork server and warmed in every process worker, all of which
+        start now. THREAD skills compile their class-wide contracts here;
+        each pool thread still builds its own instance. Raises UnknownSkill
+        for a task_type no skill provides.
+        """
+        hot: list[HotSkill] = []
+        for task_type in task_types:
+            cls = self.skill_class(task_type)
+            config = self.skill_config.get(task_type, {})
+            mode = self.mode_for(task_type)
+            if mode is ExecutionMode.PROCESS:
+                hot.append((cls, config))
+                continue
+            skill = self._instances.get(task_type) or cls(config)
+            skill.warm()
+            if mode is ExecutionMode.ASYNC:
+                self._instances[task_type] = skill
+        if hot:
+            await self.executors.prestart(hot)
+
+    async def run(self, task_type: str, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Execute one skill call; unknown task_types return an UNKNOWN_SKILL error."""
+        try:
+            cls = self.skill_class(task_type)
+        except UnknownSkill:
+            return BaseSkill.error_response(
+                "UNKNOWN_SKILL", f"No skill registered for task_type {task_type!r}"
+            )
+        config = self.skill_config.get(task_type, {})
+        mode = self.mode_for(task_type)
+        if mode is ExecutionMode.ASYNC:
+            skill = self._instances.get(task_type)
+            if skill is None:
+                skill = self._instances[task_type] = cls(config)
+            return await skill.execute_async(input_data)
+        return await self.executors.submit(mode, cls, config, input_data)
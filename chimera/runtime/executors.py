@@ -0,0 +1,177 @@
+"""
+Where each skill runs.
+
+Skills are async, but they are not all I/O bound:
+
+    ASYNC    awaited on the runtime loop; for network-bound skills
+    THREAD   a thread pool, one event loop per thread; for skills that call
+             blocking SDKs and would otherwise stall the runtime loop
+    PROCESS  a process pool forked from a fork server; for CPU-bound work
+             that would hold the GIL (safety scoring)
+
+A skill's mode comes from its manifest (see ``registry``). THREAD and PROCESS
+calls go through ``execute_skill()``. It caches one skill instance and one
+event loop per worker thread, so pools and caches inside a skill survive from
+one task to the next.
+
+Process workers are started from a fork server, which imports the runtime
+and the hot skills' modules once; each worker is a fork of that state rather
+than a fresh interpreter that imports everything again. ``prestart()``
+starts every worker up front and warms the hot skills in each.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import StrEnum
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from chimera.runtime.registry import SkillSpec, default_registry
+from skills.base import BaseSkill
+
+
+class ExecutionMode(StrEnum):
+    ASYNC = "async"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+DEFAULT_MODES: dict[str, ExecutionMode] = {
+    name: ExecutionMode(mode) for name, mode in default_registry().modes().items()
+}
+# Unknown skills might block, and a thread is the safe place to block.
+FALLBACK_MODE = ExecutionMode.THREAD
+
+# A skill class and its config, as handed to process workers.
+HotSkill = tuple[type[BaseSkill], dict[str, Any]]
+
+
+def load_skill(task_type: str) -> type[BaseSkill]:
+    """
+    Resolve a task_type to a skill class.
+
+    ``fetch_trends`` and ``skill_fetch_trends`` both resolve to the class
+    named by the ``fetch_trends`` manifest. ``package.module:ClassName``
+    names a class explicitly.
+    """
+    if ":" in task_type:
+        return SkillSpec(task_type, task_type).load()
+    return default_registry().load(task_type)
+
+
+_local = threading.local()
+
+
+def _thread_skill(skill_cls: type[BaseSkill], config: dict[str, Any]) -> BaseSkill:
+    if not hasattr(_local, "loop"):
+        _local.loop = asyncio.new_event_loop()
+        _local.skills = {}
+    key = (skill_cls, json.dumps(config, sort_keys=True, default=repr))
+    skill: BaseSkill | None = _local.skills.get(key)
+    if skill is None:
+        skill = _local.skills[key] = skill_cls(config)
+    return skill
+
+
+def execute_skill(
+    skill_cls: type[BaseSkill], config: dict[str, Any], input_data: dict[str, Any]
+) -> dict[str, Any]:
+    """Run one skill call on this thread's own event loop."""
+    skill = _thread_skill(skill_cls, config)
+    result: dict[str, Any] = _local.loop.run_until_complete(skill.execute_async(input_data))
+    return result
+
+
+def warm_skills(hot: tuple[HotSkill, ...]) -> None:
+    """Process worker initializer: build and warm the hot skills before any task."""
+    for skill_cls, config in hot:
+        _thread_skill(skill_cls, config).warm()
+
+
+def process_context(preload: Iterable[str] = ()) -> BaseContext:
+    """
+    The fork server's context, importing ``preload``; spawn where there is none.
+
+    Never plain fork: a forked child would inherit the parent's event loops
+    and pool connections without their threads. The fork server is a fresh
+    interpreter that only imports. Its preload list is process-wide and
+    fixed once the server has started; modules missing from it are imported
+    by each worker as usual.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__, *preload])
+    return context
+
+
+class Executors:
+    """Lazily created thread and process pools shared by a WorkerPool."""
+
+    def __init__(self, thread_workers: int = 16, process_workers: int | None = None):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self.hot: tuple[HotSkill, ...] = ()
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+
+    def executor(self, mode: ExecutionMode) -> Executor:
+        if mode is ExecutionMode.PROCESS:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    self.process_workers,
+                    mp_context=process_context(cls.__module__ for cls, _ in self.hot),
+                    initializer=warm_skills,
+                    initargs=(self.hot,),
+                )
+            return self._processes
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                self.thread_workers, thread_name_prefix="chimera-skill"
+            )
+        return self._threads
+
+    async def submit(
+        self,
+        mode: ExecutionMode,
+        skill_cls: type[BaseSkill],
+        config: dict[str, Any],
+        input_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor(mode), execute_skill, skill_cls, config, input_data
+        )
+
+    async def prestart(self, hot: Iterable[HotSkill] = ()) -> None:
+        """
+        Start every process worker now, with ``hot`` skills imported and warmed.
+
+        ``hot`` configs must be picklable. Workers started later (after a
+        ``reset()``) are warmed the same way.
+        """
+        if self._processes is None:
+            self.hot = tuple(hot)
+        loop = asyncio.get_running_loop()
+        pool = self.executor(ExecutionMode.PROCESS)
+        # The pool starts one worker per submit until it has process_workers.
+        await asyncio.gather(
+            *(loop.run_in_executor(pool, os.getpid) for _ in range(self.process_workers))
+        )
+
+    def reset(self) -> None:
+        """Discard the process pool after a worker died; the next call respawns it."""
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=not wait)
+        self._threads = self._processes = None
@@ -0,0 +1,219 @@
+"""
+Worker pool: the Worker role from the SRS (research/SRS.md#3.1.2).
+
+One ``WorkerPool`` per node leases tasks from the TaskQueue and runs each
+task's skill in the mode given by its task_type (see ``executors``).
+
+Backpressure: at most ``concurrency`` tasks are in flight, and the pool only
+leases as many tasks as it has free slots. Work it cannot start yet stays in
+the queue, where another node can pick it up. While a task runs, a heartbeat
+extends its lease, so slow skills are not handed to a second worker.
+
+Shutdown: ``stop()`` stops leasing. The pool then waits up to
+``drain_timeout`` for in-flight tasks and nacks whatever is still running, so
+nothing is lost when a node is recycled.
+
+Cold start: skills are imported when their first task arrives. Skills named
+in ``warm`` are imported, built and warmed before the pool leases anything,
+with their process workers already started.
+
+A task's skill input is ``task.context["input"]``.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import BrokenExecutor
+from typing import Any
+
+from chimera.runtime.dispatch import SkillDispatcher
+from chimera.runtime.executors import ExecutionMode, Executors
+from chimera.tasks import Task, TaskQueue
+from skills.base import BaseSkill
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 50
+# Error codes that will fail the same way on every retry.
+NON_RETRYABLE = frozenset({"INVALID_INPUT", "UNKNOWN_SKILL"})
+
+ResultHook = Callable[[Task, dict[str, Any]], Awaitable[None]]
+LeaseHook = Callable[[list[Task]], None]
+
+
+class WorkerPool:
+    """
+    Leases tasks from ``queue`` and executes them concurrently.
+
+    Args:
+        queue: Source of tasks.
+        concurrency: Maximum tasks in flight across all execution modes.
+        batch_size: Maximum tasks leased per dequeue.
+        thread_workers / process_workers: Executor pool sizes.
+        modes: task_type -> ExecutionMode overrides on top of DEFAULT_MODES.
+        skills: task_type -> skill class overrides on top of ``load_skill``.
+        skill_config: task_type -> config dict for the skill. Configs for
+            PROCESS skills must be picklable.
+        on_result: Awaited with ``(task, result)`` after every task.
+        on_lease: Called with each leased batch before its tasks start, e.g.
+            ``HierarchicalMemory.prefetch_tasks``. Must not block.
+        warm: task_types to warm before the first lease (the hot skills).
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        *,
+        worker_id: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        batch_size: int = 10,
+        thread_workers: int = 16,
+        process_workers: int | None = None,
+        modes: dict[str, ExecutionMode] | None = None,
+        skills: dict[str, type[BaseSkill]] | None = None,
+        skill_config: dict[str, dict[str, Any]] | None = None,
+        poll_interval: float = 0.5,
+        drain_timeout: float = 30.0,
+        on_result: ResultHook | None = None,
+        on_lease: LeaseHook | None = None,
+        warm: Iterable[str] = (),
+    ):
+        self.queue = queue
+        self.worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.drain_timeout = drain_timeout
+        self.on_result = on_result
+        self.on_lease = on_lease
+        self.warm = tuple(warm)
+        self.executors = Executors(thread_workers, process_workers)
+        self.dispatcher = SkillDispatcher(
+            modes=modes, skills=skills, skill_config=skill_config, executors=self.executors
+        )
+        self.stats: Counter[str] = Counter()
+        self.peak_in_flight = 0
+        self._running: set[asyncio.Task[None]] = set()
+        self._stopping = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._running)
+
+    def mode_for(self, task_type: str) -> ExecutionMode:
+        return self.dispatcher.mode_for(task_type)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def stop(self) -> None:
+        """Stop leasing new tasks; ``run()`` returns once drained."""
+        self._stopping.set()
+
+    async def run(self, stop_when_idle: bool = False) -> None:
+        """
+        Lease and execute tasks until ``stop()``, then drain.
+
+        With ``stop_when_idle`` the pool also stops once the queue is empty
+        and nothing is in flight (batch jobs, tests, benchmarks).
+        """
+        self._stopping.clear()
+        if self.warm:
+            await self.dispatcher.warm(self.warm)
+        stopping = asyncio.create_task(self._stopping.wait())
+        try:
+            while not self._stopping.is_set():
+                free = self.concurrency - len(self._running)
+                if free <= 0:
+                    await asyncio.wait({*self._running, stopping}, return_when="FIRST_COMPLETED")
+                    continue
+                tasks = await self.queue.dequeue(
+                    self.worker_id,
+                    max_tasks=min(free, self.batch_size),
+                    wait=self.poll_interval,
+                )
+                if not tasks and stop_when_idle and not self._running:
+                    break
+                if tasks and self.on_lease is not None:
+                    self.on_lease(tasks)
+                for task in tasks:
+                    self._start(task)
+        finally:
+            stopping.cancel()
+            await self._drain()
+
+    def _start(self, task: Task) -> None:
+        handler = asyncio.create_task(self._handle(task))
+        self._running.add(handler)
+        handler.add_done_callback(self._running.discard)
+        self.peak_in_flight = max(self.peak_in_flight, len(self._running))
+
+    async def _drain(self) -> None:
+        pending: set[asyncio.Task[None]] = set()
+        if self._running:
+            logger.info("draining %d in-flight tasks", len(self._running))
+            _, pending = await asyncio.wait(set(self._running), timeout=self.drain_timeout)
+            for handler in pending:
+                handler.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        await asyncio.to_thread(self.executors.shutdown, not pending)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def dispatch(self, task: Task) -> dict[str, Any]:
+        """Run ``task``'s skill in its execution mode and return the result."""
+        self.stats[f"{self.mode_for(task.task_type)}_tasks"] += 1
+        return await self.dispatcher.run(task.task_type, task.context.get("input", {}))
+
+    async def _handle(self, task: Task) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(task.task_id))
+        try:
+            result = await self.dispatch(task)
+        except asyncio.CancelledError:
+            await self.queue.nack(task.task_id)
+            self.stats["abandoned"] += 1
+            raise
+        except BrokenExecutor as exc:
+            logger.error("executor died running %s: %s", task.task_id, exc)
+            self.executors.reset()
+            await self.queue.nack(task.task_id)
+            self.stats["retried"] += 1
+            return
+        except Exception:
+            logger.exception("task %s crashed", task.task_id)
+            await self.queue.nack(task.task_id)
+            self.stats["retried"] += 1
+            return
+        finally:
+            heartbeat.cancel()
+
+        if result.get("status") != "error":
+            await self.queue.ack(task.task_id)
+            self.stats["completed"] += 1
+        elif result.get("error_code") in NON_RETRYABLE:
+            await self.queue.ack(task.task_id)
+            self.stats["failed"] += 1
+        else:
+            await self.queue.nack(task.task_id)
+            self.stats["retried"] += 1
+        if self.on_result is not None:
+            await self.on_result(task, result)
+
+    async def _heartbeat(self, task_id: str) -> None:
+        timeout = self.queue.visibility_timeout
+        while True:
+            await asyncio.sleep(timeout / 3)
+            await self.queue.extend(task_id, timeout)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            **self.stats,
+        }
@@ -0,0 +1,138 @@
+"""
+Skill registry: which skills exist, found without importing any of them.
+
+Every skill package ships a ``skill.toml`` manifest naming its task_type,
+the ``module:Class`` that implements it and its execution mode:
+
+    name = "fetch_trends"
+    entry = "skills.skill_fetch_trends.main:FetchTrendsSkill"
+    mode = "async"
+
+Discovery only parses those files, so a worker knows every skill and its
+mode at startup and imports a skill (its contracts, numpy, HTTP clients)
+when the first task for it arrives. Skills shipped by other distributions
+register under the ``chimera.skills`` entry-point group instead:
+
+    [project.entry-points."chimera.skills"]
+    my_skill = "my_package.skill:MySkill"
+
+Entry points are only consulted for a name no manifest claims: scanning the
+metadata of every installed distribution costs more than the manifests do.
+"""
+
+import importlib
+import threading
+import tomllib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from pathlib import Path
+
+import skills
+from skills.base import BaseSkill
+
+MANIFEST = "skill.toml"
+ENTRY_POINT_GROUP = "chimera.skills"
+SKILLS_DIR = Path(skills.__file__).parent
+
+
+class UnknownSkill(LookupError):
+    """No skill is registered or importable for a task_type."""
+
+
+@dataclass(frozen=True)
+class SkillSpec:
+    """A skill as its manifest describes it; nothing is imported until ``load()``."""
+
+    name: str
+    entry: str
+    mode: str | None = None
+    description: str = ""
+
+    def load(self) -> type[BaseSkill]:
+        module_name, _, attr = self.entry.partition(":")
+        try:
+            cls = getattr(importlib.import_module(module_name), attr)
+        except (ImportError, AttributeError) as exc:
+            raise UnknownSkill(self.name) from exc
+        if not (isinstance(cls, type) and issubclass(cls, BaseSkill)):
+            raise UnknownSkill(f"{self.name}: {self.entry} is not a BaseSkill")
+        return cls
+
+
+def read_manifest(path: Path) -> SkillSpec:
+    with path.open("rb") as f:
+        data = tomllib.load(f)
+    try:
+        return SkillSpec(
+            name=data["name"],
+            entry=data["entry"],
+            mode=data.get("mode"),
+            description=data.get("description", ""),
+        )
+    except KeyError as exc:
+        raise ValueError(f"{path}: manifest is missing {exc.args[0]!r}") from None
+
+
+class SkillRegistry:
+    """
+    Skills from the manifests under ``roots``, then the entry-point group.
+
+    Manifests are read once, on the first lookup. A skill's class is
+    imported by the first ``load()`` for it and cached from then on.
+    """
+
+    def __init__(self, roots: Iterable[Path] | None = None, group: str = ENTRY_POINT_GROUP):
+        self.roots = [Path(root) for root in roots] if roots is not None else [SKILLS_DIR]
+        self.group = group
+        self._specs: dict[str, SkillSpec] | None = None
+        self._classes: dict[str, type[BaseSkill]] = {}
+
+    def specs(self) -> dict[str, SkillSpec]:
+        """Every manifest-declared skill by name; the first root wins a clash."""
+        if self._specs is None:
+            specs: dict[str, SkillSpec] = {}
+            for root in self.roots:
+                for path in sorted(root.glob(f"*/{MANIFEST}")):
+                    spec = read_manifest(path)
+                    specs.setdefault(spec.name, spec)
+            self._specs = specs
+        return self._specs
+
+    def spec(self, task_type: str) -> SkillSpec:
+        """``fetch_trends`` and ``skill_fetch_trends`` name the same skill."""
+        name = task_type.removeprefix("skill_")
+        specs = self.specs()
+        spec = specs.get(name)
+        if spec is None:
+            for point in entry_points(group=self.group, name=name):
+                spec = specs[name] = SkillSpec(name, point.value)
+                break
+            else:
+                raise UnknownSkill(task_type)
+        return spec
+
+    def modes(self) -> dict[str, str]:
+        """Execution mode per skill, for the skills whose manifest sets one."""
+        return {name: spec.mode for name, spec in self.specs().items() if spec.mode}
+
+    def load(self, task_type: str) -> type[BaseSkill]:
+        """The skill class for ``task_type``, imported on first use."""
+        spec = self.spec(task_type)
+        cls = self._classes.get(spec.name)
+        if cls is None:
+            cls = self._classes[spec.name] = spec.load()
+        return cls
+
+
+_default_registry: SkillRegistry | None = None
+_default_lock = threading.Lock()
+
+
+def default_registry() -> SkillRegistry:
+    """The process-wide registry of the built-in skills and installed entry points."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = SkillRegistry()
+        return _default_registry
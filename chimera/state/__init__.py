@@ -0,0 +1,35 @@
+"""
+Versioned state for the swarm, with optimistic concurrency control.
+
+Campaign, content and approval records carry versions, and commits are
+compare-and-swap. See ``chimera.state.store`` for the commit rules.
+
+Backends:
+    MemoryStateStore - in-process, for tests and single-node runs.
+    SQLStateStore    - SQLite locally, PostgreSQL (specs/technical.md §3).
+
+``Database`` puts one pooled engine behind the SQL store and per-table
+repositories. The repositories do bulk upserts, COPY loads and keyset
+pagination (see ``chimera.state.repository``).
+
+Reference: research/SRS.md#3.1.3-the-judge-gatekeeper
+"""
+
+from chimera.state.memory import MemoryStateStore
+from chimera.state.repository import Database, Page, Repository, TrendRepository
+from chimera.state.sql import SQLStateStore
+from chimera.state.store import KINDS, ConflictError, Record, StateStore, Write
+
+__all__ = [
+    "KINDS",
+    "ConflictError",
+    "Database",
+    "MemoryStateStore",
+    "Page",
+    "Record",
+    "Repository",
+    "SQLStateStore",
+    "StateStore",
+    "TrendRepository",
+    "Write",
+]
@@ -0,0 +1,50 @@
+"""
+In-process StateStore backend.
+
+Used by tests and single-process runs. A commit validates every write and
+then applies them all without awaiting in between, so it is atomic with
+respect to other coroutines on the same event loop.
+"""
+
+from collections.abc import Iterable
+
+from chimera.state.store import (
+    KINDS,
+    ConflictError,
+    Record,
+    StateStore,
+    Write,
+    check_kind,
+    check_writes,
+)
+
+
+class MemoryStateStore(StateStore):
+    """StateStore held in this process's memory."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, dict[str, Record]] = {kind: {} for kind in KINDS}
+
+    async def get_many(self, kind: str, ids: Iterable[str]) -> dict[str, Record]:
+        check_kind(kind)
+        table = self._records[kind]
+        return {id: table[id] for id in ids if id in table}
+
+    async def commit(self, writes: Iterable[Write]) -> list[Record]:
+        writes = check_writes(writes)
+        for write in writes:
+            current = self._records[write.kind].get(write.id)
+            actual = current.version if current is not None else 0
+            if actual != write.expected:
+                raise ConflictError(write.kind, write.id, write.expected, actual)
+
+        written: list[Record] = []
+        for write in writes:
+            if write.data is None:
+                continue
+            current = self._records[write.kind].get(write.id)
+            data = {**current.data, **write.data} if current is not None else dict(write.data)
+            record = Record(write.kind, write.id, write.expected + 1, data)
+            self._records[write.kind][write.id] = record
+            written.append(record)
+        return written
@@ -0,0 +1,250 @@
+"""
+Bulk writes and keyset reads over the specs/technical.md tables.
+
+Ingest paths, cheapest last:
+
+- ``insert_many``: chunked executemany. SQLAlchemy sends each chunk as
+  multi-row INSERTs (``insertmanyvalues``) or a driver executemany, so a
+  chunk costs a few round trips rather than one per row.
+- ``upsert_many``: the same, as ``INSERT ... ON CONFLICT (key) DO UPDATE``.
+  Rows that repeat a key within a chunk are collapsed (last wins), because
+  PostgreSQL refuses to update one row twice in a statement.
+- ``copy``: PostgreSQL ``COPY ... FROM STDIN`` through asyncpg, for large
+  loads of new rows. It falls back to ``insert_many`` on other databases.
+
+Each chunk commits on its own, so a multi-million-row load never holds one
+huge transaction.
+
+``page`` is keyset pagination on ``created_at DESC, id DESC``. A page
+starts from the ``(created_at, id)`` of the previous page's last row, so
+page 10,000 costs as much as page 1. OFFSET has to skip every earlier row.
+"""
+
+import base64
+import json
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import JSON, Insert, Table, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from chimera.state import schema
+from chimera.state.sql import SQLStateStore
+
+DEFAULT_CHUNK_ROWS = 5000
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# uuid5 namespace for trend ids derived from (platform, external id).
+TREND_NAMESPACE = uuid.UUID("6f0d9c52-8a51-4c4e-9f0e-5b1f3c2a7d10")
+
+# Columns an upsert never overwrites.
+_IMMUTABLE = frozenset({"id", "created_at"})
+
+
+def trend_id(platform: str, external_id: str) -> str:
+    """Stable row id for a platform trend, so re-fetches map to one row."""
+    return str(uuid.uuid5(TREND_NAMESPACE, f"{platform}:{external_id}"))
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), id
+    except ValueError as exc:
+        raise ValueError(f"malformed page cursor {cursor!r}") from exc
+
+
+def _chunks(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@dataclass(frozen=True)
+class Page:
+    """One page of rows, newest first. ``cursor`` is None on the last page."""
+
+    rows: list[dict[str, Any]]
+    cursor: str | None
+
+
+class Repository:
+    """
+    Bulk writes and keyset pages for one table.
+
+    Args:
+        engine: Shared ``AsyncEngine`` (see ``schema.create_engine``).
+        table: Table from ``chimera.state.schema``.
+        chunk_rows: Rows per statement batch and per transaction.
+    """
+
+    def __init__(self, engine: AsyncEngine, table: Table, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self.engine = engine
+        self.table = table
+        self.chunk_rows = chunk_rows
+
+    async def insert_many(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Insert rows in chunks; returns how many were written."""
+        written = 0
+        for chunk in _chunks(rows, self.chunk_rows):
+            async with self.engine.begin() as conn:
+                await conn.execute(self.table.insert(), chunk)
+            written += len(chunk)
+        return written
+
+    async def upsert_many(
+        self,
+        rows: Iterable[dict[str, Any]],
+        key: Sequence[str],
+        update: Sequence[str] | None = None,
+    ) -> int:
+        """
+        Insert rows, updating ``update`` columns where ``key`` already exists.
+
+        ``key`` must match a primary key or unique index. ``update`` defaults
+        to every supplied column except the key, ``id`` and ``created_at``.
+        Returns how many distinct rows were written.
+        """
+        written = 0
+        for chunk in _chunks(rows, self.chunk_rows):
+            unique = list({tuple(row[k] for k in key): row for row in chunk}.values())
+            columns = update if update is not None else [
+                c for c in unique[0] if c not in key and c not in _IMMUTABLE
+            ]
+            statement = self._upsert(key, columns)
+            async with self.engine.begin() as conn:
+                await conn.execute(statement, unique)
+            written += len(unique)
+        return written
+
+    def _upsert(self, key: Sequence[str], columns: Sequence[str]) -> Insert:
+        dialect = self.engine.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert  # type: ignore[assignment]
+        else:
+            raise NotImplementedError(f"upsert is not supported on {dialect}")
+        statement = insert(self.table)
+        if not columns:
+            return statement.on_conflict_do_nothing(index_elements=list(key))
+        return statement.on_conflict_do_update(
+            index_elements=list(key), set_={c: statement.excluded[c] for c in columns}
+        )
+
+    async def copy(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Load new rows with COPY (PostgreSQL + asyncpg), else ``insert_many``.
+
+        Every row must supply the same columns. Omitted columns take their
+        server defaults. Conflicting keys fail the chunk; use ``upsert_many``
+        for data that may already be stored.
+        """
+        if self.engine.dialect.driver != "asyncpg":
+            return await self.insert_many(rows)
+        written = 0
+        for chunk in _chunks(rows, self.chunk_rows):
+            columns = list(chunk[0])
+            json_columns = {c for c in columns if isinstance(self.table.c[c].type, JSON)}
+            records = [
+                tuple(json.dumps(row[c]) if c in json_columns else row[c] for c in columns)
+                for row in chunk
+            ]
+            async with self.engine.begin() as conn:
+                raw = await conn.get_raw_connection()
+                driver = raw.driver_connection
+                if driver is None:
+                    raise RuntimeError("asyncpg connection was closed before COPY")
+                await driver.copy_records_to_table(
+                    self.table.name, records=records, columns=columns
+                )
+            written += len(chunk)
+        return written
+
+    async def page(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: str | None = None, **where: Any
+    ) -> Page:
+        """
+        Up to ``limit`` rows newest first, optionally filtered by column
+        equality (``page(status="approved")``). Pass the returned cursor as
+        ``after`` for the next page.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        table = self.table
+        query = select(table).where(*(table.c[column] == value for column, value in where.items()))
+        if after is not None:
+            created_at, id = decode_cursor(after)
+            query = query.where(tuple_(table.c.created_at, table.c.id) < tuple_(created_at, id))
+        query = query.order_by(table.c.created_at.desc(), table.c.id.desc()).limit(limit + 1)
+        async with self.engine.connect() as conn:
+            rows = [dict(row._mapping) for row in await conn.execute(query)]
+        if len(rows) <= limit:
+            return Page(rows, None)
+        rows = rows[:limit]
+        return Page(rows, encode_cursor(rows[-1]["created_at"], str(rows[-1]["id"])))
+
+
+class TrendRepository(Repository):
+    """``trends`` table, keyed by (platform, external id)."""
+
+    def __init__(self, engine: AsyncEngine, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        super().__init__(engine, schema.trends, chunk_rows)
+
+    @staticmethod
+    def row(trend: dict[str, Any]) -> dict[str, Any]:
+        """Row for one trend in the skill_fetch_trends contract shape."""
+        external_id = str(trend["id"])
+        return {
+            "id": trend_id(trend["platform"], external_id),
+            "external_id": external_id,
+            "title": trend["title"][:255],
+            "platform": trend["platform"],
+            "engagement_score": trend["engagement_score"],
+            "volume": trend["volume"],
+            "metadata": trend.get("metadata", {}),
+        }
+
+    async def upsert_trends(self, trends: Iterable[dict[str, Any]]) -> int:
+        """Store fetched trends; a re-fetched trend updates its score, volume and metadata."""
+        return await self.upsert_many(
+            (self.row(trend) for trend in trends),
+            key=("platform", "external_id"),
+            update=("title", "engagement_score", "volume", "metadata"),
+        )
+
+
+class Database:
+    """
+    One pooled engine with a repository per table and the OCC state store.
+
+    ``Database.connect(os.environ["DATABASE_URL"])`` in production;
+    ``Database.connect("sqlite+aiosqlite:///chimera.db")`` locally.
+    """
+
+    def __init__(self, engine: AsyncEngine, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self.engine = engine
+        self.trends = TrendRepository(engine, chunk_rows)
+        self.content = Repository(engine, schema.content, chunk_rows)
+        self.engagement = Repository(engine, schema.engagement, chunk_rows)
+        self.approval = Repository(engine, schema.approval, chunk_rows)
+        self.state = SQLStateStore(engine)
+
+    @classmethod
+    def connect(cls, url: str, chunk_rows: int = DEFAULT_CHUNK_ROWS, **options: Any) -> "Database":
+        return cls(schema.create_engine(url, **options), chunk_rows)
+
+    async def create_tables(self) -> None:
+        await schema.create_tables(self.engine)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
@@ -0,0 +1,176 @@
+"""
+SQL schema for specs/technical.md §3.2, plus the engine factory.
+
+The tables follow the spec. The differences are all additions:
+
+- ``version`` columns on campaign, content and approval (OCC, see
+  ``chimera.state.store``), and the ``campaign`` table itself;
+- ``trends.external_id``, the platform's own id. With ``platform`` it is
+  the natural key that trend upserts conflict on;
+- ``(created_at, id)`` indexes, so keyset pages read an index range
+  instead of sorting.
+
+Types degrade on SQLite: UUIDs are stored as text, JSONB as JSON.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    Text,
+    Uuid,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+_JSON = JSON().with_variant(JSONB(), "postgresql")
+_SCORE = Numeric(3, 2, asdecimal=False)
+_UUID = Uuid(as_uuid=False)
+
+# Pool defaults for server databases; SQLite ignores them.
+POOL_SIZE = 10
+MAX_OVERFLOW = 20
+POOL_RECYCLE_S = 1800
+
+metadata = MetaData()
+
+
+def _now() -> datetime:
+    # Set client-side as well as by the server, so every row written through
+    # SQLAlchemy stores timestamps in one format. SQLite compares them as text.
+    return datetime.now(UTC)
+
+
+trends = Table(
+    "trends",
+    metadata,
+    Column("id", _UUID, primary_key=True),
+    Column("external_id", String(255), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("platform", String(50), nullable=False, index=True),
+    Column("engagement_score", _SCORE, nullable=False),
+    Column("volume", Integer, nullable=False),
+    Column("metadata", _JSON, server_default="{}"),
+    Column("created_at", DateTime(timezone=True), default=_now, server_default=func.now()),
+    Index("uq_trends_platform_external_id", "platform", "external_id", unique=True),
+    Index("idx_trends_created_at_id", "created_at", "id"),
+)
+
+campaign = Table(
+    "campaign",
+    metadata,
+    Column("id", _UUID, primary_key=True),
+    Column("goal", Text),
+    Column("status", String(20), server_default="active"),
+    Column("state", _JSON, server_default="{}"),
+    Column("version", Integer, nullable=False, server_default="1"),
+    Column("created_at", DateTime(timezone=True), default=_now, server_default=func.now()),
+)
+
+content = Table(
+    "content",
+    metadata,
+    Column("id", _UUID, primary_key=True),
+    Column("trend_id", _UUID, ForeignKey("trends.id"), index=True),
+    Column("persona_id", _UUID),
+    Column("content_type", String(50)),
+    Column("body", Text),
+    Column("hashtags", _JSON, server_default="[]"),
+    Column("safety_score", _SCORE),
+    Column("status", String(20), server_default="draft", index=True),
+    Column("version", Integer, nullable=False, server_default="1"),
+    Column("created_at", DateTime(timezone=True), default=_now, server_default=func.now()),
+    Index("idx_content_created_at_id", "created_at", "id"),
+)
+
+engagement = Table(
+    "engagement",
+    metadata,
+    Column("id", _UUID, primary_key=True),
+    Column("content_id", _UUID, ForeignKey("content.id"), index=True),
+    Column("interaction_type", String(50), nullable=False),
+    Column("original_message", Text),
+    Column("response", Text),
+    Column("safety_score", _SCORE),
+    Column("status", String(20), server_default="pending"),
+    Column("created_at", DateTime(timezone=True), default=_now, server_default=func.now()),
+    Index("idx_engagement_created_at_id", "created_at", "id"),
+)
+
+approval = Table(
+    "approval",
+    metadata,
+    Column("id", _UUID, primary_key=True),
+    Column("content_id", _UUID, ForeignKey("content.id"), index=True),
+    Column("engagement_id", _UUID, ForeignKey("engagement.id")),
+    Column("approver_id", String(255), nullable=False),
+    Column("decision", String(20), nullable=False),
+    Column("feedback", Text),
+    Column("content_version", Integer),
+    Column("version", Integer, nullable=False, server_default="1"),
+    Column("reviewed_at", DateTime(timezone=True), default=_now, server_default=func.now()),
+)
+
+
+def create_engine(url: str, **options: Any) -> AsyncEngine:
+    """
+    Pooled async engine for ``url`` (e.g. ``DATABASE_URL``).
+
+    Server databases get a bounded pool with pre-ping and recycling. SQLite
+    files run in WAL mode, so readers never wait for a writer. Transactions
+    opened with ``execution_options(sqlite_immediate=True)`` take the write
+    lock up front (BEGIN IMMEDIATE), and writers wait up to 30 s for it
+    instead of failing. In-memory SQLite shares one connection.
+    """
+    sqlite = url.startswith("sqlite")
+    if sqlite:
+        options.setdefault("connect_args", {}).setdefault("timeout", 30)
+        if make_url(url).database in (None, "", ":memory:"):
+            options.setdefault("poolclass", StaticPool)
+    else:
+        options.setdefault("pool_size", POOL_SIZE)
+        options.setdefault("max_overflow", MAX_OVERFLOW)
+        options.setdefault("pool_recycle", POOL_RECYCLE_S)
+        options.setdefault("pool_pre_ping", True)
+    engine = create_async_engine(url, **options)
+    if engine.dialect.name == "sqlite":
+        _sqlite_transactions(engine)
+    return engine
+
+
+async def create_tables(engine: AsyncEngine) -> None:
+    """Create missing tables (tests and local runs; use migrations elsewhere)."""
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+
+def _sqlite_transactions(engine: AsyncEngine) -> None:
+    """Let SQLAlchemy, not the driver, emit BEGIN, so BEGIN IMMEDIATE is possible."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _connect(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn: Any) -> None:
+        immediate = conn.get_execution_options().get("sqlite_immediate")
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if immediate else "BEGIN")
@@ -0,0 +1,133 @@
+"""
+SQL StateStore backend (SQLAlchemy asyncio).
+
+Records live in the ``campaign``, ``content`` and ``approval`` tables of
+specs/technical.md §3.2 (see ``chimera.state.schema``), each with a
+``version`` column. ``Record.data`` holds a row's other columns. A commit
+runs in one transaction:
+
+    create      INSERT; a duplicate key is a conflict, any other
+                integrity error is raised as is
+    update      UPDATE ... SET version = version + 1
+                WHERE id = :id AND version = :expected
+    validation  SELECT version ... FOR SHARE (PostgreSQL row lock until
+                commit; SQLite ignores it)
+
+An update whose WHERE matches no row is stale, so the transaction is rolled
+back. This works on PostgreSQL (``postgresql+asyncpg://``) under its
+default READ COMMITTED isolation, because the UPDATE re-checks its WHERE
+after waiting on a row lock. It also works on SQLite
+(``sqlite+aiosqlite://``). There, commits take the write lock up front
+(BEGIN IMMEDIATE, see ``schema.create_engine``), so a validation read
+cannot be overtaken by another writer before the commit's own writes.
+
+Takes any ``AsyncEngine``; drivers are not imported here.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Table, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from chimera.state import schema
+from chimera.state.store import ConflictError, Record, StateStore, Write, check_kind, check_writes
+
+TABLES: dict[str, Table] = {
+    "campaign": schema.campaign,
+    "content": schema.content,
+    "approval": schema.approval,
+}
+
+
+def _record(kind: str, row: Any) -> Record:
+    data = dict(row._mapping)
+    id = str(data.pop("id"))
+    version = data.pop("version")
+    return Record(kind, id, version, data)
+
+
+class SQLStateStore(StateStore):
+    """StateStore over SQLAlchemy's asyncio engine (SQLite or PostgreSQL)."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    @classmethod
+    def connect(cls, url: str, **engine_options: Any) -> "SQLStateStore":
+        """Store on a new pooled engine for ``url``; see ``schema.create_engine``."""
+        return cls(schema.create_engine(url, **engine_options))
+
+    async def create_tables(self) -> None:
+        """Create missing tables (tests and local runs; use migrations elsewhere)."""
+        await schema.create_tables(self.engine)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
+
+    async def get_many(self, kind: str, ids: Iterable[str]) -> dict[str, Record]:
+        check_kind(kind)
+        ids = list(ids)
+        if not ids:
+            return {}
+        table = TABLES[kind]
+        async with self.engine.connect() as conn:
+            rows = await conn.execute(select(table).where(table.c.id.in_(ids)))
+            records = [_record(kind, row) for row in rows]
+        return {record.id: record for record in records}
+
+    async def commit(self, writes: Iterable[Write]) -> list[Record]:
+        writes = check_writes(writes)
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(sqlite_immediate=True)
+            async with conn.begin():
+                return [
+                    record
+                    for write in writes
+                    if (record := await self._apply(conn, write)) is not None
+                ]
+
+    async def _apply(self, conn: AsyncConnection, write: Write) -> Record | None:
+        table = TABLES[write.kind]
+        if write.expected == 0:
+            try:
+                async with conn.begin_nested():
+                    inserted = await conn.execute(
+                        table.insert()
+                        .values(id=write.id, version=1, **(write.data or {}))
+                        .returning(*table.c)
+                    )
+                    return _record(write.kind, inserted.one())
+            except IntegrityError:
+                # Only a duplicate key is a conflict. A foreign-key, NOT NULL
+                # or CHECK failure is a bad row, and retrying will not fix it.
+                actual = await self._version(conn, write)
+                if actual == 0:
+                    raise
+                raise ConflictError(write.kind, write.id, 0, actual)
+        if write.data is None:
+            actual = await self._version(conn, write, lock=True)
+            if actual != write.expected:
+                raise ConflictError(write.kind, write.id, write.expected, actual)
+            return None
+        row = (
+            await conn.execute(
+                update(table)
+                .where(table.c.id == write.id, table.c.version == write.expected)
+                .values(version=table.c.version + 1, **write.data)
+                .returning(*table.c)
+            )
+        ).one_or_none()
+        if row is None:
+            actual = await self._version(conn, write)
+            raise ConflictError(write.kind, write.id, write.expected, actual)
+        return _record(write.kind, row)
+
+    async def _version(self, conn: AsyncConnection, write: Write, lock: bool = False) -> int:
+        table = TABLES[write.kind]
+        query = select(table.c.version).where(table.c.id == write.id)
+        if lock:
+            query = query.with_for_update(read=True)
+        version = (await conn.execute(query)).scalar_one_or_none()
+        return version or 0
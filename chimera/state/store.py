@@ -0,0 +1,109 @@
+"""
+Versioned record store interface shared by the memory and SQL backends.
+
+Every record carries a version. It starts at 1 and goes up by one on each
+committed update. A commit is a list of ``Write``s applied atomically. Each
+write names the version its author read:
+
+    expected == 0           create; conflicts if the record exists
+    expected > 0, data      compare-and-swap update; conflicts if the stored
+                            version moved on
+    expected > 0, no data   read validation only; the record must still be
+                            at that version when the commit lands
+
+If any write conflicts, nothing is applied and ``ConflictError`` names the
+stale record. Readers never block writers, so many Judges can validate in
+parallel and only pay when they actually collide.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Record kinds; the SQL backend maps each to its table in specs/technical.md.
+KINDS: tuple[str, ...] = ("campaign", "content", "approval")
+
+
+@dataclass(frozen=True)
+class Record:
+    """One stored record: its fields in ``data`` and the version they are at."""
+
+    kind: str
+    id: str
+    version: int
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Write:
+    """One entry of a commit. See the module docstring for ``expected``."""
+
+    kind: str
+    id: str
+    expected: int
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def create(cls, kind: str, id: str, data: dict[str, Any]) -> "Write":
+        return cls(kind, id, 0, data)
+
+    @classmethod
+    def update(cls, record: Record, **changes: Any) -> "Write":
+        return cls(record.kind, record.id, record.version, changes)
+
+    @classmethod
+    def unchanged(cls, record: Record) -> "Write":
+        return cls(record.kind, record.id, record.version)
+
+
+class ConflictError(Exception):
+    """A commit read a version that is no longer current. ``actual`` 0 = missing."""
+
+    def __init__(self, kind: str, id: str, expected: int, actual: int):
+        super().__init__(f"{kind} {id}: expected version {expected}, found {actual}")
+        self.kind = kind
+        self.id = id
+        self.expected = expected
+        self.actual = actual
+
+
+class StateStore(ABC):
+    """Records with optimistic, compare-and-swap commits."""
+
+    async def get(self, kind: str, id: str) -> Record | None:
+        records = await self.get_many(kind, [id])
+        return records.get(id)
+
+    @abstractmethod
+    async def get_many(self, kind: str, ids: Iterable[str]) -> dict[str, Record]:
+        """Current records by id; missing ids are left out."""
+
+    @abstractmethod
+    async def commit(self, writes: Iterable[Write]) -> list[Record]:
+        """
+        Apply ``writes`` atomically; returns the written records at their new
+        versions (validation-only writes are not returned).
+
+        Raises ``ConflictError`` and applies nothing if any write is stale.
+        """
+
+    async def close(self) -> None:
+        """Release connections. The memory backend has none."""
+
+
+def check_kind(kind: str) -> None:
+    if kind not in KINDS:
+        raise ValueError(f"unknown record kind {kind!r}; expected one of {KINDS}")
+
+
+def check_writes(writes: Iterable[Write]) -> list[Write]:
+    """``writes`` as a list, with known kinds and at most one write per record."""
+    writes = list(writes)
+    seen: set[tuple[str, str]] = set()
+    for write in writes:
+        check_kind(write.kind)
+        if (write.kind, write.id) in seen:
+            raise ValueError(f"more than one write for {write.kind} {write.id}")
+        seen.add((write.kind, write.id))
+    return writes
@@ -0,0 +1,19 @@
+"""
+TaskQueue for the Planner/Worker/Judge swarm.
+
+Tasks follow the schema in research/SRS.md#6.1-data-models. Queues expose
+high/medium/low priority lanes, batch dequeue and visibility timeouts: a
+task leased by a worker that neither acks nor extends it before the lease
+runs out is re-queued automatically.
+
+Backends:
+    MemoryTaskQueue - in-process, for tests and single-node runs.
+    RedisTaskQueue  - shared across workers (research/SRS.md#7 Phase 1).
+"""
+
+from chimera.tasks.memory import MemoryTaskQueue
+from chimera.tasks.models import Priority, Task, TaskStatus
+from chimera.tasks.queue import TaskQueue
+from chimera.tasks.redis_queue import RedisTaskQueue
+
+__all__ = ["MemoryTaskQueue", "Priority", "RedisTaskQueue", "Task", "TaskQueue", "TaskStatus"]
@@ -0,0 +1,111 @@
+"""
+In-process TaskQueue backend.
+
+Used by tests and single-process runs. It has the same semantics as
+``RedisTaskQueue``: deques per lane, a lease map and a deadline heap, so
+expired leases are found without scanning every in-flight task.
+"""
+
+import heapq
+import time
+from collections import deque
+from collections.abc import Iterable
+
+from chimera.tasks.models import LANES, Priority, Task, TaskStatus
+from chimera.tasks.queue import DEFAULT_MAX_ATTEMPTS, DEFAULT_VISIBILITY_TIMEOUT_S, TaskQueue
+
+
+class MemoryTaskQueue(TaskQueue):
+    """TaskQueue held in this process's memory."""
+
+    def __init__(
+        self,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT_S,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        super().__init__(visibility_timeout, max_attempts)
+        self._lanes: dict[Priority, deque[Task]] = {lane: deque() for lane in LANES}
+        self._leases: dict[str, tuple[Task, float]] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        self._attempts: dict[str, int] = {}
+        self.dead: list[Task] = []
+
+    async def enqueue_many(self, tasks: Iterable[Task]) -> int:
+        added = 0
+        for task in tasks:
+            task.status = TaskStatus.PENDING
+            task.assigned_worker_id = None
+            self._lanes[task.priority].append(task)
+            added += 1
+        return added
+
+    async def _lease(self, worker_id: str, max_tasks: int, deadline: float) -> list[Task]:
+        await self.requeue_expired()
+        leased: list[Task] = []
+        for lane in LANES:
+            queue = self._lanes[lane]
+            while queue and len(leased) < max_tasks:
+                task = queue.popleft()
+                task.status = TaskStatus.IN_PROGRESS
+                task.assigned_worker_id = worker_id
+                self._attempts[task.task_id] = self._attempts.get(task.task_id, 0) + 1
+                self._leases[task.task_id] = (task, deadline)
+                heapq.heappush(self._deadlines, (deadline, task.task_id))
+                leased.append(task)
+        return leased
+
+    async def ack(self, task_id: str) -> bool:
+        lease = self._leases.pop(task_id, None)
+        if lease is None:
+            return False
+        lease[0].status = TaskStatus.COMPLETE
+        self._attempts.pop(task_id, None)
+        return True
+
+    async def nack(self, task_id: str) -> bool:
+        lease = self._leases.pop(task_id, None)
+        if lease is None:
+            return False
+        self._return(lease[0])
+        return True
+
+    async def extend(self, task_id: str, seconds: float) -> bool:
+        lease = self._leases.get(task_id)
+        if lease is None:
+            return False
+        deadline = time.time() + seconds
+        self._leases[task_id] = (lease[0], deadline)
+        heapq.heappush(self._deadlines, (deadline, task_id))
+        return True
+
+    async def requeue_expired(self) -> int:
+        now = time.time()
+        requeued = 0
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, task_id = heapq.heappop(self._deadlines)
+            lease = self._leases.get(task_id)
+            # Skip heap entries superseded by ack/nack/extend.
+            if lease is None or lease[1] != deadline:
+                continue
+            del self._leases[task_id]
+            self._return(lease[0])
+            requeued += 1
+        return requeued
+
+    def _return(self, task: Task) -> None:
+        task.assigned_worker_id = None
+        if self._attempts.get(task.task_id, 0) >= self.max_attempts:
+            self._attempts.pop(task.task_id, None)
+            self.dead.append(task)
+            return
+        task.status = TaskStatus.PENDING
+        self._lanes[task.priority].appendleft(task)
+
+    async def counts(self) -> dict[str, int]:
+        counts = {lane.value: len(self._lanes[lane]) for lane in LANES}
+        counts["in_flight"] = len(self._leases)
+        counts["dead"] = len(self.dead)
+        return counts
+
+    async def dead_letters(self, limit: int = 100) -> list[Task]:
+        return self.dead[:limit]
@@ -0,0 +1,81 @@
+"""
+Task model.
+
+See: research/SRS.md#6.1-data-models (Task Schema)
+"""
+
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+
+
+class Priority(StrEnum):
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
+# Dequeue order: every high task goes before any medium task, and so on.
+LANES: tuple[Priority, ...] = (Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+
+
+class TaskStatus(StrEnum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    REVIEW = "review"
+    COMPLETE = "complete"
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+@dataclass
+class Task:
+    """
+    One unit of work for a Worker.
+
+    ``task_type`` is open-ended: the SRS names generate_content,
+    reply_comment and execute_transaction, and the runtime also accepts
+    skill names.
+    """
+
+    task_type: str
+    priority: Priority = Priority.MEDIUM
+    context: dict[str, Any] = field(default_factory=dict)
+    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    assigned_worker_id: str | None = None
+    created_at: str = field(default_factory=_now)
+    status: TaskStatus = TaskStatus.PENDING
+
+    def __post_init__(self) -> None:
+        self.priority = Priority(self.priority)
+        self.status = TaskStatus(self.status)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["priority"] = self.priority.value
+        data["status"] = self.status.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Task":
+        return cls(
+            task_type=data["task_type"],
+            priority=Priority(data.get("priority", Priority.MEDIUM)),
+            context=data.get("context", {}),
+            task_id=data.get("task_id") or str(uuid.uuid4()),
+            assigned_worker_id=data.get("assigned_worker_id"),
+            created_at=data.get("created_at") or _now(),
+            status=TaskStatus(data.get("status", TaskStatus.PENDING)),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "Task":
+        return cls.from_dict(json.loads(raw))
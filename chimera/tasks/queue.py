@@ -0,0 +1,100 @@
+"""
+TaskQueue interface shared by the memory and Redis backends.
+
+Lifecycle:
+    enqueue -> pending in its priority lane
+    dequeue -> leased to a worker (in_progress) until the visibility timeout
+    ack     -> complete, removed from the queue
+    nack    -> back to the front of its lane straight away
+    timeout -> re-queued by ``requeue_expired()``; after ``max_attempts``
+               leases the task moves to the dead-letter list instead
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from chimera.tasks.models import Task
+
+DEFAULT_VISIBILITY_TIMEOUT_S = 30.0
+DEFAULT_MAX_ATTEMPTS = 5
+POLL_INTERVAL_S = 0.01
+MAX_POLL_INTERVAL_S = 0.2
+
+
+class TaskQueue(ABC):
+    """Priority task queue with leases."""
+
+    def __init__(
+        self,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT_S,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+
+    async def enqueue(self, task: Task) -> str:
+        """Add one task; returns its task_id."""
+        await self.enqueue_many([task])
+        return task.task_id
+
+    @abstractmethod
+    async def enqueue_many(self, tasks: Iterable[Task]) -> int:
+        """Add tasks in one round trip; returns how many were added."""
+
+    @abstractmethod
+    async def _lease(self, worker_id: str, max_tasks: int, deadline: float) -> list[Task]:
+        """
+        Lease up to ``max_tasks`` pending tasks in priority order.
+
+        Implementations re-queue expired leases first, in the same step.
+        """
+
+    @abstractmethod
+    async def ack(self, task_id: str) -> bool:
+        """Mark a leased task complete. False if the lease was already lost."""
+
+    @abstractmethod
+    async def nack(self, task_id: str) -> bool:
+        """Return a leased task to the front of its lane."""
+
+    @abstractmethod
+    async def extend(self, task_id: str, seconds: float) -> bool:
+        """Push a lease deadline ``seconds`` into the future."""
+
+    @abstractmethod
+    async def requeue_expired(self) -> int:
+        """Re-queue (or dead-letter) tasks whose lease ran out."""
+
+    @abstractmethod
+    async def counts(self) -> dict[str, int]:
+        """Pending per lane, plus ``in_flight`` and ``dead``."""
+
+    @abstractmethod
+    async def dead_letters(self, limit: int = 100) -> list[Task]:
+        """Tasks that exhausted ``max_attempts``, oldest first."""
+
+    async def dequeue(
+        self,
+        worker_id: str,
+        max_tasks: int = 1,
+        visibility_timeout: float | None = None,
+        wait: float = 0.0,
+    ) -> list[Task]:
+        """
+        Lease up to ``max_tasks`` tasks, highest priority first.
+
+        With ``wait > 0`` an empty queue is polled (with backoff) for up to
+        ``wait`` seconds before returning an empty list.
+        """
+        timeout = self.visibility_timeout if visibility_timeout is None else visibility_timeout
+        give_up = time.monotonic() + wait
+        interval = POLL_INTERVAL_S
+        while True:
+            tasks = await self._lease(worker_id, max_tasks, time.time() + timeout)
+            remaining = give_up - time.monotonic()
+            if tasks or remaining <= 0:
+                return tasks
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, MAX_POLL_INTERVAL_S)
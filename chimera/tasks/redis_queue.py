@@ -0,0 +1,207 @@
+"""
+Redis TaskQueue backend.
+
+Layout under ``namespace``:
+    <ns>:lane:<priority>  LIST   pending task ids, one list per lane
+    <ns>:tasks            HASH   task id -> task JSON
+    <ns>:lane_of          HASH   task id -> lane index (1=high, 2=medium, 3=low)
+    <ns>:leases           ZSET   task id scored by lease deadline
+    <ns>:workers          HASH   task id -> assigned worker
+    <ns>:attempts         HASH   task id -> lease count
+    <ns>:dead             LIST   task ids that exhausted max_attempts
+
+Batch dequeue is a single Lua call. It first re-queues expired leases, then
+pops up to N ids across the lanes in priority order and records their leases.
+Every state change is therefore atomic and costs one round trip.
+
+Takes any ``redis.asyncio.Redis``-compatible client (``decode_responses``
+may be either).
+"""
+
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from chimera.tasks.models import LANES, Task, TaskStatus
+from chimera.tasks.queue import DEFAULT_MAX_ATTEMPTS, DEFAULT_VISIBILITY_TIMEOUT_S, TaskQueue
+
+# KEYS: tasks, lane_of, leases, workers, attempts, dead, lane_high, lane_medium, lane_low
+# Defines requeue(id, max_attempts): lease -> front of its lane, or dead-letter.
+_REQUEUE_FN = """
+local function requeue(id, max_attempts)
+  redis.call('HDEL', KEYS[4], id)
+  local attempts = tonumber(redis.call('HGET', KEYS[5], id) or '0')
+  if attempts >= max_attempts then
+    redis.call('HDEL', KEYS[5], id)
+    redis.call('RPUSH', KEYS[6], id)
+  else
+    local lane = tonumber(redis.call('HGET', KEYS[2], id) or '2')
+    redis.call('LPUSH', KEYS[6 + lane], id)
+  end
+end
+
+local function reap(now, max_attempts)
+  local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now, 'LIMIT', 0, 1000)
+  for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[3], id)
+    requeue(id, max_attempts)
+  end
+  return #expired
+end
+"""
+
+# ARGV: now, deadline, max_tasks, max_attempts, worker_id
+_LEASE_LUA = (
+    _REQUEUE_FN
+    + """
+local max_tasks = tonumber(ARGV[3])
+reap(tonumber(ARGV[1]), tonumber(ARGV[4]))
+local out = {}
+local taken = 0
+for lane = 7, 9 do
+  if taken >= max_tasks then break end
+  local ids = redis.call('LPOP', KEYS[lane], max_tasks - taken)
+  if ids then
+    for _, id in ipairs(ids) do
+      local body = redis.call('HGET', KEYS[1], id)
+      if body then
+        redis.call('ZADD', KEYS[3], ARGV[2], id)
+        redis.call('HSET', KEYS[4], id, ARGV[5])
+        redis.call('HINCRBY', KEYS[5], id, 1)
+        table.insert(out, body)
+        taken = taken + 1
+      end
+    end
+  end
+end
+return out
+"""
+)
+
+# ARGV: now, max_attempts
+_REAP_LUA = _REQUEUE_FN + "\nreturn reap(tonumber(ARGV[1]), tonumber(ARGV[2]))\n"
+
+# ARGV: task_id
+_ACK_LUA = """
+if redis.call('ZREM', KEYS[3], ARGV[1]) == 0 then return 0 end
+redis.call('HDEL', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+redis.call('HDEL', KEYS[5], ARGV[1])
+return 1
+"""
+
+# ARGV: task_id, max_attempts
+_NACK_LUA = (
+    _REQUEUE_FN
+    + """
+if redis.call('ZREM', KEYS[3], ARGV[1]) == 0 then return 0 end
+requeue(ARGV[1], tonumber(ARGV[2]))
+return 1
+"""
+)
+
+# ARGV: task_id, deadline
+_EXTEND_LUA = """
+if not redis.call('ZSCORE', KEYS[3], ARGV[1]) then return 0 end
+redis.call('ZADD', KEYS[3], ARGV[2], ARGV[1])
+return 1
+"""
+
+_LANE_INDEX = {lane: i + 1 for i, lane in enumerate(LANES)}
+
+
+class RedisTaskQueue(TaskQueue):
+    """TaskQueue shared by every worker connected to the same Redis."""
+
+    def __init__(
+        self,
+        client: Any,
+        namespace: str = "chimera:tasks",
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT_S,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        super().__init__(visibility_timeout, max_attempts)
+        self.client = client
+        self.namespace = namespace
+        self.keys = [
+            f"{namespace}:tasks",
+            f"{namespace}:lane_of",
+            f"{namespace}:leases",
+            f"{namespace}:workers",
+            f"{namespace}:attempts",
+            f"{namespace}:dead",
+            *(f"{namespace}:lane:{lane.value}" for lane in LANES),
+        ]
+        self._lease_script = client.register_script(_LEASE_LUA)
+        self._reap_script = client.register_script(_REAP_LUA)
+        self._ack_script = client.register_script(_ACK_LUA)
+        self._nack_script = client.register_script(_NACK_LUA)
+        self._extend_script = client.register_script(_EXTEND_LUA)
+
+    async def enqueue_many(self, tasks: Iterable[Task]) -> int:
+        bodies: dict[str, str] = {}
+        lanes: dict[str, int] = {}
+        by_lane: dict[str, list[str]] = {}
+        for task in tasks:
+            task.status = TaskStatus.PENDING
+            task.assigned_worker_id = None
+            bodies[task.task_id] = task.to_json()
+            lanes[task.task_id] = _LANE_INDEX[task.priority]
+            by_lane.setdefault(self.keys[5 + _LANE_INDEX[task.priority]], []).append(task.task_id)
+        if not bodies:
+            return 0
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(self.keys[0], mapping=bodies)
+        pipe.hset(self.keys[1], mapping=lanes)
+        for key, ids in by_lane.items():
+            pipe.rpush(key, *ids)
+        await pipe.execute()
+        return len(bodies)
+
+    async def _lease(self, worker_id: str, max_tasks: int, deadline: float) -> list[Task]:
+        bodies = await self._lease_script(
+            keys=self.keys,
+            args=[time.time(), deadline, max_tasks, self.max_attempts, worker_id],
+        )
+        tasks = []
+        for body in bodies:
+            task = Task.from_json(body)
+            task.status = TaskStatus.IN_PROGRESS
+            task.assigned_worker_id = worker_id
+            tasks.append(task)
+        return tasks
+
+    async def ack(self, task_id: str) -> bool:
+        return bool(await self._ack_script(keys=self.keys, args=[task_id]))
+
+    async def nack(self, task_id: str) -> bool:
+        args = [task_id, self.max_attempts]
+        return bool(await self._nack_script(keys=self.keys, args=args))
+
+    async def extend(self, task_id: str, seconds: float) -> bool:
+        args = [task_id, time.time() + seconds]
+        return bool(await self._extend_script(keys=self.keys, args=args))
+
+    async def requeue_expired(self) -> int:
+        args = [time.time(), self.max_attempts]
+        return int(await self._reap_script(keys=self.keys, args=args))
+
+    async def counts(self) -> dict[str, int]:
+        pipe = self.client.pipeline(transaction=False)
+        for key in self.keys[6:]:
+            pipe.llen(key)
+        pipe.zcard(self.keys[2])
+        pipe.llen(self.keys[5])
+        *lanes, in_flight, dead = await pipe.execute()
+        counts = {lane.value: int(n) for lane, n in zip(LANES, lanes, strict=True)}
+        counts["in_flight"] = int(in_flight)
+        counts["dead"] = int(dead)
+        return counts
+
+    async def dead_letters(self, limit: int = 100) -> list[Task]:
+        ids = await self.client.lrange(self.keys[5], 0, limit - 1)
+        if not ids:
+            return []
+        bodies = await self.client.hmget(self.keys[0], ids)
+        return [Task.from_json(body) for body in bodies if body is not None]
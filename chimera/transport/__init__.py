@@ -0,0 +1,11 @@
+"""
+Shared HTTP transport for all skills.
+
+One process-wide connection pool with keep-alive reuse, per-host limits,
+DNS caching and HTTP/2 where the ``h2`` package is installed.
+"""
+
+from chimera.transport.pool import HttpPool, default_pool, set_default_pool
+from chimera.transport.stats import PoolStats
+
+__all__ = ["HttpPool", "PoolStats", "default_pool", "set_default_pool"]
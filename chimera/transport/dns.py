@@ -0,0 +1,103 @@
+"""
+Caching network backend for the shared HTTP pool.
+
+Wraps the default httpcore backend to cache DNS answers for a TTL and to
+count every new TCP connection, which is what the pool reports as a miss.
+TLS still uses the original hostname for SNI and certificate checks; only the
+address lookup is cached.
+
+Every address of an answer is cached, and a connection tries them in
+order, as connecting by hostname would. A failed connect evicts the
+answer, so the next connection resolves the host again.
+"""
+
+import asyncio
+import ipaddress
+import socket
+import time
+from collections.abc import Iterable
+from typing import Any
+
+import httpcore
+
+from chimera.transport.stats import PoolStats
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """httpcore backend with a TTL'd DNS cache and connection accounting."""
+
+    def __init__(
+        self,
+        stats: PoolStats,
+        dns_ttl: float = 300.0,
+        inner: httpcore.AsyncNetworkBackend | None = None,
+    ):
+        self.stats = stats
+        self.dns_ttl = dns_ttl
+        self.inner = inner or httpcore.AnyIOBackend()
+        self._cache: dict[tuple[str, int], tuple[float, tuple[str, ...]]] = {}
+
+    async def resolve(self, host: str, port: int) -> tuple[str, ...]:
+        """Return cached addresses for ``host``, resolving them when stale."""
+        if _is_ip(host) or self.dns_ttl <= 0:
+            return (host,)
+        key = (host, port)
+        cached = self._cache.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            self.stats.dns_hits += 1
+            return cached[1]
+        self.stats.dns_misses += 1
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = tuple(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._cache[key] = (now + self.dns_ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = await self.resolve(host, port)
+        self.stats.record_connection(host)
+        for i, address in enumerate(addresses):
+            try:
+                return await self.inner.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                self._cache.pop((host, port), None)
+                if i == len(addresses) - 1:
+                    raise
+        raise httpcore.ConnectError(f"no addresses for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        self.stats.record_connection(path)
+        return await self.inner.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self.inner.sleep(seconds)
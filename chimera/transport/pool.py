@@ -0,0 +1,175 @@
+"""
+Process-wide pooled HTTP client.
+
+``HttpPool`` wraps ``httpx.AsyncClient`` with:
+    - keep-alive connection reuse (one pool per process, not per skill)
+    - HTTP/2 when the optional ``h2`` package is installed
+    - a per-host concurrency limit on top of httpx's global limit
+    - a TTL'd DNS cache (see ``chimera.transport.dns``)
+    - hit/miss counters for sizing the pool (``HttpPool.stats``)
+
+httpx clients are bound to the event loop they first ran on, so the pool
+keeps one client per loop. In practice that is a single client: skills run
+on the shared skills loop (``skills.base.shared_loop``).
+
+Skills receive the pool through ``config["http_pool"]`` and fall back to
+``default_pool()``.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpcore
+import httpx
+
+from chimera.transport.dns import CachingNetworkBackend
+from chimera.transport.stats import PoolStats
+
+
+def http2_available() -> bool:
+    """True when httpx can negotiate HTTP/2 (``pip install httpx[http2]``)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+    """httpx transport whose connection pool uses the caching backend."""
+
+    def __init__(self, backend: CachingNetworkBackend, limits: httpx.Limits, http2: bool):
+        super().__init__(limits=limits, http2=http2)
+        # AsyncHTTPTransport has no network_backend argument, so rebuild its
+        # httpcore pool with the same settings plus our backend.
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=backend,
+        )
+
+
+class _LoopState:
+    """Client and per-host semaphores bound to one event loop."""
+
+    def __init__(self, client: httpx.AsyncClient, per_host: int):
+        self.client = client
+        self.per_host = per_host
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self.semaphores.get(host)
+        if sem is None:
+            sem = self.semaphores[host] = asyncio.Semaphore(self.per_host)
+        return sem
+
+
+class HttpPool:
+    """Shared keep-alive HTTP client with per-host limits and stats."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        max_keepalive: int = 20,
+        keepalive_expiry: float = 30.0,
+        dns_ttl: float = 300.0,
+        http2: bool | None = None,
+        timeout: float = 10.0,
+        headers: dict[str, str] | None = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2_available() if http2 is None else http2
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.stats = PoolStats()
+        self._backend = CachingNetworkBackend(self.stats, dns_ttl=dns_ttl)
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None or state.client.is_closed:
+                transport = _PooledTransport(self._backend, self.limits, self.http2)
+                client = httpx.AsyncClient(
+                    transport=transport, timeout=self.timeout, headers=self.headers
+                )
+                state = self._states[loop] = _LoopState(client, self.max_connections_per_host)
+            return state
+
+    def client(self) -> httpx.AsyncClient:
+        """The underlying client for the running loop (no per-host limit)."""
+        return self._state().client
+
+    @asynccontextmanager
+    async def _host_slot(self, state: _LoopState, url: str) -> AsyncIterator[None]:
+        host = httpx.URL(url).host
+        self.stats.record_request(host)
+        sem = state.semaphore(host)
+        if sem.locked():
+            self.stats.host_limit_waits += 1
+        async with sem:
+            yield
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request and read the full response body."""
+        state = self._state()
+        async with self._host_slot(state, url):
+            return await state.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Stream a response; the per-host slot is held until the block exits."""
+        state = self._state()
+        async with self._host_slot(state, url):
+            async with state.client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def aclose(self) -> None:
+        """Close the client bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.pop(loop, None)
+        if state is not None:
+            await state.client.aclose()
+
+
+_default_pool: HttpPool | None = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> HttpPool:
+    """The process-wide pool shared by every skill without its own."""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = HttpPool()
+        return _default_pool
+
+
+def set_default_pool(pool: HttpPool | None) -> None:
+    """Replace the process-wide pool (``None`` resets to a fresh default)."""
+    global _default_pool
+    with _default_lock:
+        _default_pool = pool
@@ -0,0 +1,63 @@
+"""
+Counters for the shared HTTP pool.
+
+A request that opens a new connection is a miss; every other request reused
+a keep-alive (or multiplexed HTTP/2) connection and is a hit.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class PoolStats:
+    """Pool hit/miss and DNS cache counters."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    dns_hits: int = 0
+    dns_misses: int = 0
+    host_limit_waits: int = 0
+    requests_by_host: Counter[str] = field(default_factory=Counter)
+    connections_by_host: Counter[str] = field(default_factory=Counter)
+
+    def record_request(self, host: str) -> None:
+        self.requests += 1
+        self.requests_by_host[host] += 1
+
+    def record_connection(self, host: str) -> None:
+        self.connections_opened += 1
+        self.connections_by_host[host] += 1
+
+    @property
+    def hits(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def misses(self) -> int:
+        return min(self.connections_opened, self.requests)
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Snapshot suitable for logging or a metrics endpoint."""
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+            "connections_opened": self.connections_opened,
+            "dns_hits": self.dns_hits,
+            "dns_misses": self.dns_misses,
+            "host_limit_waits": self.host_limit_waits,
+            "hosts": {
+                host: {
+                    "requests": count,
+                    "connections": self.connections_by_host.get(host, 0),
+                }
+                for host, count in self.requests_by_host.items()
+            },
+        }
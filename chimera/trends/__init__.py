@@ -0,0 +1,25 @@
+"""
+Trend analytics for the Planner.
+
+``TrendSeries`` keeps rolling windows of trend snapshots in NumPy ring
+buffers and ranks rising trends by velocity, acceleration and decayed heat
+without going back to the database.
+
+``TrendClusters`` merges the same trend seen on several platforms into one
+cluster with per-platform volumes, using hashtag matching and MinHash LSH
+over titles, joined by union-find.
+
+Reference: research/SRS.md#4.2-perception-system-fr-2.0-2.2
+"""
+
+from chimera.trends.clusters import Cluster, TrendClusters, normalize_hashtag
+from chimera.trends.series import RANKINGS, TrendSeries, series_key
+
+__all__ = [
+    "RANKINGS",
+    "Cluster",
+    "TrendClusters",
+    "TrendSeries",
+    "normalize_hashtag",
+    "series_key",
+]
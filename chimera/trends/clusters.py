@@ -0,0 +1,302 @@
+"""
+Cross-platform trend clustering.
+
+One story often trends on several platforms at once, for example
+``#ViralChallenge2024`` on TikTok, a "Viral Challenge 2024 compilation"
+upload on YouTube, and a tweet quoting both. Each fetch returns those as
+separate records. ``TrendClusters`` links them incrementally:
+
+- hashtags are normalized (NFKC, case-folded, ``#`` and punctuation
+  dropped), and two trends sharing a hashtag are linked;
+- titles and hashtags are split into words, CamelCase hashtags included,
+  and MinHashed as word sets. The LSH index finds candidates, and a trend
+  is linked to candidates on other platforms whose word-set Jaccard reaches
+  the threshold. Words are used rather than the character grams used for
+  captions, because short unrelated titles share too many grams. Trends on
+  the same platform are only linked by hashtag, since the platform already
+  tells its own trends apart and tweets share boilerplate words;
+- links are merged with union-find, so a cluster is every trend reachable
+  through any chain of links.
+
+A cluster's id is the key (``platform:id``) of its earliest member, so the
+id stays the same as the cluster grows. Clusters only ever merge. ``evict()``
+drops stale trends and rebuilds the clusters from the trends that remain.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any
+
+import numpy as np
+
+from chimera.cache.fingerprint import NUM_PERM, MinHashLSH, canonical_text, minhash_codes
+from chimera.trends.series import series_key
+
+DEFAULT_THRESHOLD = 0.6
+# LSH candidates are looked up this far below the threshold, then checked
+# against it with exact word-set Jaccard. 64-permutation estimates have a
+# standard deviation of about 0.06, so they are not used for the decision.
+CANDIDATE_MARGIN = 0.15
+# 32 bands of 2 rows: pairs at 0.45 similarity become candidates more than
+# 99.9% of the time.
+DEFAULT_BANDS = 32
+# Tags that ride along on unrelated posts and would chain everything together.
+STOP_TAGS = frozenset(
+    {"explore", "foryou", "foryoupage", "fyp", "reels", "shorts", "trend", "trending", "viral"}
+)
+
+_HASHTAG = re.compile(r"#\w+")
+_NOT_TAG = re.compile(r"[\W_]+")
+_WORD = re.compile(r"\w+")
+_CAMEL = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Za-z])(?=[0-9])|(?<=[0-9])(?=[A-Za-z])")
+
+
+def normalize_hashtag(tag: str) -> str:
+    """``#Viral_Challenge-2024`` -> ``viralchallenge2024``."""
+    return _NOT_TAG.sub("", canonical_text(tag))
+
+
+def hashtags(trend: dict[str, Any]) -> list[str]:
+    """Raw hashtags of a trend: ``metadata.hashtags`` and ``#tags`` in the title."""
+    tags = trend.get("metadata", {}).get("hashtags") or []
+    return [tag for tag in tags if isinstance(tag, str)] + _HASHTAG.findall(trend["title"])
+
+
+def signature_words(
+    trend: dict[str, Any], stop_tags: frozenset[str] = STOP_TAGS
+) -> frozenset[str]:
+    """Words of the title and hashtags, CamelCase split, stop tags left out."""
+    tags = [tag for tag in hashtags(trend) if normalize_hashtag(tag) not in stop_tags]
+    title = _HASHTAG.sub(" ", trend["title"])
+    raw = _CAMEL.sub(" ", " ".join([title, *tags])).replace("_", " ")
+    return frozenset(_WORD.findall(canonical_text(raw)))
+
+
+def _word_codes(words: frozenset[str]) -> np.ndarray:
+    digests = (blake2b(word.encode(), digest_size=8).digest() for word in words or [""])
+    return np.array([int.from_bytes(d, "little") for d in digests], dtype=np.uint64)
+
+
+@dataclass(frozen=True)
+class Cluster:
+    """One trend as seen across platforms."""
+
+    id: str
+    title: str
+    members: tuple[str, ...]
+    platform_volumes: dict[str, int]
+
+    @property
+    def volume(self) -> int:
+        return sum(self.platform_volumes.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "members": list(self.members),
+            "platform_volumes": dict(self.platform_volumes),
+            "volume": self.volume,
+        }
+
+
+@dataclass(slots=True)
+class _Member:
+    key: str
+    platform: str
+    title: str
+    volume: int
+    seq: int
+    last_seen: float
+    words: frozenset[str]
+    tags: frozenset[str]
+    signature: np.ndarray
+
+
+class TrendClusters:
+    """
+    Incremental hashtag + MinHash clustering of trends across platforms.
+
+    Args:
+        threshold: Smallest Jaccard similarity of ``signature_words`` that
+            links two trends.
+        bands: LSH bands; must divide the MinHash signature length.
+        stop_tags: Normalized hashtags that never link trends.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        bands: int = DEFAULT_BANDS,
+        stop_tags: Iterable[str] = STOP_TAGS,
+    ):
+        self.threshold = threshold
+        self.bands = bands
+        self.stop_tags = frozenset(stop_tags)
+        self._members: dict[str, _Member] = {}
+        self._seq = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        floor = max(self.threshold - CANDIDATE_MARGIN, 0.0)
+        self._lsh = MinHashLSH(floor, num_perm=NUM_PERM, bands=self.bands)
+        self._tag_owner: dict[str, str] = {}
+        self._parent: dict[str, str] = {}
+        self._groups: dict[str, list[str]] = {}
+        self._founder: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._members
+
+    # ------------------------------------------------------------------
+    # Union-find
+    # ------------------------------------------------------------------
+
+    def _find(self, key: str) -> str:
+        parent = self._parent
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def _union(self, a: str, b: str) -> None:
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return
+        if len(self._groups[ra]) < len(self._groups[rb]):
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        self._groups[ra].extend(self._groups.pop(rb))
+        founders = (self._founder[ra], self._founder.pop(rb))
+        self._founder[ra] = min(founders, key=lambda key: self._members[key].seq)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, trends: Iterable[dict[str, Any]], at: float) -> list[str]:
+        """
+        Add or refresh trends (skill_fetch_trends shape) seen at ``at``;
+        returns each trend's cluster id, in input order.
+        """
+        trends = list(trends)
+        keys = [series_key(trend) for trend in trends]
+        words = [signature_words(trend, self.stop_tags) for trend in trends]
+        changed = [
+            i
+            for i, (key, found) in enumerate(zip(keys, words, strict=True))
+            if key not in self._members or self._members[key].words != found
+        ]
+        signatures = minhash_codes([_word_codes(words[i]) for i in changed])
+        for i, signature in zip(changed, signatures, strict=True):
+            trend, key = trends[i], keys[i]
+            tags = frozenset(normalize_hashtag(tag) for tag in hashtags(trend))
+            member = self._members.get(key)
+            if member is None:
+                member = self._members[key] = _Member(
+                    key=key,
+                    platform=trend["platform"],
+                    title=trend["title"],
+                    volume=int(trend["volume"]),
+                    seq=self._seq,
+                    last_seen=at,
+                    words=words[i],
+                    tags=tags,
+                    signature=signature,
+                )
+                self._seq += 1
+            else:
+                member.words, member.tags, member.signature = words[i], tags, signature
+            self._link(member)
+        for trend, key in zip(trends, keys, strict=True):
+            member = self._members[key]
+            member.title, member.volume = trend["title"], int(trend["volume"])
+            member.last_seen = max(member.last_seen, at)
+        return [self.cluster_id(key) for key in keys]
+
+    def _link(self, member: _Member) -> None:
+        key = member.key
+        if key not in self._parent:
+            self._parent[key] = key
+            self._groups[key] = [key]
+            self._founder[key] = key
+        for tag in member.tags - self.stop_tags:
+            if len(tag) < 3:
+                continue
+            owner = self._tag_owner.setdefault(tag, key)
+            self._union(key, owner)
+        for _, other in self._lsh.near(member.signature):
+            found = self._members[other]  # type: ignore[index]
+            if found.platform == member.platform:
+                continue
+            shared = len(member.words & found.words)
+            if shared and shared >= self.threshold * len(member.words | found.words):
+                self._union(key, other)  # type: ignore[arg-type]
+        self._lsh.add(key, member.signature)
+
+    def evict(self, older_than: float) -> int:
+        """Forget trends not seen since ``older_than``; returns how many."""
+        stale = [key for key, member in self._members.items() if member.last_seen < older_than]
+        if not stale:
+            return 0
+        for key in stale:
+            del self._members[key]
+        self._reset()
+        for member in sorted(self._members.values(), key=lambda member: member.seq):
+            self._link(member)
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def cluster_id(self, key: str) -> str:
+        """Cluster id of a tracked trend; KeyError if it is not tracked."""
+        return self._founder[self._find(key)]
+
+    def cluster(self, key: str) -> Cluster:
+        """The cluster containing ``key`` (a trend key or a cluster id)."""
+        root = self._find(key)
+        members = [self._members[key] for key in self._groups[root]]
+        members.sort(key=lambda member: member.seq)
+        volumes: defaultdict[str, int] = defaultdict(int)
+        for member in members:
+            volumes[member.platform] += member.volume
+        return Cluster(
+            id=self._founder[root],
+            title=max(members, key=lambda member: member.volume).title,
+            members=tuple(member.key for member in members),
+            platform_volumes=dict(volumes),
+        )
+
+    def clusters(self) -> list[Cluster]:
+        """Every cluster, largest total volume first."""
+        found = [self.cluster(root) for root in self._groups]
+        return sorted(found, key=lambda cluster: cluster.volume, reverse=True)
+
+    def collapse(self, trends: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        One trend per cluster: the member with the highest engagement_score,
+        in order of each cluster's first appearance. Each gets
+        ``metadata.cluster_id`` and ``metadata.platform_volumes``. Every
+        trend must already have been added.
+        """
+        best: dict[str, dict[str, Any]] = {}
+        for trend in trends:
+            cluster_id = self.cluster_id(series_key(trend))
+            current = best.get(cluster_id)
+            if current is None or trend["engagement_score"] > current["engagement_score"]:
+                best[cluster_id] = trend
+        collapsed = []
+        for cluster_id, trend in best.items():
+            volumes = self.cluster(cluster_id).platform_volumes
+            metadata = {**trend["metadata"], "cluster_id": cluster_id}
+            metadata["platform_volumes"] = volumes
+            collapsed.append({**trend, "metadata": metadata})
+        return collapsed
@@ -0,0 +1,316 @@
+"""
+In-memory time series of trend snapshots, for ranking rising trends.
+
+Every fetch yields a ``volume`` and ``engagement_score`` per trend. Each
+trend owns one row of a set of NumPy ring buffers holding its last
+``window`` snapshots. Alongside the rings, every row keeps running sums, so
+a new snapshot updates these in O(1) without rereading the window:
+
+- velocity: least-squares slope of volume over the window (volume/hour);
+- acceleration: least-squares slope of velocity over the same window
+  (volume/hour²);
+- heat: volume growth with exponential decay. Each snapshot adds its
+  positive volume increase, and the total halves every ``half_life``
+  seconds, so a trend that stops growing cools off.
+
+A batch of snapshots is applied to all of its rows at once with fancy
+indexing. ``top()`` then ranks every live trend with one ``argpartition``.
+Neither path loops over trends in Python beyond the id-to-row lookup.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+DEFAULT_WINDOW = 48
+DEFAULT_HALF_LIFE_S = 6 * 3600.0
+DEFAULT_CAPACITY = 1024
+RANKINGS: tuple[str, ...] = ("heat", "velocity", "acceleration", "volume", "engagement_score")
+
+
+def series_key(trend: dict[str, Any]) -> str:
+    """Key for a trend in the skill_fetch_trends contract shape."""
+    return f"{trend['platform']}:{trend['id']}"
+
+
+def _slopes(
+    n: np.ndarray, st: np.ndarray, stt: np.ndarray, sy: np.ndarray, sty: np.ndarray
+) -> np.ndarray:
+    """Least-squares slopes from running sums; 0 where fewer than two distinct times."""
+    denominator = n * stt - st * st
+    numerator = n * sty - st * sy
+    # Equal times leave only rounding noise in the denominator.
+    spread = denominator > 1e-12 * n * stt
+    return np.where(spread, numerator / np.where(spread, denominator, 1.0), 0.0)
+
+
+class TrendSeries:
+    """
+    Rolling snapshot windows and derived signals for many trends.
+
+    Args:
+        window: Snapshots kept per trend.
+        half_life: Seconds for heat to halve without new growth.
+        capacity: Initial rows; doubles when full.
+
+    Times are Unix seconds. Snapshots older than a trend's latest one are
+    ignored.
+    """
+
+    # (attribute, is a ring of ``window`` columns, dtype)
+    _ARRAYS: tuple[tuple[str, bool, Any], ...] = (
+        # Rings: snapshot time (hours since origin), volume, velocity.
+        ("_t", True, np.float64),
+        ("_v", True, np.float64),
+        ("_u", True, np.float64),
+        # Ring position and fill.
+        ("_n", False, np.int64),
+        ("_head", False, np.int64),
+        # Running sums over the window: t, t², volume, t·volume, velocity, t·velocity.
+        ("_st", False, np.float64),
+        ("_stt", False, np.float64),
+        ("_sv", False, np.float64),
+        ("_stv", False, np.float64),
+        ("_su", False, np.float64),
+        ("_stu", False, np.float64),
+        # Latest values and derived signals.
+        ("_last_t", False, np.float64),
+        ("_last_v", False, np.float64),
+        ("_score", False, np.float64),
+        ("_velocity", False, np.float64),
+        ("_acceleration", False, np.float64),
+        ("_heat", False, np.float64),
+        ("_live", False, bool),
+    )
+    _t: np.ndarray
+    _v: np.ndarray
+    _u: np.ndarray
+    _n: np.ndarray
+    _head: np.ndarray
+    _st: np.ndarray
+    _stt: np.ndarray
+    _sv: np.ndarray
+    _stv: np.ndarray
+    _su: np.ndarray
+    _stu: np.ndarray
+    _last_t: np.ndarray
+    _last_v: np.ndarray
+    _score: np.ndarray
+    _velocity: np.ndarray
+    _acceleration: np.ndarray
+    _heat: np.ndarray
+    _live: np.ndarray
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        half_life: float = DEFAULT_HALF_LIFE_S,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.half_life = half_life
+        self._origin: float | None = None
+        self._rows: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._free: list[int] = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Create or grow every per-row array to ``capacity`` rows."""
+        old = len(self._keys)
+        for name, shape, dtype in self._ARRAYS:
+            fresh = np.zeros((capacity, self.window) if shape else (capacity,), dtype=dtype)
+            if old:
+                fresh[:old] = getattr(self, name)
+            setattr(self, name, fresh)
+        self._keys.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(self, trends: Iterable[dict[str, Any]], at: float) -> int:
+        """Add one fetch's trends (skill_fetch_trends shape) observed at ``at``."""
+        latest: dict[str, tuple[float, float]] = {}
+        for trend in trends:
+            latest[series_key(trend)] = (float(trend["volume"]), float(trend["engagement_score"]))
+        keys = list(latest)
+        values = np.array([latest[key] for key in keys], dtype=np.float64).reshape(-1, 2)
+        return self.record_arrays(keys, values[:, 0], values[:, 1], at)
+
+    def record_arrays(
+        self, keys: Sequence[str], volumes: np.ndarray, scores: np.ndarray, at: float
+    ) -> int:
+        """
+        Add snapshots for distinct ``keys`` observed at ``at``; returns how
+        many were applied (stale ones are skipped).
+        """
+        if not len(keys):
+            return 0
+        if self._origin is None:
+            self._origin = at
+        rows = np.fromiter((self._row(key) for key in keys), dtype=np.int64, count=len(keys))
+        t = (at - self._origin) / 3600.0
+        fresh = ~self._live[rows] | (t >= self._last_t[rows])
+        rows, volumes, scores = rows[fresh], np.asarray(volumes)[fresh], np.asarray(scores)[fresh]
+        new = ~self._live[rows]
+        self._live[rows] = True
+
+        # Heat: decay to now, then add the volume gained since the last snapshot.
+        decay = np.exp2(-(t - self._last_t[rows]) * 3600.0 / self.half_life)
+        gained = np.where(new, 0.0, np.maximum(volumes - self._last_v[rows], 0.0))
+        self._heat[rows] = np.where(new, 0.0, self._heat[rows] * decay) + gained
+
+        # Drop the snapshot leaving the window from the running sums.
+        head = self._head[rows]
+        full = self._n[rows] == self.window
+        old_t = np.where(full, self._t[rows, head], 0.0)
+        old_v = np.where(full, self._v[rows, head], 0.0)
+        old_u = np.where(full, self._u[rows, head], 0.0)
+        self._st[rows] += t - old_t
+        self._stt[rows] += t * t - old_t * old_t
+        self._sv[rows] += volumes - old_v
+        self._stv[rows] += t * volumes - old_t * old_v
+        n = np.minimum(self._n[rows] + 1, self.window)
+        self._n[rows] = n
+
+        velocity = _slopes(n, self._st[rows], self._stt[rows], self._sv[rows], self._stv[rows])
+        self._su[rows] += velocity - old_u
+        self._stu[rows] += t * velocity - old_t * old_u
+        acceleration = _slopes(n, self._st[rows], self._stt[rows], self._su[rows], self._stu[rows])
+
+        self._t[rows, head] = t
+        self._v[rows, head] = volumes
+        self._u[rows, head] = velocity
+        self._head[rows] = (head + 1) % self.window
+        self._last_t[rows] = t
+        self._last_v[rows] = volumes
+        self._score[rows] = scores
+        self._velocity[rows] = velocity
+        self._acceleration[rows] = acceleration
+
+        # Re-sum each full window as its ring wraps, so that rounding error
+        # from the running add/subtract cannot build up.
+        wrapped = rows[self._head[rows] == 0]
+        if len(wrapped):
+            t_ring = self._t[wrapped]
+            self._st[wrapped] = t_ring.sum(axis=1)
+            self._stt[wrapped] = (t_ring * t_ring).sum(axis=1)
+            self._sv[wrapped] = self._v[wrapped].sum(axis=1)
+            self._stv[wrapped] = (t_ring * self._v[wrapped]).sum(axis=1)
+            self._su[wrapped] = self._u[wrapped].sum(axis=1)
+            self._stu[wrapped] = (t_ring * self._u[wrapped]).sum(axis=1)
+        return len(rows)
+
+    def _row(self, key: str) -> int:
+        row = self._rows.get(key)
+        if row is None:
+            if not self._free:
+                self._allocate(2 * len(self._keys))
+            row = self._free.pop()
+            self._rows[key] = row
+            self._keys[row] = key
+        return row
+
+    def evict(self, older_than: float) -> int:
+        """Forget trends not seen since ``older_than`` (Unix seconds); returns how many."""
+        if self._origin is None:
+            return 0
+        cutoff = (older_than - self._origin) / 3600.0
+        rows = np.flatnonzero(self._live & (self._last_t < cutoff))
+        for row in rows.tolist():
+            key = self._keys[row]
+            del self._rows[key]  # type: ignore[arg-type]
+            self._keys[row] = None
+            self._free.append(row)
+        self._live[rows] = False
+        self._n[rows] = 0
+        self._head[rows] = 0
+        for array in (self._st, self._stt, self._sv, self._stv, self._su, self._stu):
+            array[rows] = 0.0
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def heat(self, now: float) -> np.ndarray:
+        """Heat of every row decayed to ``now``; dead rows are -inf."""
+        if self._origin is None:
+            return np.full(len(self._keys), -np.inf)
+        t = (now - self._origin) / 3600.0
+        elapsed = np.maximum(t - self._last_t, 0.0) * 3600.0
+        decayed = self._heat * np.exp2(-elapsed / self.half_life)
+        return np.where(self._live, decayed, -np.inf)
+
+    def top(self, k: int = 10, by: str = "heat", now: float | None = None) -> list[dict[str, Any]]:
+        """
+        The ``k`` live trends with the highest ``by`` (one of ``RANKINGS``),
+        best first. ``heat`` is decayed to ``now``, which defaults to the
+        latest snapshot time.
+        """
+        if by not in RANKINGS:
+            raise ValueError(f"by must be one of {RANKINGS}")
+        heat = self.heat(self._latest() if now is None else now)
+        values = {
+            "heat": heat,
+            "velocity": self._velocity,
+            "acceleration": self._acceleration,
+            "volume": self._last_v,
+            "engagement_score": self._score,
+        }[by]
+        return self._best(np.where(self._live, values, -np.inf), k, heat)
+
+    def rising(self, k: int = 10, now: float | None = None) -> list[dict[str, Any]]:
+        """Hottest ``k`` trends whose volume is still growing (velocity > 0)."""
+        heat = self.heat(self._latest() if now is None else now)
+        return self._best(np.where(self._velocity > 0, heat, -np.inf), k, heat)
+
+    def stats(self, key: str, now: float | None = None) -> dict[str, Any]:
+        """Current signals for one trend; KeyError if it is not tracked."""
+        row = self._rows[key]
+        return self._describe(row, self.heat(self._latest() if now is None else now))
+
+    def history(self, key: str) -> tuple[np.ndarray, np.ndarray]:
+        """(Unix times, volumes) in the window for one trend, oldest first."""
+        row = self._rows[key]
+        n, head = int(self._n[row]), int(self._head[row])
+        order = np.arange(head - n, head) % self.window
+        origin = self._origin or 0.0
+        return self._t[row, order] * 3600.0 + origin, self._v[row, order].copy()
+
+    def _latest(self) -> float:
+        if self._origin is None or not self._rows:
+            return 0.0
+        return float(self._last_t[self._live].max()) * 3600.0 + self._origin
+
+    def _best(self, values: np.ndarray, k: int, heat: np.ndarray) -> list[dict[str, Any]]:
+        candidates = np.flatnonzero(np.isfinite(values))
+        if k <= 0 or not len(candidates):
+            return []
+        if len(candidates) > k:
+            part = np.argpartition(-values[candidates], k - 1)[:k]
+            candidates = candidates[part]
+        ordered = candidates[np.argsort(-values[candidates], kind="stable")]
+        return [self._describe(row, heat) for row in ordered.tolist()]
+
+    def _describe(self, row: int, heat: np.ndarray) -> dict[str, Any]:
+        return {
+            "key": self._keys[row],
+            "heat": float(heat[row]),
+            "velocity": float(self._velocity[row]),
+            "acceleration": float(self._acceleration[row]),
+            "volume": float(self._last_v[row]),
+            "engagement_score": float(self._score[row]),
+            "snapshots": int(self._n[row]),
+        }
@@ -1,6 +1,4 @@
-def main():
-    print("Hello from chimera!")
-
+from chimera.__main__ import main
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Load-test the API service against the latency targets in the specs.
+
+Sends an open-loop mix of requests at --rps for --duration seconds:
+trends/fetch, content/generate (for a trend fetched at start-up) and
+engagement/respond, weighted by --mix. Open loop means requests keep
+arriving at the set rate whether or not earlier ones have finished, the
+way real clients behave. Reports per endpoint: requests, successes, shed
+(503), other errors and the p50/p95/p99 latency of successes, checked
+against the targets:
+
+    trends/fetch         < 30 s   (specs/functional.md §3.1)
+    content/generate     < 60 s   (specs/functional.md §3.1)
+    engagement/respond   < 10 s   (research/SRS.md NFR 3.0, end to end)
+
+Without --url the service runs in-process on its own thread and event
+loop. The upstream platforms and model are the offline stubs, with
+--platform-ms and --model-ms of latency; trend fetches go through a
+``ResultCache`` as in production (--no-cache to hit the platform rate
+limits on every request). With --url, a running
+``python -m chimera.api`` is tested instead.
+
+Usage:
+    python scripts/bench_api.py [--rps 200] [--duration 10] [--mix 1,1,4]
+    python scripts/bench_api.py --url http://127.0.0.1:8080 --rps 50
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+import aiohttp
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from aiohttp import web  # noqa: E402
+
+from chimera.api import ApiServices, create_app  # noqa: E402
+from chimera.cache import ResultCache  # noqa: E402
+from chimera.ratelimit import RateLimit, RateLimiter  # noqa: E402
+from skills.skill_fetch_trends import FetchTrendsSkill  # noqa: E402
+from skills.skill_fetch_trends.stub import FakePlatformServer  # noqa: E402
+from skills.skill_generate_caption import GenerateCaptionSkill  # noqa: E402
+from skills.skill_generate_caption.stub import FakeModelServer  # noqa: E402
+
+TARGETS_S = {"trends": 30.0, "content": 60.0, "engagement": 10.0}
+PATHS = {
+    "trends": "/api/v1/trends/fetch",
+    "content": "/api/v1/content/generate",
+    "engagement": "/api/v1/engagement/respond",
+}
+CATEGORIES = ["food", "tech", "travel", "fitness", "music", "gaming"]
+MESSAGES = [
+    "This is amazing! Love your content!",
+    "Which camera do you use for these shots?",
+    "🔥🔥🔥",
+    "first",
+    "Where was this filmed? It looks unreal",
+]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class InProcessServer:
+    """The API app with stub upstreams, served from a background thread."""
+
+    def __init__(self, platform_s, model_s, reply_s, cache):
+        self.platforms = FakePlatformServer(
+            latency={"tiktok": platform_s, "youtube": platform_s, "twitter": platform_s}
+        ).start()
+        self.model = FakeModelServer(latency_s=model_s).start()
+        self.reply_s = reply_s
+        self.cache = cache
+        self.url = ""
+        self._ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    async def _reply(self, batch):
+        await asyncio.sleep(self.reply_s)
+        return ["Thank you so much! Glad you enjoyed it!" for _ in batch]
+
+    def _serve(self):
+        asyncio.set_event_loop(self._loop)
+        limiter = RateLimiter(limits={"llm": RateLimit(rate=10_000, burst=10_000)})
+        trends_config = {"endpoints": self.platforms.endpoints()}
+        if self.cache:
+            trends_config["cache"] = ResultCache()
+        services = ApiServices(
+            trends=FetchTrendsSkill(trends_config),
+            captions=GenerateCaptionSkill({"model_url": self.model.url, "rate_limiter": limiter}),
+            reply=self._reply,
+        )
+        self._runner = web.AppRunner(create_app(services), access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        self._loop.run_until_complete(site.start())
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self.platforms.stop()
+        self.model.stop()
+
+
+def body(kind, rng, trend_ids, n):
+    if kind == "trends":
+        return {
+            "platforms": rng.sample(["tiktok", "youtube", "twitter"], rng.randint(1, 3)),
+            "category": rng.choice(CATEGORIES),
+            "limit": 10,
+            "time_range": "24h",
+        }
+    if kind == "content":
+        return {
+            "trend_id": rng.choice(trend_ids),
+            "content_type": "post",
+            "persona_id": rng.choice(["funny", "casual", "professional"]),
+            "variations": 3,
+            "safety_check": True,
+        }
+    return {
+        "interaction_id": f"int_{n}",
+        "interaction_type": rng.choice(["comment", "comment", "mention"]),
+        "message": rng.choice(MESSAGES),
+        "context": {
+            "previous_interactions": rng.choice([0, 1, 5]),
+            "user_follower_count": int(rng.paretovariate(1.2) * 50),
+            "agent_id": f"agent_{rng.randrange(100)}",
+        },
+    }
+
+
+async def load(url, rps, duration, mix, seed):
+    rng = random.Random(seed)
+    results = {kind: {"latency": [], "ok": 0, "shed": 0, "error": 0} for kind in PATHS}
+    connector = aiohttp.TCPConnector(limit=0)
+    timeout = aiohttp.ClientTimeout(total=max(TARGETS_S.values()) * 2)
+    async with aiohttp.ClientSession(url, connector=connector, timeout=timeout) as session:
+        seed_body = {"platforms": ["tiktok", "youtube", "twitter"], "category": "food", "limit": 30}
+        async with session.post(PATHS["trends"], json=seed_body) as response:
+            trend_ids = [t["id"] for t in (await response.json())["data"]["trends"]]
+
+        async def one(kind, n):
+            start = time.perf_counter()
+            try:
+                async with session.post(PATHS[kind], json=body(kind, rng, trend_ids, n)) as r:
+                    await r.read()
+                    status = r.status
+            except (aiohttp.ClientError, TimeoutError):
+                status = 0
+            elapsed = time.perf_counter() - start
+            if status == 200:
+                results[kind]["ok"] += 1
+                results[kind]["latency"].append(elapsed)
+            elif status == 503:
+                results[kind]["shed"] += 1
+            else:
+                results[kind]["error"] += 1
+
+        kinds = list(PATHS)
+        tasks = []
+        start = time.perf_counter()
+        for n in range(int(rps * duration)):
+            delay = start + n / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            kind = rng.choices(kinds, weights=mix)[0]
+            tasks.append(asyncio.create_task(one(kind, n)))
+        await asyncio.gather(*tasks)
+        async with session.get("/api/v1/status") as response:
+            status = (await response.json())["data"]
+    return results, status
+
+
+def report(results):
+    failed = False
+    print(f"  {'endpoint':<11} {'sent':>6} {'ok':>6} {'shed':>5} {'err':>4}"
+          f"  {'p50':>8} {'p95':>8} {'p99':>8}  target")
+    for kind, r in results.items():
+        sent = r["ok"] + r["shed"] + r["error"]
+        if not r["latency"]:
+            print(f"  {kind:<11} {sent:6d} {0:6d} {r['shed']:5d} {r['error']:4d}  (no successes)")
+            continue
+        p50, p95, p99 = (percentile(r["latency"], p) for p in (50, 95, 99))
+        verdict = "PASS" if p99 < TARGETS_S[kind] else "FAIL"
+        failed |= verdict == "FAIL"
+        print(
+            f"  {kind:<11} {sent:6d} {r['ok']:6d} {r['shed']:5d} {r['error']:4d}"
+            f"  {p50 * 1000:6.1f}ms {p95 * 1000:6.1f}ms {p99 * 1000:6.1f}ms"
+            f"  p99 < {TARGETS_S[kind]:.0f}s {verdict}"
+            f"  (mean {statistics.fmean(r['latency']) * 1000:.1f}ms)"
+        )
+    return failed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="test a running server instead of an in-process one")
+    parser.add_argument("--rps", type=float, default=200.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--mix", default="1,1,4", help="trends,content,engagement weights")
+    parser.add_argument("--platform-ms", type=float, default=50.0)
+    parser.add_argument("--model-ms", type=float, default=300.0)
+    parser.add_argument("--reply-ms", type=float, default=200.0)
+    parser.add_argument("--no-cache", action="store_true", help="no trend result cache")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    mix = [float(w) for w in args.mix.split(",")]
+
+    server = None
+    url = args.url
+    if url is None:
+        server = InProcessServer(
+            args.platform_ms / 1000,
+            args.model_ms / 1000,
+            args.reply_ms / 1000,
+            cache=not args.no_cache,
+        ).start()
+        url = server.url
+    try:
+        print(f"{url}: {args.rps:.0f} req/s for {args.duration:.0f} s, mix {args.mix}")
+        results, status = await load(url, args.rps, args.duration, mix, args.seed)
+    finally:
+        if server is not None:
+            server.stop()
+    failed = report(results)
+    shed = {k: v.get("shed_queue_full", 0) + v.get("shed_timeout", 0)
+            for k, v in status["admission"].items()}
+    print(f"  server shed {shed}, orjson {status['orjson']}")
+    if status.get("engagement"):
+        engagement = status["engagement"]
+        print(
+            f"  engagement: {engagement.get('model_calls', 0)} model calls"
+            f" for {engagement.get('received', 0)} interactions"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
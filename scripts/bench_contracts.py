@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark the compiled skill contracts.
+
+Reports the cost of one input check and one output check for every skill,
+for valid and invalid values. Contracts compile on first use, so an
+untimed check of each value compiles them before timing starts. It then
+runs ``FetchTrendsSkill`` end to end against an in-process source
+returning --trends trends, with output validation on (the default) and
+off (``trusted``), to show what the output check adds to a call.
+
+Usage:
+    python scripts/bench_contracts.py [--calls 20000] [--trends 100]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from skills.skill_download_video import DownloadVideoSkill  # noqa: E402
+from skills.skill_fetch_trends import FetchTrendsSkill  # noqa: E402
+from skills.skill_fetch_trends.stub import fake_trends  # noqa: E402
+from skills.skill_generate_caption import GenerateCaptionSkill  # noqa: E402
+from skills.skill_post_content import PostContentSkill  # noqa: E402
+from skills.skill_safety_check import SafetyCheckSkill  # noqa: E402
+from skills.skill_transcribe_audio import TranscribeAudioSkill  # noqa: E402
+
+CAPTION = {"text": "Pasta night", "hashtags": ["#pasta"], "safety_score": 0.9}
+CASES = {
+    "fetch_trends": (
+        FetchTrendsSkill,
+        {"platforms": ["tiktok", "youtube"], "category": "food", "limit": 10, "time_range": "24h"},
+        {"platforms": [], "category": 1, "limit": "10", "time_range": "1w"},
+        {"status": "success", "trends": fake_trends("tiktok", "food", 10), "timestamp": "t"},
+    ),
+    "download_video": (
+        DownloadVideoSkill,
+        {"url": "https://t.co/v/1", "platform": "tiktok", "output_path": "/tmp/v.mp4"},
+        {"url": "ftp://x", "platform": "myspace", "output_path": ""},
+        {
+            "status": "success",
+            "filepath": "/tmp/v.mp4",
+            "metadata": {"duration": 12.5, "resolution": "1080x1920", "size": 1 << 20},
+        },
+    ),
+    "transcribe_audio": (
+        TranscribeAudioSkill,
+        {"filepath": "/tmp/v.mp4", "language": "en-US", "model": "base"},
+        {"filepath": "", "language": "English", "model": "huge"},
+        {"status": "success", "transcript": "hello", "duration": 12.5, "language": "en-US"},
+    ),
+    "generate_caption": (
+        GenerateCaptionSkill,
+        {
+            "transcript": "pasta night",
+            "persona": "funny",
+            "platform": "tiktok",
+            "include_hashtags": True,
+            "variations": 3,
+        },
+        {"transcript": " ", "persona": "x", "platform": "tiktok", "variations": 0},
+        {"status": "success", "captions": [CAPTION] * 3, "best_choice": 0},
+    ),
+    "post_content": (
+        PostContentSkill,
+        {
+            "platform": "twitter",
+            "content": {"text": "Pasta night", "media": [], "hashtags": ["#food"]},
+            "schedule": None,
+        },
+        {"platform": "twitter", "content": {"text": "x" * 300}, "schedule": "soon"},
+        {"status": "success", "post_id": "1", "url": "https://x/1", "published_at": "t"},
+    ),
+    "safety_check": (
+        SafetyCheckSkill,
+        {"content": "Pasta night!", "check_types": ["toxicity", "spam", "policy"]},
+        {"content": 42, "check_types": ["vibes"]},
+        {"status": "success", "scores": {"spam": 0.1}, "is_safe": True, "flags": []},
+    ),
+}
+
+
+def per_call_us(check, value, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        check(value)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+class InProcessSource:
+    def __init__(self, platform):
+        self.platform = platform
+
+    async def fetch(self, category, limit, time_range):
+        return fake_trends(self.platform, category, limit)
+
+
+async def end_to_end(trends, calls):
+    request = {"platforms": ["tiktok"], "category": "food", "limit": trends, "time_range": "24h"}
+    timings = {}
+    sources = {"tiktok": InProcessSource("tiktok")}
+    for trusted in (False, True):
+        skill = FetchTrendsSkill({"sources": sources, "trusted": trusted})
+        assert (await skill.execute_async(request))["status"] == "success"
+        start = time.perf_counter()
+        for _ in range(calls):
+            await skill.execute_async(request)
+        timings[trusted] = (time.perf_counter() - start) / calls * 1e6
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--trends", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"  {'skill':<17} {'input ok':>9} {'input bad':>10} {'output ok':>10}")
+    for name, (cls, good, bad, output) in CASES.items():
+        skill = cls()
+        assert skill.input_errors(good) == [], skill.input_errors(good)
+        assert skill.input_errors(bad), name
+        assert skill.output_errors(output) == [], skill.output_errors(output)
+        print(
+            f"  {name:<17}"
+            f" {per_call_us(skill.input_errors, good, args.calls):7.2f}us"
+            f" {per_call_us(skill.input_errors, bad, args.calls):8.2f}us"
+            f" {per_call_us(skill.output_errors, output, args.calls):8.2f}us"
+        )
+
+    calls = max(1, args.calls // 10)
+    timings = asyncio.run(end_to_end(args.trends, calls))
+    print(
+        f"fetch_trends execute, {args.trends} trends: {timings[False]:.1f}us validated,"
+        f" {timings[True]:.1f}us trusted"
+        f" (output check {timings[False] - timings[True]:+.1f}us per call)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark streaming engagement triage against replying to everything.
+
+Generates --interactions comments and mentions for --agents agents with a
+realistic mix: most comments come from small accounts and say little
+("🔥", "nice", "first!"), some are spam or duplicates, and a minority are
+real questions or come from large or loyal accounts. The reply model
+charges --call-ms per call plus --item-ms per drafted reply.
+
+- naive: every interaction is drafted and safety-checked, one per call.
+- stream: EngagementStream triage and micro-batching.
+
+Reports model calls, drafts (the token spend), wall time and the share of
+the high-value interactions (questions, and praise from large or loyal
+accounts) that got a reply. The stream sees interactions arrive at --rate
+per second; the naive path is given them all at once.
+
+Usage:
+    python scripts/bench_engagement.py [--interactions 5000] [--agents 20]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.engagement import EngagementStream, Interaction, merge  # noqa: E402
+from skills.skill_safety_check import SafetyCheckSkill  # noqa: E402
+
+LOW_VALUE = ["🔥", "nice", "first!", "lol", "😍😍", "ok", "wow", "@friend look"]
+SPAM = ["follow for follow!", "free followers at my page, link in bio", "sub4sub?"]
+QUESTIONS = [
+    "Which camera do you use for these shots?",
+    "Where was this filmed, it looks amazing?",
+    "Can you share the recipe for the sauce?",
+    "How long did it take you to learn this trick?",
+]
+PRAISE = ["This is amazing! Love your content!", "Your edits keep getting better every week"]
+
+
+def generate(rng, count, agents):
+    items, valuable = [], set()
+    for n in range(count):
+        roll = rng.random()
+        followers = int(rng.paretovariate(1.2) * 20)
+        history = rng.choice([0, 0, 0, 1, 2, 5, 12])
+        if roll < 0.55:
+            message = rng.choice(LOW_VALUE)
+        elif roll < 0.65:
+            message = rng.choice(SPAM)
+        elif roll < 0.70 and items:
+            # Re-delivered by the platform.
+            items.append(items[-1])
+            continue
+        elif roll < 0.85:
+            message = rng.choice(PRAISE)
+        else:
+            message = rng.choice(QUESTIONS)
+        item = Interaction(
+            f"int_{n}",
+            message,
+            kind=rng.choice(["comment", "comment", "comment", "mention"]),
+            agent_id=f"agent_{rng.randrange(agents)}",
+            author_id=f"user_{rng.randrange(count)}",
+            follower_count=followers,
+            previous_interactions=history,
+        )
+        if message in QUESTIONS or (message in PRAISE and (followers > 10_000 or history >= 5)):
+            valuable.add(item.id)
+        items.append(item)
+    return items, valuable
+
+
+class Model:
+    def __init__(self, call_s, item_s):
+        self.call_s, self.item_s = call_s, item_s
+        self.calls = self.drafts = 0
+
+    async def __call__(self, batch):
+        self.calls += 1
+        self.drafts += len(batch)
+        await asyncio.sleep(self.call_s + self.item_s * len(batch))
+        return ["Thank you so much! Glad you enjoyed it!" for _ in batch]
+
+
+async def source(items, start, step, rate):
+    # ``rate`` interactions per second, released in ticks of 50.
+    for n, item in enumerate(items[start::step]):
+        yield item
+        if n % 50 == 49:
+            await asyncio.sleep(50 / rate)
+
+
+async def naive(items, model, safety, concurrency=32):
+    gate = asyncio.Semaphore(concurrency)
+    replied = set()
+
+    async def one(item):
+        async with gate:
+            [text] = await model([item])
+            await safety.execute_batch_async(
+                [{"content": text, "check_types": ["toxicity", "spam", "policy"]}]
+            )
+            replied.add(item.id)
+
+    await asyncio.gather(*(one(item) for item in items))
+    return replied
+
+
+async def streamed(items, model, safety, batch_size, rate):
+    stream = EngagementStream(model, safety, batch_size=batch_size, daily_limit=10**6)
+    comments, mentions = source(items, 0, 2, rate / 2), source(items, 1, 2, rate / 2)
+    replied = {reply.interaction.id async for reply in stream.run(merge(comments, mentions))}
+    return replied, stream.report()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interactions", type=int, default=5000)
+    parser.add_argument("--agents", type=int, default=20)
+    parser.add_argument("--call-ms", type=float, default=200.0)
+    parser.add_argument("--item-ms", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--rate", type=float, default=2000.0, help="interactions per second")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    items, valuable = generate(random.Random(args.seed), args.interactions, args.agents)
+    safety = SafetyCheckSkill()
+    print(f"{len(items)} interactions, {len(valuable)} high-value")
+
+    for name in ("naive", "stream"):
+        model = Model(args.call_ms / 1000, args.item_ms / 1000)
+        start = time.perf_counter()
+        if name == "naive":
+            replied = await naive(items, model, safety)
+        else:
+            replied, report = await streamed(
+                items, model, safety, args.batch_size, args.rate
+            )
+        wall = time.perf_counter() - start
+        covered = len(replied & valuable) / len(valuable) if valuable else 1.0
+        print(
+            f"  {name:<7} calls {model.calls:6d}  drafts {model.drafts:6d}"
+            f"  wall {wall:7.2f} s  high-value replied {covered:6.1%}"
+        )
+    print(f"  triage  {report}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark caption generation: one call per variation vs micro-batched.
+
+Runs --requests concurrent caption requests against the local mock model
+server. The naive baseline makes one model call per variation, with no
+batching. The batched run is the skill's default. The server charges
+--latency-s per call plus --per-caption-s per generated caption. The bench
+reports wall time, model calls, and prompt tokens, including the shared
+prefix tokens billed as cached.
+
+Usage:
+    python scripts/bench_generate_caption.py [--requests 64] [--variations 3] [--latency-s 0.2]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.ratelimit import RateLimit, RateLimiter  # noqa: E402
+from skills.skill_generate_caption import GenerateCaptionSkill  # noqa: E402
+from skills.skill_generate_caption.stub import FakeModelServer  # noqa: E402
+
+TOPICS = ("pasta", "marathon", "budget travel", "skincare", "chess openings", "sourdough")
+
+
+def requests(count, variations):
+    return [
+        {
+            "transcript": f"Today we talk about {TOPICS[i % len(TOPICS)]} and why it matters. "
+            f"Episode {i} of the {TOPICS[i % len(TOPICS)]} series.",
+            "persona": "funny",
+            "platform": "tiktok",
+            "include_hashtags": True,
+            "variations": variations,
+        }
+        for i in range(count)
+    ]
+
+
+async def naive(skill, batch):
+    single = [{**r, "variations": 1} for r in batch for _ in range(r["variations"])]
+    return await asyncio.gather(*[skill.execute_async(r) for r in single])
+
+
+async def batched(skill, batch):
+    return await asyncio.gather(*[skill.execute_async(r) for r in batch])
+
+
+def run(label, mode, config, batch, args):
+    with FakeModelServer(latency_s=args.latency_s, per_caption_s=args.per_caption_s) as server:
+        limiter = RateLimiter(limits={"llm": RateLimit(rate=10_000, burst=10_000)})
+        skill = GenerateCaptionSkill({"model_url": server.url, "rate_limiter": limiter, **config})
+        start = time.perf_counter()
+        results = asyncio.run(mode(skill, batch))
+        elapsed = time.perf_counter() - start
+        stats = server.report()
+    failed = sum(r["status"] != "success" for r in results)
+    print(
+        f"{label:<10} {elapsed:7.2f}s  calls={stats['requests']:<4} "
+        f"prompt_tokens={stats['prompt_tokens']:<7} cached={stats['cached_tokens']:<7} "
+        f"failed={failed}"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--variations", type=int, default=3)
+    parser.add_argument("--latency-s", type=float, default=0.2)
+    parser.add_argument("--per-caption-s", type=float, default=0.002)
+    args = parser.parse_args()
+
+    batch = requests(args.requests, args.variations)
+    print(f"{args.requests} requests x {args.variations} variations")
+    base = run("naive", naive, {"max_batch_items": 1, "batch_window_s": 0}, batch, args)
+    fast = run("batched", batched, {}, batch, args)
+    print(f"speedup: {base / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark Judge approval throughput as the number of Judges grows.
+
+Seeds --items pending content records, then has J Judges review them all,
+pulling ids from a shared queue. Delivery is at-least-once: a share of ids
+(--redeliver) is handed to two Judges, who race to decide it. A background
+Worker revises random pending drafts (--revise-every), which makes
+in-flight reviews stale. Validation is simulated I/O of --validate-ms.
+
+Two strategies:
+
+- lock: one lock held from read to commit, so decisions are serial.
+- occ:  ApprovalJudge; validation runs in parallel and only commits are
+        compare-and-swap.
+
+Runs on the in-process store and a temporary SQLite file (when aiosqlite
+is installed), or on --database-url.
+
+Usage:
+    python scripts/bench_judge_occ.py [--items 400] [--judges 1,2,4,8,16]
+                                      [--validate-ms 2] [--redeliver 0.1]
+                                      [--revise-every 5] [--database-url URL]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.judge import PENDING, ApprovalJudge, Decision, Review  # noqa: E402
+from chimera.state import ConflictError, MemoryStateStore, SQLStateStore, Write  # noqa: E402
+
+
+class LockingJudge(ApprovalJudge):
+    """Pessimistic baseline: the whole review runs under one shared lock."""
+
+    def __init__(self, lock, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = lock
+
+    async def review(self, content_id, campaign_id=None):
+        async with self.lock:
+            return await super().review(content_id, campaign_id)
+
+
+async def seed(store, items):
+    ids = [str(uuid.uuid4()) for _ in range(items)]
+    await store.commit(
+        Write.create("content", id, {"body": f"caption {n}", "status": PENDING})
+        for n, id in enumerate(ids)
+    )
+    return ids
+
+
+async def run(store, ids, judges, strategy, options):
+    async def validate(content, campaign):
+        await asyncio.sleep(options.validate_ms / 1000)
+        return Review(Decision.APPROVE, safety_score=0.0)
+
+    lock = asyncio.Lock()
+    panel = [
+        LockingJudge(lock, store, validate, f"judge-{j}")
+        if strategy == "lock"
+        else ApprovalJudge(store, validate, f"judge-{j}")
+        for j in range(judges)
+    ]
+    done = asyncio.Event()
+
+    async def worker():
+        rng = random.Random(7)
+        while not done.is_set():
+            await asyncio.sleep(options.revise_every / 1000)
+            record = await store.get("content", rng.choice(ids))
+            if record.data["status"] == PENDING:
+                try:
+                    await store.commit([Write.update(record, body=record.data["body"] + "!")])
+                except ConflictError:
+                    pass  # a Judge decided it first
+
+    rng = random.Random(judges)
+    deliveries = list(ids) + [id for id in ids if rng.random() < options.redeliver]
+    rng.shuffle(deliveries)
+    queue = asyncio.Queue()
+    for id in deliveries:
+        queue.put_nowait(id)
+
+    async def judge(member):
+        while not queue.empty():
+            await member.review(queue.get_nowait())
+
+    revisions = asyncio.create_task(worker()) if options.revise_every > 0 else None
+    start = time.perf_counter()
+    await asyncio.gather(*(judge(m) for m in panel))
+    elapsed = time.perf_counter() - start
+    done.set()
+    if revisions is not None:
+        await revisions
+    commits = sum(m.stats.commits for m in panel)
+    assert commits == len(ids), (commits, len(ids))
+    conflicts = sum(m.stats.conflicts for m in panel)
+    return len(ids) / elapsed, conflicts
+
+
+def backends(database_url):
+    if database_url:
+        yield "sql", lambda: SQLStateStore.connect(database_url)
+        return
+    yield "memory", MemoryStateStore
+    try:
+        import aiosqlite  # noqa: F401
+    except ImportError:
+        print("aiosqlite not installed; skipping sqlite backend")
+        return
+    folder = tempfile.mkdtemp()
+    counter = iter(range(1_000_000))
+    yield "sqlite", lambda: SQLStateStore.connect(
+        f"sqlite+aiosqlite:///{folder}/state-{next(counter)}.db"
+    )
+
+
+async def measure(factory, judges, strategy, options):
+    store = factory()
+    if isinstance(store, SQLStateStore):
+        await store.create_tables()
+    try:
+        ids = await seed(store, options.items)
+        return await run(store, ids, judges, strategy, options)
+    finally:
+        await store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=400)
+    parser.add_argument("--judges", default="1,2,4,8,16")
+    parser.add_argument("--validate-ms", type=float, default=2.0)
+    parser.add_argument("--redeliver", type=float, default=0.1)
+    parser.add_argument("--revise-every", type=float, default=5.0, help="ms; 0 disables")
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+    panel_sizes = [int(j) for j in args.judges.split(",")]
+
+    header = ("backend", "judges", "mode", "decisions/s", "conflicts")
+    print("{:>8} {:>6} {:>6} {:>12} {:>10}".format(*header))
+    for name, factory in backends(args.database_url):
+        for judges in panel_sizes:
+            for strategy in ("lock", "occ"):
+                rate, conflicts = asyncio.run(measure(factory, judges, strategy, args))
+                print(f"{name:>8} {judges:>6} {strategy:>6} {rate:>12.0f} {conflicts:>10}")
+
+
+if __name__ == "__main__":
+    main()
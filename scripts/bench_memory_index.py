@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark the in-process vector index for persona memory.
+
+Loads --agents agents with --memories memories each (clustered random
+vectors standing in for embeddings), then reports:
+
+- ingest: batched upserts, one batch per agent.
+- footprint: int8 codes + scales vs the float32 vectors they replace,
+  and the flush / reopen time of the memory-mapped files.
+- recall: per-agent filtered top-10 latency (what persona recall does),
+  with recall@10 against float32 brute force.
+- ann: unfiltered top-10 over every memory, exact vs IVF at several
+  nprobe values, recall@10 against float32 brute force.
+
+Usage:
+    python scripts/bench_memory_index.py [--agents 1000] [--memories 200] [--dim 256]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.memory import NumpyVectorIndex  # noqa: E402
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def memories(rng, count, dim, topics, spread):
+    vectors = topics[rng.integers(0, len(topics), count)]
+    vectors = vectors + spread * rng.standard_normal((count, dim), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def recall_at(hits, truth, k):
+    return np.mean([len({h.id for h in row} & set(top)) / k for row, top in zip(hits, truth)])
+
+
+async def timed_search(index, queries, k, where=None):
+    samples, hits = [], []
+    for query in queries:
+        start = time.perf_counter()
+        [row] = await index.search(query[None, :], k, where)
+        samples.append(time.perf_counter() - start)
+        hits.append(row)
+    return samples, hits
+
+
+async def main_async(args):
+    rng = np.random.default_rng(11)
+    topics = rng.standard_normal((args.topics, args.dim), dtype=np.float32)
+    directory = tempfile.mkdtemp()
+    index = NumpyVectorIndex(args.dim, directory, nlist=args.nlist)
+    everything = np.empty((args.agents * args.memories, args.dim), dtype=np.float32)
+
+    start = time.perf_counter()
+    for agent in range(args.agents):
+        vectors = memories(rng, args.memories, args.dim, topics, args.spread)
+        lo = agent * args.memories
+        everything[lo : lo + args.memories] = vectors
+        ids = [f"{agent}:{i}" for i in range(args.memories)]
+        await index.upsert(ids, vectors, [{"agent_id": f"agent-{agent}"}] * args.memories)
+    ingest = len(everything) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await index.flush()
+    flush_s = time.perf_counter() - start
+    start = time.perf_counter()
+    index = NumpyVectorIndex(args.dim, directory)
+    open_s = time.perf_counter() - start
+    usage = index.memory_usage()
+    int8_mb = (usage["codes_mapped"] + 4 * len(index)) / 1e6
+
+    print(f"{len(index)} memories, {args.agents} agents, dim {args.dim}")
+    print(f"  ingest      {ingest:>10.0f} vectors/s")
+    print(f"  footprint   {int8_mb:>10.1f} MB int8 vs {everything.nbytes / 1e6:.1f} MB float32")
+    print(f"  flush       {flush_s * 1000:>10.1f} ms   reopen {open_s * 1000:.1f} ms")
+
+    # Persona recall: one agent's memories per query.
+    agents = rng.integers(0, args.agents, args.queries)
+    samples, truth_recall = [], []
+    for agent in agents.tolist():
+        lo = agent * args.memories
+        query = memories(rng, 1, args.dim, topics, args.spread)
+        start = time.perf_counter()
+        [hits] = await index.search(query, 10, {"agent_id": f"agent-{agent}"})
+        samples.append(time.perf_counter() - start)
+        top = np.argsort(-(everything[lo : lo + args.memories] @ query[0]))[:10]
+        truth_recall.append(recall_at([hits], [[f"{agent}:{i}" for i in top]], 10))
+    print(
+        f"  recall      p50 {statistics.median(samples) * 1000:7.3f} ms"
+        f"  p99 {percentile(samples, 99) * 1000:7.3f} ms"
+        f"  recall@10 {np.mean(truth_recall):.3f}"
+    )
+
+    # Unfiltered search over every memory.
+    queries = memories(rng, min(args.queries, 100), args.dim, topics, args.spread)
+    top = np.argsort(-(queries @ everything.T), axis=1)[:, :10]
+    truth = [[f"{i // args.memories}:{i % args.memories}" for i in row] for row in top]
+    print(f"  {'ann':<10} {'p50 ms':>8} {'p99 ms':>8} {'recall@10':>10}")
+    centroids = index._centroids
+    index._centroids = None
+    samples, hits = await timed_search(index, queries, 10)
+    index._centroids = centroids
+    print(
+        f"  {'exact':<10} {statistics.median(samples) * 1000:>8.2f}"
+        f" {percentile(samples, 99) * 1000:>8.2f} {recall_at(hits, truth, 10):>10.3f}"
+    )
+    for nprobe in (1, 4, 8, 16, 32):
+        index.nprobe = nprobe
+        samples, hits = await timed_search(index, queries, 10)
+        print(
+            f"  {f'nprobe {nprobe}':<10} {statistics.median(samples) * 1000:>8.2f}"
+            f" {percentile(samples, 99) * 1000:>8.2f} {recall_at(hits, truth, 10):>10.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--memories", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--topics", type=int, default=50)
+    parser.add_argument("--spread", type=float, default=1.5)
+    parser.add_argument("--nlist", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=500)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
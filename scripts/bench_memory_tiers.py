@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark context assembly through the hierarchical memory tiers.
+
+Loads --agents agents with --memories memories each into a SemanticMemory
+whose searches pay --store-ms of extra latency (a stand-in for the network
+round trip to Weaviate), then runs --tasks generation tasks. Each task's
+goal is drawn from a small per-agent pool (--goals), so the same questions
+recur the way they do for a persona working one campaign. Reports context
+assembly latency p50/p99 and the share of calls that reached the store:
+
+- direct: SemanticMemory.recall for every task (no tiers).
+- tiers: HierarchicalMemory.context, cold caches.
+- prefetch: as tiers, but recall is prefetched when the task is leased and
+  the context call comes --startup-ms later (skill start-up).
+
+Usage:
+    python scripts/bench_memory_tiers.py [--agents 200] [--tasks 2000] [--store-ms 5]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.memory import HierarchicalMemory, SemanticMemory  # noqa: E402
+from chimera.tasks import Task  # noqa: E402
+
+WORDS = (
+    "coffee hiking sushi sneakers festival skincare gaming concert beach budget "
+    "travel vinyl yoga matcha podcast streetwear camera rooftop brunch marathon"
+).split()
+
+
+class SlowSemantic(SemanticMemory):
+    """SemanticMemory with a fixed extra latency per search."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.searches = 0
+
+    async def recall_many(self, agent_id, queries, k=5, where=None):
+        self.searches += 1
+        await asyncio.sleep(self.delay)
+        return await super().recall_many(agent_id, queries, k, where)
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def sentence(rng, n=6):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+async def run(name, semantic, tasks, assemble, prefetch=None, startup=0.0):
+    semantic.searches = 0
+    samples = []
+
+    async def one(task):
+        if prefetch is not None:
+            prefetch([task])
+        await asyncio.sleep(startup)
+        start = time.perf_counter()
+        await assemble(task.context["agent_id"], task.context["goal_description"])
+        samples.append(time.perf_counter() - start)
+
+    # Batches of concurrent tasks, like one worker pool lease.
+    for lo in range(0, len(tasks), 50):
+        await asyncio.gather(*(one(task) for task in tasks[lo : lo + 50]))
+    print(
+        f"  {name:<10} p50 {statistics.median(samples) * 1000:7.3f} ms"
+        f"  p99 {percentile(samples, 99) * 1000:7.3f} ms"
+        f"  store {semantic.searches / len(tasks):6.1%}"
+    )
+
+
+async def main_async(args):
+    rng = random.Random(7)
+    semantic = SlowSemantic(args.store_ms / 1000)
+    for agent in range(args.agents):
+        await semantic.remember(f"agent-{agent}", [sentence(rng) for _ in range(args.memories)])
+    goals = {
+        f"agent-{agent}": [sentence(rng, 4) for _ in range(args.goals)]
+        for agent in range(args.agents)
+    }
+    tasks = []
+    for _ in range(args.tasks):
+        agent = f"agent-{int(rng.paretovariate(1.2)) % args.agents}"
+        context = {"agent_id": agent, "goal_description": rng.choice(goals[agent])}
+        tasks.append(Task("generate_content", context=context))
+    print(f"{args.agents} agents x {args.memories} memories, {args.tasks} tasks")
+
+    await run("direct", semantic, tasks, lambda agent, goal: semantic.recall(agent, goal, 5))
+    memory = HierarchicalMemory(semantic)
+    await run("tiers", semantic, tasks, lambda agent, goal: memory.context(agent, goal, 5))
+    memory = HierarchicalMemory(semantic)
+    await run(
+        "prefetch",
+        semantic,
+        tasks,
+        lambda agent, goal: memory.context(agent, goal, 5),
+        prefetch=memory.prefetch_tasks,
+        startup=args.startup_ms / 1000,
+    )
+    print(f"  report     {memory.report()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=200)
+    parser.add_argument("--memories", type=int, default=200)
+    parser.add_argument("--goals", type=int, default=3)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--store-ms", type=float, default=5.0)
+    parser.add_argument("--startup-ms", type=float, default=10.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark trend ingest and deep pagination on the SQL schema.
+
+Ingest --rows trends three ways:
+
+- row:    one INSERT and commit per trend, the naive path.
+- upsert: TrendRepository.upsert_trends, chunked INSERT ... ON CONFLICT.
+- copy:   Repository.copy, COPY on PostgreSQL, chunked INSERT elsewhere.
+
+Then read one page at increasing depths with OFFSET and with a keyset
+cursor.
+
+Runs on a temporary SQLite file unless --database-url is given (e.g. a
+postgresql+asyncpg:// URL). Tables are created if missing, and trends rows
+written by the run are deleted afterwards.
+
+Usage:
+    python scripts/bench_persistence.py [--rows 50000] [--chunk 5000] [--database-url URL]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import delete, select  # noqa: E402
+
+from chimera.state import Database  # noqa: E402
+from chimera.state.schema import trends  # noqa: E402
+
+PLATFORMS = ("tiktok", "youtube", "twitter")
+PAGE = 50
+
+
+def fake_trends(count, tag):
+    for n in range(count):
+        yield {
+            "id": f"bench-{tag}-{n}",
+            "title": f"Trend {n}",
+            "platform": PLATFORMS[n % 3],
+            "engagement_score": (n % 100) / 100,
+            "volume": n,
+            "metadata": {"n": n},
+        }
+
+
+async def ingest(db, rows):
+    results = {}
+    naive = max(1, rows // 10)  # the slow path gets a tenth of the rows
+    start = time.perf_counter()
+    for trend in fake_trends(naive, "row"):
+        async with db.engine.begin() as conn:
+            await conn.execute(trends.insert(), db.trends.row(trend))
+    results["row"] = naive / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await db.trends.upsert_trends(fake_trends(rows, "upsert"))
+    results["upsert"] = rows / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await db.trends.copy(db.trends.row(t) for t in fake_trends(rows, "copy"))
+    results["copy"] = rows / (time.perf_counter() - start)
+    return results
+
+
+async def paginate(db, total):
+    timings = []
+    query = select(trends).order_by(trends.c.created_at.desc(), trends.c.id.desc())
+    cursor = None
+    depth = 0
+    targets = sorted({0, total // 10, total // 2, total - PAGE})
+    for target in targets:
+        while depth < target:
+            page = await db.trends.page(limit=min(1000, target - depth), after=cursor)
+            depth += len(page.rows)
+            cursor = page.cursor
+        start = time.perf_counter()
+        async with db.engine.connect() as conn:
+            (await conn.execute(query.offset(target).limit(PAGE))).all()
+        offset_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        await db.trends.page(limit=PAGE, after=cursor)
+        keyset_ms = (time.perf_counter() - start) * 1000
+        timings.append((target, offset_ms, keyset_ms))
+    return timings
+
+
+async def main_async(args):
+    url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+    db = Database.connect(url, chunk_rows=args.chunk)
+    await db.create_tables()
+    try:
+        rates = await ingest(db, args.rows)
+        print(f"{db.engine.dialect.name}, {args.rows} rows, chunk {args.chunk}")
+        for name, rate in rates.items():
+            print(f"  ingest {name:<7} {rate:>10.0f} rows/s")
+        total = args.rows * 2 + max(1, args.rows // 10)
+        print(f"  {'depth':>8} {'OFFSET ms':>10} {'keyset ms':>10}")
+        for depth, offset_ms, keyset_ms in await paginate(db, total):
+            print(f"  {depth:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+    finally:
+        async with db.engine.begin() as conn:
+            await conn.execute(delete(trends).where(trends.c.external_id.like("bench-%")))
+        await db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--chunk", type=int, default=5000)
+    parser.add_argument("--database-url")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
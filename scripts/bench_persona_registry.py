@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark PersonaRegistry startup and reload with many SOUL.md files.
+
+Writes --personas SOUL.md files into a temporary agents directory, then
+reports:
+
+- cold: first start, every file parsed and compiled.
+- warm: start from the pickled snapshot cache (stat only).
+- idle refresh: a reload check when nothing changed.
+- edit refresh: a reload after --edits files changed.
+- lookup: Persona lookup plus prompt prefix access, per call.
+
+Usage:
+    python scripts/bench_persona_registry.py [--personas 5000] [--edits 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.persona import PersonaRegistry  # noqa: E402
+
+SOUL = """---
+name: Persona {i}
+id: persona-{i:06d}
+voice_traits:
+  - Witty
+  - Upbeat
+  - Curious about {topic}
+directives:
+  - Never discuss politics
+  - Disclose that you are an AI when asked
+  - Keep replies under 280 characters
+  - Only promote products approved for {topic}
+backstory: |
+  Persona {i} grew up posting about {topic} and now runs a small
+  community of fans who care about honest reviews.
+---
+
+Notes: generated for benchmarking.
+"""
+TOPICS = ("sneakers", "skincare", "gaming", "travel", "coffee", "fitness")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--personas", type=int, default=5000)
+    parser.add_argument("--edits", type=int, default=10)
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp()
+    root = os.path.join(base, "agents")
+    for i in range(args.personas):
+        os.makedirs(os.path.join(root, f"agent-{i}"))
+        with open(os.path.join(root, f"agent-{i}", "SOUL.md"), "w") as handle:
+            handle.write(SOUL.format(i=i, topic=TOPICS[i % len(TOPICS)]))
+    cache = os.path.join(base, "personas.pickle")
+
+    registry, cold = timed(lambda: PersonaRegistry(root, cache_path=cache))
+    warm_registry, warm = timed(lambda: PersonaRegistry(root, cache_path=cache))
+    _, idle = timed(registry.refresh)
+    for i in range(args.edits):
+        path = os.path.join(root, f"agent-{i}", "SOUL.md")
+        with open(path, "a") as handle:
+            handle.write("Edited.\n")
+    _, edit = timed(registry.refresh)
+
+    ids = [f"persona-{i:06d}" for i in range(args.personas)]
+    start = time.perf_counter()
+    total = 0
+    for persona_id in ids * 20:
+        total += len(registry[persona_id].prompt_prefix)
+    lookup_us = (time.perf_counter() - start) / (len(ids) * 20) * 1e6
+
+    assert len(warm_registry) == len(registry) == args.personas
+    print(f"{args.personas} personas, cache {os.path.getsize(cache) / 1e6:.1f} MB")
+    print(f"  cold start     {cold:>9.1f} ms")
+    print(f"  warm start     {warm:>9.1f} ms")
+    print(f"  idle refresh   {idle:>9.1f} ms")
+    print(f"  edit refresh   {edit:>9.1f} ms  ({args.edits} files)")
+    print(f"  lookup         {lookup_us:>9.3f} us")
+
+
+if __name__ == "__main__":
+    main()
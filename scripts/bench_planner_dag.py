@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark the content DAG: sequential chain vs the Planner's scheduler.
+
+Each node sleeps for its task_type's estimate (DEFAULT_ESTIMATES_S x
+--scale), so the numbers show scheduling only, not skill cost. The SRS
+target is under 10 s end to end (NFR 3.1); at --scale 1 one video branch
+alone is about 16 s of work in sequence.
+
+Usage:
+    python scripts/bench_planner_dag.py [--branches 5] [--videos 2] [--scale 0.05]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.planner import DagScheduler, content_pipeline  # noqa: E402
+from chimera.planner.graph import DEFAULT_ESTIMATES_S  # noqa: E402
+
+
+def simulated(scale):
+    async def run(node, input_data):
+        await asyncio.sleep(DEFAULT_ESTIMATES_S.get(node.task_type, 1.0) * scale)
+        if node.task_type == "fetch_trends":
+            trends = [{"title": f"trend {i}"} for i in range(input_data["limit"])]
+            return {"status": "success", "trends": trends}
+        if node.task_type == "download_video":
+            return {"status": "success", "filepath": input_data["output_path"]}
+        if node.task_type == "transcribe_audio":
+            return {"status": "success", "transcript": "spoken words"}
+        if node.task_type == "generate_caption":
+            return {"status": "success", "captions": [{"text": "caption", "hashtags": []}]}
+        if node.task_type == "safety_check":
+            return {"status": "success", "is_safe": True}
+        return {"status": "success"}
+
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--branches", type=int, default=5)
+    parser.add_argument("--videos", type=int, default=2)
+    parser.add_argument("--scale", type=float, default=0.05)
+    args = parser.parse_args()
+
+    graph = content_pipeline(
+        {"platforms": ["tiktok"], "category": "entertainment", "time_range": "24h"},
+        persona="funny",
+        platform="tiktok",
+        branches=args.branches,
+        video_urls=[f"https://tiktok.com/video/{i}" for i in range(args.videos)],
+    )
+    runner = simulated(args.scale)
+
+    sequential = DagScheduler(runner, max_parallel=1)
+    start = time.perf_counter()
+    asyncio.run(sequential.run(graph))
+    seq_s = time.perf_counter() - start
+
+    dag = DagScheduler(runner)
+    run = asyncio.run(dag.run(graph))
+    critical = sum(
+        DEFAULT_ESTIMATES_S[graph.nodes[n].task_type] * args.scale for n in graph.critical_path()
+    )
+
+    print(f"{len(graph)} nodes, {args.branches} branches ({args.videos} with video)")
+    print(f"  sequential: {seq_s:.3f}s")
+    print(f"  dag:        {run.elapsed:.3f}s  (critical path {critical:.3f}s)")
+    print(f"  speedup:    {seq_s / run.elapsed:.2f}x")
+
+    node = f"caption:{args.branches - 1}"
+    dirty = graph.update(node, input={**graph.nodes[node].input, "persona": "serious"})
+    rerun = asyncio.run(dag.run(graph, previous=run))
+    print(f"  re-plan {node}: {rerun.elapsed:.3f}s, re-ran {len(dirty)}/{len(graph)} nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the skill_post_content calendar and publish batching.
+
+calendar: --agents agents each schedule --posts posts, spread over the
+next --span seconds, on one PostScheduler. Reports the cost per add, the
+memory held per scheduled post (tracemalloc) and how late posts fire
+(p50/p99).
+
+batching: --burst posts to twitter arrive together, published through a
+DryRunPublisher with --latency-ms per call. Reports wall time and calls
+made with batching on and off.
+
+Usage:
+    python scripts/bench_post_content.py [--agents 1000] [--posts 10] [--span 3]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from skills.skill_post_content import (  # noqa: E402
+    DryRunPublisher,
+    PostContentSkill,
+    PostScheduler,
+)
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def calendar(agents, posts, span):
+    scheduler = PostScheduler()
+    lateness = []
+    total = agents * posts
+
+    def job(due):
+        async def run():
+            lateness.append(time.time() - due)
+
+        return run
+
+    start = time.time() + 0.5
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    for agent in range(agents):
+        for i in range(posts):
+            # Agents post at different offsets, so due times interleave.
+            due = start + span * ((agent * posts + i * 7919) % total) / total
+            scheduler.add(due, f"agent{agent}:post{i}", job(due))
+    add_s = time.perf_counter() - t0
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    while len(scheduler):
+        await asyncio.sleep(0.05)
+    await scheduler.drain()
+    print(f"calendar: {total} posts from {agents} agents over {span:.1f} s")
+    print(f"  add      {add_s / total * 1e6:7.2f} us/post")
+    print(f"  memory   {held / total:7.0f} B/post")
+    print(
+        f"  late     p50 {statistics.median(lateness) * 1000:6.2f} ms"
+        f"  p99 {percentile(lateness, 99) * 1000:6.2f} ms"
+    )
+
+
+async def batching(burst, latency_s):
+    print(f"batching: {burst} twitter posts, {latency_s * 1000:.0f} ms per call")
+    for label, max_batch in (("single", 1), ("batched", 20)):
+        publisher = DryRunPublisher("twitter", max_batch=max_batch, latency_s=latency_s)
+        skill = PostContentSkill({"publishers": {"twitter": publisher}})
+        requests = [
+            {"content": {"text": f"post {i}"}, "platform": "twitter", "schedule": None}
+            for i in range(burst)
+        ]
+        t0 = time.perf_counter()
+        results = await asyncio.gather(*(skill.execute_async(r) for r in requests))
+        wall = time.perf_counter() - t0
+        assert all(r["status"] == "success" for r in results)
+        print(
+            f"  {label:<8} {wall * 1000:8.1f} ms  calls {publisher.stats['calls']:5d}"
+            f"  posts/call {publisher.stats['posts'] / publisher.stats['calls']:5.1f}"
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=10)
+    parser.add_argument("--span", type=float, default=3.0)
+    parser.add_argument("--burst", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    await calendar(args.agents, args.posts, args.span)
+    await batching(args.burst, args.latency_ms / 1000)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
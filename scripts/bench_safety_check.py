@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark safety scoring: per-item execute() vs execute_batch().
+
+Generates --items Worker outputs (captions, replies, a share of spam and
+abuse) and scores them all with every check type, in three ways:
+
+- per-item: what a Judge pays when it checks outputs one at a time.
+- batch: one vectorised pass.
+- stream: --tick items per execute_batch() call, with and without a
+  VerdictCache. Repeated and near-duplicate outputs in later ticks reuse
+  earlier verdicts.
+
+Reports items per second for each.
+
+Usage:
+    python scripts/bench_safety_check.py [--items 5000] [--block-rows 512] [--tick 250]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from skills.skill_safety_check import SafetyCheckSkill, VerdictCache  # noqa: E402
+
+CLEAN = (
+    "Easy lemon garlic pasta for dinner tonight",
+    "Three lessons on budget travel worth your next two minutes.",
+    "ok sourdough is kinda amazing ngl",
+    "POV: you just discovered chess openings and now it's your whole personality",
+)
+DIRTY = (
+    "FREE MONEY!!! click here www.win.xyz",
+    "you are such an idiot, shut up",
+    "this miracle cure works overnight #health #wow #omg #fyp #viral #love #cure",
+    "DM ME FOR A GIVEAWAY",
+)
+
+
+def outputs(count, seed=5):
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        pool = DIRTY if rng.random() < 0.2 else CLEAN
+        text = " ".join(rng.choice(pool) for _ in range(rng.randint(1, 4)))
+        checks = ["toxicity", "spam", "policy"]
+        items.append({"content": text, "context": {}, "check_types": checks})
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--block-rows", type=int, default=512)
+    parser.add_argument("--tick", type=int, default=250)
+    args = parser.parse_args()
+
+    items = outputs(args.items)
+    skill = SafetyCheckSkill({"block_rows": args.block_rows})
+    skill.execute(items[0])  # start the shared loop outside the timings
+
+    start = time.perf_counter()
+    single = [skill.execute(item) for item in items]
+    per_item = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = skill.execute_batch(items)
+    batched = time.perf_counter() - start
+
+    ticks = [items[i : i + args.tick] for i in range(0, len(items), args.tick)]
+    start = time.perf_counter()
+    for tick in ticks:
+        skill.execute_batch(tick)
+    streamed = time.perf_counter() - start
+
+    cache = VerdictCache()
+    cached_skill = SafetyCheckSkill({"block_rows": args.block_rows, "verdict_cache": cache})
+    start = time.perf_counter()
+    cached_results = [r for tick in ticks for r in cached_skill.execute_batch(tick)]
+    cached = time.perf_counter() - start
+
+    agree = sum(a["is_safe"] == b["is_safe"] for a, b in zip(single, batch, strict=True))
+    cached_agree = sum(
+        a["is_safe"] == b["is_safe"] for a, b in zip(batch, cached_results, strict=True)
+    )
+    unsafe = sum(not r["is_safe"] for r in batch)
+    print(f"{args.items} items, {unsafe} unsafe")
+    print(f"verdicts agree: batch {agree}, cached stream {cached_agree}")
+    for label, seconds in (
+        ("per-item", per_item),
+        ("batch", batched),
+        ("stream", streamed),
+        ("stream+cache", cached),
+    ):
+        print(f"{label:<13} {seconds:7.3f}s  {args.items / seconds:9.0f} items/s")
+    print(f"cache: {cache.report()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark worker cold start.
+
+Import cost: each statement runs in a fresh interpreter under
+``python -X importtime``, --repeat times. The report gives the median total
+import time and the median wall time. The statements cover the bare
+interpreter, the worker entry point, skill discovery from the manifests
+(which must not import a skill), and each skill's first load with and
+without ``warm()``. The heaviest modules behind the slowest statement
+are listed after.
+
+Process workers: each scenario runs in its own interpreter, since the fork
+server and its preload list are per process. "cold" submits the first
+safety_check straight to a new process pool. "prestart" warms safety_check
+as a hot skill first (fork server preload, warmed workers) and then submits.
+
+Usage:
+    python scripts/bench_startup.py [--repeat 5] [--top 12] [--workers 4]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+SKILLS = (
+    "fetch_trends",
+    "download_video",
+    "transcribe_audio",
+    "generate_caption",
+    "post_content",
+    "safety_check",
+)
+DISCOVER = (
+    "import sys; from chimera.runtime import default_registry; default_registry().specs(); "
+    "assert not [m for m in sys.modules if m.startswith('skills.skill_')]"
+)
+LOAD = "from chimera.runtime import load_skill; cls = load_skill({name!r})"
+SAFETY_INPUT = {"content": "Pasta night!", "check_types": ["toxicity", "spam", "policy"]}
+
+
+def statements():
+    yield "interpreter", "pass"
+    yield "worker entry (chimera.__main__)", "import chimera.__main__"
+    yield "discover skills", DISCOVER
+    for name in SKILLS:
+        yield f"load {name}", LOAD.format(name=name)
+        yield f"load + warm {name}", LOAD.format(name=name) + "; cls().warm()"
+
+
+def importtime(statement):
+    """(total import ms, wall ms, {module: cumulative ms}) for one fresh run."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = (time.perf_counter() - start) * 1e3
+    total = 0.0
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        total += int(self_us)
+        cumulative[module.strip()] = int(cumulative_us) / 1e3
+    return total / 1e3, wall, cumulative
+
+
+async def first_call(scenario, workers):
+    from chimera.runtime import ExecutionMode, SkillDispatcher
+
+    dispatcher = SkillDispatcher()
+    dispatcher.executors.process_workers = workers
+    assert dispatcher.mode_for("safety_check") is ExecutionMode.PROCESS
+    timings = {}
+    try:
+        if scenario == "prestart":
+            start = time.perf_counter()
+            await dispatcher.warm(["safety_check"])
+            timings["prestart_ms"] = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        result = await dispatcher.run("safety_check", SAFETY_INPUT)
+        timings["first_call_ms"] = (time.perf_counter() - start) * 1e3
+        assert result["status"] == "success", result
+        # One call per worker, all at once: the tail waits on the slowest worker.
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(dispatcher.run("safety_check", SAFETY_INPUT) for _ in range(workers))
+        )
+        timings["burst_ms"] = (time.perf_counter() - start) * 1e3
+    finally:
+        dispatcher.executors.shutdown()
+    return timings
+
+
+def run_scenario(scenario, workers):
+    proc = subprocess.run(
+        [sys.executable, __file__, "--scenario", scenario, "--workers", str(workers)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--scenario", choices=("cold", "prestart"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(asyncio.run(first_call(args.scenario, args.workers))))
+        return
+
+    print(f"  {'statement':<34} {'imports':>9} {'wall':>9}")
+    slowest = (0.0, "", {})
+    for label, statement in statements():
+        runs = [importtime(statement) for _ in range(args.repeat)]
+        total = statistics.median(run[0] for run in runs)
+        wall = statistics.median(run[1] for run in runs)
+        print(f"  {label:<34} {total:7.1f}ms {wall:7.1f}ms")
+        if label.startswith("load ") and total > slowest[0]:
+            slowest = (total, label, runs[-1][2])
+
+    _, label, cumulative = slowest
+    print(f"heaviest modules under '{label}' (cumulative):")
+    top = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)
+    for module, ms in [item for item in top if "." not in item[0]][: args.top]:
+        print(f"  {module:<34} {ms:7.1f}ms")
+
+    print(f"process workers ({args.workers}), safety_check:")
+    for scenario in ("cold", "prestart"):
+        timings = run_scenario(scenario, args.workers)
+        prestart = timings.get("prestart_ms")
+        print(
+            f"  {scenario:<9}"
+            + (f" prestart {prestart:7.1f}ms" if prestart is not None else " " * 19)
+            + f"  first call {timings['first_call_ms']:7.1f}ms"
+            f"  burst of {args.workers} {timings['burst_ms']:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark TaskQueue throughput and dequeue latency.
+
+Enqueues N tasks spread over the three priority lanes, then drains them with
+single-task and batched dequeues, acking each one. Runs against the
+in-process queue and, when fakeredis + lupa are installed, the Redis backend
+(pass --redis-url to use a real server).
+
+Usage:
+    python scripts/bench_task_queue.py [--tasks 5000] [--batch 50] [--redis-url URL]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.tasks import MemoryTaskQueue, Priority, RedisTaskQueue, Task  # noqa: E402
+
+PRIORITIES = [Priority.HIGH, Priority.MEDIUM, Priority.LOW]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(queue, n_tasks, batch):
+    tasks = [Task("generate_content", PRIORITIES[i % 3], {"i": i}) for i in range(n_tasks)]
+    start = time.perf_counter()
+    await queue.enqueue_many(tasks)
+    enqueue_s = time.perf_counter() - start
+
+    latencies = []
+    drained = 0
+    start = time.perf_counter()
+    while drained < n_tasks:
+        t0 = time.perf_counter()
+        leased = await queue.dequeue("bench", max_tasks=batch)
+        latencies.append(time.perf_counter() - t0)
+        for task in leased:
+            await queue.ack(task.task_id)
+        drained += len(leased)
+    drain_s = time.perf_counter() - start
+    return n_tasks / enqueue_s, n_tasks / drain_s, latencies
+
+
+def backends(redis_url):
+    yield "memory", MemoryTaskQueue
+    if redis_url:
+        import redis.asyncio as redis
+
+        yield "redis", lambda: RedisTaskQueue(redis.from_url(redis_url), namespace="bench")
+        return
+    try:
+        import fakeredis
+        import lupa  # noqa: F401
+    except ImportError:
+        print("fakeredis/lupa not installed; skipping redis backend")
+        return
+    yield "fakeredis", lambda: RedisTaskQueue(fakeredis.FakeAsyncRedis())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--redis-url")
+    args = parser.parse_args()
+
+    header = ("backend", "batch", "enqueue/s", "drain/s", "p50 ms", "p99 ms")
+    print("{:>10} {:>5} {:>11} {:>9} {:>7} {:>7}".format(*header))
+    for name, factory in backends(args.redis_url):
+        for batch in (1, args.batch):
+            enq, drain, lat = asyncio.run(run(factory(), args.tasks, batch))
+            p50 = statistics.median(lat) * 1000
+            p99 = percentile(lat, 99) * 1000
+            print(f"{name:>10} {batch:>5} {enq:>11.0f} {drain:>9.0f} {p50:>7.3f} {p99:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
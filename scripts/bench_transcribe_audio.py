@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark chunked transcription: one pass vs parallel chunks.
+
+Synthesises --minutes of tone-coded speech and transcribes it with the
+local backend, which burns --rtf CPU-seconds per second of audio to stand
+in for a real decoder. It reports wall time and time to the first partial
+transcript. The first partial is when caption generation can start. A final
+repeat run shows the same media answered from the artifact store.
+
+Usage:
+    python scripts/bench_transcribe_audio.py [--minutes 5] [--rtf 0.05] [--workers 4]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.cache import ArtifactStore  # noqa: E402
+from skills.skill_transcribe_audio import TranscribeAudioSkill  # noqa: E402
+from skills.skill_transcribe_audio.backends import VOCABULARY  # noqa: E402
+from skills.skill_transcribe_audio.stub import write_speech  # noqa: E402
+
+
+def sentences(minutes, seed=7):
+    rng = random.Random(seed)
+    out, seconds = [], 0.0
+    while seconds < minutes * 60:
+        words = rng.randint(3, 12)
+        out.append(" ".join(rng.choice(VOCABULARY) for _ in range(words)))
+        seconds += words * 0.3 + 0.6
+    return out
+
+
+async def measure(skill, input_data):
+    start = time.perf_counter()
+    first = None
+    texts = []
+    async for partial in skill.stream(input_data):
+        first = first or time.perf_counter() - start
+        texts.append(partial.text)
+    return time.perf_counter() - start, first, " ".join(t for t in texts if t)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=5)
+    parser.add_argument("--rtf", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "speech.wav")
+        expected = write_speech(path, sentences(args.minutes))
+        input_data = {"filepath": path, "language": "en-US", "model": "base"}
+        options = {"backend_options": {"rtf": args.rtf}}
+
+        single = TranscribeAudioSkill({**options, "workers": 1, "chunk_max_s": 1e9})
+        one_s, one_first, one_text = asyncio.run(measure(single, input_data))
+
+        store = ArtifactStore(os.path.join(tmp, "artifacts"))
+        chunked = TranscribeAudioSkill({**options, "workers": args.workers, "artifacts": store})
+        if chunked.executor is not None:
+            chunked.executor.submit(int).result()  # spawn the pool outside the timing
+        par_s, par_first, par_text = asyncio.run(measure(chunked, input_data))
+        repeat_s, _, repeat_text = asyncio.run(measure(chunked, input_data))
+        chunked.close()
+
+    print(f"{args.minutes:g} min of audio, rtf {args.rtf}, {args.workers} workers")
+    print(f"  single pass: {one_s:.2f}s  (first partial {one_first:.2f}s)")
+    print(f"  chunked:     {par_s:.2f}s  (first partial {par_first:.2f}s)")
+    print(f"  speedup:     {one_s / par_s:.2f}x")
+    print(f"  repeat:      {repeat_s * 1000:.1f}ms  (artifact store: {store.report()})")
+    print(f"  transcripts match: {one_text == par_text == repeat_text == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark cross-platform trend clustering.
+
+Generates --stories synthetic stories, each trending on TikTok (as a
+CamelCase hashtag), YouTube (as a title with extra words) and Twitter (as a
+tweet using the hashtag in another spelling). Feeds them to TrendClusters in
+fetch-sized batches and reports throughput and how well clusters match the
+stories:
+
+- split: stories whose records landed in more than one cluster.
+- merged: clusters holding more than one story.
+
+For comparison, the first 3000 records are compared by an all-pairs
+word-set Jaccard scan (no LSH), which is what dedup without an index costs.
+
+Usage:
+    python scripts/bench_trend_clusters.py [--stories 2000] [--batch 300]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.trends import TrendClusters  # noqa: E402
+from chimera.trends.clusters import DEFAULT_THRESHOLD, signature_words  # noqa: E402
+
+# Ordinary title words, plus invented names so that stories do not share
+# most of their words.
+WORDS = (
+    "viral dance challenge cat dog recipe prank remix trailer final goal glow makeup "
+    "tutorial budget travel hack workout street food duet song beach winter summer "
+    "pizza coffee garden puppy kitten baby wedding prom gaming speedrun anime movie"
+).split()
+SYLLABLES = "ka ri mo zu te la vi no sha pe qu dor fen gal hib jun lox mek"
+EXTRAS = ("compilation", "reaction", "explained", "best moments", "full video", "part 2")
+OPENERS = ("omg", "ok but", "cannot stop watching", "why is everyone doing", "day 3 of", "lol")
+
+
+def record(trend_id, platform, title, rng, tags=()):
+    return {
+        "id": trend_id,
+        "platform": platform,
+        "title": title,
+        "volume": rng.randint(100, 10_000_000),
+        "engagement_score": 0.5,
+        "metadata": {"hashtags": list(tags)},
+    }
+
+
+def stories(count, rng):
+    records = []
+    for n in range(count):
+        name = "".join(rng.choices(SYLLABLES.split(), k=3))
+        words = [name, *rng.sample(WORDS, 2), str(rng.randint(1, 99))]
+        camel = "".join(word.capitalize() for word in words)
+        tag = "_".join(words)
+        records += [
+            (n, record(f"t{n}", "tiktok", f"#{camel}", rng, [f"#{camel}", "#fyp"])),
+            (n, record(f"y{n}", "youtube", f"{' '.join(words).title()} {rng.choice(EXTRAS)}", rng)),
+            (n, record(f"w{n}", "twitter", f"{rng.choice(OPENERS)} #{tag}", rng)),
+        ]
+    rng.shuffle(records)
+    return records
+
+
+def quality(labels, ids):
+    by_story, by_cluster = {}, {}
+    for story, cluster in zip(labels, ids, strict=True):
+        by_story.setdefault(story, set()).add(cluster)
+        by_cluster.setdefault(cluster, set()).add(story)
+    split = sum(len(clusters) > 1 for clusters in by_story.values())
+    merged = sum(len(members) > 1 for members in by_cluster.values())
+    return split, merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stories", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=300)
+    args = parser.parse_args()
+
+    records = stories(args.stories, random.Random(5))
+    labels = [story for story, _ in records]
+    trends = [trend for _, trend in records]
+
+    clusters = TrendClusters()
+    start = time.perf_counter()
+    for offset in range(0, len(trends), args.batch):
+        clusters.add(trends[offset : offset + args.batch], float(offset))
+    elapsed = time.perf_counter() - start
+    ids = [clusters.cluster_id(f"{t['platform']}:{t['id']}") for t in trends]
+    split, merged = quality(labels, ids)
+    print(f"{len(trends)} trends from {args.stories} stories, batches of {args.batch}")
+    print(f"  lsh       {len(trends) / elapsed:>10.0f} trends/s   "
+          f"{len(clusters.clusters())} clusters, split {split}, merged {merged}")
+
+    # All-pairs: compare every record's signature with every earlier one.
+    sample = trends[: min(len(trends), 3000)]
+    start = time.perf_counter()
+    words = [signature_words(t) for t in sample]
+    pairs = 0
+    for i in range(1, len(sample)):
+        for j in range(i):
+            if len(words[i] & words[j]) >= DEFAULT_THRESHOLD * len(words[i] | words[j]):
+                pairs += 1
+    elapsed = time.perf_counter() - start
+    print(f"  all-pairs {len(sample) / elapsed:>10.0f} trends/s   "
+          f"({len(sample)} trends, {pairs} similar pairs, no hashtag links)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Benchmark sequential vs concurrent trend fan-out against the local stub.
+
+Starts the fake-platform HTTP server with per-platform latency and times
+fetching all platforms one after another versus FetchTrendsSkill's concurrent
+fan-out. Concurrent wall time should track the slowest platform.
+
+Usage:
+    python scripts/bench_trend_fanout.py [--rounds 5]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from skills.skill_fetch_trends import FetchTrendsSkill  # noqa: E402
+from skills.skill_fetch_trends.stub import FakePlatformServer  # noqa: E402
+
+LATENCY = {"tiktok": 0.30, "youtube": 0.50, "twitter": 0.20}
+REQUEST = {
+    "platforms": list(LATENCY),
+    "category": "entertainment",
+    "limit": 10,
+    "time_range": "24h",
+}
+
+
+async def sequential(skill):
+    trends = []
+    for platform in REQUEST["platforms"]:
+        trends += await skill.fetch_platform(
+            platform, REQUEST["category"], REQUEST["limit"], REQUEST["time_range"]
+        )
+    return trends
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with FakePlatformServer(latency=LATENCY) as server:
+        skill = FetchTrendsSkill(config={"endpoints": server.endpoints()})
+        timings = {"sequential": [], "concurrent": []}
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            asyncio.run(sequential(skill))
+            timings["sequential"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            result = skill.execute(REQUEST)
+            timings["concurrent"].append(time.perf_counter() - start)
+            assert result["status"] == "success", result
+
+    print(f"platform latency: {LATENCY}")
+    for mode, samples in timings.items():
+        print(f"{mode:>10}: mean {sum(samples) / len(samples):.3f}s  min {min(samples):.3f}s")
+    speedup = sum(timings["sequential"]) / sum(timings["concurrent"])
+    print(f"   speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
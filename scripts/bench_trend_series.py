@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark TrendSeries ingest and rising-trend queries.
+
+Simulates --cycles fetch cycles over --trends trends (volumes growing at
+random rates), then measures:
+
+- record: one TrendSeries.record() call per cycle (all trends at once).
+- rising: TrendSeries.rising(k), every trend ranked from the incremental
+  signals.
+- naive: the same ranking recomputed from raw history each query, with a
+  per-trend least-squares fit and heat sum, which is roughly what
+  re-querying the database each Planner cycle costs on the client.
+
+Usage:
+    python scripts/bench_trend_series.py [--trends 5000] [--cycles 48] [--k 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.trends import TrendSeries  # noqa: E402
+
+T0 = 1_738_663_200.0
+CYCLE_S = 900.0
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def naive_rising(history, k, now, half_life):
+    scored = []
+    for key, points in history.items():
+        times = np.array([t for t, _ in points]) / 3600.0
+        volumes = np.array([v for _, v in points])
+        velocity = np.polyfit(times, volumes, 1)[0] if len(points) > 1 else 0.0
+        gains = np.maximum(np.diff(volumes), 0.0)
+        ages = now - np.array([t for t, _ in points[1:]])
+        heat = float((gains * np.exp2(-ages / half_life)).sum())
+        if velocity > 0:
+            scored.append((heat, key))
+    scored.sort(reverse=True)
+    return [key for _, key in scored[:k]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trends", type=int, default=5000)
+    parser.add_argument("--cycles", type=int, default=48)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    signs = rng.choice([-0.2, 1.0], args.trends, p=[0.2, 0.8])
+    rates = rng.lognormal(3, 1.5, args.trends) * signs
+    base = rng.uniform(1e3, 1e6, args.trends)
+    keys = [f"tiktok:{i}" for i in range(args.trends)]
+    series = TrendSeries(window=args.cycles)
+    history = {key: [] for key in keys}
+
+    record_s = []
+    for cycle in range(args.cycles):
+        at = T0 + cycle * CYCLE_S
+        volumes = np.maximum(base + rates * cycle * (1 + 0.02 * cycle), 0)
+        noisy = volumes * rng.uniform(0.99, 1.01, args.trends)
+        start = time.perf_counter()
+        series.record_arrays(keys, noisy, rng.uniform(0, 1, args.trends), at)
+        record_s.append(time.perf_counter() - start)
+        for key, volume in zip(keys, noisy.tolist(), strict=True):
+            history[key].append((at, volume))
+
+    now = T0 + (args.cycles - 1) * CYCLE_S
+    query_s = []
+    for _ in range(args.queries):
+        start = time.perf_counter()
+        fast = series.rising(args.k, now=now)
+        query_s.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    slow = naive_rising(history, args.k, now, series.half_life)
+    naive_s = time.perf_counter() - start
+
+    overlap = len({row["key"] for row in fast} & set(slow))
+    print(f"{args.trends} trends x {args.cycles} snapshots, top {args.k}")
+    print(f"record   p50 {statistics.median(record_s) * 1000:8.3f} ms per cycle")
+    print(f"rising   p50 {statistics.median(query_s) * 1000:8.3f} ms"
+          f"   p99 {percentile(query_s, 99) * 1000:8.3f} ms")
+    print(f"naive        {naive_s * 1000:8.3f} ms")
+    print(f"top-{args.k} agreement with naive: {overlap}/{args.k}")
+
+
+if __name__ == "__main__":
+    main()
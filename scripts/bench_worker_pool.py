@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Measure WorkerPool concurrency and executor choice.
+
+I/O: N tasks that each await a fixed delay, run at increasing concurrency
+limits. Throughput should scale with the limit until the limit reaches N.
+
+CPU: tasks that burn a fixed amount of pure-Python work, run on the thread
+pool and on the process pool. Only the process pool escapes the GIL.
+
+Usage:
+    python scripts/bench_worker_pool.py [--tasks 200] [--delay 0.1]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from chimera.runtime import ExecutionMode, WorkerPool  # noqa: E402
+from chimera.tasks import MemoryTaskQueue, Task  # noqa: E402
+from skills.base import BaseSkill  # noqa: E402
+
+
+class IoSkill(BaseSkill):
+    name = "io"
+
+    def input_errors(self, input_data):
+        return []
+
+    def output_errors(self, output_data):
+        return []
+
+    async def run(self, input_data):
+        await asyncio.sleep(input_data["delay"])
+        return {"status": "success"}
+
+
+class CpuSkill(IoSkill):
+    name = "cpu"
+
+    async def run(self, input_data):
+        total = sum(i * i for i in range(input_data["n"]))
+        return {"status": "success", "total": total}
+
+
+async def timed(task_type, n, payload, **pool_options):
+    queue = MemoryTaskQueue()
+    await queue.enqueue_many(Task(task_type, context={"input": payload}) for _ in range(n))
+    pool = WorkerPool(
+        queue,
+        skills={"io": IoSkill, "cpu": CpuSkill},
+        batch_size=50,
+        poll_interval=0.01,
+        **pool_options,
+    )
+    start = time.perf_counter()
+    await pool.run(stop_when_idle=True)
+    return time.perf_counter() - start, pool
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.1)
+    parser.add_argument("--cpu-tasks", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"I/O: {args.tasks} tasks x {args.delay * 1000:.0f} ms")
+    for concurrency in (1, 10, 50, 100):
+        elapsed, pool = asyncio.run(
+            timed(
+                "io",
+                args.tasks,
+                {"delay": args.delay},
+                concurrency=concurrency,
+                modes={"io": ExecutionMode.ASYNC},
+            )
+        )
+        print(
+            f"  concurrency {concurrency:>3}: {args.tasks / elapsed:8.1f} tasks/s"
+            f"  peak in flight {pool.peak_in_flight}"
+        )
+
+    print(f"CPU: {args.cpu_tasks} tasks, {os.cpu_count()} cores")
+    for mode in (ExecutionMode.THREAD, ExecutionMode.PROCESS):
+        elapsed, pool = asyncio.run(
+            timed("cpu", args.cpu_tasks, {"n": 2_000_000}, concurrency=16, modes={"cpu": mode})
+        )
+        print(f"  {mode:>7}: {elapsed:6.2f}s  ({pool.stats['completed']} completed)")
+
+
+if __name__ == "__main__":
+    main()
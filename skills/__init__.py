@@ -0,0 +1,12 @@
+"""
+Project Chimera - Runtime Skills
+
+Skills are the reusable capability packages the Chimera Agent calls at
+runtime. Every skill implements the common interface in ``skills.base``.
+
+Reference: research/tooling_strategy.md#skill-implementation-guidelines
+"""
+
+from skills.base import BaseSkill, run_sync
+
+__all__ = ["BaseSkill", "run_sync"]
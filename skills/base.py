@@ -0,0 +1,231 @@
+"""
+Base skill interface shared by every runtime skill.
+
+Each skill validates its input, executes, and returns a dict matching its
+contract. Errors never raise out of ``execute()``; they are returned in the
+consistent error format documented in skills/README.md. Contracts are
+compiled pydantic schemas (see ``skills.contracts``); a skill whose config
+sets ``trusted`` skips checking its own output.
+
+Skills are async at their core. ``execute()`` is the synchronous entry point
+and runs ``execute_async()`` on a process-wide event loop, so connection pools
+and other loop-bound resources survive across calls.
+
+Reference: research/tooling_strategy.md#common-interface
+"""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from chimera.ratelimit import RateLimiter
+    from chimera.transport import HttpPool
+    from skills.contracts import Contract
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def shared_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide skills event loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="chimera-skills-loop", daemon=True
+            )
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the shared skills loop and block until it finishes.
+
+    Must not be called from the shared loop itself; async callers should await
+    the coroutine (e.g. ``execute_async()``) directly.
+    """
+    loop = shared_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() called from the shared skills loop; await instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def utc_timestamp() -> str:
+    """Current time as an ISO 8601 string with a ``Z`` suffix."""
+    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+class BaseSkill:
+    """
+    Common interface for all skills.
+
+    Subclasses set ``input_contract`` and ``output_contract`` (or override
+    ``input_errors()`` and ``output_errors()``) and implement ``run()``.
+
+    Shared config keys:
+        http_pool: ``chimera.transport.HttpPool`` used for outbound HTTP;
+            defaults to the process-wide pool.
+        rate_limiter: ``chimera.ratelimit.RateLimiter`` guarding platform
+            APIs; defaults to the process-wide limiter.
+        trusted: Skip validating successful output against
+            ``output_contract``. For internal hops, where the caller is
+            Chimera's own code and the skill's output is already known to
+            match its contract.
+    """
+
+    name: str = "skill"
+    input_contract: "Contract | None" = None
+    output_contract: "Contract | None" = None
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        self.config: dict[str, Any] = dict(config or {})
+
+    @property
+    def http_pool(self) -> "HttpPool":
+        """Pooled HTTP client from config, or the process-wide default."""
+        pool = self.config.get("http_pool")
+        if pool is None:
+            # Imported lazily: skills that never touch HTTP skip httpx.
+            from chimera.transport import default_pool
+
+            pool = default_pool()
+        return pool
+
+    @property
+    def rate_limiter(self) -> "RateLimiter":
+        """Platform API rate limiter from config, or the process-wide default."""
+        limiter = self.config.get("rate_limiter")
+        if limiter is None:
+            from chimera.ratelimit import default_limiter
+
+            limiter = default_limiter()
+        return limiter
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    @property
+    def trusted(self) -> bool:
+        return bool(self.config.get("trusted", False))
+
+    def validation_context(self) -> dict[str, Any] | None:
+        """Instance state the contracts' own validators read, if any."""
+        return None
+
+    def input_errors(self, input_data: dict[str, Any]) -> list[str]:
+        """Return a list of contract violations for ``input_data``."""
+        if self.input_contract is None:
+            raise NotImplementedError
+        return self.input_contract.errors(input_data, self.validation_context())
+
+    def output_errors(self, output_data: dict[str, Any]) -> list[str]:
+        """Return a list of contract violations for ``output_data``."""
+        if self.output_contract is None:
+            raise NotImplementedError
+        return self.output_contract.errors(output_data, self.validation_context())
+
+    def validate_input(self, input_data: dict[str, Any]) -> bool:
+        """Validate input against the skill contract."""
+        return not self.input_errors(input_data)
+
+    def validate_output(self, output_data: dict[str, Any]) -> bool:
+        """Validate output against the skill contract."""
+        return not self.output_errors(output_data)
+
+    def warm(self) -> None:
+        """
+        Pay one-off setup costs now instead of on the first call.
+
+        Compiles the contracts this instance checks: the input contract, and
+        the output contract unless the skill is trusted. Skills with other
+        setup worth doing ahead of traffic extend this.
+        """
+        if self.input_contract is not None:
+            self.input_contract.compile()
+        if self.output_contract is not None and not self.trusted:
+            self.output_contract.compile()
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Skill logic. Called with input that already passed validation."""
+        raise NotImplementedError
+
+    async def execute_async(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Validate and execute the skill on the caller's event loop.
+
+        Unless the skill is ``trusted``, a successful result is checked
+        against the output contract, and a violation is returned as an
+        INVALID_OUTPUT error rather than handed on.
+        """
+        errors = self.input_errors(input_data)
+        if errors:
+            return self.error_response(
+                "INVALID_INPUT",
+                f"Invalid input for {self.name}: {errors[0]}",
+                validation_errors=errors,
+            )
+        try:
+            result = await self.run(input_data)
+        except Exception as exc:
+            return self.error_response(
+                "EXECUTION_FAILED",
+                f"{self.name} failed: {exc}",
+                details={"exception": type(exc).__name__},
+            )
+        if self.trusted or result.get("status") == "error":
+            return result
+        errors = self.output_errors(result)
+        if errors:
+            return self.error_response(
+                "INVALID_OUTPUT",
+                f"{self.name} returned invalid output: {errors[0]}",
+                validation_errors=errors,
+            )
+        return result
+
+    def execute(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Validate and execute the skill, blocking until it completes."""
+        return run_sync(self.execute_async(input_data))
+
+    # ------------------------------------------------------------------
+    # Responses
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def error_response(
+        error_code: str,
+        message: str,
+        *,
+        validation_errors: list[str] | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Build an error response in the format from skills/README.md."""
+        response: dict[str, Any] = {
+            "status": "error",
+            "error_code": error_code,
+            "message": message,
+            "timestamp": utc_timestamp(),
+        }
+        if validation_errors is not None:
+            response["validation_errors"] = validation_errors
+        if details is not None:
+            response["details"] = details
+        return response
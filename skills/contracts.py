@@ -0,0 +1,82 @@
+"""
+Compiled input/output contracts for skills.
+
+Each skill declares its input and output as pydantic ``TypedDict`` schemas
+in its package's ``contract.py`` and wraps each schema in a ``Contract``.
+The ``Contract`` compiles the schema into a pydantic-core validator once,
+on its first check or when ``BaseSkill.warm()`` asks for it, not at import:
+importing a skill stays cheap, and a trusted skill never compiles the
+output contract it skips. ``BaseSkill.input_errors()`` and
+``output_errors()`` then check a call with one call into that validator
+instead of walking the dict in Python.
+
+TypedDicts are used rather than ``BaseModel``s because a passing check
+builds nothing: there is no model instance to allocate and throw away, and
+the skill still receives the caller's own dict.
+
+Schemas are strict. A string is not coerced to an int, nor an int to a
+bool, so a contract accepts what the skill's hand-written checks accepted.
+Unknown keys are ignored. Checks that need instance state (the caption
+skill's configured personas) read it from the validation context passed by
+``BaseSkill.validation_context()``.
+
+Reference: skills/README.md#skill-contracts-reference
+"""
+
+from collections.abc import Callable
+from typing import Any, Literal, NotRequired
+
+from pydantic import ConfigDict, InstanceOf, TypeAdapter, ValidationError, with_config
+from typing_extensions import TypedDict
+
+STRICT = ConfigDict(strict=True)
+
+# A dict whose contents the contract does not constrain. It is checked with
+# isinstance only: a plain ``dict[str, Any]`` field is copied key by key.
+AnyDict = InstanceOf[dict]
+
+
+def error_messages(exc: ValidationError) -> list[str]:
+    """``field.path: message`` for every error, in the validation_errors style."""
+    messages = []
+    for error in exc.errors(include_url=False, include_input=False):
+        location = ".".join(str(part) for part in error["loc"])
+        messages.append(f"{location}: {error['msg']}" if location else error["msg"])
+    return messages
+
+
+class Contract:
+    """A schema compiled on first use; ``errors()`` lists what a value violates."""
+
+    def __init__(self, schema: Any):
+        self.schema = schema
+        self._validate: Callable[..., Any] | None = None
+
+    @property
+    def compiled(self) -> bool:
+        return self._validate is not None
+
+    def compile(self) -> Callable[..., Any]:
+        """Build the validator now, if no check has yet."""
+        if self._validate is None:
+            self._validate = TypeAdapter(self.schema).validator.validate_python
+        return self._validate
+
+    def errors(self, data: Any, context: dict[str, Any] | None = None) -> list[str]:
+        validate = self._validate or self.compile()
+        try:
+            validate(data, context=context)
+        except ValidationError as exc:
+            return error_messages(exc)
+        return []
+
+
+@with_config(STRICT)
+class ErrorOutput(TypedDict):
+    """The shared error format (skills/README.md#error-handling)."""
+
+    status: Literal["error"]
+    error_code: str
+    message: str
+    validation_errors: NotRequired[list[str]]
+    details: NotRequired[AnyDict]
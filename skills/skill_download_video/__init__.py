@@ -0,0 +1,10 @@
+"""
+skill_download_video - Download video content from platform URLs.
+
+Reference: research/tooling_strategy.md#2-skill_download_video
+"""
+
+from skills.skill_download_video.dedup import DedupIndex
+from skills.skill_download_video.main import DownloadVideoSkill
+
+__all__ = ["DedupIndex", "DownloadVideoSkill"]
@@ -0,0 +1,37 @@
+"""
+Configuration defaults for skill_download_video.
+
+Reference: research/tooling_strategy.md#2-skill_download_video
+"""
+
+from typing import Literal, get_args
+
+# Platforms the skill accepts URLs for.
+Platform = Literal["tiktok", "youtube", "twitter", "instagram"]
+SUPPORTED_PLATFORMS: tuple[str, ...] = get_args(Platform)
+
+# Files at least this large are fetched as parallel byte-range segments
+# (when the server advertises ``Accept-Ranges: bytes``).
+SEGMENT_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+# Parallel segments per large download.
+SEGMENTS = 4
+
+# Retries per segment after a dropped connection or 5xx; each retry resumes
+# from the last byte written.
+MAX_RETRIES = 3
+RETRY_BACKOFF_S = 0.5
+
+# Progress is checkpointed to the ``.part.json`` sidecar at least this often,
+# so a killed worker resumes close to where it stopped.
+CHECKPOINT_BYTES = 8 * 1024 * 1024
+
+# Whole-download timeout (seconds); per-read timeouts come from the HttpPool.
+DOWNLOAD_TIMEOUT_S = 600.0
+
+# Suffixes for in-progress files next to ``output_path``.
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+# Read size used when hashing a finished file for dedup.
+HASH_BLOCK_BYTES = 1024 * 1024
@@ -0,0 +1,48 @@
+"""
+Input and output contracts for skill_download_video.
+
+Reference: research/tooling_strategy.md#2-skill_download_video
+"""
+
+from typing import Annotated, Literal
+
+from pydantic import Field, with_config
+from typing_extensions import TypedDict
+
+from skills.contracts import STRICT, AnyDict, Contract
+from skills.skill_download_video.config import Platform
+
+
+@with_config(STRICT)
+class DownloadVideoInput(TypedDict):
+    url: Annotated[str, Field(pattern=r"(?i)^https?://")]
+    platform: Platform
+    # A file path, not a directory.
+    output_path: Annotated[str, Field(pattern=r"[^/]$")]
+
+
+@with_config(STRICT)
+class VideoMetadata(TypedDict):
+    duration: float
+    resolution: str
+    size: int
+
+
+@with_config(STRICT)
+class DownloadVideoOutput(TypedDict):
+    status: Literal["success"]
+    filepath: str
+    metadata: VideoMetadata
+
+
+@with_config(STRICT)
+class DownloadVideoError(TypedDict):
+    status: Literal["error"]
+    filepath: str
+    metadata: AnyDict
+
+
+INPUT_CONTRACT = Contract(DownloadVideoInput)
+OUTPUT_CONTRACT = Contract(
+    Annotated[DownloadVideoOutput | DownloadVideoError, Field(discriminator="status")]
+)
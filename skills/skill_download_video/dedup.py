@@ -0,0 +1,97 @@
+"""
+Content-hash dedup for downloaded videos.
+
+The index has two maps:
+    source -> sha256   (media URL + ETag/Last-Modified)
+    sha256 -> path     (one canonical copy per content hash)
+
+Before a download, a known source whose file still exists is hard-linked
+into place, with no network transfer. After a download, a new file whose
+hash is already known is swapped for a hard link to the canonical copy, so
+the same clip reposted under another URL is kept on disk once.
+
+The index is in-process by default. With ``path`` it is persisted as JSON
+(written atomically), so it survives worker restarts.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from skills.skill_download_video.config import HASH_BLOCK_BYTES
+
+
+def file_sha256(path: str) -> str:
+    """Hash a file in fixed-size blocks (flat memory)."""
+    digest = hashlib.sha256()
+    buffer = bytearray(HASH_BLOCK_BYTES)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def place(existing: str, target: str) -> None:
+    """Make ``target`` a hard link to ``existing`` (copy across filesystems)."""
+    if os.path.exists(target) and os.path.samefile(existing, target):
+        return
+    tmp = f"{target}.link"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    try:
+        os.link(existing, tmp)
+    except OSError:
+        shutil.copyfile(existing, tmp)
+    os.replace(tmp, target)
+
+
+class DedupIndex:
+    """Maps download sources and content hashes to files on disk."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.sources: dict[str, str] = {}
+        self.files: dict[str, str] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            self.sources = dict(data.get("sources", {}))
+            self.files = dict(data.get("files", {}))
+
+    @staticmethod
+    def source_key(url: str, validator: str | None) -> str | None:
+        # Without a validator the same URL may serve new bytes; don't trust it.
+        return f"{url}|{validator}" if validator else None
+
+    def by_source(self, url: str, validator: str | None) -> tuple[str, str] | None:
+        """``(sha256, path)`` of a live file previously downloaded from this source."""
+        key = self.source_key(url, validator)
+        with self._lock:
+            sha = self.sources.get(key) if key else None
+            path = self.files.get(sha) if sha else None
+        if sha and path and os.path.exists(path):
+            return sha, path
+        return None
+
+    def by_hash(self, sha256: str) -> str | None:
+        with self._lock:
+            path = self.files.get(sha256)
+        return path if path and os.path.exists(path) else None
+
+    def add(self, url: str, validator: str | None, sha256: str, path: str) -> None:
+        key = self.source_key(url, validator)
+        with self._lock:
+            if key:
+                self.sources[key] = sha256
+            existing = self.files.get(sha256)
+            if existing is None or not os.path.exists(existing):
+                self.files[sha256] = path
+            if self.path:
+                tmp = f"{self.path}.tmp"
+                with open(tmp, "w") as f:
+                    json.dump({"sources": self.sources, "files": self.files}, f)
+                os.replace(tmp, self.path)
@@ -0,0 +1,237 @@
+"""
+skill_download_video - Download platform videos to local disk.
+
+Media is streamed to disk chunk by chunk, so memory per download stays flat
+no matter how large the video is. Large files on servers that accept byte
+ranges are fetched as parallel segments. Interrupted downloads resume from
+the ``.part`` file and its checkpoint instead of starting again. See
+``transfer`` for the details.
+
+With a ``DedupIndex`` in ``config["dedup"]``, a video already on disk (same
+source, or same content hash) is hard-linked instead of stored twice.
+With a ``chimera.cache.ArtifactStore`` in ``config["artifacts"]``, finished
+videos are also kept in the host-wide, size-bounded artifact store under
+their sha256, so other workers on the host skip the transfer too.
+
+Reference: research/tooling_strategy.md#2-skill_download_video
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from skills.base import BaseSkill, utc_timestamp
+from skills.skill_download_video.config import (
+    CHECKPOINT_BYTES,
+    DOWNLOAD_TIMEOUT_S,
+    MAX_RETRIES,
+    PART_SUFFIX,
+    RETRY_BACKOFF_S,
+    SEGMENT_THRESHOLD_BYTES,
+    SEGMENTS,
+    STATE_SUFFIX,
+)
+from skills.skill_download_video.contract import INPUT_CONTRACT, OUTPUT_CONTRACT
+from skills.skill_download_video.dedup import DedupIndex, file_sha256, place
+from skills.skill_download_video.mp4 import probe_mp4
+from skills.skill_download_video.transfer import (
+    RemoteChanged,
+    RemoteFile,
+    Transfer,
+    TransferState,
+    probe,
+)
+
+if TYPE_CHECKING:
+    from chimera.cache import ArtifactStore
+
+# Turns a platform page URL into a direct media URL.
+Resolver = Callable[[str], Awaitable[str]]
+
+
+class DownloadVideoSkill(BaseSkill):
+    """
+    Download a video from a platform URL to ``output_path``.
+
+    Config keys:
+        resolvers: {platform: async (url) -> media_url}. Without one the
+            URL is fetched as-is (already a direct media URL).
+        segment_threshold: bytes above which downloads are segmented.
+        segments: parallel segments per large download.
+        max_retries: retries per segment before giving up.
+        retry_backoff: base backoff in seconds between retries.
+        timeout: whole-download timeout in seconds.
+        dedup: ``DedupIndex`` for skipping videos already on disk.
+        artifacts: ``ArtifactStore`` shared with other workers on the host.
+        http_pool: shared ``HttpPool`` (see ``BaseSkill``).
+    """
+
+    name = "skill_download_video"
+    input_contract = INPUT_CONTRACT
+    output_contract = OUTPUT_CONTRACT
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        super().__init__(config)
+        self.resolvers: dict[str, Resolver] = dict(self.config.get("resolvers", {}))
+        self.dedup: DedupIndex | None = self.config.get("dedup")
+        self.artifacts: ArtifactStore | None = self.config.get("artifacts")
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def execute_async(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        result = await super().execute_async(input_data)
+        if result["status"] == "error":
+            # Errors carry the contract fields too, so callers can always index them.
+            target = input_data.get("output_path") if isinstance(input_data, dict) else None
+            result.setdefault("filepath", target if isinstance(target, str) else "")
+            result.setdefault("metadata", {})
+        return result
+
+    async def resolve(self, platform: str, url: str) -> str:
+        resolver = self.resolvers.get(platform)
+        return await resolver(url) if resolver else url
+
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        started = time.monotonic()
+        output_path = os.path.abspath(input_data["output_path"])
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        media_url = await self.resolve(input_data["platform"], input_data["url"])
+        remote = await probe(self.http_pool, media_url)
+
+        if self.dedup is not None:
+            known = self.dedup.by_source(remote.url, remote.validator)
+            if known is not None:
+                sha, existing = known
+                await asyncio.to_thread(place, existing, output_path)
+                return await self._success(
+                    output_path, remote, started, sha256=sha, deduplicated="source"
+                )
+
+        source_key = None
+        if self.artifacts is not None and remote.validator:
+            source_key = self.artifacts.key(remote.url, remote.validator)
+            stored = await asyncio.to_thread(
+                self._from_artifacts, self.artifacts, source_key, output_path
+            )
+            if stored is not None:
+                return await self._success(
+                    output_path, remote, started, sha256=stored, deduplicated="artifact"
+                )
+
+        timeout = float(self.config.get("timeout", DOWNLOAD_TIMEOUT_S))
+        stats = await asyncio.wait_for(self.download(remote, output_path), timeout)
+
+        if self.dedup is None and self.artifacts is None:
+            return await self._success(output_path, remote, started, **stats)
+        sha = await asyncio.to_thread(file_sha256, output_path)
+        if self.dedup is not None:
+            canonical = self.dedup.by_hash(sha)
+            if canonical is not None and canonical != output_path:
+                await asyncio.to_thread(place, canonical, output_path)
+                stats["deduplicated"] = "content"
+            self.dedup.add(remote.url, remote.validator, sha, output_path)
+        if self.artifacts is not None:
+            await asyncio.to_thread(self.artifacts.put_file, "media", sha, output_path)
+            if source_key is not None:
+                self.artifacts.put_bytes("source", source_key, sha.encode())
+        return await self._success(output_path, remote, started, sha256=sha, **stats)
+
+    @staticmethod
+    def _from_artifacts(store: "ArtifactStore", source_key: str, output_path: str) -> str | None:
+        """
+        Place a stored copy of this source at ``output_path``; its sha256 or None.
+
+        One reuse is one hit (or miss) in the store's stats. The source
+        pointer is read uncounted, and only the media lookup counts.
+        """
+        ref = store.read("source", source_key, count=False)
+        if ref is None:
+            store.miss()
+            return None
+        sha = ref.decode()
+        media = store.path("media", sha)
+        if media is None:
+            return None
+        place(media, output_path)
+        return sha
+
+    async def download(self, remote: RemoteFile, output_path: str) -> dict[str, Any]:
+        """Stream ``remote`` into ``output_path``, resuming a previous attempt."""
+        part = output_path + PART_SUFFIX
+        state_path = output_path + STATE_SUFFIX
+        state = TransferState.load(state_path)
+        resumed = bool(
+            state is not None and state.matches(remote) and os.path.exists(part) and state.done
+        )
+        if state is None or not resumed:
+            state = self._plan(remote, part, state_path)
+        transfer = self._transfer(remote, part, state_path)
+        try:
+            await transfer.run(state)
+        except RemoteChanged:
+            # The file changed under a resume; start clean once.
+            resumed = False
+            state = self._plan(remote, part, state_path)
+            transfer = self._transfer(remote, part, state_path)
+            await transfer.run(state)
+        except BaseException:
+            if remote.accepts_ranges and remote.validator:
+                state.save(state_path)
+            raise
+        os.replace(part, output_path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        return {
+            "bytes_downloaded": transfer.downloaded,
+            "segments": len(state.segments),
+            "retries": transfer.retries,
+            "resumed": resumed,
+        }
+
+    def _plan(self, remote: RemoteFile, part: str, state_path: str) -> TransferState:
+        for stale in (part, state_path):
+            if os.path.exists(stale):
+                os.remove(stale)
+        return TransferState.plan(
+            remote,
+            int(self.config.get("segment_threshold", SEGMENT_THRESHOLD_BYTES)),
+            int(self.config.get("segments", SEGMENTS)),
+        )
+
+    def _transfer(self, remote: RemoteFile, part: str, state_path: str) -> Transfer:
+        return Transfer(
+            self.http_pool,
+            remote,
+            part,
+            state_path,
+            max_retries=int(self.config.get("max_retries", MAX_RETRIES)),
+            backoff=float(self.config.get("retry_backoff", RETRY_BACKOFF_S)),
+            checkpoint_bytes=CHECKPOINT_BYTES,
+        )
+
+    async def _success(
+        self, output_path: str, remote: RemoteFile, started: float, **extra: Any
+    ) -> dict[str, Any]:
+        probed = await asyncio.to_thread(probe_mp4, output_path)
+        duration, resolution = probed or (0.0, "unknown")
+        metadata = {
+            "duration": float(duration),
+            "resolution": resolution,
+            "size": os.path.getsize(output_path),
+            "content_type": remote.content_type,
+            "source_url": remote.url,
+            "bytes_downloaded": 0,
+            "deduplicated": None,
+            **extra,
+            "elapsed_s": round(time.monotonic() - started, 3),
+        }
+        return {
+            "status": "success",
+            "filepath": output_path,
+            "metadata": metadata,
+            "timestamp": utc_timestamp(),
+        }
@@ -0,0 +1,85 @@
+"""
+Minimal ISO-BMFF (MP4/MOV) header reader for download metadata.
+
+Only box headers are read, by seeking. ``moov/mvhd`` gives the duration and
+the first ``trak/tkhd`` with a non-zero size gives the resolution. Reading
+them never loads the media data, so probing a 2 GB file costs a few small
+reads.
+"""
+
+import struct
+from collections.abc import Iterator
+from typing import BinaryIO
+
+_CONTAINERS = {b"moov", b"trak"}
+
+
+def _boxes(f: BinaryIO, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """Yield ``(type, payload_offset, box_end)`` for boxes in ``[start, end)``."""
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, kind = struct.unpack(">I4s", header)
+        payload = offset + 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", f.read(8))
+            payload += 8
+        elif size == 0:
+            size = end - offset
+        if size < payload - offset:
+            return
+        yield kind, payload, min(offset + size, end)
+        offset += size
+
+
+def _read(f: BinaryIO, offset: int, n: int) -> bytes:
+    f.seek(offset)
+    return f.read(n)
+
+
+def _mvhd_duration(f: BinaryIO, payload: int) -> float | None:
+    version = _read(f, payload, 1)[0]
+    if version == 1:
+        timescale, duration = struct.unpack(">IQ", _read(f, payload + 20, 12))
+    else:
+        timescale, duration = struct.unpack(">II", _read(f, payload + 12, 8))
+    return duration / timescale if timescale else None
+
+
+def _tkhd_size(f: BinaryIO, payload: int) -> tuple[int, int]:
+    version = _read(f, payload, 1)[0]
+    # version/flags, the version-sized times/ids, 16 bytes of layer/volume
+    # fields and the 36-byte matrix; then width/height as 16.16 fixed point.
+    dims = payload + (4 + 32 + 52 if version == 1 else 4 + 20 + 52)
+    width, height = struct.unpack(">II", _read(f, dims, 8))
+    return width >> 16, height >> 16
+
+
+def probe_mp4(path: str) -> tuple[float, str] | None:
+    """``(duration_seconds, "WxH")`` for an MP4/MOV file, or None if unreadable."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            size = f.tell()
+            duration: float | None = None
+            resolution: str | None = None
+            stack = [(0, size)]
+            while stack:
+                start, end = stack.pop()
+                for kind, payload, box_end in _boxes(f, start, end):
+                    if kind in _CONTAINERS:
+                        stack.append((payload, box_end))
+                    elif kind == b"mvhd" and duration is None:
+                        duration = _mvhd_duration(f, payload)
+                    elif kind == b"tkhd" and resolution is None:
+                        width, height = _tkhd_size(f, payload)
+                        if width and height:
+                            resolution = f"{width}x{height}"
+    except (OSError, struct.error, IndexError):
+        return None
+    if duration is None:
+        return None
+    return duration, resolution or "unknown"
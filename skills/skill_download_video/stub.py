@@ -0,0 +1,188 @@
+"""
+Local media HTTP stub for skill_download_video.
+
+Serves ``GET``/``HEAD /media/<name>`` with deterministic bytes generated on
+the fly, so multi-hundred-MB downloads can be tested without holding the
+file in memory on either side. It supports ``Range``/``If-Range``, strong
+ETags, and dropping the connection part-way through a response.
+
+Example:
+    with FakeMediaServer(sizes={"clip.mp4": 50_000_000}) as server:
+        skill.execute({"url": server.media_url("clip.mp4"), ...})
+"""
+
+import hashlib
+import re
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+# Odd block length so the pattern never lines up with chunk or segment sizes.
+_BLOCK = 65_521
+_RANGE = re.compile(r"^bytes=(\d+)-(\d*)$")
+
+
+def _block(name: str) -> bytes:
+    seed = hashlib.sha256(name.encode()).digest()
+    out = bytearray()
+    while len(out) < _BLOCK:
+        seed = hashlib.sha256(seed).digest()
+        out += seed
+    return bytes(out[:_BLOCK])
+
+
+def iter_media(name: str, start: int, end: int, chunk: int = 64 * 1024) -> Iterator[bytes]:
+    """Bytes ``start..end`` (inclusive) of the generated file ``name``."""
+    block = _block(name) * 2
+    offset = start
+    while offset <= end:
+        phase = offset % _BLOCK
+        piece = block[phase : phase + min(chunk, end + 1 - offset, _BLOCK)]
+        yield piece
+        offset += len(piece)
+
+
+def media_sha256(name: str, size: int) -> str:
+    """Expected sha256 of a generated file."""
+    digest = hashlib.sha256()
+    for piece in iter_media(name, 0, size - 1):
+        digest.update(piece)
+    return digest.hexdigest()
+
+
+class FakeMediaServer:
+    """
+    Threaded media server.
+
+    Args:
+        sizes: {name: size} of generated files.
+        files: {name: bytes} of literal files (e.g. a real MP4 header).
+        ranges: advertise and honour byte ranges.
+        etags: send strong ETags.
+        drop_after: {name: n} closes the first response for ``name`` after
+            ``n`` body bytes.
+    """
+
+    def __init__(
+        self,
+        sizes: dict[str, int] | None = None,
+        files: dict[str, bytes] | None = None,
+        ranges: bool = True,
+        etags: bool = True,
+        drop_after: dict[str, int] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.sizes = dict(sizes or {})
+        self.files = dict(files or {})
+        self.ranges = ranges
+        self.etags = etags
+        self.drop_after = dict(drop_after or {})
+        self.log: list[tuple[str, str, str | None]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def media_url(self, name: str) -> str:
+        return f"{self.url}/media/{name}"
+
+    def etag(self, name: str) -> str:
+        size = len(self.files[name]) if name in self.files else self.sizes[name]
+        return f'"{hashlib.sha1(f"{name}:{size}".encode()).hexdigest()[:16]}"'
+
+    def gets(self, name: str) -> list[str | None]:
+        """Range headers of every GET for ``name`` (None for a full GET)."""
+        return [rng for method, path, rng in self.log if method == "GET" and path == name]
+
+    def start(self) -> "FakeMediaServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeMediaServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_HEAD(self) -> None:
+                self._serve(body=False)
+
+            def do_GET(self) -> None:
+                self._serve(body=True)
+
+            def _serve(self, body: bool) -> None:
+                name = self.path.removeprefix("/media/")
+                range_header = self.headers.get("Range")
+                with stub._lock:
+                    stub.log.append((self.command, name, range_header))
+                if name in stub.files:
+                    size = len(stub.files[name])
+                elif name in stub.sizes:
+                    size = stub.sizes[name]
+                else:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                etag = stub.etag(name)
+                start, end, status = 0, size - 1, 200
+                match = _RANGE.match(range_header or "")
+                if_range = self.headers.get("If-Range")
+                if stub.ranges and match and (if_range is None or if_range == etag):
+                    start = int(match.group(1))
+                    end = min(int(match.group(2) or size - 1), size - 1)
+                    status = 206
+                self.send_response(status)
+                self.send_header("Content-Type", "video/mp4")
+                self.send_header("Content-Length", str(end + 1 - start))
+                if stub.ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+                if status == 206:
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                if stub.etags:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                if not body:
+                    return
+                with stub._lock:
+                    limit = stub.drop_after.pop(name, None)
+                sent = 0
+                for piece in self._body(name, start, end):
+                    if limit is not None and sent + len(piece) > limit:
+                        self.wfile.write(piece[: limit - sent])
+                        self.wfile.flush()
+                        self.close_connection = True
+                        return
+                    self.wfile.write(piece)
+                    sent += len(piece)
+
+            def _body(self, name: str, start: int, end: int) -> Iterator[bytes]:
+                if name in stub.files:
+                    yield stub.files[name][start : end + 1]
+                else:
+                    yield from iter_media(name, start, end)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
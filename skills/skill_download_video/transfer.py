@@ -0,0 +1,243 @@
+"""
+Resumable, segmented HTTP transfer into a file.
+
+A transfer is a list of byte-range ``Segment``s written into one ``.part``
+file at their own offsets. A small file is a single segment. A large file on
+a server that accepts ranges is split into several segments fetched in
+parallel. Each response is streamed: every chunk goes straight to disk with
+``os.pwrite`` through a memoryview and is then dropped. Memory use is
+therefore one network chunk per segment, whatever the file size.
+
+Progress (bytes done per segment, plus the server's ETag/Last-Modified) is
+checkpointed to a JSON sidecar. After a dropped connection the segment
+retries from its last byte with ``Range`` + ``If-Range``. After a crash the
+next call resumes from the checkpoint. If the remote file changed in the
+meantime, the server answers 200 to ``If-Range`` and the transfer starts
+over.
+"""
+
+import asyncio
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from chimera.transport import HttpPool
+
+
+class DownloadError(Exception):
+    """The server refused the download or it failed after all retries."""
+
+
+class RemoteChanged(Exception):
+    """The remote file no longer matches the checkpoint; restart from zero."""
+
+
+@dataclass
+class RemoteFile:
+    url: str
+    size: int | None
+    accepts_ranges: bool
+    validator: str | None
+    content_type: str = "application/octet-stream"
+
+
+@dataclass
+class Segment:
+    """Bytes ``start..end`` (inclusive); ``end`` is None while the size is unknown."""
+
+    start: int
+    end: int | None
+    done: int = 0
+
+    @property
+    def offset(self) -> int:
+        return self.start + self.done
+
+    @property
+    def complete(self) -> bool:
+        return self.end is not None and self.offset > self.end
+
+
+@dataclass
+class TransferState:
+    url: str
+    size: int | None
+    validator: str | None
+    segments: list[Segment] = field(default_factory=list)
+
+    @classmethod
+    def plan(cls, remote: RemoteFile, threshold: int, segments: int) -> "TransferState":
+        size = remote.size
+        if size is None or not remote.accepts_ranges or size < threshold or segments < 2:
+            parts = [Segment(0, None if size is None else size - 1)]
+        else:
+            step = -(-size // segments)
+            parts = [Segment(s, min(s + step, size) - 1) for s in range(0, size, step)]
+        return cls(remote.url, size, remote.validator, parts)
+
+    def matches(self, remote: RemoteFile) -> bool:
+        """True if a checkpoint can be resumed against ``remote``."""
+        return (
+            remote.accepts_ranges
+            and remote.validator is not None
+            and self.validator == remote.validator
+            and self.size == remote.size
+        )
+
+    @property
+    def done(self) -> int:
+        return sum(seg.done for seg in self.segments)
+
+    def save(self, path: str) -> None:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "TransferState | None":
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            data["segments"] = [Segment(**seg) for seg in data["segments"]]
+            return cls(**data)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+
+async def probe(pool: "HttpPool", url: str) -> RemoteFile:
+    """HEAD the media URL for size, range support and a validator."""
+    response = await pool.request("HEAD", url, follow_redirects=True)
+    if response.status_code in (405, 501):
+        # No HEAD support: a one-byte range GET carries the same headers.
+        response = await pool.request(
+            "GET", url, headers={"Range": "bytes=0-0"}, follow_redirects=True
+        )
+    if response.status_code >= 400:
+        raise DownloadError(f"HTTP {response.status_code} for {url}")
+    headers = response.headers
+    size: int | None = None
+    if response.status_code == 206 and "/" in headers.get("Content-Range", ""):
+        total = headers["Content-Range"].rsplit("/", 1)[1]
+        size = int(total) if total.isdigit() else None
+    elif headers.get("Content-Length", "").isdigit():
+        size = int(headers["Content-Length"])
+    return RemoteFile(
+        url=str(response.url),
+        size=size,
+        accepts_ranges=response.status_code == 206
+        or headers.get("Accept-Ranges", "").lower() == "bytes",
+        validator=headers.get("ETag") or headers.get("Last-Modified"),
+        content_type=headers.get("Content-Type", "application/octet-stream"),
+    )
+
+
+def write_at(fd: int, data: bytes, offset: int) -> None:
+    """pwrite all of ``data`` at ``offset`` without copying it."""
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+class Transfer:
+    """Executes a TransferState into ``part_path``."""
+
+    def __init__(
+        self,
+        pool: "HttpPool",
+        remote: RemoteFile,
+        part_path: str,
+        state_path: str,
+        *,
+        max_retries: int,
+        backoff: float,
+        checkpoint_bytes: int,
+    ):
+        self.pool = pool
+        self.remote = remote
+        self.part_path = part_path
+        self.state_path = state_path
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.checkpoint_bytes = checkpoint_bytes
+        self.retries = 0
+        self.downloaded = 0
+        self._unsaved = 0
+
+    async def run(self, state: TransferState) -> None:
+        fd = os.open(self.part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if state.size is not None:
+                os.ftruncate(fd, state.size)
+            jobs = [asyncio.create_task(self._fetch(fd, state, seg)) for seg in state.segments]
+            try:
+                await asyncio.gather(*jobs)
+            except BaseException:
+                for job in jobs:
+                    job.cancel()
+                await asyncio.gather(*jobs, return_exceptions=True)
+                raise
+            last = state.segments[-1]
+            if state.size is None and last.end is not None:
+                state.size = last.end + 1
+                os.ftruncate(fd, state.size)
+        finally:
+            os.close(fd)
+
+    async def _fetch(self, fd: int, state: TransferState, seg: Segment) -> None:
+        # Imported here: the skill imports without httpx until it downloads.
+        import httpx
+
+        attempt = 0
+        while not seg.complete:
+            try:
+                await self._stream(fd, state, seg)
+                if seg.end is None:
+                    seg.end = seg.offset - 1
+                elif not seg.complete:
+                    raise httpx.RemoteProtocolError("response ended before the segment did")
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code < 500:
+                    raise DownloadError(f"HTTP {exc.response.status_code} for {state.url}") from exc
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise DownloadError(f"{state.url}: {exc}") from exc
+                self.retries += 1
+                state.save(self.state_path)
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+    async def _stream(self, fd: int, state: TransferState, seg: Segment) -> None:
+        ranged = seg.offset > 0 or len(state.segments) > 1
+        headers: dict[str, Any] = {}
+        if ranged and self.remote.accepts_ranges:
+            end = "" if seg.end is None else str(seg.end)
+            headers["Range"] = f"bytes={seg.offset}-{end}"
+            # If-Range needs a strong validator; weak ETags are not allowed.
+            if state.validator and not state.validator.startswith("W/"):
+                headers["If-Range"] = state.validator
+        elif ranged:
+            # No range support: the only option is to start the file again.
+            seg.done = 0
+        async with self.pool.stream("GET", state.url, headers=headers) as response:
+            if response.status_code >= 400:
+                response.raise_for_status()
+            if "Range" in headers and response.status_code == 200:
+                if seg.start != 0 or len(state.segments) > 1:
+                    raise RemoteChanged(state.url)
+                seg.done = 0
+            async for chunk in response.aiter_bytes():
+                if seg.end is not None:
+                    chunk = chunk[: seg.end + 1 - seg.offset]
+                write_at(fd, chunk, seg.offset)
+                seg.done += len(chunk)
+                self.downloaded += len(chunk)
+                self._unsaved += len(chunk)
+                if self._unsaved >= self.checkpoint_bytes:
+                    self._unsaved = 0
+                    state.save(self.state_path)
+                if seg.complete:
+                    break
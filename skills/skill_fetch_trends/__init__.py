@@ -0,0 +1,9 @@
+"""
+skill_fetch_trends - Fetch trending topics from social media platforms.
+
+Reference: specs/technical.md#2.1-trend-fetcher-service
+"""
+
+from skills.skill_fetch_trends.main import FetchTrendsSkill
+
+__all__ = ["FetchTrendsSkill"]
@@ -0,0 +1,58 @@
+"""
+Configuration defaults for skill_fetch_trends.
+
+Reference: specs/technical.md#2.1-trend-fetcher-service
+"""
+
+import re
+from typing import Literal, get_args
+
+# Platforms the skill knows how to query.
+Platform = Literal["tiktok", "youtube", "twitter"]
+SUPPORTED_PLATFORMS: tuple[str, ...] = get_args(Platform)
+
+# time_range is "<n>h" or "<n>d", e.g. "1h", "24h", "7d".
+TIME_RANGE_PATTERN = re.compile(r"^([1-9][0-9]*)([hd])$")
+
+# Upper bound on requested trends per call.
+MAX_LIMIT = 100
+
+# Seconds each platform gets before it is dropped from the merged result.
+DEFAULT_PLATFORM_TIMEOUT_S = 10.0
+
+# Whole-request budget. See: specs/functional.md#3.1-performance
+FETCH_BUDGET_S = 30.0
+
+# Path appended to a platform endpoint to list trends.
+TRENDS_PATH = "/trends"
+
+# Result-cache freshness per requested window: (max hours, ttl seconds).
+# Short windows move fast and go stale quickly; weekly trends barely move.
+CACHE_TTLS: tuple[tuple[int, float], ...] = (
+    (1, 60.0),
+    (24, 300.0),
+    (24 * 7, 1800.0),
+)
+CACHE_TTL_MAX_S = 3600.0
+
+# How long past its TTL a cached result may still be served while it is
+# refreshed in the background, as a fraction of the TTL.
+CACHE_STALE_FACTOR = 1.0
+
+
+def time_range_hours(time_range: str) -> int:
+    """Convert a validated time_range string ("24h", "7d") to hours."""
+    match = TIME_RANGE_PATTERN.match(time_range)
+    if match is None:
+        raise ValueError(f"invalid time_range: {time_range!r}")
+    value, unit = int(match.group(1)), match.group(2)
+    return value * 24 if unit == "d" else value
+
+
+def cache_ttl(time_range: str) -> float:
+    """Seconds a cached result for ``time_range`` stays fresh."""
+    hours = time_range_hours(time_range)
+    for max_hours, ttl in CACHE_TTLS:
+        if hours <= max_hours:
+            return ttl
+    return CACHE_TTL_MAX_S
@@ -0,0 +1,46 @@
+"""
+Input and output contracts for skill_fetch_trends.
+
+Reference: specs/technical.md#2.1-trend-fetcher-service
+"""
+
+from typing import Annotated, Any, Literal, NotRequired
+
+from pydantic import Field, with_config
+from typing_extensions import TypedDict
+
+from skills.contracts import STRICT, AnyDict, Contract, ErrorOutput
+from skills.skill_fetch_trends.config import MAX_LIMIT, TIME_RANGE_PATTERN, Platform
+
+
+@with_config(STRICT)
+class FetchTrendsInput(TypedDict):
+    platforms: Annotated[list[Platform], Field(min_length=1)]
+    category: str
+    limit: Annotated[int, Field(ge=1, le=MAX_LIMIT)]
+    time_range: Annotated[str, Field(pattern=TIME_RANGE_PATTERN.pattern)]
+
+
+@with_config(STRICT)
+class Trend(TypedDict):
+    id: str
+    title: str
+    platform: str
+    engagement_score: Annotated[float, Field(ge=0.0, le=1.0)]
+    volume: int
+    metadata: AnyDict
+    created_at: NotRequired[Any]
+
+
+@with_config(STRICT)
+class FetchTrendsOutput(TypedDict):
+    status: Literal["success"]
+    trends: list[Trend]
+    timestamp: str
+    data: NotRequired[AnyDict]
+
+
+INPUT_CONTRACT = Contract(FetchTrendsInput)
+OUTPUT_CONTRACT = Contract(
+    Annotated[FetchTrendsOutput | ErrorOutput, Field(discriminator="status")]
+)
@@ -0,0 +1,182 @@
+"""
+skill_fetch_trends - Fetch trending topics from social platforms.
+
+All requested platforms are queried concurrently on one event loop, each
+under its own timeout, so wall-clock latency is set by the slowest platform
+rather than the sum of all of them. Results are merged by engagement_score.
+
+A platform that fails or times out is reported under ``data.errors`` and the
+remaining platforms are still returned (graceful degradation).
+
+With a ``chimera.cache.ResultCache`` in ``config["cache"]``, identical
+``(platforms, category, time_range, limit)`` requests are served from cache
+with a TTL chosen per time_range. Concurrent identical requests share one
+upstream fan-out, and stale results are refreshed in the background.
+
+With a ``chimera.trends.TrendSeries`` in ``config["series"]``, every
+upstream fetch (not cache hits) is recorded as a snapshot, so the Planner
+can rank rising trends without re-querying.
+
+With a ``chimera.trends.TrendClusters`` in ``config["clusters"]``, the same
+trend seen on several platforms is returned once, as its best-scoring
+member, with ``metadata.cluster_id`` and per-platform volumes.
+
+Reference: specs/technical.md#2.1-trend-fetcher-service
+Reference: specs/functional.md#1.1-trend-research
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from skills.base import BaseSkill, utc_timestamp
+from skills.skill_fetch_trends.config import (
+    CACHE_STALE_FACTOR,
+    DEFAULT_PLATFORM_TIMEOUT_S,
+    FETCH_BUDGET_S,
+    cache_ttl,
+)
+from skills.skill_fetch_trends.contract import INPUT_CONTRACT, OUTPUT_CONTRACT
+from skills.skill_fetch_trends.platforms import (
+    PlatformNotConfigured,
+    TrendSource,
+    UnconfiguredSource,
+    build_sources,
+    normalize_trend,
+)
+
+if TYPE_CHECKING:
+    from chimera.cache import ResultCache
+    from chimera.trends import TrendClusters, TrendSeries
+
+
+class FetchTrendsSkill(BaseSkill):
+    """
+    Fetch and merge trends from TikTok, YouTube and Twitter.
+
+    Config keys:
+        api_keys: {platform: key} passed to HTTP sources.
+        endpoints: {platform: base_url} serving ``GET /trends``.
+        sources: {platform: TrendSource} injected source objects.
+        timeouts: {platform: seconds} per-platform timeout overrides.
+        platform_timeout: default per-platform timeout in seconds.
+        http_pool: shared ``HttpPool`` (see ``BaseSkill``).
+        rate_limiter: shared ``RateLimiter`` (see ``BaseSkill``).
+        cache: ``ResultCache`` placed in front of the platform fan-out.
+        cache_ttls: {time_range: seconds} overrides for the cache TTL.
+        series: ``TrendSeries`` that records every upstream fetch.
+        clusters: ``TrendClusters`` that merges one trend across platforms.
+    """
+
+    name = "skill_fetch_trends"
+    input_contract = INPUT_CONTRACT
+    output_contract = OUTPUT_CONTRACT
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        super().__init__(config)
+        self.sources: dict[str, TrendSource] = build_sources(
+            self.config, self.http_pool, self.rate_limiter
+        )
+        self.cache: ResultCache | None = self.config.get("cache")
+        self.series: TrendSeries | None = self.config.get("series")
+        self.clusters: TrendClusters | None = self.config.get("clusters")
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def platform_timeout(self, platform: str) -> float:
+        """Timeout for one platform, capped by the whole-request budget."""
+        default = self.config.get("platform_timeout", DEFAULT_PLATFORM_TIMEOUT_S)
+        timeout = self.config.get("timeouts", {}).get(platform, default)
+        return min(float(timeout), FETCH_BUDGET_S)
+
+    async def fetch_platform(
+        self, platform: str, category: str, limit: int, time_range: str
+    ) -> list[dict[str, Any]]:
+        """Fetch one platform under its timeout and normalize the records."""
+        source = self.sources.get(platform) or UnconfiguredSource(platform)
+        raw = await asyncio.wait_for(
+            source.fetch(category, limit, time_range), self.platform_timeout(platform)
+        )
+        return [normalize_trend(item, platform) for item in raw]
+
+    @staticmethod
+    def cache_key(input_data: dict[str, Any]) -> str:
+        """Cache key for a validated request; platform order does not matter."""
+        platforms = ",".join(sorted(set(input_data["platforms"])))
+        return "trends:{}:{}:{}:{}".format(
+            platforms, input_data["category"], input_data["time_range"], input_data["limit"]
+        )
+
+    def cache_ttl(self, time_range: str) -> float:
+        return float(self.config.get("cache_ttls", {}).get(time_range, cache_ttl(time_range)))
+
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        if self.cache is None:
+            return await self.fetch_all(input_data)
+        ttl = self.cache_ttl(input_data["time_range"])
+        response: dict[str, Any] = await self.cache.get_or_fetch(
+            self.cache_key(input_data),
+            lambda: self.fetch_all(input_data),
+            ttl=ttl,
+            stale_ttl=ttl * CACHE_STALE_FACTOR,
+            # Outages and partial results (a platform failed) are not worth pinning.
+            cacheable=lambda result: "data" in result and "errors" not in result["data"],
+        )
+        return response
+
+    async def fetch_all(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Fan out to every requested platform and merge the results."""
+        platforms = list(dict.fromkeys(input_data["platforms"]))
+        limit = input_data["limit"]
+        results = await asyncio.gather(
+            *(
+                self.fetch_platform(
+                    platform, input_data["category"], limit, input_data["time_range"]
+                )
+                for platform in platforms
+            ),
+            return_exceptions=True,
+        )
+
+        trends: list[dict[str, Any]] = []
+        errors: dict[str, str] = {}
+        outage = False
+        for platform, result in zip(platforms, results, strict=True):
+            if isinstance(result, asyncio.TimeoutError):
+                errors[platform] = f"timed out after {self.platform_timeout(platform)}s"
+            elif isinstance(result, BaseException):
+                errors[platform] = str(result) or type(result).__name__
+            else:
+                trends.extend(result)
+                continue
+            outage = outage or not isinstance(result, PlatformNotConfigured)
+        if outage and len(errors) == len(platforms):
+            # Every platform failed and at least one was reachable in principle:
+            # an outage, which callers must be able to tell from "no trends".
+            return self.error_response(
+                "PLATFORMS_UNAVAILABLE",
+                "every requested platform failed",
+                details={"errors": errors},
+            )
+        now = time.time()
+        if self.series is not None:
+            self.series.record(trends, now)
+        if self.clusters is not None:
+            self.clusters.add(trends, now)
+            trends = self.clusters.collapse(trends)
+        trends.sort(key=lambda t: t["engagement_score"], reverse=True)
+        trends = trends[:limit]
+
+        # ``data`` follows the service API contract (specs/technical.md#2.1);
+        # top-level ``trends`` follows the skill contract (tooling_strategy.md).
+        data: dict[str, Any] = {"trends": trends}
+        if errors:
+            data["errors"] = errors
+        return {
+            "status": "success",
+            "data": data,
+            "trends": trends,
+            "timestamp": utc_timestamp(),
+        }
@@ -0,0 +1,112 @@
+"""
+Per-platform trend sources for skill_fetch_trends.
+
+A trend source is any object with an async ``fetch(category, limit,
+time_range)`` method returning a list of Trend dicts. ``HttpTrendSource``
+talks to a platform endpoint (an API gateway, MCP server or the local fake
+stub) that serves ``GET /trends`` as JSON.
+
+Reference: specs/technical.md#2.1-trend-fetcher-service
+"""
+
+from typing import TYPE_CHECKING, Any, Protocol
+
+from skills.skill_fetch_trends.config import TRENDS_PATH
+
+if TYPE_CHECKING:
+    from chimera.ratelimit import RateLimiter
+    from chimera.transport import HttpPool
+
+
+class TrendSource(Protocol):
+    """Anything that can list trends for one platform."""
+
+    async def fetch(self, category: str, limit: int, time_range: str) -> list[dict[str, Any]]:
+        """Return up to ``limit`` raw Trend dicts."""
+        ...
+
+
+class PlatformNotConfigured(Exception):
+    """Raised when a platform has no endpoint or source configured."""
+
+
+class HttpTrendSource:
+    """
+    Fetches trends from a JSON endpoint over the shared HTTP pool.
+
+    Every request passes through the platform's rate limiter, which also
+    retries 429/503 responses with backoff.
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        base_url: str,
+        pool: "HttpPool",
+        limiter: "RateLimiter",
+        api_key: str | None = None,
+    ):
+        self.platform = platform
+        self.base_url = base_url.rstrip("/")
+        self.pool = pool
+        self.limiter = limiter
+        self.api_key = api_key
+
+    async def fetch(self, category: str, limit: int, time_range: str) -> list[dict[str, Any]]:
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        params = {"category": category, "limit": limit, "time_range": time_range}
+        url = self.base_url + TRENDS_PATH
+        response = await self.limiter.call(
+            self.platform,
+            self.api_key,
+            lambda: self.pool.get(url, params=params, headers=headers),
+        )
+        response.raise_for_status()
+        payload = response.json()
+        trends = payload.get("trends", payload.get("data", {}).get("trends", []))
+        return list(trends)
+
+
+class UnconfiguredSource:
+    """Placeholder for platforms without an endpoint; always fails."""
+
+    def __init__(self, platform: str):
+        self.platform = platform
+
+    async def fetch(self, category: str, limit: int, time_range: str) -> list[dict[str, Any]]:
+        raise PlatformNotConfigured(f"no endpoint configured for {self.platform}")
+
+
+def build_sources(
+    config: dict[str, Any], pool: "HttpPool", limiter: "RateLimiter"
+) -> dict[str, TrendSource]:
+    """
+    Build a source per platform from skill config.
+
+    ``config["sources"]`` entries win over ``config["endpoints"]`` so callers
+    can inject their own source objects.
+    """
+    api_keys: dict[str, str] = config.get("api_keys", {})
+    sources: dict[str, TrendSource] = {}
+    for platform, base_url in config.get("endpoints", {}).items():
+        sources[platform] = HttpTrendSource(
+            platform, base_url, pool, limiter, api_keys.get(platform)
+        )
+    sources.update(config.get("sources", {}))
+    return sources
+
+
+def normalize_trend(raw: dict[str, Any], platform: str) -> dict[str, Any]:
+    """Coerce a raw platform record into the Trend contract."""
+    score = float(raw.get("engagement_score", 0.0))
+    trend = {
+        "id": str(raw.get("id", "")),
+        "title": str(raw.get("title", "")),
+        "platform": str(raw.get("platform", platform)),
+        "engagement_score": min(max(score, 0.0), 1.0),
+        "volume": int(raw.get("volume", 0)),
+        "metadata": dict(raw.get("metadata", {})),
+    }
+    if "created_at" in raw:
+        trend["created_at"] = raw["created_at"]
+    return trend
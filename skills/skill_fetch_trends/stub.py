@@ -0,0 +1,138 @@
+"""
+Local fake-platform HTTP stub for skill_fetch_trends.
+
+Serves ``GET /<platform>/trends`` with deterministic trend data and a
+configurable per-platform latency, so fan-out behaviour can be tested and
+benchmarked offline. Platforms can also be made to fail (500) or to answer
+their first N requests with 429 + Retry-After.
+
+Example:
+    with FakePlatformServer(latency={"tiktok": 0.2, "youtube": 0.5}) as server:
+        skill = FetchTrendsSkill(config={"endpoints": server.endpoints()})
+"""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from skills.skill_fetch_trends.config import SUPPORTED_PLATFORMS, TRENDS_PATH
+
+
+def fake_trends(platform: str, category: str, limit: int) -> list[dict[str, Any]]:
+    """Deterministic trend records for one platform and category."""
+    trends = []
+    for i in range(limit):
+        digest = hashlib.sha256(f"{platform}:{category}:{i}".encode()).digest()
+        score = round(int.from_bytes(digest[:2], "big") / 0xFFFF, 4)
+        tag = f"#{category.title()}{platform.title()}{i}"
+        trends.append(
+            {
+                "id": f"{platform}_{category}_{i:03d}",
+                "title": tag,
+                "platform": platform,
+                "engagement_score": score,
+                "volume": int.from_bytes(digest[2:5], "big"),
+                "metadata": {"hashtags": [tag], "sentiment": "positive"},
+            }
+        )
+    return trends
+
+
+class FakePlatformServer:
+    """Threaded HTTP server imitating the platform trend endpoints."""
+
+    def __init__(
+        self,
+        latency: dict[str, float] | None = None,
+        fail: set[str] | None = None,
+        throttle: dict[str, int] | None = None,
+        retry_after: float = 0.1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = dict(latency or {})
+        self.fail = set(fail or ())
+        self.throttle = dict(throttle or {})
+        self.retry_after = retry_after
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def endpoints(self, platforms: tuple[str, ...] = SUPPORTED_PLATFORMS) -> dict[str, str]:
+        """``endpoints`` config for FetchTrendsSkill pointing at this server."""
+        return {platform: f"{self.url}/{platform}" for platform in platforms}
+
+    def start(self) -> "FakePlatformServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakePlatformServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                platform, _, path = parsed.path.lstrip("/").partition("/")
+                with stub._lock:
+                    stub.requests += 1
+                if "/" + path != TRENDS_PATH or platform not in SUPPORTED_PLATFORMS:
+                    self._reply(404, {"error": "not found"})
+                    return
+                time.sleep(stub.latency.get(platform, 0.0))
+                with stub._lock:
+                    throttled = stub.throttle.get(platform, 0) > 0
+                    if throttled:
+                        stub.throttle[platform] -= 1
+                if throttled:
+                    self._reply(429, {"error": "rate limited"}, {"Retry-After": stub.retry_after})
+                    return
+                if platform in stub.fail:
+                    self._reply(500, {"error": f"{platform} unavailable"})
+                    return
+                query = parse_qs(parsed.query)
+                category = query.get("category", ["general"])[0]
+                limit = int(query.get("limit", ["10"])[0])
+                self._reply(200, {"trends": fake_trends(platform, category, limit)})
+
+            def _reply(
+                self, status: int, body: dict[str, Any], headers: dict[str, Any] | None = None
+            ) -> None:
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, str(value))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
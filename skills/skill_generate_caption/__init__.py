@@ -0,0 +1,10 @@
+"""
+skill_generate_caption - Generate persona-styled captions with batched model calls.
+
+Reference: research/tooling_strategy.md#4-skill_generate_caption
+"""
+
+from skills.skill_generate_caption.batching import MicroBatcher
+from skills.skill_generate_caption.main import GenerateCaptionSkill
+
+__all__ = ["GenerateCaptionSkill", "MicroBatcher"]
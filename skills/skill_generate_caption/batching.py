@@ -0,0 +1,118 @@
+"""
+Micro-batching of caption requests.
+
+Each caption request is one item. Items are queued per prompt prefix
+(persona + platform). A queue is sent as a single model call when one of
+these happens:
+
+- ``window_s`` has passed since its first item arrived,
+- it holds ``max_items`` items,
+- one more item would take it past ``max_captions`` requested captions.
+
+Concurrent agents asking for the same persona on the same platform
+therefore share one round trip and one copy of the prefix. A lone request
+waits at most ``window_s``.
+
+The batcher belongs to the event loop it is first used on, like the rest
+of the skill's async state.
+"""
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from skills.skill_generate_caption.prompts import CaptionItem
+
+# (prefix, items) -> candidate lists, one per item, in order.
+SendBatch = Callable[[str, list[CaptionItem]], Awaitable[list[list[dict[str, Any]]]]]
+
+
+class _Queue:
+    def __init__(self) -> None:
+        self.items: list[CaptionItem] = []
+        self.futures: list[asyncio.Future[list[dict[str, Any]]]] = []
+        self.captions = 0
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher:
+    """
+    Packs caption items that share a prefix into batched model calls.
+
+    Args:
+        send: Coroutine function making one model call for a batch.
+        window_s: Longest time an item waits for company.
+        max_items / max_captions: Batch size caps.
+    """
+
+    def __init__(
+        self,
+        send: SendBatch,
+        window_s: float = 0.02,
+        max_items: int = 16,
+        max_captions: int = 48,
+    ):
+        self.send = send
+        self.window_s = window_s
+        self.max_items = max_items
+        self.max_captions = max_captions
+        self.stats: Counter[str] = Counter()
+        self._queues: dict[str, _Queue] = {}
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def submit(self, prefix: str, item: CaptionItem) -> list[dict[str, Any]]:
+        """Queue ``item`` behind ``prefix`` and wait for its candidates."""
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(prefix)
+        if queue is not None and queue.captions + item.variations > self.max_captions:
+            self._flush(prefix)
+            queue = None
+        if queue is None:
+            queue = self._queues[prefix] = _Queue()
+            if self.window_s > 0:
+                queue.timer = loop.call_later(self.window_s, self._flush, prefix)
+        future: asyncio.Future[list[dict[str, Any]]] = loop.create_future()
+        queue.items.append(item)
+        queue.futures.append(future)
+        queue.captions += item.variations
+        if len(queue.items) >= self.max_items or self.window_s <= 0:
+            self._flush(prefix)
+        return await future
+
+    def _flush(self, prefix: str) -> None:
+        queue = self._queues.pop(prefix, None)
+        if queue is None:
+            return
+        if queue.timer is not None:
+            queue.timer.cancel()
+        self.stats["batches"] += 1
+        self.stats["items"] += len(queue.items)
+        self.stats["captions"] += queue.captions
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(queue.items))
+        task = asyncio.get_running_loop().create_task(self._dispatch(prefix, queue))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, prefix: str, queue: _Queue) -> None:
+        try:
+            results = await self.send(prefix, queue.items)
+            if len(results) != len(queue.items):
+                raise ValueError(f"{len(results)} results for a batch of {len(queue.items)}")
+        except Exception as exc:
+            self.stats["failed_batches"] += 1
+            for future in queue.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future, candidates in zip(queue.futures, results, strict=True):
+            if not future.done():
+                future.set_result(candidates)
+
+    def report(self) -> dict[str, Any]:
+        """Counters plus the mean items per model call."""
+        batches = self.stats["batches"]
+        return {
+            **self.stats,
+            "items_per_batch": round(self.stats["items"] / batches, 2) if batches else 0.0,
+        }
@@ -0,0 +1,62 @@
+"""
+Configuration defaults for skill_generate_caption.
+
+Reference: research/tooling_strategy.md#4-skill_generate_caption
+"""
+
+from typing import Literal, get_args
+
+# Built-in persona styles; config["personas"] adds or overrides entries.
+SUPPORTED_PERSONAS: tuple[str, ...] = ("funny", "professional", "casual")
+
+# Platforms captions are written for.
+Platform = Literal["tiktok", "youtube", "twitter", "instagram"]
+SUPPORTED_PLATFORMS: tuple[str, ...] = get_args(Platform)
+
+MAX_VARIATIONS = 10
+
+# Hard caption length limits (characters) per platform.
+CAPTION_LIMITS: dict[str, int] = {
+    "tiktok": 2200,
+    "youtube": 5000,
+    "twitter": 280,
+    "instagram": 2200,
+}
+
+# Length that tends to perform best per platform; scoring favours captions
+# near it.
+IDEAL_LENGTHS: dict[str, int] = {
+    "tiktok": 100,
+    "youtube": 150,
+    "twitter": 110,
+    "instagram": 140,
+}
+
+# Hashtags kept per caption, and the count scoring aims for.
+HASHTAG_LIMITS: dict[str, int] = {"tiktok": 5, "youtube": 3, "twitter": 2, "instagram": 10}
+HASHTAG_TARGETS: dict[str, int] = {"tiktok": 3, "youtube": 2, "twitter": 1, "instagram": 5}
+
+# Transcripts are trimmed to this many characters before prompting.
+MAX_TRANSCRIPT_CHARS = 4000
+
+# OpenAI-compatible chat completions endpoint. See: specs/technical.md#5
+MODEL_URL = "https://api.openai.com/v1"
+MODEL = "gpt-4o-mini"
+TEMPERATURE = 0.9
+REQUEST_TIMEOUT_S = 60.0
+# Rate limiter bucket for model calls.
+RATE_LIMIT_KEY = "llm"
+
+# Micro-batching: requests sharing a prompt prefix that arrive within
+# BATCH_WINDOW_S are sent as one model call, capped by item and caption
+# counts so a batch's output fits the model's completion budget.
+BATCH_WINDOW_S = 0.02
+MAX_BATCH_ITEMS = 16
+MAX_BATCH_CAPTIONS = 48
+
+# Terms that lower a caption's safety_score. This is a cheap local
+# screen; skill_safety_check remains the gate before posting.
+FLAGGED_TERMS: frozenset[str] = frozenset(
+    {"hate", "kill", "scam", "nsfw", "giveaway", "free money", "click here", "dm me"}
+)
+MIN_SAFETY_SCORE = 0.5
@@ -0,0 +1,64 @@
+"""
+Input and output contracts for skill_generate_caption.
+
+The accepted personas depend on the skill's config, so the ``persona``
+check reads them from the validation context
+(``GenerateCaptionSkill.validation_context()``). Without a context it
+falls back to the built-in ``SUPPORTED_PERSONAS``.
+
+Reference: research/tooling_strategy.md#4-skill_generate_caption
+"""
+
+from typing import Annotated, Any, Literal
+
+from pydantic import AfterValidator, Field, ValidationInfo, with_config
+from pydantic_core import PydanticCustomError
+from typing_extensions import TypedDict
+
+from skills.contracts import STRICT, Contract
+from skills.skill_generate_caption.config import MAX_VARIATIONS, SUPPORTED_PERSONAS, Platform
+
+
+def _known_persona(value: str, info: ValidationInfo) -> str:
+    personas = info.context["personas"] if info.context else SUPPORTED_PERSONAS
+    if value not in personas:
+        raise PydanticCustomError(
+            "persona", "persona must be one of {personas}", {"personas": sorted(personas)}
+        )
+    return value
+
+
+@with_config(STRICT)
+class GenerateCaptionInput(TypedDict):
+    # At least one non-whitespace character.
+    transcript: Annotated[str, Field(pattern=r"\S")]
+    persona: Annotated[str, AfterValidator(_known_persona)]
+    platform: Platform
+    include_hashtags: bool
+    variations: Annotated[int, Field(ge=1, le=MAX_VARIATIONS)]
+
+
+@with_config(STRICT)
+class Caption(TypedDict):
+    text: str
+    hashtags: list[Any]
+    safety_score: float
+
+
+@with_config(STRICT)
+class GenerateCaptionOutput(TypedDict):
+    status: Literal["success", "error"]
+    captions: list[Caption]
+    best_choice: int
+
+
+def _best_choice_in_range(output: GenerateCaptionOutput) -> GenerateCaptionOutput:
+    if output["captions"] and not 0 <= output["best_choice"] < len(output["captions"]):
+        raise PydanticCustomError("best_choice", "best_choice must index captions")
+    return output
+
+
+INPUT_CONTRACT = Contract(GenerateCaptionInput)
+OUTPUT_CONTRACT = Contract(
+    Annotated[GenerateCaptionOutput, AfterValidator(_best_choice_in_range)]
+)
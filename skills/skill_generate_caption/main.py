@@ -0,0 +1,143 @@
+"""
+skill_generate_caption - Social captions for a transcript, in a persona's voice.
+
+A request for N variations is one item in a model call, not N calls.
+Items from concurrent requests that share a persona and platform are
+packed into micro-batches (see ``batching``) under one shared prompt
+prefix (see ``prompts``). Candidates are cleaned up to platform rules and
+scored together with numpy (see ``scoring``) to pick ``best_choice``.
+
+Reference: research/tooling_strategy.md#4-skill_generate_caption
+"""
+
+import os
+import re
+from typing import Any
+
+from skills.base import BaseSkill, utc_timestamp
+from skills.skill_generate_caption.batching import MicroBatcher
+from skills.skill_generate_caption.config import (
+    BATCH_WINDOW_S,
+    CAPTION_LIMITS,
+    HASHTAG_LIMITS,
+    MAX_BATCH_CAPTIONS,
+    MAX_BATCH_ITEMS,
+    MODEL,
+    MODEL_URL,
+)
+from skills.skill_generate_caption.contract import INPUT_CONTRACT, OUTPUT_CONTRACT
+from skills.skill_generate_caption.model import ChatModel
+from skills.skill_generate_caption.prompts import PERSONA_STYLES, CaptionItem, system_prefix
+from skills.skill_generate_caption.scoring import score
+
+_HASHTAG = re.compile(r"^#?([A-Za-z0-9_]+)$")
+
+
+class GenerateCaptionSkill(BaseSkill):
+    """
+    Generate caption variations and pick the best one.
+
+    Config keys:
+        model_url: OpenAI-compatible base URL (``MODEL_URL``).
+        api_key: model API key; defaults to ``$OPENAI_API_KEY``.
+        model: model name (``MODEL``).
+        personas: {name: style} added to the built-in persona styles.
+        batcher: shared ``MicroBatcher``; pass one to batch across skill
+            instances. Built from the keys below otherwise.
+        batch_window_s, max_batch_items, max_batch_captions: batching
+            limits.
+        http_pool / rate_limiter: see ``BaseSkill``.
+    """
+
+    name = "skill_generate_caption"
+    input_contract = INPUT_CONTRACT
+    output_contract = OUTPUT_CONTRACT
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        super().__init__(config)
+        self.personas: dict[str, str] = {**PERSONA_STYLES, **self.config.get("personas", {})}
+        self._model: ChatModel | None = None
+        self._batcher: MicroBatcher | None = self.config.get("batcher")
+
+    @property
+    def model(self) -> ChatModel:
+        if self._model is None:
+            self._model = ChatModel(
+                self.config.get("model_url", MODEL_URL),
+                self.http_pool,
+                self.rate_limiter,
+                api_key=self.config.get("api_key", os.environ.get("OPENAI_API_KEY")),
+                model=self.config.get("model", MODEL),
+            )
+        return self._model
+
+    @property
+    def batcher(self) -> MicroBatcher:
+        if self._batcher is None:
+            self._batcher = MicroBatcher(
+                self.model.complete,
+                window_s=float(self.config.get("batch_window_s", BATCH_WINDOW_S)),
+                max_items=int(self.config.get("max_batch_items", MAX_BATCH_ITEMS)),
+                max_captions=int(self.config.get("max_batch_captions", MAX_BATCH_CAPTIONS)),
+            )
+        return self._batcher
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def validation_context(self) -> dict[str, Any]:
+        return {"personas": self.personas}
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def execute_async(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        result = await super().execute_async(input_data)
+        if result["status"] == "error":
+            result.setdefault("captions", [])
+            result.setdefault("best_choice", -1)
+        return result
+
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        persona, platform = input_data["persona"], input_data["platform"]
+        prefix = system_prefix(persona, self.personas[persona], platform)
+        item = CaptionItem(
+            input_data["transcript"], input_data["variations"], input_data["include_hashtags"]
+        )
+        raw = await self.batcher.submit(prefix, item)
+        captions = [
+            self.clean(candidate, platform, item.include_hashtags)
+            for candidate in raw[: item.variations]
+            if isinstance(candidate.get("text"), str) and candidate["text"].strip()
+        ]
+        if not captions:
+            raise ValueError("model returned no usable captions")
+        quality, safety, best = score(item.transcript, captions, platform)
+        for caption, q, s in zip(captions, quality, safety, strict=True):
+            caption["safety_score"] = round(float(s), 4)
+            caption["score"] = round(float(q), 4)
+        return {
+            "status": "success",
+            "captions": captions,
+            "best_choice": best,
+            "timestamp": utc_timestamp(),
+        }
+
+    @staticmethod
+    def clean(candidate: dict[str, Any], platform: str, include_hashtags: bool) -> dict[str, Any]:
+        """Apply platform limits and hashtag rules to one model candidate."""
+        hashtags: list[str] = []
+        if include_hashtags:
+            for tag in candidate.get("hashtags") or []:
+                match = _HASHTAG.match(str(tag).strip())
+                normalized = f"#{match.group(1)}" if match else None
+                if normalized and normalized.lower() not in {h.lower() for h in hashtags}:
+                    hashtags.append(normalized)
+            hashtags = hashtags[: HASHTAG_LIMITS[platform]]
+        text = candidate["text"].strip()
+        budget = CAPTION_LIMITS[platform] - sum(len(h) + 1 for h in hashtags)
+        if len(text) > budget:
+            text = text[: max(budget - 1, 0)].rstrip() + "…"
+        return {"text": text, "hashtags": hashtags}
@@ -0,0 +1,77 @@
+"""
+Chat-completions client for skill_generate_caption.
+
+``ChatModel.complete(prefix, items)`` makes one OpenAI-compatible
+``/chat/completions`` call for a whole batch. The request goes over the
+shared HTTP pool and through the rate limiter's ``llm`` bucket. Token
+usage is counted, including the provider-reported cached prompt tokens,
+so prefix reuse shows up in ``report()``.
+"""
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from skills.skill_generate_caption.config import (
+    MODEL,
+    RATE_LIMIT_KEY,
+    REQUEST_TIMEOUT_S,
+    TEMPERATURE,
+)
+from skills.skill_generate_caption.prompts import CaptionItem, batch_message, parse_reply
+
+if TYPE_CHECKING:
+    from chimera.ratelimit import RateLimiter
+    from chimera.transport import HttpPool
+
+
+class ChatModel:
+    """One model endpoint; safe to share between skills on a loop."""
+
+    def __init__(
+        self,
+        base_url: str,
+        pool: "HttpPool",
+        limiter: "RateLimiter",
+        api_key: str | None = None,
+        model: str = MODEL,
+        temperature: float = TEMPERATURE,
+        timeout: float = REQUEST_TIMEOUT_S,
+    ):
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.pool = pool
+        self.limiter = limiter
+        self.api_key = api_key
+        self.model = model
+        self.temperature = temperature
+        self.timeout = timeout
+        self.stats: Counter[str] = Counter()
+
+    async def complete(self, prefix: str, items: list[CaptionItem]) -> list[list[dict[str, Any]]]:
+        """Candidates for every item in the batch, in order."""
+        body = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": prefix},
+                {"role": "user", "content": batch_message(items)},
+            ],
+        }
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        response = await self.limiter.call(
+            RATE_LIMIT_KEY,
+            self.api_key,
+            lambda: self.pool.post(self.url, json=body, headers=headers, timeout=self.timeout),
+        )
+        response.raise_for_status()
+        payload = response.json()
+        usage = payload.get("usage", {})
+        self.stats["requests"] += 1
+        self.stats["prompt_tokens"] += int(usage.get("prompt_tokens", 0))
+        self.stats["completion_tokens"] += int(usage.get("completion_tokens", 0))
+        details = usage.get("prompt_tokens_details") or {}
+        self.stats["cached_tokens"] += int(details.get("cached_tokens", 0))
+        return parse_reply(payload["choices"][0]["message"]["content"], len(items))
+
+    def report(self) -> dict[str, Any]:
+        return dict(self.stats)
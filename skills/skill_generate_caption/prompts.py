@@ -0,0 +1,94 @@
+"""
+Prompt layout for skill_generate_caption.
+
+Every model call is two messages:
+
+    system   the prefix: persona voice, platform rules and the reply
+             format. It is identical for every request with the same
+             persona and platform.
+    user     one or more numbered items (transcript, caption count,
+             hashtags yes/no). This is the only part that varies.
+
+Putting everything stable in the prefix lets requests from many agents
+be packed into one call under a single copy of it. It also keeps the
+prefix byte-identical from call to call, so providers with prompt caching
+bill it as cached tokens.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from skills.skill_generate_caption.config import (
+    CAPTION_LIMITS,
+    HASHTAG_TARGETS,
+    MAX_TRANSCRIPT_CHARS,
+)
+
+PERSONA_STYLES: dict[str, str] = {
+    "funny": "Playful and witty. Light jokes, punchy hooks, the odd emoji.",
+    "professional": "Clear and credible. One concrete takeaway, no slang.",
+    "casual": "Relaxed and friendly, like texting a friend about the video.",
+}
+
+ITEM_PATTERN = re.compile(
+    r"^### Item (\d+)\ncaptions: (\d+)\nhashtags: (yes|no)\ntranscript:\n(.*?)(?=\n### Item |\Z)",
+    re.DOTALL | re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class CaptionItem:
+    """One request's share of a batch."""
+
+    transcript: str
+    variations: int
+    include_hashtags: bool
+
+
+@lru_cache(maxsize=256)
+def system_prefix(persona: str, style: str, platform: str) -> str:
+    """The shared prompt prefix for a persona on a platform."""
+    return (
+        f"You write social media captions as the persona '{persona}'.\n"
+        f"Voice: {style}\n"
+        f"Platform: {platform}. Keep each caption under {CAPTION_LIMITS[platform]} "
+        f"characters and use about {HASHTAG_TARGETS[platform]} hashtags when asked.\n"
+        "Each caption must stand on its own and differ from the others.\n"
+        "The user message lists numbered items. Reply with JSON only:\n"
+        '{"items": [[{"text": "...", "hashtags": ["#..."]}, ...], ...]}\n'
+        "with one list per item, in item order, each holding exactly the requested "
+        "number of captions. Leave hashtags empty when an item says 'hashtags: no'."
+    )
+
+
+def batch_message(items: list[CaptionItem]) -> str:
+    """The user message for a batch of items."""
+    blocks = []
+    for number, item in enumerate(items, 1):
+        transcript = item.transcript[:MAX_TRANSCRIPT_CHARS].replace("###", "#")
+        blocks.append(
+            f"### Item {number}\ncaptions: {item.variations}\n"
+            f"hashtags: {'yes' if item.include_hashtags else 'no'}\ntranscript:\n{transcript}"
+        )
+    return "\n".join(blocks)
+
+
+def parse_items(message: str) -> list[CaptionItem]:
+    """Inverse of ``batch_message``; used by the model stub."""
+    return [
+        CaptionItem(transcript.strip(), int(count), flag == "yes")
+        for _, count, flag, transcript in ITEM_PATTERN.findall(message)
+    ]
+
+
+def parse_reply(content: str, expected: int) -> list[list[dict[str, Any]]]:
+    """Split the model's JSON reply into per-item candidate lists."""
+    payload = json.loads(content)
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list) or len(items) != expected:
+        got = len(items) if isinstance(items, list) else "no"
+        raise ValueError(f"model returned {got} items for a batch of {expected}")
+    return [[c for c in item if isinstance(c, dict)] for item in items]
@@ -0,0 +1,86 @@
+"""
+Vectorised caption scoring for skill_generate_caption.
+
+All of a request's candidates are scored at once. Each caption and the
+transcript become hashed bag-of-words vectors, so relevance and
+redundancy are two matrix products instead of Python loops over pairs.
+
+    relevance    cosine(caption, transcript)
+    length       closeness to the platform's ideal length
+    hashtags     closeness to the platform's target hashtag count
+    novelty      1 - max cosine to any other candidate
+
+``best_choice`` is the highest quality among candidates whose
+safety_score clears the floor.
+"""
+
+import re
+import zlib
+
+import numpy as np
+
+from skills.skill_generate_caption.config import (
+    FLAGGED_TERMS,
+    HASHTAG_TARGETS,
+    IDEAL_LENGTHS,
+    MIN_SAFETY_SCORE,
+)
+
+DIMENSIONS = 512
+WEIGHTS = np.array([0.4, 0.25, 0.15, 0.2])  # relevance, length, hashtags, novelty
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def _tokens(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def embed(texts: list[str]) -> np.ndarray:
+    """Row-normalised hashed bag-of-words vectors, one row per text."""
+    rows, cols = [], []
+    for row, text in enumerate(texts):
+        for token in _tokens(text):
+            rows.append(row)
+            cols.append(zlib.crc32(token.encode()) % DIMENSIONS)
+    matrix = np.zeros((len(texts), DIMENSIONS), dtype=np.float32)
+    np.add.at(matrix, (rows, cols), 1.0)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def safety_scores(texts: list[str]) -> np.ndarray:
+    """1.0 for clean text, minus 0.5 per flagged term, floored at 0."""
+    hits = np.array(
+        [sum(term in text.lower() for term in FLAGGED_TERMS) for text in texts], dtype=np.float32
+    )
+    return np.asarray(np.clip(1.0 - 0.5 * hits, 0.0, 1.0))
+
+
+def score(
+    transcript: str, captions: list[dict[str, object]], platform: str
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Quality and safety per caption, plus the index of the best choice."""
+    texts = [str(c["text"]) for c in captions]
+    vectors = embed(texts + [transcript])
+    candidates, source = vectors[:-1], vectors[-1]
+
+    relevance = candidates @ source
+    lengths = np.array([len(t) for t in texts], dtype=np.float32)
+    ideal = IDEAL_LENGTHS[platform]
+    length_fit = np.exp(-(((lengths - ideal) / ideal) ** 2))
+    counts = np.array(
+        [len(tags) if isinstance(tags := c.get("hashtags"), list) else 0 for c in captions],
+        dtype=np.float32,
+    )
+    target = HASHTAG_TARGETS[platform]
+    hashtag_fit = np.clip(1.0 - np.abs(counts - target) / max(target, 1), 0.0, 1.0)
+    similarity = candidates @ candidates.T
+    np.fill_diagonal(similarity, 0.0)
+    novelty = 1.0 - (similarity.max(axis=1) if len(texts) > 1 else np.zeros(len(texts)))
+
+    quality = np.stack([relevance, length_fit, hashtag_fit, novelty], axis=1) @ WEIGHTS
+    safety = safety_scores(texts)
+    eligible = np.where(safety >= MIN_SAFETY_SCORE, quality, -np.inf)
+    best = int(np.argmax(eligible)) if np.isfinite(eligible).any() else int(np.argmax(safety))
+    return quality, safety, best
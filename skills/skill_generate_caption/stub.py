@@ -0,0 +1,199 @@
+"""
+Local mock model server for skill_generate_caption.
+
+Serves an OpenAI-compatible ``POST /v1/chat/completions`` that understands
+the batch layout from ``prompts``. It writes deterministic captions from
+the transcript's keywords in the requested persona's voice. Latency is
+modelled as a fixed cost per request plus a cost per generated caption,
+like a real decoder.
+
+The server counts requests, items and tokens (about four characters per
+token). A system prefix it has seen before is reported as
+``cached_tokens``, as a provider with prompt caching would bill it. That
+makes batching and prefix reuse measurable offline.
+
+Example:
+    with FakeModelServer(latency_s=0.05) as server:
+        skill = GenerateCaptionSkill({"model_url": server.url})
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from skills.skill_generate_caption.prompts import parse_items
+
+_PERSONA = re.compile(r"persona '([^']+)'")
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9']{3,}")
+_STOPWORDS = frozenset(
+    {"this", "that", "with", "have", "just", "what", "your", "from", "they", "were", "about"}
+)
+
+TEMPLATES: dict[str, tuple[str, ...]] = {
+    "funny": (
+        "POV: you just discovered {0} and now it's your whole personality 😂",
+        "Nobody: ... Me at 3am: researching {0} and {1}",
+        "{0} but make it chaotic 🤪",
+        "Tell me you love {0} without telling me you love {0}",
+    ),
+    "professional": (
+        "Key takeaway: {0} changes how we think about {1}.",
+        "Three lessons on {0} worth your next two minutes.",
+        "What {0} means for {1}, explained briefly.",
+        "A practical look at {0} and why it matters.",
+    ),
+    "casual": (
+        "ok {0} is kinda amazing ngl",
+        "can't stop thinking about {0} tbh",
+        "{0} + {1} = my whole weekend",
+        "lowkey obsessed with {0} right now",
+    ),
+}
+GENERIC = ("{0}, seen through a {persona} lens", "Another take on {0} and {1}")
+
+
+def keywords(transcript: str, count: int = 3) -> list[str]:
+    """Most frequent content words, first-seen order breaking ties."""
+    words = [w.lower() for w in _WORD.findall(transcript) if w.lower() not in _STOPWORDS]
+    ranked = [w for w, _ in Counter(words).most_common(count)]
+    return (ranked + ["this", "today", "trend"])[:count]
+
+
+def tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+class FakeModelServer:
+    """
+    Threaded mock chat-completions server.
+
+    Args:
+        latency_s: Fixed cost of every request (network + prefill).
+        per_caption_s: Decoding cost per generated caption.
+    """
+
+    def __init__(
+        self,
+        latency_s: float = 0.0,
+        per_caption_s: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency_s = latency_s
+        self.per_caption_s = per_caption_s
+        self.stats: Counter[str] = Counter()
+        self.prefixes: set[str] = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/v1"
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            return dict(self.stats)
+
+    def start(self) -> "FakeModelServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeModelServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def complete(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Build the completion payload for a request body."""
+        messages = {m["role"]: m["content"] for m in body["messages"]}
+        prefix, user = messages["system"], messages["user"]
+        match = _PERSONA.search(prefix)
+        persona = match.group(1) if match else "default"
+        templates = TEMPLATES.get(persona, GENERIC)
+        items = []
+        for item in parse_items(user):
+            words = keywords(item.transcript)
+            captions = []
+            for v in range(item.variations):
+                text = templates[v % len(templates)].format(*words, persona=persona)
+                if v >= len(templates):
+                    text += f" (take {v + 1})"
+                hashtags = [f"#{w}" for w in words[:2]] + ["#fyp"] if item.include_hashtags else []
+                captions.append({"text": text, "hashtags": hashtags})
+            items.append(captions)
+        content = json.dumps({"items": items})
+        captions_made = sum(len(i) for i in items)
+        with self._lock:
+            cached = tokens(prefix) if prefix in self.prefixes else 0
+            self.prefixes.add(prefix)
+            self.stats["requests"] += 1
+            self.stats["items"] += len(items)
+            self.stats["captions"] += captions_made
+            self.stats["prompt_tokens"] += tokens(prefix) + tokens(user)
+            self.stats["cached_tokens"] += cached
+            self.stats["completion_tokens"] += tokens(content)
+        time.sleep(self.latency_s + self.per_caption_s * captions_made)
+        return {
+            "id": f"chatcmpl-{self.stats['requests']}",
+            "object": "chat.completion",
+            "model": body.get("model", "mock"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": tokens(prefix) + tokens(user),
+                "completion_tokens": tokens(content),
+                "prompt_tokens_details": {"cached_tokens": cached},
+            },
+        }
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                if self.path != "/v1/chat/completions":
+                    self._send(404, {"error": {"message": "not found"}})
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length))
+                    payload = stub.complete(body)
+                except (ValueError, KeyError) as exc:
+                    self._send(400, {"error": {"message": str(exc)}})
+                    return
+                self._send(200, payload)
+
+            def _send(self, status: int, payload: dict[str, Any]) -> None:
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,18 @@
+"""
+skill_post_content - Publish posts with scheduling, batching and idempotency.
+
+Reference: research/tooling_strategy.md#5-skill_post_content
+"""
+
+from skills.skill_post_content.idempotency import IdempotencyStore
+from skills.skill_post_content.main import PostContentSkill
+from skills.skill_post_content.publishers import DryRunPublisher, HttpPublisher
+from skills.skill_post_content.scheduler import PostScheduler
+
+__all__ = [
+    "DryRunPublisher",
+    "HttpPublisher",
+    "IdempotencyStore",
+    "PostContentSkill",
+    "PostScheduler",
+]
@@ -0,0 +1,101 @@
+"""
+Batching of publish calls per platform.
+
+Posts to the same platform are queued for up to ``window_s`` and sent
+together, up to the publisher's ``max_batch``. For platforms without a
+batch endpoint (``max_batch == 1``) posts go straight through. One bad
+post in a batch fails only that post.
+
+The batcher belongs to the event loop it is first used on.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Any
+
+from skills.skill_post_content.publishers import Post, Publisher, PublishFailed
+
+
+class PublishBatcher:
+    """
+    Packs posts for one publisher into batch calls.
+
+    Args:
+        publisher: Where batches go.
+        window_s: Longest time a post waits for company.
+    """
+
+    def __init__(self, publisher: Publisher, window_s: float = 0.05):
+        self.publisher = publisher
+        self.window_s = window_s
+        self.stats: Counter[str] = Counter()
+        self._posts: list[Post] = []
+        self._futures: list[asyncio.Future[dict[str, Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def submit(self, post: Post) -> dict[str, Any]:
+        """Queue ``post`` and wait for its result."""
+        if self.publisher.max_batch <= 1:
+            self.stats["calls"] += 1
+            self.stats["posts"] += 1
+            [result] = await self.publisher.publish([post])
+            return self._checked(result)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._posts.append(post)
+        self._futures.append(future)
+        if len(self._posts) >= self.publisher.max_batch or self.window_s <= 0:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_s, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._posts:
+            return
+        posts, futures = self._posts, self._futures
+        self._posts, self._futures = [], []
+        self.stats["calls"] += 1
+        self.stats["posts"] += len(posts)
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(posts))
+        task = asyncio.get_running_loop().create_task(self._dispatch(posts, futures))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(
+        self, posts: list[Post], futures: list[asyncio.Future[dict[str, Any]]]
+    ) -> None:
+        try:
+            results = await self.publisher.publish(posts)
+            if len(results) != len(posts):
+                raise ValueError(f"{len(results)} results for a batch of {len(posts)}")
+        except Exception as exc:
+            self.stats["failed_calls"] += 1
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future, result in zip(futures, results, strict=True):
+            if future.done():
+                continue
+            try:
+                future.set_result(self._checked(result))
+            except PublishFailed as exc:
+                future.set_exception(exc)
+
+    def _checked(self, result: dict[str, Any]) -> dict[str, Any]:
+        if "error" in result or not result.get("post_id"):
+            self.stats["rejected"] += 1
+            raise PublishFailed(str(result.get("error", "no post_id in response")))
+        return result
+
+    def report(self) -> dict[str, Any]:
+        calls = self.stats["calls"]
+        return {
+            **self.stats,
+            "posts_per_call": round(self.stats["posts"] / calls, 2) if calls else 0.0,
+        }
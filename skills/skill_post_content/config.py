@@ -0,0 +1,55 @@
+"""
+Configuration defaults for skill_post_content.
+
+Reference: research/tooling_strategy.md#5-skill_post_content
+"""
+
+from typing import Literal, get_args
+
+# Platforms the skill can publish to.
+Platform = Literal["tiktok", "youtube", "twitter", "instagram"]
+SUPPORTED_PLATFORMS: tuple[str, ...] = get_args(Platform)
+
+# Hard post text limits (characters, hashtags included) per platform.
+TEXT_LIMITS: dict[str, int] = {
+    "tiktok": 2200,
+    "youtube": 5000,
+    "twitter": 280,
+    "instagram": 2200,
+}
+
+# Media attachments allowed per post.
+MAX_MEDIA = 10
+
+# Posts per call to a platform's batch publish endpoint. 1 means the
+# platform only has a single-post endpoint.
+BATCH_LIMITS: dict[str, int] = {"tiktok": 1, "youtube": 1, "twitter": 20, "instagram": 10}
+
+# How long a post waits for others to share its batch call.
+BATCH_WINDOW_S = 0.05
+
+# Media uploads in flight at once across all posts on the node.
+UPLOAD_CONCURRENCY = 16
+
+# Publish and upload paths appended to a platform endpoint.
+MEDIA_PATH = "/media"
+POSTS_PATH = "/posts"
+BATCH_PATH = "/posts/batch"
+
+# Per-request timeout for publish calls; uploads get UPLOAD_TIMEOUT_S.
+REQUEST_TIMEOUT_S = 30.0
+UPLOAD_TIMEOUT_S = 300.0
+
+# How long a published post's result is remembered under its idempotency
+# key. A retry inside this window returns the original post.
+IDEMPOTENCY_TTL_S = 7 * 24 * 3600.0
+
+# How long a claim on a key is held while the post is being published. A
+# worker that dies mid-publish blocks retries for at most this long.
+CLAIM_TTL_S = 600.0
+
+# A schedule no later than this many seconds from now is published at once.
+SCHEDULE_SLACK_S = 1.0
+
+# Furthest ahead a post may be scheduled.
+MAX_SCHEDULE_AHEAD_S = 90 * 24 * 3600.0
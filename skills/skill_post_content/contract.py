@@ -0,0 +1,101 @@
+"""
+Input and output contracts for skill_post_content.
+
+Field shapes are checked by the compiled schema. Two rules span fields and
+run once the shapes pass: the composed post text (text plus hashtags) must
+be non-empty unless there is media, and must fit the platform's limit; and
+a ``schedule`` must parse and be at most ``MAX_SCHEDULE_AHEAD_S`` away.
+
+Reference: research/tooling_strategy.md#5-skill_post_content
+"""
+
+from datetime import UTC, datetime
+from typing import Annotated, Any, Literal, NotRequired
+
+from pydantic import AfterValidator, Field, with_config
+from pydantic_core import PydanticCustomError
+from typing_extensions import TypedDict
+
+from skills.contracts import STRICT, Contract
+from skills.skill_post_content.config import (
+    MAX_MEDIA,
+    MAX_SCHEDULE_AHEAD_S,
+    TEXT_LIMITS,
+    Platform,
+)
+
+
+def parse_schedule(value: str) -> datetime:
+    """ISO 8601 timestamp; naive values are taken as UTC."""
+    moment = datetime.fromisoformat(value)
+    return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+
+
+def compose_text(content: dict[str, Any]) -> str:
+    """Post text with any hashtags it does not already contain appended."""
+    text = content.get("text", "").strip()
+    tags = []
+    for tag in content.get("hashtags", []):
+        tag = tag if tag.startswith("#") else f"#{tag}"
+        if tag.casefold() not in text.casefold() and tag not in tags:
+            tags.append(tag)
+    return " ".join([text, *tags]) if text else " ".join(tags)
+
+
+def _schedule(value: str | None) -> str | None:
+    if value is None:
+        return None
+    try:
+        ahead = parse_schedule(value).timestamp() - datetime.now(UTC).timestamp()
+    except ValueError:
+        raise PydanticCustomError(
+            "schedule", "schedule must be an ISO 8601 timestamp or null"
+        ) from None
+    if ahead > MAX_SCHEDULE_AHEAD_S:
+        raise PydanticCustomError("schedule", "schedule is too far in the future")
+    return value
+
+
+MediaPath = Annotated[str, Field(min_length=1)]
+# A hashtag needs something besides '#'.
+Hashtag = Annotated[str, Field(pattern=r"[^#]")]
+
+
+@with_config(STRICT)
+class PostBody(TypedDict):
+    text: NotRequired[str]
+    media: NotRequired[Annotated[list[MediaPath], Field(max_length=MAX_MEDIA)]]
+    hashtags: NotRequired[list[Hashtag]]
+
+
+@with_config(STRICT)
+class PostContentInput(TypedDict):
+    platform: Platform
+    content: PostBody
+    schedule: NotRequired[Annotated[str | None, AfterValidator(_schedule)]]
+    idempotency_key: NotRequired[Annotated[str, Field(min_length=1)] | None]
+
+
+def _fits_platform(data: PostContentInput) -> PostContentInput:
+    content = data["content"]
+    composed = compose_text(dict(content))
+    if not composed and not content.get("media"):
+        raise PydanticCustomError("post_text", "content needs text, hashtags or media")
+    limit = TEXT_LIMITS.get(data["platform"])
+    if limit is not None and len(composed) > limit:
+        raise PydanticCustomError(
+            "post_text", "text with hashtags exceeds {limit} characters", {"limit": limit}
+        )
+    return data
+
+
+@with_config(STRICT)
+class PostContentOutput(TypedDict):
+    status: Literal["success", "scheduled", "error"]
+    post_id: str
+    url: str
+    published_at: str
+
+
+INPUT_CONTRACT = Contract(Annotated[PostContentInput, AfterValidator(_fits_platform)])
+OUTPUT_CONTRACT = Contract(PostContentOutput)
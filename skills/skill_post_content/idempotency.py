@@ -0,0 +1,130 @@
+"""
+Idempotency keys for skill_post_content.
+
+Every post has a key: the caller's ``idempotency_key``, or a hash of the
+platform, text, media and schedule. ``IdempotencyStore`` makes a retry
+with the same key return the original post instead of publishing again:
+
+    begin(key)     NEW    the caller now owns the key and publishes;
+                   DONE   already published, here is the result;
+                   BUSY   another worker is publishing it right now.
+    complete(key)  stores the result for ``ttl`` seconds.
+    release(key)   drops the claim after a failure so a retry can publish.
+
+A claim expires after ``claim_ttl`` so a crashed worker cannot block a
+post forever. Releasing after an ambiguous failure (e.g. a timeout after
+the request was sent) is safe because the same key also goes to the
+platform as ``Idempotency-Key``.
+
+Without Redis the store is per process. With any
+``redis.asyncio.Redis``-compatible client it is shared by every worker:
+a claim is ``SET NX PX``, a result is the JSON value.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from enum import StrEnum
+from typing import Any
+
+from skills.skill_post_content.config import CLAIM_TTL_S, IDEMPOTENCY_TTL_S
+
+_PENDING = b""
+
+
+class Claim(StrEnum):
+    NEW = "new"
+    DONE = "done"
+    BUSY = "busy"
+
+
+def idempotency_key(
+    platform: str, text: str, media: Sequence[str], schedule: str | None
+) -> str:
+    """Key for a post that came without one: same content, same key."""
+    payload = json.dumps([platform, text, list(media), schedule], separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Published-post results by idempotency key.
+
+    Args:
+        redis: Optional ``redis.asyncio.Redis``-compatible client
+            (``decode_responses=False``) shared by every worker.
+        ttl: Seconds a published result is remembered.
+        claim_ttl: Seconds an unfinished claim blocks other publishers.
+        namespace: Redis key prefix.
+    """
+
+    def __init__(
+        self,
+        redis: Any = None,
+        ttl: float = IDEMPOTENCY_TTL_S,
+        claim_ttl: float = CLAIM_TTL_S,
+        namespace: str = "chimera:posts:",
+    ):
+        self.redis = redis
+        self.ttl = ttl
+        self.claim_ttl = claim_ttl
+        self.namespace = namespace
+        # key -> (expires_at, JSON result or _PENDING), oldest write first.
+        self._local: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def begin(self, key: str) -> tuple[Claim, dict[str, Any] | None]:
+        """Claim ``key`` or report who has it."""
+        if self.redis is None:
+            return self._begin_local(key)
+        name = self.namespace + key
+        for _ in range(2):
+            if await self.redis.set(name, _PENDING, nx=True, px=int(self.claim_ttl * 1000)):
+                return Claim.NEW, None
+            raw = await self.redis.get(name)
+            if raw is not None:
+                return self._state(bytes(raw))
+            # Expired between SET and GET; try to claim again.
+        return Claim.BUSY, None
+
+    def _begin_local(self, key: str) -> tuple[Claim, dict[str, Any] | None]:
+        now = time.time()
+        self._expire(now)
+        entry = self._local.get(key)
+        if entry is not None and entry[0] > now:
+            return self._state(entry[1])
+        self._write(key, _PENDING, now + self.claim_ttl)
+        return Claim.NEW, None
+
+    @staticmethod
+    def _state(raw: bytes) -> tuple[Claim, dict[str, Any] | None]:
+        if raw == _PENDING:
+            return Claim.BUSY, None
+        return Claim.DONE, json.loads(raw)
+
+    async def complete(self, key: str, result: dict[str, Any]) -> None:
+        raw = json.dumps(result, separators=(",", ":")).encode()
+        if self.redis is None:
+            self._write(key, raw, time.time() + self.ttl)
+        else:
+            await self.redis.set(self.namespace + key, raw, px=int(self.ttl * 1000))
+
+    async def release(self, key: str) -> None:
+        if self.redis is None:
+            self._local.pop(key, None)
+        else:
+            await self.redis.delete(self.namespace + key)
+
+    def _write(self, key: str, raw: bytes, expires_at: float) -> None:
+        self._local[key] = (expires_at, raw)
+        self._local.move_to_end(key)
+
+    def _expire(self, now: float) -> None:
+        # Entries are in write order; claims expire sooner than results, so
+        # this can stop early and leave a few dead entries behind for a while.
+        while self._local:
+            key, (expires_at, _) = next(iter(self._local.items()))
+            if expires_at > now:
+                break
+            del self._local[key]
@@ -0,0 +1,222 @@
+"""
+skill_post_content - Publish content to social platforms.
+
+Publishing goes through one pipeline per node:
+
+1. Idempotency. Every post has a key: the caller's ``idempotency_key``, or
+   a hash of platform, text, media and schedule. A key that was already
+   published returns the original post (``duplicate: true``), so a
+   retried task never double-posts. See ``idempotency``.
+2. Scheduling. A ``schedule`` in the future puts the post on the node's
+   ``PostScheduler`` calendar and returns ``status: "scheduled"`` at once.
+   The post then goes through the rest of the pipeline when it is due.
+3. Media upload. A post's files are uploaded concurrently, under a
+   node-wide cap on uploads in flight.
+4. Publish. Posts to a platform with a batch endpoint are packed into
+   batch calls (``PublishBatcher``); the others go out one by one.
+
+Platforms without an endpoint use ``DryRunPublisher``: nothing is sent
+and results are marked ``dry_run``.
+
+Reference: research/tooling_strategy.md#5-skill_post_content
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from skills.base import BaseSkill, utc_timestamp
+from skills.skill_post_content.batching import PublishBatcher
+from skills.skill_post_content.config import (
+    BATCH_WINDOW_S,
+    SCHEDULE_SLACK_S,
+    UPLOAD_CONCURRENCY,
+)
+from skills.skill_post_content.contract import (
+    INPUT_CONTRACT,
+    OUTPUT_CONTRACT,
+    compose_text,
+    parse_schedule,
+)
+from skills.skill_post_content.idempotency import Claim, IdempotencyStore, idempotency_key
+from skills.skill_post_content.publishers import (
+    DryRunPublisher,
+    Post,
+    Publisher,
+    build_publishers,
+)
+from skills.skill_post_content.scheduler import PostScheduler
+
+logger = logging.getLogger(__name__)
+
+# Awaited with the result of every scheduled post once it is published.
+PublishedHook = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class PostInProgress(Exception):
+    """Another worker holds the idempotency key; retry later."""
+
+
+def iso_utc(moment: datetime) -> str:
+    """``moment`` in the ``utc_timestamp()`` format."""
+    return moment.astimezone(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+class PostContentSkill(BaseSkill):
+    """
+    Publish a post now or at its ``schedule``.
+
+    Config keys:
+        api_keys: {platform: key} passed to HTTP publishers.
+        endpoints: {platform: base_url} serving /media, /posts and
+            /posts/batch.
+        publishers: {platform: Publisher} injected publisher objects.
+        batch_limits: {platform: posts per batch call} overrides.
+        batch_window_s: how long a post waits to share a batch call.
+        upload_concurrency: media uploads in flight across all posts.
+        idempotency: shared ``IdempotencyStore``; pass one built on Redis
+            to deduplicate across workers.
+        scheduler: shared ``PostScheduler`` holding the posting calendar.
+        on_published: async hook called with each scheduled post's result.
+        http_pool / rate_limiter: see ``BaseSkill``.
+    """
+
+    name = "skill_post_content"
+    input_contract = INPUT_CONTRACT
+    output_contract = OUTPUT_CONTRACT
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        super().__init__(config)
+        self.publishers: dict[str, Publisher] = build_publishers(
+            self.config, self.http_pool, self.rate_limiter
+        )
+        self.idempotency: IdempotencyStore = self.config.get("idempotency") or IdempotencyStore()
+        self.scheduler: PostScheduler = self.config.get("scheduler") or PostScheduler()
+        self.on_published: PublishedHook | None = self.config.get("on_published")
+        self.batch_window_s = float(self.config.get("batch_window_s", BATCH_WINDOW_S))
+        self.upload_concurrency = int(self.config.get("upload_concurrency", UPLOAD_CONCURRENCY))
+        self._batchers: dict[str, PublishBatcher] = {}
+        self._uploads: asyncio.Semaphore | None = None
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def execute_async(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        result = await super().execute_async(input_data)
+        if result["status"] == "error":
+            for field in ("post_id", "url", "published_at"):
+                result.setdefault(field, "")
+        return result
+
+    def publisher(self, platform: str) -> Publisher:
+        publisher = self.publishers.get(platform)
+        if publisher is None:
+            publisher = self.publishers[platform] = DryRunPublisher(platform)
+        return publisher
+
+    def batcher(self, platform: str) -> PublishBatcher:
+        batcher = self._batchers.get(platform)
+        if batcher is None:
+            batcher = PublishBatcher(self.publisher(platform), self.batch_window_s)
+            self._batchers[platform] = batcher
+        return batcher
+
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        platform, content = input_data["platform"], input_data["content"]
+        text, media = compose_text(content), list(content.get("media", []))
+        schedule = input_data.get("schedule")
+        key = input_data.get("idempotency_key") or idempotency_key(platform, text, media, schedule)
+
+        when = parse_schedule(schedule) if schedule else None
+        if when is not None and when.timestamp() > datetime.now(UTC).timestamp() + SCHEDULE_SLACK_S:
+            added = self.scheduler.add(
+                when.timestamp(), key, lambda: self._publish_scheduled(platform, key, text, media)
+            )
+            return {
+                "status": "scheduled",
+                "post_id": "",
+                "url": "",
+                "published_at": iso_utc(when),
+                "idempotency_key": key,
+                "duplicate": not added,
+            }
+        record = await self.publish(platform, key, text, media)
+        return {"status": "success", **record, "idempotency_key": key}
+
+    async def publish(self, platform: str, key: str, text: str, media: list[str]) -> dict[str, Any]:
+        """Publish once per key; concurrent calls for one key share the attempt."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._publish_once(platform, key, text, media)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _publish_once(
+        self, platform: str, key: str, text: str, media: list[str]
+    ) -> dict[str, Any]:
+        claim, previous = await self.idempotency.begin(key)
+        if claim is Claim.DONE:
+            assert previous is not None
+            return {**previous, "duplicate": True}
+        if claim is Claim.BUSY:
+            raise PostInProgress(f"post {key[:12]} is being published by another worker")
+        try:
+            media_ids = await self.upload_all(platform, key, media)
+            result = await self.batcher(platform).submit(Post(key, text, media_ids))
+        except BaseException:
+            await self.idempotency.release(key)
+            raise
+        record: dict[str, Any] = {
+            "post_id": str(result["post_id"]),
+            "url": str(result.get("url", "")),
+            "published_at": str(result.get("published_at") or utc_timestamp()),
+        }
+        if result.get("dry_run"):
+            record["dry_run"] = True
+        await self.idempotency.complete(key, record)
+        return {**record, "duplicate": False}
+
+    async def upload_all(self, platform: str, key: str, media: list[str]) -> tuple[str, ...]:
+        """Upload a post's media concurrently, in order, under the node-wide cap."""
+        if not media:
+            return ()
+        if self._uploads is None:
+            self._uploads = asyncio.Semaphore(self.upload_concurrency)
+        publisher, uploads = self.publisher(platform), self._uploads
+
+        async def upload(index: int, path: str) -> str:
+            async with uploads:
+                return await publisher.upload(path, f"{key}:{index}")
+
+        return tuple(await asyncio.gather(*(upload(i, p) for i, p in enumerate(media))))
+
+    async def _publish_scheduled(
+        self, platform: str, key: str, text: str, media: list[str]
+    ) -> dict[str, Any]:
+        try:
+            record = await self.publish(platform, key, text, media)
+            result = {"status": "success", **record, "idempotency_key": key}
+        except Exception as exc:
+            logger.error("scheduled post %s on %s failed: %s", key[:12], platform, exc)
+            result = self.error_response(
+                "EXECUTION_FAILED",
+                f"{self.name} failed: {exc}",
+                details={"exception": type(exc).__name__, "idempotency_key": key},
+            )
+        if self.on_published is not None:
+            await self.on_published(result)
+        return result
+
+    def report(self) -> dict[str, Any]:
+        """Scheduler and per-platform batching counters."""
+        return {
+            "scheduler": self.scheduler.report(),
+            "batching": {p: b.report() for p, b in self._batchers.items()},
+        }
@@ -0,0 +1,231 @@
+"""
+Per-platform publishers for skill_post_content.
+
+A publisher uploads media and publishes posts for one platform. Every call
+carries an idempotency key. ``HttpPublisher`` sends it as an
+``Idempotency-Key`` header, so a platform (or the MCP server in front of
+it) that honours the header never creates a post twice for one key. That
+holds even when the first attempt's response was lost.
+
+``publish()`` takes a list. ``max_batch`` says how many posts the
+platform's endpoint accepts in one call; 1 means single posts only.
+
+``DryRunPublisher`` is used for platforms without an endpoint. Nothing
+leaves the process and results are marked ``dry_run``.
+
+Reference: research/tooling_strategy.md#5-skill_post_content
+"""
+
+import asyncio
+import hashlib
+import os
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+from skills.base import utc_timestamp
+from skills.skill_post_content.config import (
+    BATCH_LIMITS,
+    BATCH_PATH,
+    MEDIA_PATH,
+    POSTS_PATH,
+    REQUEST_TIMEOUT_S,
+    UPLOAD_TIMEOUT_S,
+)
+
+if TYPE_CHECKING:
+    from chimera.ratelimit import RateLimiter
+    from chimera.transport import HttpPool
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Post:
+    """One post ready to publish: final text and already uploaded media."""
+
+    key: str
+    text: str
+    media_ids: tuple[str, ...] = ()
+
+
+class PublishFailed(Exception):
+    """The platform rejected one post of a batch."""
+
+
+class Publisher(Protocol):
+    """Uploads media and publishes posts for one platform."""
+
+    platform: str
+    max_batch: int
+
+    async def upload(self, path: str, key: str) -> str:
+        """Upload one media file; returns the platform's media id."""
+        ...
+
+    async def publish(self, posts: list[Post]) -> list[dict[str, Any]]:
+        """
+        Publish up to ``max_batch`` posts in one call.
+
+        Returns one dict per post, in order: ``post_id``, ``url`` and
+        optionally ``published_at``, or ``error`` for a rejected post.
+        """
+        ...
+
+
+async def _file_chunks(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as handle:
+        while chunk := await asyncio.to_thread(handle.read, UPLOAD_CHUNK_BYTES):
+            yield chunk
+
+
+class HttpPublisher:
+    """
+    Publishes through a JSON endpoint over the shared HTTP pool.
+
+    Endpoints, relative to ``base_url``:
+        POST /media        raw file body -> {"media_id"}
+        POST /posts        {"text", "media_ids"} -> {"post_id", "url", ...}
+        POST /posts/batch  {"posts": [{"idempotency_key", ...}]} -> {"results": [...]}
+
+    Every request passes through the platform's rate limiter, which retries
+    429/503 with backoff; the retry reuses the idempotency key.
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        base_url: str,
+        pool: "HttpPool",
+        limiter: "RateLimiter",
+        api_key: str | None = None,
+        max_batch: int | None = None,
+    ):
+        self.platform = platform
+        self.base_url = base_url.rstrip("/")
+        self.pool = pool
+        self.limiter = limiter
+        self.api_key = api_key
+        self.max_batch = max_batch or BATCH_LIMITS.get(platform, 1)
+
+    def _headers(self, key: str | None = None) -> dict[str, str]:
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        if key is not None:
+            headers["Idempotency-Key"] = key
+        return headers
+
+    async def upload(self, path: str, key: str) -> str:
+        headers = {
+            **self._headers(key),
+            "Content-Type": "application/octet-stream",
+            "X-Filename": os.path.basename(path),
+        }
+        response = await self.limiter.call(
+            self.platform,
+            self.api_key,
+            lambda: self.pool.post(
+                self.base_url + MEDIA_PATH,
+                content=_file_chunks(path),
+                headers=headers,
+                timeout=UPLOAD_TIMEOUT_S,
+            ),
+        )
+        response.raise_for_status()
+        return str(response.json()["media_id"])
+
+    async def publish(self, posts: list[Post]) -> list[dict[str, Any]]:
+        if len(posts) == 1:
+            [post] = posts
+            body: dict[str, Any] = {"text": post.text, "media_ids": list(post.media_ids)}
+            response = await self._post(POSTS_PATH, body, post.key)
+            return [response]
+        body = {
+            "posts": [
+                {"idempotency_key": p.key, "text": p.text, "media_ids": list(p.media_ids)}
+                for p in posts
+            ]
+        }
+        # The batch as a whole is keyed too, so a retried batch call is
+        # recognised even before the per-post keys are looked at.
+        batch_key = hashlib.sha256("|".join(p.key for p in posts).encode()).hexdigest()
+        results: list[dict[str, Any]] = (await self._post(BATCH_PATH, body, batch_key))["results"]
+        return results
+
+    async def _post(self, path: str, body: dict[str, Any], key: str) -> dict[str, Any]:
+        response = await self.limiter.call(
+            self.platform,
+            self.api_key,
+            lambda: self.pool.post(
+                self.base_url + path,
+                json=body,
+                headers=self._headers(key),
+                timeout=REQUEST_TIMEOUT_S,
+            ),
+        )
+        response.raise_for_status()
+        payload: dict[str, Any] = response.json()
+        return payload
+
+
+class DryRunPublisher:
+    """
+    Publisher that only pretends: ids are derived from the idempotency key.
+
+    ``latency_s`` is added per call, so batching and scheduling can be
+    measured offline.
+    """
+
+    def __init__(self, platform: str, max_batch: int | None = None, latency_s: float = 0.0):
+        self.platform = platform
+        self.max_batch = max_batch or BATCH_LIMITS.get(platform, 1)
+        self.latency_s = latency_s
+        self.stats: Counter[str] = Counter()
+
+    async def upload(self, path: str, key: str) -> str:
+        self.stats["uploads"] += 1
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return "dry_media_" + hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    async def publish(self, posts: list[Post]) -> list[dict[str, Any]]:
+        self.stats["calls"] += 1
+        self.stats["posts"] += len(posts)
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        results = []
+        for post in posts:
+            post_id = "dry_" + hashlib.sha256(post.key.encode()).hexdigest()[:16]
+            results.append(
+                {
+                    "post_id": post_id,
+                    "url": f"dry-run://{self.platform}/{post_id}",
+                    "published_at": utc_timestamp(),
+                    "dry_run": True,
+                }
+            )
+        return results
+
+
+def build_publishers(
+    config: dict[str, Any], pool: "HttpPool", limiter: "RateLimiter"
+) -> dict[str, Publisher]:
+    """
+    Build a publisher per configured platform from skill config.
+
+    ``config["publishers"]`` entries win over ``config["endpoints"]``.
+    """
+    api_keys: dict[str, str] = config.get("api_keys", {})
+    batch_limits: dict[str, int] = config.get("batch_limits", {})
+    publishers: dict[str, Publisher] = {}
+    for platform, base_url in config.get("endpoints", {}).items():
+        publishers[platform] = HttpPublisher(
+            platform,
+            base_url,
+            pool,
+            limiter,
+            api_keys.get(platform),
+            batch_limits.get(platform),
+        )
+    publishers.update(config.get("publishers", {}))
+    return publishers
@@ -0,0 +1,135 @@
+"""
+Posting calendar for skill_post_content.
+
+``PostScheduler`` keeps every scheduled post in one heap ordered by due
+time. A single asyncio task sleeps until the earliest post is due, or
+until an earlier post is added, and then starts the due jobs. Memory is
+one small tuple per post, and there is no thread or timer handle per post.
+That is enough for the calendars of thousands of agents on one node.
+
+Jobs are keyed by idempotency key. Scheduling a key that is already
+scheduled is a no-op, and ``cancel()`` removes a post lazily: its heap
+entry is skipped when it comes up.
+
+The calendar lives in memory. Posts still pending when the process
+stops are returned by ``pending()``, so a supervisor can re-submit them.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Coroutine[Any, Any, Any]]
+
+
+class PostScheduler:
+    """Runs jobs at their due time (epoch seconds) from one heap and one driver task."""
+
+    def __init__(self) -> None:
+        self.stats: Counter[str] = Counter()
+        self._heap: list[tuple[float, int, str]] = []
+        self._jobs: dict[str, tuple[int, float, Job]] = {}
+        self._seq = itertools.count()
+        self._wake: asyncio.Event | None = None
+        self._driver: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[Any]] = set()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._jobs
+
+    def add(self, due: float, key: str, job: Job) -> bool:
+        """Schedule ``job`` at epoch ``due``; False if ``key`` is already scheduled."""
+        if key in self._jobs:
+            self.stats["duplicates"] += 1
+            return False
+        seq = next(self._seq)
+        self._jobs[key] = (seq, due, job)
+        earliest = not self._heap or due < self._heap[0][0]
+        heapq.heappush(self._heap, (due, seq, key))
+        self.stats["scheduled"] += 1
+        if self._driver is None or self._driver.done():
+            self._wake = asyncio.Event()
+            self._driver = asyncio.get_running_loop().create_task(self._drive())
+        elif earliest and self._wake is not None:
+            self._wake.set()
+        return True
+
+    def cancel(self, key: str) -> bool:
+        if self._jobs.pop(key, None) is None:
+            return False
+        self.stats["cancelled"] += 1
+        return True
+
+    def pending(self) -> list[tuple[float, str]]:
+        """(due, key) of every scheduled job, earliest first."""
+        return sorted((due, key) for key, (_, due, _) in self._jobs.items())
+
+    def next_due(self) -> float | None:
+        self._skip_cancelled()
+        return self._heap[0][0] if self._heap else None
+
+    def _skip_cancelled(self) -> None:
+        while self._heap:
+            _, seq, key = self._heap[0]
+            entry = self._jobs.get(key)
+            if entry is not None and entry[0] == seq:
+                return
+            heapq.heappop(self._heap)
+
+    async def _drive(self) -> None:
+        assert self._wake is not None
+        while True:
+            self._skip_cancelled()
+            if not self._heap:
+                return
+            delay = self._heap[0][0] - time.time()
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+            _, _, key = heapq.heappop(self._heap)
+            _, _, job = self._jobs.pop(key)
+            self._start(key, job)
+
+    def _start(self, key: str, job: Job) -> None:
+        self.stats["started"] += 1
+        task = asyncio.get_running_loop().create_task(job())
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        task.add_done_callback(lambda t: self._finished(key, t))
+
+    def _finished(self, key: str, task: asyncio.Task[Any]) -> None:
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.stats["failed"] += 1
+            logger.error("scheduled post %s failed: %s", key, task.exception())
+        else:
+            self.stats["completed"] += 1
+
+    async def drain(self) -> None:
+        """Wait for jobs that have already started (tests, shutdown)."""
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def close(self) -> None:
+        """Stop the driver; scheduled jobs stay in ``pending()``."""
+        if self._driver is not None:
+            self._driver.cancel()
+            self._driver = None
+
+    def report(self) -> dict[str, Any]:
+        return {**self.stats, "pending": len(self._jobs), "running": len(self._running)}
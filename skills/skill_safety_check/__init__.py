@@ -0,0 +1,11 @@
+"""
+skill_safety_check - Batch-first toxicity, spam and policy scoring.
+
+Reference: research/tooling_strategy.md#6-skill_safety_check
+"""
+
+from skills.skill_safety_check.automaton import KeywordAutomaton
+from skills.skill_safety_check.main import SafetyCheckSkill
+from skills.skill_safety_check.verdicts import VerdictCache
+
+__all__ = ["KeywordAutomaton", "SafetyCheckSkill", "VerdictCache"]
@@ -0,0 +1,102 @@
+"""
+Configuration defaults for skill_safety_check.
+
+Reference: research/tooling_strategy.md#6-skill_safety_check
+"""
+
+from typing import Literal, get_args
+
+# Bump when scoring logic changes, so cached verdicts from the old logic
+# are dropped (see ``verdicts``).
+POLICY_REVISION = 1
+
+# Checks a request can ask for.
+CheckType = Literal["toxicity", "spam", "policy"]
+CHECK_TYPES: tuple[str, ...] = get_args(CheckType)
+
+# Content longer than this is rejected rather than scored.
+MAX_CONTENT_CHARS = 20_000
+
+# A check fails when its score reaches the threshold; config["thresholds"]
+# overrides entries.
+THRESHOLDS: dict[str, float] = {"toxicity": 0.5, "spam": 0.5, "policy": 0.5}
+
+# Term lists per check, matched as whole words after normalisation (see
+# ``automaton.normalize``). config["terms"] adds entries.
+TERMS: dict[str, tuple[str, ...]] = {
+    "toxicity": (
+        "hate you",
+        "kill yourself",
+        "kys",
+        "idiot",
+        "moron",
+        "stupid",
+        "loser",
+        "trash human",
+        "shut up",
+        "die",
+        "disgusting",
+        "worthless",
+    ),
+    "spam": (
+        "click here",
+        "dm me",
+        "free money",
+        "buy now",
+        "limited offer",
+        "act now",
+        "follow for follow",
+        "f4f",
+        "link in bio",
+        "giveaway",
+        "100 guaranteed",
+        "earn cash",
+        "work from home",
+    ),
+    "policy": (
+        "nsfw",
+        "onlyfans",
+        "guaranteed returns",
+        "crypto pump",
+        "miracle cure",
+        "cures cancer",
+        "buy followers",
+        "fake reviews",
+        "weed delivery",
+        "gambling bonus",
+        "hate speech",
+    ),
+}
+
+# Probability one matched term contributes per check; n hits score
+# 1 - (1 - p) ** n.
+TERM_WEIGHTS: dict[str, float] = {"toxicity": 0.6, "spam": 0.5, "policy": 0.6}
+
+# Surface-feature tuning. Text shorter than SHOUT_MIN_LETTERS letters is
+# never counted as shouting, and ratios use at least RATIO_MIN_CHARS
+# characters so a doubled letter in a short reply is not spam.
+SHOUT_MIN_LETTERS = 12
+SHOUT_WEIGHT = 0.4
+RATIO_MIN_CHARS = 20
+LINKS_SATURATE = 3
+EXCLAIMS_ALLOWED = 3
+EXCLAIMS_SATURATE = 10
+REPEAT_BASELINE = 0.15
+HASHTAGS_ALLOWED = 6
+HASHTAGS_SATURATE = 10
+
+# A surface signal at or above this strength is reported in ``flags``.
+FEATURE_FLAG = 0.3
+
+# Hashtags that satisfy a sponsored post's disclosure requirement.
+DISCLOSURE_TAGS: tuple[str, ...] = ("#ad", "#sponsored", "#paidpartnership")
+
+# Rows scored per vectorised block. Items are sorted by length first so a
+# block pads to the length of its longest item, not the batch's.
+BLOCK_ROWS = 512
+
+# Verdict cache defaults (see ``verdicts.VerdictCache``).
+VERDICT_CACHE_ENTRIES = 100_000
+VERDICT_CACHE_BYTES = 64 * 1024 * 1024
+VERDICT_TTL_S = 24 * 3600.0
+NEAR_DUPLICATE_SIMILARITY = 0.7
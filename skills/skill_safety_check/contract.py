@@ -0,0 +1,32 @@
+"""
+Input and output contracts for skill_safety_check.
+
+Reference: research/tooling_strategy.md#6-skill_safety_check
+"""
+
+from typing import Annotated, Literal, NotRequired
+
+from pydantic import Field, with_config
+from typing_extensions import TypedDict
+
+from skills.contracts import STRICT, AnyDict, Contract
+from skills.skill_safety_check.config import MAX_CONTENT_CHARS, CheckType
+
+
+@with_config(STRICT)
+class SafetyCheckInput(TypedDict):
+    content: Annotated[str, Field(max_length=MAX_CONTENT_CHARS)]
+    context: NotRequired[AnyDict]
+    check_types: Annotated[list[CheckType], Field(min_length=1)]
+
+
+@with_config(STRICT)
+class SafetyCheckOutput(TypedDict):
+    status: Literal["success", "error"]
+    scores: dict[str, Annotated[float, Field(ge=0.0, le=1.0)]]
+    is_safe: bool
+    flags: list[str]
+
+
+INPUT_CONTRACT = Contract(SafetyCheckInput)
+OUTPUT_CONTRACT = Contract(SafetyCheckOutput)
@@ -0,0 +1,47 @@
+"""
+Surface features for skill_safety_check, computed for a whole batch at once.
+
+The canonical texts (``canonical_text``, not the leet-folded ones the
+automaton sees) become one padded code-point matrix. Every per-character
+statistic is then a reduction over that matrix: letters, upper-case
+letters, ``!``, and printable ASCII characters that repeat the one before
+them. Emoji runs and blank lines are not counted as repetition. URLs and
+hashtags are counted with precompiled regexes.
+"""
+
+import re
+
+import numpy as np
+
+_URL = re.compile(r"https?://|www\.|\b[a-z0-9-]+\.(?:com|net|io|ly|xyz|biz|link)\b", re.I)
+_HASHTAG = re.compile(r"(?<!\w)#\w+")
+
+FEATURES: tuple[str, ...] = (
+    "length",
+    "letters",
+    "upper",
+    "exclaims",
+    "repeats",
+    "links",
+    "hashtags",
+)
+
+
+def surface_features(texts: list[str]) -> dict[str, np.ndarray]:
+    """Per-text feature columns, each of shape (n,), keyed by ``FEATURES``."""
+    width = max((len(t) for t in texts), default=0)
+    raw = "".join(t.ljust(width, "\0") for t in texts).encode("utf-32-le")
+    codes = np.frombuffer(raw, dtype=np.uint32).reshape(len(texts), width)
+    upper = (codes >= 65) & (codes <= 90)
+    lower = (codes >= 97) & (codes <= 122)
+    printable = (codes > 32) & (codes < 127)
+    repeats = (codes[:, 1:] == codes[:, :-1]) & printable[:, 1:]
+    return {
+        "length": np.array([len(t) for t in texts]),
+        "letters": (upper | lower).sum(axis=1),
+        "upper": upper.sum(axis=1),
+        "exclaims": (codes == 33).sum(axis=1),
+        "repeats": repeats.sum(axis=1),
+        "links": np.array([len(_URL.findall(t)) for t in texts]),
+        "hashtags": np.array([len(_HASHTAG.findall(t)) for t in texts]),
+    }
@@ -0,0 +1,338 @@
+"""
+skill_safety_check - Score content for toxicity, spam and policy violations.
+
+Scoring is batch-first. ``execute_batch()`` scores a list of requests
+together. Every term list is matched by one compiled Aho-Corasick
+automaton (see ``automaton``), and surface features like links, repeats
+and hashtag stuffing are NumPy reductions (see ``features``). A single
+``execute()`` is a batch of one, so both paths give identical results.
+Content is scored in its canonical form, the same text the verdict cache
+keys on, with the key's shouting bucket as the upper-case signal.
+
+Each check's score is a probability-style value in [0, 1]. Its independent
+signals are combined by noisy-or: ``1 - prod(1 - p_i)``. A check fails when
+its score reaches its threshold, and ``is_safe`` is True only if no
+requested check failed. Errors fail closed, with ``is_safe`` False.
+
+With a ``VerdictCache`` in ``config["verdict_cache"]``, repeated and
+near-duplicate content reuses earlier verdicts (see ``verdicts``). Within a
+batch, each canonical content is scored only once.
+
+Reference: research/tooling_strategy.md#6-skill_safety_check
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from chimera.cache.fingerprint import canonical_text, minhash
+from skills.base import BaseSkill, run_sync, utc_timestamp
+from skills.skill_safety_check.automaton import KeywordAutomaton
+from skills.skill_safety_check.config import (
+    BLOCK_ROWS,
+    CHECK_TYPES,
+    DISCLOSURE_TAGS,
+    EXCLAIMS_ALLOWED,
+    EXCLAIMS_SATURATE,
+    FEATURE_FLAG,
+    HASHTAGS_ALLOWED,
+    HASHTAGS_SATURATE,
+    LINKS_SATURATE,
+    POLICY_REVISION,
+    RATIO_MIN_CHARS,
+    REPEAT_BASELINE,
+    SHOUT_MIN_LETTERS,
+    SHOUT_WEIGHT,
+    TERM_WEIGHTS,
+    TERMS,
+    THRESHOLDS,
+)
+from skills.skill_safety_check.contract import INPUT_CONTRACT, OUTPUT_CONTRACT
+from skills.skill_safety_check.features import surface_features
+from skills.skill_safety_check.verdicts import VerdictCache
+
+_TOXICITY, _SPAM, _POLICY = (CHECK_TYPES.index(c) for c in ("toxicity", "spam", "policy"))
+_UPPER = bytes(range(65, 91))
+_LETTERS = _UPPER + bytes(range(97, 123))
+_DISCLOSURE = re.compile(
+    r"(?<!\w)(?:" + "|".join(re.escape(t) for t in DISCLOSURE_TAGS) + r")\b", re.I
+)
+
+
+@lru_cache(maxsize=8)
+def _compile(terms: tuple[tuple[str, tuple[str, ...]], ...]) -> KeywordAutomaton:
+    return KeywordAutomaton(dict(terms))
+
+
+def _noisy_or(*signals: np.ndarray) -> np.ndarray:
+    return np.asarray(1.0 - np.prod([1.0 - s for s in signals], axis=0))
+
+
+class SafetyCheckSkill(BaseSkill):
+    """
+    Score content against the requested checks.
+
+    Config keys:
+        thresholds: {check: score} overriding ``THRESHOLDS``.
+        terms: {check: [term, ...]} added to the built-in ``TERMS``.
+        block_rows: rows per vectorised block (``BLOCK_ROWS``).
+        verdict_cache: ``VerdictCache`` shared between checks, or a dict
+            of ``VerdictCache`` options to build one per skill instance.
+            The dict form suits PROCESS mode, where config is pickled.
+        policy_version: label mixed into ``policy_version``; change it to
+            drop cached verdicts after an out-of-band policy change.
+    """
+
+    name = "skill_safety_check"
+    input_contract = INPUT_CONTRACT
+    output_contract = OUTPUT_CONTRACT
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        super().__init__(config)
+        thresholds = {**THRESHOLDS, **self.config.get("thresholds", {})}
+        self.thresholds = np.array([thresholds[c] for c in CHECK_TYPES])
+        extra = self.config.get("terms", {})
+        self.automaton = _compile(
+            tuple((c, tuple(TERMS[c]) + tuple(extra.get(c, ()))) for c in CHECK_TYPES)
+        )
+        self.block_rows = int(self.config.get("block_rows", BLOCK_ROWS))
+        verdicts = self.config.get("verdict_cache")
+        if isinstance(verdicts, dict):
+            verdicts = VerdictCache(**verdicts)
+        self.verdicts: VerdictCache | None = verdicts
+        self.policy_version = self._policy_digest()
+
+    def _policy_digest(self) -> str:
+        """Digest of everything that decides a verdict; cached verdicts are keyed on it."""
+        automaton = self.automaton
+        policy = {
+            "revision": POLICY_REVISION,
+            "label": self.config.get("policy_version"),
+            "terms": [
+                [automaton.categories[c], t]
+                for c, t in zip(automaton.term_category, automaton.terms, strict=True)
+            ],
+            "thresholds": self.thresholds.tolist(),
+            "weights": TERM_WEIGHTS,
+        }
+        raw = json.dumps(policy, sort_keys=True, default=str).encode()
+        return hashlib.sha256(raw).hexdigest()[:16]
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def execute_async(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        result = await super().execute_async(input_data)
+        return self._fail_closed(result)
+
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        return self.score_batch([input_data])[0]
+
+    async def execute_batch_async(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Validate and score many requests in one vectorised pass.
+
+        Results come back in input order. An invalid item gets its own
+        INVALID_INPUT error and does not affect the rest of the batch.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        valid = []
+        for i, item in enumerate(items):
+            errors = self.input_errors(item)
+            if errors:
+                results[i] = self._fail_closed(
+                    self.error_response(
+                        "INVALID_INPUT",
+                        f"Invalid input for {self.name}: {errors[0]}",
+                        validation_errors=errors,
+                    )
+                )
+            else:
+                valid.append(i)
+        try:
+            scored = self.score_batch([items[i] for i in valid])
+        except Exception as exc:
+            failure = self._fail_closed(
+                self.error_response(
+                    "EXECUTION_FAILED",
+                    f"{self.name} failed: {exc}",
+                    details={"exception": type(exc).__name__},
+                )
+            )
+            scored = [dict(failure) for _ in valid]
+        for i, result in zip(valid, scored, strict=True):
+            results[i] = result
+        return [r for r in results if r is not None]
+
+    def execute_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Blocking ``execute_batch_async()``."""
+        return run_sync(self.execute_batch_async(items))
+
+    @staticmethod
+    def _fail_closed(result: dict[str, Any]) -> dict[str, Any]:
+        if result["status"] == "error":
+            result.setdefault("scores", {})
+            result.setdefault("is_safe", False)
+            result.setdefault("flags", [])
+        return result
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def score_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Score already-validated requests; results are in input order."""
+        cache = self.verdicts
+        verdicts = self._score(items) if cache is None else self._score_cached(items, cache)
+        timestamp = utc_timestamp()
+        return [{"status": "success", **verdict, "timestamp": timestamp} for verdict in verdicts]
+
+    def scope(self, item: dict[str, Any]) -> str:
+        """Verdict-cache scope: the checks asked for and the context bits that score."""
+        sponsored = int(bool(item.get("context", {}).get("sponsored")))
+        return f"{','.join(sorted(set(item['check_types'])))}|{sponsored}"
+
+    @staticmethod
+    def content_key(content: str) -> str:
+        """
+        Canonical content plus its shouting bucket (see ``verdicts``).
+
+        ``_score`` scores exactly this: the canonical text, with the bucket
+        standing in for the upper-case share. Anything the key folds away
+        (padding, emoji, case) therefore cannot change a verdict, and no
+        variant can cache a verdict its key-mates would not get.
+        """
+        raw = unicodedata.normalize("NFKC", content).encode("ascii", "ignore")
+        letters = len(raw) - len(raw.translate(None, _LETTERS))
+        bucket = 0
+        if letters >= SHOUT_MIN_LETTERS:
+            bucket = round(10 * (len(raw) - len(raw.translate(None, _UPPER))) / letters)
+        return f"{bucket}\x1f{canonical_text(content)}"
+
+    def _score_cached(
+        self, items: list[dict[str, Any]], cache: VerdictCache
+    ) -> list[dict[str, Any]]:
+        """Score only the canonical contents the cache cannot answer, once each."""
+        cache.ensure_policy(self.policy_version)
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        pending: dict[tuple[str, str], list[int]] = {}
+        for i, item in enumerate(items):
+            group = (self.scope(item), self.content_key(item["content"]))
+            pending.setdefault(group, []).append(i)
+        for group, indices in list(pending.items()):
+            verdict = cache.get(*group, uses=len(indices))
+            if verdict is not None:
+                for i in pending.pop(group):
+                    results[i] = verdict
+
+        groups = list(pending)
+        signatures: list[np.ndarray | None] = [None] * len(groups)
+        if groups and cache.near_duplicates:
+            texts = [content_key.partition("\x1f")[2] for _, content_key in groups]
+            found: list[np.ndarray] = list(minhash(texts))
+            signatures = list(found)
+            for group, sig in zip(groups, found, strict=True):
+                verdict = cache.get_near(group[0], sig, uses=len(pending[group]))
+                if verdict is not None:
+                    for i in pending.pop(group):
+                        results[i] = verdict
+        misses = [(g, sig) for g, sig in zip(groups, signatures, strict=True) if g in pending]
+        cache.miss(len(misses), coalesced=sum(len(pending[g]) - 1 for g, _ in misses))
+
+        fresh = self._score([items[pending[group][0]] for group, _ in misses])
+        for (group, signature), verdict in zip(misses, fresh, strict=True):
+            cache.put(*group, signature, verdict)
+            for i in pending[group]:
+                results[i] = verdict
+        return [
+            {"scores": dict(r["scores"]), "is_safe": r["is_safe"], "flags": list(r["flags"])}
+            for r in results
+            if r is not None
+        ]
+
+    def _score(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Verdicts (scores, is_safe, flags) for already-validated requests."""
+        keys = [self.content_key(item["content"]).partition("\x1f") for item in items]
+        texts = [text for _, _, text in keys]
+        shout = np.array([int(bucket) / 10 for bucket, _, _ in keys])
+        requested = np.zeros((len(items), len(CHECK_TYPES)), dtype=bool)
+        for row, item in enumerate(items):
+            requested[row, [CHECK_TYPES.index(c) for c in item["check_types"]]] = True
+        sponsored = np.array([bool(item.get("context", {}).get("sponsored")) for item in items])
+
+        scores = np.zeros((len(items), len(CHECK_TYPES)))
+        flags: list[list[str]] = [[] for _ in items]
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        for start in range(0, len(order), self.block_rows):
+            rows = np.array(order[start : start + self.block_rows])
+            block = [texts[i] for i in rows]
+            block_scores, block_flags = self._score_block(block, sponsored[rows], shout[rows])
+            scores[rows] = block_scores
+            for row, labels in zip(rows, block_flags, strict=True):
+                flags[row] = labels
+
+        unsafe = np.asarray(((scores >= self.thresholds) & requested).any(axis=1))
+        return [
+            {
+                "scores": {
+                    c: round(float(scores[row, col]), 4)
+                    for col, c in enumerate(CHECK_TYPES)
+                    if requested[row, col]
+                },
+                "is_safe": not bool(unsafe[row]),
+                "flags": [f for f in flags[row] if f.partition(":")[0] in item["check_types"]],
+            }
+            for row, item in enumerate(items)
+        ]
+
+    def _score_block(
+        self, texts: list[str], sponsored: np.ndarray, shout: np.ndarray
+    ) -> tuple[np.ndarray, list[list[str]]]:
+        """(rows, checks) scores and per-row flags for one block of canonical texts."""
+        automaton = self.automaton
+        hits = automaton.scan(texts)
+        counts = automaton.category_hits(hits)
+        weights = np.array([TERM_WEIGHTS[c] for c in CHECK_TYPES])
+        terms = 1.0 - (1.0 - weights) ** counts
+
+        f = surface_features(texts)
+        length = np.maximum(f["length"], RATIO_MIN_CHARS)
+        signals = {
+            "toxicity:shouting": SHOUT_WEIGHT * np.clip((shout - 0.5) / 0.3, 0.0, 1.0),
+            "spam:links": np.clip(f["links"] / LINKS_SATURATE, 0.0, 1.0),
+            "spam:exclamation": 0.5
+            * np.clip(
+                (f["exclaims"] - EXCLAIMS_ALLOWED) / (EXCLAIMS_SATURATE - EXCLAIMS_ALLOWED), 0, 1
+            ),
+            "spam:repetition": 0.5
+            * np.clip((f["repeats"] / length - REPEAT_BASELINE) / (1 - REPEAT_BASELINE), 0, 1),
+            "spam:hashtags": np.clip(
+                (f["hashtags"] - HASHTAGS_ALLOWED) / (HASHTAGS_SATURATE - HASHTAGS_ALLOWED), 0, 1
+            ),
+        }
+        undisclosed = sponsored & np.array(
+            [_DISCLOSURE.search(t) is None for t in texts], dtype=bool
+        )
+        signals["policy:missing_disclosure"] = undisclosed * 0.9
+
+        scores = np.empty((len(texts), len(CHECK_TYPES)))
+        scores[:, _TOXICITY] = _noisy_or(terms[:, _TOXICITY], signals["toxicity:shouting"])
+        scores[:, _SPAM] = _noisy_or(
+            terms[:, _SPAM], *(v for k, v in signals.items() if k.startswith("spam:"))
+        )
+        scores[:, _POLICY] = _noisy_or(terms[:, _POLICY], signals["policy:missing_disclosure"])
+
+        flags: list[list[str]] = [[] for _ in texts]
+        for row, term in zip(*np.nonzero(hits), strict=True):
+            category = automaton.categories[automaton.term_category[term]]
+            flags[row].append(f"{category}:{automaton.terms[term]}")
+        for label, values in signals.items():
+            for row in np.flatnonzero(values >= FEATURE_FLAG):
+                flags[row].append(label)
+        return scores, flags
@@ -0,0 +1,212 @@
+"""
+Verdict memoisation for skill_safety_check.
+
+The same captions, replies and spam waves are checked over and over.
+``VerdictCache`` remembers verdicts in two ways:
+
+- **Exact**: keyed on the canonical content (see
+  ``chimera.cache.fingerprint.canonical_text``). Case, emoji and spacing
+  are folded away, and the key also carries a shouting bucket, because
+  upper-case share is the one scored signal that case folding would hide.
+- **Near duplicate**: a MinHash signature of the canonical content is
+  looked up in an LSH index (see ``chimera.cache.fingerprint``). Only
+  unsafe verdicts are reused this way by default. A near-duplicate of
+  spam is still spam, but a near-duplicate of a clean caption might be
+  the one with an insult added.
+
+Entries are scoped to the requested check types and context bits, live in
+an LRU bounded by count and bytes, and expire after ``ttl``. Only verdicts
+that near duplicates may reuse are indexed for near lookup. Every key
+includes the skill's policy version. When the version changes, the whole
+cache is dropped.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from chimera.cache.fingerprint import MinHashLSH
+from chimera.cache.lru import CacheEntry, LRUCache
+from skills.skill_safety_check.config import (
+    NEAR_DUPLICATE_SIMILARITY,
+    VERDICT_CACHE_BYTES,
+    VERDICT_CACHE_ENTRIES,
+    VERDICT_TTL_S,
+)
+
+
+@dataclass
+class VerdictStats:
+    """
+    Counters for ``VerdictCache``, per request served.
+
+    ``near_hits`` count as hits. ``coalesced`` requests repeated a miss in
+    the same batch and shared its freshly scored verdict.
+    """
+
+    hits: int = 0
+    near_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.near_hits + self.misses
+        return (self.hits + self.near_hits) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+class VerdictCache:
+    """
+    Bounded, TTL'd verdict memo shared by safety checks with one policy.
+
+    Args:
+        max_entries / max_bytes: LRU bounds.
+        ttl: Seconds a verdict may be reused.
+        near_threshold: Estimated Jaccard similarity at which two contents
+            count as near duplicates; None disables near-duplicate reuse.
+        reuse_safe_near_duplicates: Also reuse safe verdicts for near
+            duplicates. Off by default; see the module docstring.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = VERDICT_CACHE_ENTRIES,
+        max_bytes: int = VERDICT_CACHE_BYTES,
+        ttl: float = VERDICT_TTL_S,
+        near_threshold: float | None = NEAR_DUPLICATE_SIMILARITY,
+        reuse_safe_near_duplicates: bool = False,
+    ):
+        self.ttl = ttl
+        self.near_threshold = near_threshold
+        self.reuse_safe_near_duplicates = reuse_safe_near_duplicates
+        self.stats = VerdictStats()
+        self.policy_version: str | None = None
+        self.memory = LRUCache(max_entries, max_bytes, on_evict=self._evicted)
+        self._near: dict[str, MinHashLSH] = {}
+        self._scope_of: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def near_duplicates(self) -> bool:
+        return self.near_threshold is not None
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+    def report(self) -> dict[str, Any]:
+        return {**self.stats.as_dict(), "entries": len(self.memory), "policy": self.policy_version}
+
+    # ------------------------------------------------------------------
+    # Policy
+    # ------------------------------------------------------------------
+
+    def ensure_policy(self, version: str) -> None:
+        """Adopt ``version``; a change from a previous version drops every verdict."""
+        with self._lock:
+            if version == self.policy_version:
+                return
+            if self.policy_version is not None:
+                self.stats.invalidations += 1
+            self.clear()
+            self.policy_version = version
+
+    def clear(self) -> None:
+        with self._lock:
+            self.memory.clear()
+            self._near.clear()
+            self._scope_of.clear()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _key(self, scope: str, content_key: str) -> str:
+        raw = f"{self.policy_version}\x1f{scope}\x1f{content_key}".encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, scope: str, content_key: str, uses: int = 1) -> dict[str, Any] | None:
+        """
+        Exact hit for this scope and canonical content, or None (not counted
+        as a miss). A hit serves ``uses`` requests.
+        """
+        entry = self.memory.get(self._key(scope, content_key))
+        if entry is None:
+            return None
+        self.stats.hits += uses
+        verdict: dict[str, Any] = json.loads(entry.value)
+        return verdict
+
+    def get_near(
+        self, scope: str, signature: np.ndarray, uses: int = 1
+    ) -> dict[str, Any] | None:
+        """Most similar reusable near-duplicate verdict at or above ``near_threshold``."""
+        with self._lock:
+            index = self._near.get(scope)
+            candidates = index.near(signature) if index is not None else []
+            for _, key in candidates:
+                entry = self.memory.get(str(key))
+                if entry is None:
+                    self._forget(str(key))
+                    continue
+                self.stats.near_hits += uses
+                verdict: dict[str, Any] = json.loads(entry.value)
+                return verdict
+        return None
+
+    def miss(self, count: int = 1, coalesced: int = 0) -> None:
+        self.stats.misses += count
+        self.stats.coalesced += coalesced
+
+    def put(
+        self,
+        scope: str,
+        content_key: str,
+        signature: np.ndarray | None,
+        verdict: dict[str, Any],
+    ) -> None:
+        key = self._key(scope, content_key)
+        expires = time.time() + self.ttl
+        value = json.dumps(verdict, separators=(",", ":")).encode()
+        with self._lock:
+            self.memory.set(key, CacheEntry(value, expires, expires))
+            if signature is None or self.near_threshold is None or key not in self.memory:
+                return
+            if verdict["is_safe"] and not self.reuse_safe_near_duplicates:
+                return
+            index = self._near.get(scope)
+            if index is None:
+                index = self._near[scope] = MinHashLSH(self.near_threshold)
+            index.add(key, signature)
+            self._scope_of[key] = scope
+            if len(self._scope_of) > 2 * max(len(self.memory), 1):
+                # Expired entries leave the LRU without an eviction callback.
+                for stale in [k for k in self._scope_of if k not in self.memory]:
+                    self._forget(stale)
+
+    def _evicted(self, key: str) -> None:
+        self.stats.evictions += 1
+        with self._lock:
+            self._forget(key)
+
+    def _forget(self, key: str) -> None:
+        scope = self._scope_of.pop(key, None)
+        if scope is not None:
+            self._near[scope].discard(key)
@@ -0,0 +1,9 @@
+"""
+skill_transcribe_audio - Transcribe audio to text with chunked, parallel decoding.
+
+Reference: research/tooling_strategy.md#3-skill_transcribe_audio
+"""
+
+from skills.skill_transcribe_audio.main import Partial, TranscribeAudioSkill
+
+__all__ = ["Partial", "TranscribeAudioSkill"]
@@ -0,0 +1,78 @@
+"""
+Audio decoding for skill_transcribe_audio.
+
+Everything is normalised to mono int16 PCM at one sample rate. WAV files
+are read with the standard library; anything else (MP4, M4A, MP3, ...) is
+decoded by piping it through ``ffmpeg``, which must be on ``PATH``.
+"""
+
+import shutil
+import subprocess
+import wave
+
+import numpy as np
+
+
+class AudioError(RuntimeError):
+    """The file could not be decoded to PCM."""
+
+
+def load_audio(path: str, rate: int) -> np.ndarray:
+    """Decode ``path`` to mono int16 samples at ``rate`` Hz."""
+    if path.lower().endswith(".wav"):
+        return read_wav(path, rate)
+    return _ffmpeg_decode(path, rate)
+
+
+def read_wav(path: str, rate: int) -> np.ndarray:
+    """Read a PCM WAV file, downmixing and resampling as needed."""
+    try:
+        with wave.open(path, "rb") as wav:
+            channels, width, source_rate = (
+                wav.getnchannels(),
+                wav.getsampwidth(),
+                wav.getframerate(),
+            )
+            raw = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as exc:
+        raise AudioError(f"{path}: {exc}") from exc
+    if width != 2:
+        raise AudioError(f"{path}: only 16-bit PCM WAV is supported, got {8 * width}-bit")
+    samples = np.frombuffer(raw, dtype="<i2")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return resample(samples, source_rate, rate)
+
+
+def write_wav(path: str, samples: np.ndarray, rate: int) -> None:
+    """Write mono int16 ``samples`` as a PCM WAV file."""
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.asarray(samples, dtype="<i2").tobytes())
+
+
+def resample(samples: np.ndarray, source_rate: int, rate: int) -> np.ndarray:
+    """Linear-interpolation resample; adequate for speech at 16 kHz."""
+    if source_rate == rate or not len(samples):
+        return samples
+    count = round(len(samples) * rate / source_rate)
+    positions = np.arange(count) * (source_rate / rate)
+    out = np.interp(positions, np.arange(len(samples)), samples.astype(np.float32))
+    return np.asarray(out, dtype=np.int16)
+
+
+def _ffmpeg_decode(path: str, rate: int) -> np.ndarray:
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise AudioError(f"{path}: ffmpeg is required to decode non-WAV audio")
+    proc = subprocess.run(
+        [ffmpeg, "-nostdin", "-v", "error", "-i", path]
+        + ["-f", "s16le", "-ac", "1", "-ar", str(rate), "-"],
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise AudioError(f"{path}: {proc.stderr.decode(errors='replace').strip()}")
+    return np.frombuffer(proc.stdout, dtype="<i2")
@@ -0,0 +1,130 @@
+"""
+Speech-to-text backends for skill_transcribe_audio.
+
+A backend turns one chunk of mono int16 samples into text. Backends are
+named in config (``"backend": "local"``) rather than passed as objects,
+because chunks are transcribed in worker processes. Each process builds
+a backend once through ``get_backend`` and reuses it, so model weights
+load once per worker rather than once per chunk.
+
+    local     deterministic decoder for tone-coded test audio (see stub.py)
+    whisper   faster-whisper; ``pip install faster-whisper``
+"""
+
+import json
+import time
+from typing import Any, Protocol
+
+import numpy as np
+
+from skills.skill_transcribe_audio.segment import silence_runs, silent_frames
+
+# LocalBackend vocabulary. Word i is a pure tone at BASE_HZ + i * STEP_HZ.
+VOCABULARY: tuple[str, ...] = (
+    "the", "a", "and", "to", "of", "in", "is", "it", "this", "that",
+    "you", "we", "they", "new", "video", "trend", "today", "look", "at", "how",
+    "make", "best", "way", "try", "watch", "wait", "for", "end", "just", "got",
+    "so", "good", "really", "love", "with", "my", "your", "first", "time", "ever",
+    "check", "out", "hello", "world", "why", "not", "now", "more",
+)  # fmt: skip
+BASE_HZ = 400.0
+STEP_HZ = 50.0
+
+
+class Backend(Protocol):
+    def transcribe(self, samples: np.ndarray, rate: int, language: str, model: str) -> str:
+        """Text spoken in ``samples``."""
+        ...
+
+
+class LocalBackend:
+    """
+    Deterministic backend for tests and benchmarks.
+
+    Every voiced run in the chunk is one word, identified by its dominant
+    frequency. ``rtf`` (real-time factor) burns that many CPU-seconds per
+    second of audio, so benchmarks can model a real decoder's cost.
+    """
+
+    def __init__(self, rtf: float = 0.0, min_word_s: float = 0.04):
+        self.rtf = rtf
+        self.min_word_s = min_word_s
+
+    def transcribe(self, samples: np.ndarray, rate: int, language: str, model: str) -> str:
+        if self.rtf:
+            deadline = time.perf_counter() + self.rtf * len(samples) / rate
+            while time.perf_counter() < deadline:
+                pass
+        frame_s = 0.02
+        frame = int(frame_s * rate)
+        voiced = ~silent_frames(samples, rate, frame_s, -40.0)
+        starts, ends = silence_runs(voiced)
+        words = []
+        for start, end in zip(starts, ends, strict=True):
+            if (end - start) * frame_s < self.min_word_s:
+                continue
+            words.append(self.word(samples[start * frame : end * frame], rate))
+        return " ".join(words)
+
+    @staticmethod
+    def word(samples: np.ndarray, rate: int) -> str:
+        spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+        peak = np.argmax(spectrum) * rate / len(samples)
+        index = round((peak - BASE_HZ) / STEP_HZ)
+        return VOCABULARY[index] if 0 <= index < len(VOCABULARY) else "<unk>"
+
+
+class WhisperBackend:
+    """faster-whisper, loaded lazily with one model per size per process."""
+
+    def __init__(self, device: str = "auto", compute_type: str = "default", beam_size: int = 5):
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as exc:
+            raise RuntimeError(
+                "the whisper backend needs faster-whisper: pip install faster-whisper"
+            ) from exc
+        self._model_cls = WhisperModel
+        self.device = device
+        self.compute_type = compute_type
+        self.beam_size = beam_size
+        self._models: dict[str, Any] = {}
+
+    def transcribe(self, samples: np.ndarray, rate: int, language: str, model: str) -> str:
+        if model not in self._models:
+            self._models[model] = self._model_cls(
+                model, device=self.device, compute_type=self.compute_type
+            )
+        audio = samples.astype(np.float32) / 32768.0
+        segments, _ = self._models[model].transcribe(
+            audio, language=language.split("-")[0], beam_size=self.beam_size
+        )
+        return " ".join(segment.text.strip() for segment in segments)
+
+
+BACKENDS: dict[str, type] = {"local": LocalBackend, "whisper": WhisperBackend}
+
+_instances: dict[tuple[str, str], Backend] = {}
+
+
+def get_backend(name: str, options: dict[str, Any] | None = None) -> Backend:
+    """This process's backend ``name`` built with ``options``."""
+    key = (name, json.dumps(options or {}, sort_keys=True))
+    backend = _instances.get(key)
+    if backend is None:
+        if name not in BACKENDS:
+            raise ValueError(f"unknown transcription backend {name!r}")
+        backend = _instances[key] = BACKENDS[name](**(options or {}))
+    return backend
+
+
+def transcribe_chunk(
+    backend: str,
+    options: dict[str, Any],
+    samples: np.ndarray,
+    rate: int,
+    language: str,
+    model: str,
+) -> str:
+    """Transcribe one chunk; the unit of work sent to the process pool."""
+    return get_backend(backend, options).transcribe(samples, rate, language, model).strip()
@@ -0,0 +1,35 @@
+"""
+Configuration defaults for skill_transcribe_audio.
+
+Reference: research/tooling_strategy.md#3-skill_transcribe_audio
+"""
+
+from typing import Literal, get_args
+
+# Whisper model sizes accepted in the ``model`` field.
+ModelSize = Literal["base", "small", "medium", "large"]
+SUPPORTED_MODELS: tuple[str, ...] = get_args(ModelSize)
+
+# Backend used when config does not name one. "local" is deterministic and
+# needs no GPU, model download or network.
+DEFAULT_BACKEND = "local"
+
+# Audio is decoded to mono 16-bit PCM at this rate before segmentation;
+# it is what Whisper-family models expect.
+SAMPLE_RATE = 16_000
+
+# Chunking: cut near CHUNK_TARGET_S at the longest nearby silence, never
+# beyond CHUNK_MAX_S. Chunks shorter than CHUNK_MIN_S are not produced
+# except at the end of the file.
+CHUNK_TARGET_S = 30.0
+CHUNK_MIN_S = 10.0
+CHUNK_MAX_S = 45.0
+
+# A frame is silent when its RMS is this far below full scale. Silences
+# of at least MIN_SILENCE_S are preferred as cut points.
+FRAME_S = 0.02
+SILENCE_DB = -40.0
+MIN_SILENCE_S = 0.3
+
+# Per-file timeout (seconds) for decoding plus all chunk transcriptions.
+TRANSCRIBE_TIMEOUT_S = 1800.0
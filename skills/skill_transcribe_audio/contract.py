@@ -0,0 +1,35 @@
+"""
+Input and output contracts for skill_transcribe_audio.
+
+Reference: research/tooling_strategy.md#3-skill_transcribe_audio
+"""
+
+from typing import Annotated, Literal
+
+from pydantic import Field, with_config
+from typing_extensions import TypedDict
+
+from skills.contracts import STRICT, Contract
+from skills.skill_transcribe_audio.config import ModelSize
+
+# A BCP 47-style language tag such as "en" or "en-US".
+LANGUAGE_PATTERN = r"^[a-z]{2,3}(-[A-Za-z0-9]{2,8})*$"
+
+
+@with_config(STRICT)
+class TranscribeAudioInput(TypedDict):
+    filepath: Annotated[str, Field(min_length=1)]
+    language: Annotated[str, Field(pattern=LANGUAGE_PATTERN)]
+    model: ModelSize
+
+
+@with_config(STRICT)
+class TranscribeAudioOutput(TypedDict):
+    status: Literal["success", "error"]
+    transcript: str
+    duration: float
+    language: str
+
+
+INPUT_CONTRACT = Contract(TranscribeAudioInput)
+OUTPUT_CONTRACT = Contract(TranscribeAudioOutput)
@@ -0,0 +1,239 @@
+"""
+skill_transcribe_audio - Speech to text for downloaded videos.
+
+Transcription is the slowest stage of the content pipeline, so long audio
+is split at silences (see ``segment``) and the chunks are transcribed in
+parallel on a process pool. ``stream()`` yields each chunk's text as soon
+as it and every earlier chunk are done, so a consumer such as caption
+generation can start on the opening lines before the whole file is
+finished. ``run()`` collects the stream into the contract output.
+
+With a ``chimera.cache.ArtifactStore`` in ``config["artifacts"]``, finished
+transcripts are stored under the media's content hash plus backend, model
+and language. The same clip transcribed again, by any agent and under any
+filename, streams back from disk without decoding.
+
+Reference: research/tooling_strategy.md#3-skill_transcribe_audio
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from skills.base import BaseSkill, utc_timestamp
+from skills.skill_transcribe_audio.audio import load_audio
+from skills.skill_transcribe_audio.backends import transcribe_chunk
+from skills.skill_transcribe_audio.config import (
+    CHUNK_MAX_S,
+    CHUNK_MIN_S,
+    CHUNK_TARGET_S,
+    DEFAULT_BACKEND,
+    FRAME_S,
+    MIN_SILENCE_S,
+    SAMPLE_RATE,
+    SILENCE_DB,
+    TRANSCRIBE_TIMEOUT_S,
+)
+from skills.skill_transcribe_audio.contract import INPUT_CONTRACT, OUTPUT_CONTRACT
+from skills.skill_transcribe_audio.segment import Chunk, split_on_silence
+
+if TYPE_CHECKING:
+    from chimera.cache import ArtifactStore
+
+
+@dataclass(frozen=True)
+class Partial:
+    """Transcript of one chunk, with its offsets in seconds."""
+
+    index: int
+    start: float
+    end: float
+    text: str
+    cached: bool = False
+
+
+class TranscribeAudioSkill(BaseSkill):
+    """
+    Transcribe the audio track of ``filepath``.
+
+    Config keys:
+        backend: backend name from ``backends.BACKENDS`` ("local").
+        backend_options: keyword arguments for the backend constructor.
+        workers: processes for chunk transcription (CPU count); with 1,
+            chunks run on the default thread pool instead.
+        executor: shared ``concurrent.futures`` executor to use instead
+            of a private process pool.
+        chunk_target_s, chunk_min_s, chunk_max_s: chunk length bounds.
+        silence_db, min_silence_s: what counts as a cut-worthy silence.
+        timeout: whole-file timeout in seconds.
+        artifacts: ``ArtifactStore`` for reusing finished transcripts.
+    """
+
+    name = "skill_transcribe_audio"
+    input_contract = INPUT_CONTRACT
+    output_contract = OUTPUT_CONTRACT
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        super().__init__(config)
+        self.backend: str = self.config.get("backend", DEFAULT_BACKEND)
+        self.backend_options: dict[str, Any] = dict(self.config.get("backend_options", {}))
+        self.workers = int(self.config.get("workers", os.cpu_count() or 1))
+        self._executor: Executor | None = self.config.get("executor")
+        self._owns_executor = False
+        self.artifacts: ArtifactStore | None = self.config.get("artifacts")
+
+    @property
+    def executor(self) -> Executor | None:
+        """Pool chunks are transcribed on; None means the default thread pool."""
+        if self._executor is None and self.workers > 1:
+            # spawn: forked children would inherit the skills loop without its thread.
+            self._executor = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            self._owns_executor = True
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the private process pool, if one was started."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._owns_executor = False
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def execute_async(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        result = await super().execute_async(input_data)
+        if result["status"] == "error":
+            language = input_data.get("language") if isinstance(input_data, dict) else None
+            result.setdefault("transcript", "")
+            result.setdefault("duration", 0.0)
+            result.setdefault("language", language if isinstance(language, str) else "")
+        return result
+
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        started = time.monotonic()
+
+        async def collect() -> list[Partial]:
+            return [partial async for partial in self.stream(input_data)]
+
+        timeout = float(self.config.get("timeout", TRANSCRIBE_TIMEOUT_S))
+        partials = await asyncio.wait_for(collect(), timeout)
+        return {
+            "status": "success",
+            "transcript": " ".join(p.text for p in partials if p.text),
+            "duration": round(partials[-1].end, 3) if partials else 0.0,
+            "language": input_data["language"],
+            "model": input_data["model"],
+            "segments": [{"start": p.start, "end": p.end, "text": p.text} for p in partials],
+            "chunks": len(partials),
+            "cached": bool(partials) and partials[0].cached,
+            "elapsed_s": round(time.monotonic() - started, 3),
+            "timestamp": utc_timestamp(),
+        }
+
+    async def stream(self, input_data: dict[str, Any]) -> AsyncIterator[Partial]:
+        """
+        Yield chunk transcripts in order while later chunks are still running.
+
+        Every chunk is submitted up front. Chunk ``i`` is yielded once it and
+        all chunks before it are done. Closing the iterator early cancels
+        chunks that have not started. A transcript already in the artifact
+        store is replayed from it.
+        """
+        errors = self.input_errors(input_data)
+        if errors:
+            raise ValueError(errors[0])
+        filepath = input_data["filepath"]
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"no such file: {filepath}")
+        key = None
+        if self.artifacts is not None:
+            key = await asyncio.to_thread(self.artifact_key, self.artifacts, input_data)
+            stored = await asyncio.to_thread(self.artifacts.read_json, "transcript", key)
+            if stored is not None:
+                for i, segment in enumerate(stored["segments"]):
+                    yield Partial(
+                        i, segment["start"], segment["end"], segment["text"], cached=True
+                    )
+                return
+        samples, chunks = await asyncio.to_thread(self.prepare, filepath)
+        pending = [self._submit(samples, chunk, input_data) for chunk in chunks]
+        done: list[Partial] = []
+        try:
+            for chunk, future in zip(chunks, pending, strict=True):
+                text = await future if future is not None else ""
+                start, end = chunk.span(SAMPLE_RATE)
+                done.append(Partial(chunk.index, round(start, 3), round(end, 3), text))
+                yield done[-1]
+        except BrokenExecutor:
+            # A worker died (OOM, segfault in a native decoder); respawn next call.
+            self.close()
+            raise
+        finally:
+            for future in pending:
+                if future is None:
+                    continue
+                if not future.done():
+                    future.cancel()
+                elif not future.cancelled():
+                    future.exception()  # already failed with the first error; mark retrieved
+        if self.artifacts is not None and key is not None:
+            segments = [{"start": p.start, "end": p.end, "text": p.text} for p in done]
+            await asyncio.to_thread(
+                self.artifacts.put_json, "transcript", key, {"segments": segments}
+            )
+
+    def artifact_key(self, store: "ArtifactStore", input_data: dict[str, Any]) -> str:
+        """Store key: media content hash plus everything that changes the text."""
+        return store.key(
+            store.file_digest(input_data["filepath"]),
+            self.backend,
+            json.dumps(self.backend_options, sort_keys=True),
+            input_data["model"],
+            input_data["language"],
+        )
+
+    def prepare(self, filepath: str) -> tuple[np.ndarray, list[Chunk]]:
+        """Decode ``filepath`` and split it into chunks (blocking)."""
+        samples = load_audio(filepath, SAMPLE_RATE)
+        chunks = split_on_silence(
+            samples,
+            SAMPLE_RATE,
+            target_s=float(self.config.get("chunk_target_s", CHUNK_TARGET_S)),
+            min_s=float(self.config.get("chunk_min_s", CHUNK_MIN_S)),
+            max_s=float(self.config.get("chunk_max_s", CHUNK_MAX_S)),
+            frame_s=FRAME_S,
+            threshold_db=float(self.config.get("silence_db", SILENCE_DB)),
+            min_silence_s=float(self.config.get("min_silence_s", MIN_SILENCE_S)),
+        )
+        return samples, chunks
+
+    def _submit(
+        self, samples: np.ndarray, chunk: Chunk, input_data: dict[str, Any]
+    ) -> "asyncio.Future[str] | None":
+        if not chunk.voiced:
+            # Nothing to hear; speech models tend to hallucinate on silence.
+            return None
+        args = (
+            self.backend,
+            self.backend_options,
+            samples[chunk.start : chunk.end],
+            SAMPLE_RATE,
+            input_data["language"],
+            input_data["model"],
+        )
+        executor = self.executor
+        if executor is None:
+            return asyncio.ensure_future(asyncio.to_thread(transcribe_chunk, *args))
+        return asyncio.get_running_loop().run_in_executor(executor, transcribe_chunk, *args)
@@ -0,0 +1,106 @@
+"""
+Silence-aligned chunking for skill_transcribe_audio.
+
+Long audio is cut into chunks of roughly ``target_s`` seconds so they can
+be transcribed in parallel. Each cut falls in the middle of a silence, so
+no word is split across two chunks and stitching the chunk transcripts in
+order gives the same text as one long pass. Audio with no silence in the
+allowed window is cut hard at ``max_s``.
+
+Frame energies are computed in one vectorised pass, so an hour of audio
+segments in milliseconds.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """Samples ``start:end`` of the decoded audio."""
+
+    index: int
+    start: int
+    end: int
+    voiced: bool = True
+
+    def span(self, rate: int) -> tuple[float, float]:
+        """Start and end offsets in seconds."""
+        return self.start / rate, self.end / rate
+
+
+def silent_frames(
+    samples: np.ndarray, rate: int, frame_s: float, threshold_db: float
+) -> np.ndarray:
+    """Boolean mask, one entry per ``frame_s`` frame, True where RMS < threshold."""
+    frame = max(1, int(frame_s * rate))
+    count = -(-len(samples) // frame)
+    padded = np.zeros(count * frame, dtype=np.float32)
+    padded[: len(samples)] = samples
+    rms = np.sqrt(np.mean(np.square(padded.reshape(count, frame) / 32768.0), axis=1))
+    return np.asarray(20 * np.log10(rms + 1e-10) < threshold_db)
+
+
+def silence_runs(silent: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end (exclusive) frame indexes of each run of silent frames."""
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def split_on_silence(
+    samples: np.ndarray,
+    rate: int,
+    *,
+    target_s: float,
+    min_s: float,
+    max_s: float,
+    frame_s: float,
+    threshold_db: float,
+    min_silence_s: float,
+) -> list[Chunk]:
+    """
+    Split ``samples`` into chunks cut at silences.
+
+    A cut is placed at the midpoint of the silence (at least
+    ``min_silence_s`` long) closest to ``target_s`` into the chunk. Failing
+    that, the longest shorter silence between ``min_s`` and ``max_s`` is
+    used, and failing that the chunk is cut at ``max_s``.
+    """
+    if not len(samples):
+        return []
+    frame = max(1, int(frame_s * rate))
+    silent = silent_frames(samples, rate, frame_s, threshold_db)
+    starts, ends = silence_runs(silent)
+    mids, lengths = (starts + ends) // 2, ends - starts
+    total = len(silent)
+    target, low, high = (max(1, round(s / frame_s)) for s in (target_s, min_s, max_s))
+    min_silence = max(1, round(min_silence_s / frame_s))
+
+    bounds = [0]
+    while total - bounds[-1] > high:
+        start = bounds[-1]
+        window = (mids > start + low) & (mids <= start + high)
+        long_enough = window & (lengths >= min_silence)
+        if long_enough.any():
+            candidates = np.flatnonzero(long_enough)
+            cut = mids[candidates[np.argmin(np.abs(mids[candidates] - (start + target)))]]
+        elif window.any():
+            candidates = np.flatnonzero(window)
+            cut = mids[candidates[np.argmax(lengths[candidates])]]
+        else:
+            cut = start + high
+        bounds.append(int(cut))
+    bounds.append(total)
+
+    chunks = []
+    for index, (a, b) in enumerate(zip(bounds, bounds[1:], strict=False)):
+        chunks.append(
+            Chunk(
+                index=index,
+                start=a * frame,
+                end=min(b * frame, len(samples)),
+                voiced=not silent[a:b].all(),
+            )
+        )
+    return chunks
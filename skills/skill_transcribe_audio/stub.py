@@ -0,0 +1,50 @@
+"""
+Synthetic speech for testing skill_transcribe_audio offline.
+
+``synthesize`` renders sentences of ``backends.VOCABULARY`` words as tones
+that ``LocalBackend`` decodes exactly. Words are separated by short gaps,
+sentences by longer pauses, so the segmenter has natural cut points.
+
+Example:
+    expected = write_speech(path, ["hello world", "check out this video"])
+    result = skill.execute({"filepath": path, "language": "en-US", "model": "base"})
+    assert result["transcript"] == expected
+"""
+
+from typing import Any
+
+import numpy as np
+
+from skills.skill_transcribe_audio.audio import write_wav
+from skills.skill_transcribe_audio.backends import BASE_HZ, STEP_HZ, VOCABULARY
+from skills.skill_transcribe_audio.config import SAMPLE_RATE
+
+
+def synthesize(
+    sentences: list[str],
+    rate: int = SAMPLE_RATE,
+    word_s: float = 0.2,
+    gap_s: float = 0.1,
+    pause_s: float = 0.6,
+    amplitude: float = 0.3,
+) -> np.ndarray:
+    """Mono int16 samples speaking ``sentences`` in tone-coded words."""
+    t = np.arange(int(word_s * rate)) / rate
+    ramp = np.minimum(1.0, np.minimum(t, t[::-1]) / 0.01)  # 10 ms fades, no clicks
+    gap = np.zeros(int(gap_s * rate))
+    pause = np.zeros(int(pause_s * rate))
+    parts = [pause]
+    for sentence in sentences:
+        for i, word in enumerate(sentence.split()):
+            frequency = BASE_HZ + VOCABULARY.index(word) * STEP_HZ
+            if i:
+                parts.append(gap)
+            parts.append(amplitude * ramp * np.sin(2 * np.pi * frequency * t))
+        parts.append(pause)
+    return (np.concatenate(parts) * 32767).astype(np.int16)
+
+
+def write_speech(path: str, sentences: list[str], **kwargs: Any) -> str:
+    """Write ``sentences`` to a WAV file and return the expected transcript."""
+    write_wav(path, synthesize(sentences, **kwargs), SAMPLE_RATE)
+    return " ".join(sentences)
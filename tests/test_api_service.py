@@ -0,0 +1,274 @@
+"""
+Test API Service - HTTP endpoints for trends, content and engagement
+
+Validates the spec request/response shapes of the three endpoints, that
+invalid bodies are rejected by the compiled request models, that trend
+lists stream as NDJSON or chunked JSON, and that admission control sheds
+load with 503 and Retry-After instead of queueing without bound.
+
+Reference: specs/technical.md#2-api-contracts
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from chimera.api import AdmissionControl, ApiServices, Limits, Overloaded, create_app
+from chimera.api.jsonio import dumps
+from chimera.ratelimit import RateLimit, RateLimiter
+from skills.skill_fetch_trends import FetchTrendsSkill
+from skills.skill_fetch_trends.stub import FakePlatformServer
+from skills.skill_generate_caption import GenerateCaptionSkill
+from skills.skill_generate_caption.stub import FakeModelServer
+
+TRENDS = "/api/v1/trends/fetch"
+CONTENT = "/api/v1/content/generate"
+RESPOND = "/api/v1/engagement/respond"
+
+
+async def replies(batch):
+    return ["Thank you so much! Glad you enjoyed it!" for _ in batch]
+
+
+@pytest.fixture(scope="module")
+def platforms():
+    with FakePlatformServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def model():
+    with FakeModelServer() as server:
+        yield server
+
+
+def services(platforms, model, **options):
+    limiter = RateLimiter(limits={"llm": RateLimit(rate=1000, burst=1000)})
+    return ApiServices(
+        trends=FetchTrendsSkill({"endpoints": platforms.endpoints()}),
+        captions=GenerateCaptionSkill({"model_url": model.url, "rate_limiter": limiter}),
+        reply=replies,
+        **options,
+    )
+
+
+@pytest.fixture
+async def client(platforms, model):
+    client = TestClient(TestServer(create_app(services(platforms, model))))
+    await client.start_server()
+    yield client
+    await client.close()
+
+
+class TestTrends:
+    """POST /api/v1/trends/fetch."""
+
+    async def test_fetch_returns_spec_envelope(self, client):
+        response = await client.post(
+            TRENDS, json={"platforms": ["tiktok", "youtube"], "category": "food", "limit": 5}
+        )
+        body = await response.json()
+
+        assert response.status == 200
+        assert body["status"] == "success"
+        assert len(body["data"]["trends"]) == 5
+        assert {"id", "title", "platform", "engagement_score"} <= set(body["data"]["trends"][0])
+        assert body["timestamp"].endswith("Z")
+
+    async def test_invalid_body_rejected(self, client):
+        response = await client.post(
+            TRENDS, json={"platforms": ["myspace"], "limit": 1000, "bogus": 1}
+        )
+        body = await response.json()
+
+        assert response.status == 422
+        assert body["error_code"] == "INVALID_INPUT"
+        fields = {error.split(":")[0].split(".")[0] for error in body["validation_errors"]}
+        assert fields == {"platforms", "limit", "bogus"}
+
+    async def test_malformed_json_rejected(self, client):
+        response = await client.post(TRENDS, data=b"{not json")
+
+        assert response.status == 422
+
+    async def test_ndjson_stream(self, client):
+        response = await client.post(
+            TRENDS,
+            json={"platforms": ["twitter"], "category": "tech", "limit": 4},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        lines = (await response.read()).decode().splitlines()
+
+        assert response.headers["Content-Type"].startswith("application/x-ndjson")
+        assert len(lines) == 5
+        assert all(json.loads(line)["platform"] == "twitter" for line in lines[:4])
+        assert "timestamp" in json.loads(lines[4])
+
+    async def test_large_list_sent_chunked(self, platforms, model):
+        app = create_app(services(platforms, model), stream_bytes=1)
+        async with TestClient(TestServer(app)) as client:
+            response = await client.post(
+                TRENDS, json={"platforms": ["tiktok"], "category": "food", "limit": 50}
+            )
+            body = await response.json()
+
+        assert response.headers.get("Transfer-Encoding") == "chunked"
+        assert len(body["data"]["trends"]) == 50
+
+
+class TestContent:
+    """POST /api/v1/content/generate."""
+
+    async def fetch_trend(self, client):
+        response = await client.post(
+            TRENDS, json={"platforms": ["tiktok"], "category": "food", "limit": 1}
+        )
+        return (await response.json())["data"]["trends"][0]
+
+    async def test_generate_for_fetched_trend(self, client):
+        trend = await self.fetch_trend(client)
+        response = await client.post(
+            CONTENT,
+            json={
+                "trend_id": trend["id"],
+                "content_type": "post",
+                "persona_id": "funny",
+                "variations": 3,
+                "safety_check": True,
+            },
+        )
+        body = await response.json()
+
+        assert response.status == 200
+        content = body["data"]["content"]
+        assert len(content) == 3
+        assert all(c["status"] == "pending_approval" for c in content)
+        assert all(c["id"].startswith("content_") and c["text"] for c in content)
+        assert all(0.0 <= c["safety_score"] <= 1.0 for c in content)
+
+    async def test_unknown_trend_and_persona(self, client):
+        missing = await client.post(CONTENT, json={"trend_id": "nope", "persona_id": "funny"})
+        trend = await self.fetch_trend(client)
+        persona = await client.post(CONTENT, json={"trend_id": trend["id"], "persona_id": "x"})
+
+        assert missing.status == 404
+        assert (await missing.json())["error_code"] == "TREND_NOT_FOUND"
+        assert persona.status == 404
+        assert (await persona.json())["error_code"] == "PERSONA_NOT_FOUND"
+
+
+class TestEngagement:
+    """POST /api/v1/engagement/respond."""
+
+    async def test_respond_matches_spec(self, client):
+        response = await client.post(
+            RESPOND,
+            json={
+                "interaction_id": "int_001",
+                "interaction_type": "comment",
+                "message": "This is amazing! Love your content!",
+                "context": {"previous_interactions": 5, "user_follower_count": 500},
+            },
+        )
+        body = await response.json()
+
+        assert response.status == 200
+        assert body["data"]["response"] == {
+            "id": "response_int_001",
+            "text": "Thank you so much! Glad you enjoyed it!",
+            "safety_score": 1.0,
+            "status": "pending_approval",
+        }
+
+    async def test_triaged_interactions_are_skipped(self, client):
+        requests = [
+            {"interaction_id": "int_1", "message": "🔥🔥"},
+            {"interaction_id": "int_2", "message": "What lens do you use for this?"},
+            {"interaction_id": "int_2", "message": "What lens do you use for this?"},
+        ]
+        bodies = [
+            await r.json()
+            for r in await asyncio.gather(*(client.post(RESPOND, json=b) for b in requests))
+        ]
+
+        assert bodies[0]["data"] == {"response": None, "skipped": "filtered_no_text"}
+        outcomes = sorted(str(b["data"].get("skipped")) for b in bodies[1:])
+        assert outcomes == ["None", "duplicate"]
+
+    async def test_without_reply_model(self):
+        app = create_app(ApiServices(trends=FetchTrendsSkill({})))
+        async with TestClient(TestServer(app)) as client:
+            response = await client.post(RESPOND, json={"interaction_id": "1", "message": "hi"})
+            body = await response.json()
+
+        assert response.status == 503
+        assert body["error_code"] == "NOT_CONFIGURED"
+
+
+class TestAdmission:
+    """Concurrency limits and load shedding."""
+
+    async def test_queue_full_sheds(self):
+        control = AdmissionControl("test", Limits(limit=1, queue=1, queue_timeout_s=1.0))
+        release = asyncio.Event()
+
+        async def hold():
+            async with control.admit():
+                await release.wait()
+
+        first = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded) as shed:
+            async with control.admit():
+                pass
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert shed.value.reason == "queue full"
+        assert control.report()["shed_queue_full"] == 1
+        assert control.report()["admitted"] == 2
+
+    async def test_queue_timeout_sheds(self):
+        control = AdmissionControl("test", Limits(limit=1, queue=10, queue_timeout_s=0.02))
+        async with control.admit():
+            with pytest.raises(Overloaded) as shed:
+                async with control.admit():
+                    pass
+
+        assert shed.value.reason == "queue timeout"
+        assert control.waiting == 0
+
+    async def test_overloaded_endpoint_returns_503(self, model):
+        slow = FakePlatformServer(latency={"tiktok": 0.3}).start()
+        try:
+            app = create_app(
+                services(slow, model),
+                {"trends": Limits(limit=1, queue=0, queue_timeout_s=1.0)},
+            )
+            async with TestClient(TestServer(app)) as client:
+                body = {"platforms": ["tiktok"], "category": "food", "limit": 1}
+                responses = await asyncio.gather(
+                    *(client.post(TRENDS, json=body) for _ in range(3))
+                )
+                statuses = sorted(r.status for r in responses)
+                shed = next(r for r in responses if r.status == 503)
+                status = await (await client.get("/api/v1/status")).json()
+        finally:
+            slow.stop()
+
+        assert statuses == [200, 503, 503]
+        assert shed.headers["Retry-After"] == "1"
+        assert status["data"]["admission"]["trends"]["shed_queue_full"] == 2
+
+
+class TestJson:
+    """Response encoding."""
+
+    def test_dumps_is_compact_utf8(self):
+        encoded = dumps({"text": "café 🔥", "n": [1, 2]})
+
+        assert encoded == '{"text":"café 🔥","n":[1,2]}'.encode()
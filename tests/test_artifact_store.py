@@ -0,0 +1,178 @@
+"""
+Test Artifact Store - Content-addressed media and transcript cache
+
+Validates atomic writes, mmap'd reads, size-bounded LRU eviction (including
+recency shared between processes through mtimes), hit/miss/bytes-saved
+counters, and the store sitting under DownloadVideoSkill and
+TranscribeAudioSkill so duplicate media is neither fetched nor transcribed
+twice.
+
+Reference: research/tooling_strategy.md#2-skill_download_video
+"""
+
+import os
+import time
+
+import pytest
+
+from chimera.cache import ArtifactStore
+from skills.skill_download_video import DownloadVideoSkill
+from skills.skill_download_video.stub import FakeMediaServer
+from skills.skill_transcribe_audio import TranscribeAudioSkill
+from skills.skill_transcribe_audio.backends import BACKENDS, LocalBackend
+from skills.skill_transcribe_audio.stub import write_speech
+
+KEY_A, KEY_B, KEY_C = (ArtifactStore.key(name) for name in "abc")
+
+
+class CountingBackend(LocalBackend):
+    calls = 0
+
+    def transcribe(self, samples, rate, language, model):
+        CountingBackend.calls += 1
+        return super().transcribe(samples, rate, language, model)
+
+
+class TestStore:
+    """Writes are atomic, reads are mapped, and counters add up."""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        store = ArtifactStore(str(tmp_path))
+
+        assert store.read("transcript", KEY_A) is None
+        store.put_json("transcript", KEY_A, {"text": "hello"})
+        assert store.read_json("transcript", KEY_A) == {"text": "hello"}
+        with store.view("transcript", KEY_A) as view:
+            assert isinstance(view, memoryview) and view.readonly
+
+        report = store.report()
+        assert (report["hits"], report["misses"], report["writes"]) == (2, 1, 1)
+        assert report["bytes_saved"] == 2 * len(b'{"text":"hello"}')
+        assert report["artifacts"] == 1
+
+    def test_put_file_links_and_survives_reopen(self, tmp_path):
+        source = tmp_path / "clip.mp4"
+        source.write_bytes(os.urandom(4096))
+        store = ArtifactStore(str(tmp_path / "store"))
+        sha = store.file_digest(str(source))
+
+        stored = store.put_file("media", sha, str(source))
+        reopened = ArtifactStore(str(tmp_path / "store"))
+
+        assert os.path.samefile(stored, source)
+        assert reopened.path("media", sha) == stored
+        assert reopened.size_bytes == 4096
+
+    def test_crashed_writes_are_invisible_and_cleaned(self, tmp_path):
+        store = ArtifactStore(str(tmp_path))
+        store.put_bytes("media", KEY_A, b"x" * 10)
+        stale = f"{store._path('media', KEY_B)}.tmp-1-deadbeef"
+        os.makedirs(os.path.dirname(stale), exist_ok=True)
+        with open(stale, "wb") as f:
+            f.write(b"half")
+        os.utime(stale, (time.time() - 7200, time.time() - 7200))
+
+        reopened = ArtifactStore(str(tmp_path))
+
+        assert reopened.path("media", KEY_B) is None
+        assert not os.path.exists(stale)
+        assert len(reopened) == 1
+
+    def test_rejects_unsafe_addresses(self, tmp_path):
+        store = ArtifactStore(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            store.put_bytes("media", "../../etc/passwd", b"")
+        with pytest.raises(ValueError):
+            store.path("../media", KEY_A)
+
+
+class TestEviction:
+    """The store stays under max_bytes, dropping least recently used first."""
+
+    def test_least_recently_used_is_evicted(self, tmp_path):
+        store = ArtifactStore(str(tmp_path), max_bytes=250)
+        store.put_bytes("media", KEY_A, b"a" * 100)
+        store.put_bytes("media", KEY_B, b"b" * 100)
+        store.path("media", KEY_A)
+        store.put_bytes("media", KEY_C, b"c" * 100)
+
+        assert store.path("media", KEY_B) is None
+        assert store.read("media", KEY_A) == b"a" * 100
+        assert store.size_bytes == 200
+        assert store.stats.evictions == 1
+
+    def test_hits_in_another_process_protect_an_artifact(self, tmp_path):
+        ours = ArtifactStore(str(tmp_path), max_bytes=250)
+        ours.put_bytes("media", KEY_A, b"a" * 100)
+        time.sleep(0.01)
+        ours.put_bytes("media", KEY_B, b"b" * 100)
+        time.sleep(0.01)
+        ArtifactStore(str(tmp_path)).path("media", KEY_A)  # another worker reads A
+
+        ours.put_bytes("media", KEY_C, b"c" * 100)
+
+        assert ours.path("media", KEY_A) is not None
+        assert ours.path("media", KEY_B) is None
+
+
+class TestSkills:
+    """Duplicate media is neither downloaded nor transcribed twice."""
+
+    def test_repeat_transcription_is_served_from_the_store(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(BACKENDS, "counting", CountingBackend)
+        CountingBackend.calls = 0
+        expected = write_speech(str(tmp_path / "a.wav"), ["hello world", "check out this video"])
+        (tmp_path / "b.wav").write_bytes((tmp_path / "a.wav").read_bytes())
+        store = ArtifactStore(str(tmp_path / "store"))
+        skill = TranscribeAudioSkill({"backend": "counting", "workers": 1, "artifacts": store})
+
+        def request(name, model="base"):
+            return {"filepath": str(tmp_path / name), "language": "en-US", "model": model}
+
+        first = skill.execute(request("a.wav"))
+        calls = CountingBackend.calls
+        second = skill.execute(request("b.wav"))
+        other_model = skill.execute(request("a.wav", model="small"))
+
+        assert first["cached"] is False and second["cached"] is True
+        assert second["transcript"] == first["transcript"] == expected
+        assert second["duration"] == first["duration"]
+        assert second["elapsed_s"] < 0.05
+        assert other_model["cached"] is False
+        assert CountingBackend.calls == 2 * calls
+        assert store.stats.hits == 1
+
+    def test_download_links_from_the_store_without_fetching(self, tmp_path):
+        store = ArtifactStore(str(tmp_path / "store"))
+        with FakeMediaServer(sizes={"clip.mp4": 1024 * 1024}) as server:
+            request = {"url": server.media_url("clip.mp4"), "platform": "tiktok"}
+            first = DownloadVideoSkill({"artifacts": store}).execute(
+                {**request, "output_path": str(tmp_path / "a.mp4")}
+            )
+            second = DownloadVideoSkill({"artifacts": store}).execute(
+                {**request, "output_path": str(tmp_path / "b.mp4")}
+            )
+            gets = server.gets("clip.mp4")
+
+        assert second["metadata"]["deduplicated"] == "artifact"
+        assert second["metadata"]["sha256"] == first["metadata"]["sha256"]
+        assert len(gets) == 1
+        # One miss for the first download, one hit for the reuse; the
+        # source pointer is not counted.
+        assert (store.stats.hits, store.stats.misses) == (1, 1)
+        assert store.stats.bytes_saved == 1024 * 1024
+
+    def test_missing_media_counts_one_miss(self, tmp_path):
+        store = ArtifactStore(str(tmp_path / "store"))
+        with FakeMediaServer(sizes={"clip.mp4": 4096}) as server:
+            request = {"url": server.media_url("clip.mp4"), "platform": "tiktok"}
+            first = DownloadVideoSkill({"artifacts": store}).execute(
+                {**request, "output_path": str(tmp_path / "a.mp4")}
+            )
+            store.delete("media", first["metadata"]["sha256"])
+            DownloadVideoSkill({"artifacts": store}).execute(
+                {**request, "output_path": str(tmp_path / "b.mp4")}
+            )
+
+        assert (store.stats.hits, store.stats.misses) == (0, 2)
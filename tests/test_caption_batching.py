@@ -0,0 +1,180 @@
+"""
+Test Caption Batching - Micro-batched caption generation with prefix reuse
+
+Validates that concurrent caption requests sharing a persona and platform
+are packed into one model call, that batches respect their caps, that the
+shared prompt prefix is sent once per batch, and that vectorised scoring
+picks a safe, relevant best_choice.
+
+Reference: research/tooling_strategy.md#4-skill_generate_caption
+"""
+
+import asyncio
+
+import pytest
+
+from chimera.ratelimit import RateLimit, RateLimiter
+from skills.skill_generate_caption import GenerateCaptionSkill, MicroBatcher
+from skills.skill_generate_caption.prompts import CaptionItem, batch_message, parse_items
+from skills.skill_generate_caption.scoring import score
+from skills.skill_generate_caption.stub import FakeModelServer
+
+TRANSCRIPT = "Cooking pasta with garlic and lemon is the easiest dinner hack. Pasta forever."
+
+
+def request(**overrides):
+    return {
+        "transcript": TRANSCRIPT,
+        "persona": "funny",
+        "platform": "tiktok",
+        "include_hashtags": True,
+        "variations": 3,
+        **overrides,
+    }
+
+
+def make_skill(server, **config):
+    limiter = RateLimiter(limits={"llm": RateLimit(rate=1000, burst=1000)})
+    return GenerateCaptionSkill({"model_url": server.url, "rate_limiter": limiter, **config})
+
+
+class TestBatching:
+    """Concurrent requests share model calls."""
+
+    async def test_concurrent_requests_share_one_call(self):
+        with FakeModelServer(latency_s=0.01) as server:
+            skill = make_skill(server)
+            results = await asyncio.gather(*[skill.execute_async(request()) for _ in range(12)])
+            stats = server.report()
+
+        assert all(r["status"] == "success" for r in results)
+        assert all(len(r["captions"]) == 3 for r in results)
+        assert stats["requests"] == 1
+        assert stats["items"] == 12 and stats["captions"] == 36
+
+    async def test_batches_respect_item_and_caption_caps(self):
+        with FakeModelServer() as server:
+            skill = make_skill(server, max_batch_items=4, max_batch_captions=9)
+            await asyncio.gather(*[skill.execute_async(request()) for _ in range(8)])
+
+        report = skill.batcher.report()
+        assert report["items"] == 8
+        assert report["largest_batch"] <= 3  # 3 items x 3 captions fills the 9-caption cap
+        assert report["batches"] >= 3
+
+    async def test_different_personas_are_not_mixed(self):
+        with FakeModelServer() as server:
+            skill = make_skill(server)
+            funny, formal = await asyncio.gather(
+                skill.execute_async(request()),
+                skill.execute_async(request(persona="professional")),
+            )
+            stats = server.report()
+
+        assert stats["requests"] == 2
+        assert "😂" in funny["captions"][0]["text"]
+        assert formal["captions"][0]["text"].startswith("Key takeaway")
+
+    async def test_prefix_is_reused_across_batches(self):
+        with FakeModelServer() as server:
+            skill = make_skill(server)
+            await skill.execute_async(request())
+            await skill.execute_async(request(transcript="Morning run by the river"))
+            stats = server.report()
+            cached = skill.model.report()["cached_tokens"]
+
+        assert stats["requests"] == 2
+        assert cached > 0 and cached == stats["cached_tokens"]
+
+    async def test_failed_batch_fails_every_member(self):
+        calls = []
+
+        async def send(prefix, items):
+            calls.append(len(items))
+            raise ConnectionError("model down")
+
+        batcher = MicroBatcher(send, window_s=0.01)
+        skill = GenerateCaptionSkill({"batcher": batcher})
+        results = await asyncio.gather(*[skill.execute_async(request()) for _ in range(3)])
+
+        assert calls == [3]
+        assert all(r["error_code"] == "EXECUTION_FAILED" for r in results)
+        assert all(r["captions"] == [] and r["best_choice"] == -1 for r in results)
+
+
+class TestPrompts:
+    """The batch message round-trips through the stub's parser."""
+
+    def test_batch_message_round_trip(self):
+        items = [
+            CaptionItem("first ### tricky transcript", 2, True),
+            CaptionItem("second\nmultiline", 1, False),
+        ]
+
+        parsed = parse_items(batch_message(items))
+
+        assert [(p.variations, p.include_hashtags) for p in parsed] == [(2, True), (1, False)]
+        assert parsed[1].transcript == "second\nmultiline"
+
+
+class TestScoring:
+    """Vectorised scoring prefers relevant, safe, distinct captions."""
+
+    def test_unsafe_candidate_is_never_best(self):
+        captions = [
+            {
+                "text": "Cooking pasta with garlic and lemon, free money giveaway dm me",
+                "hashtags": [],
+            },
+            {"text": "Easy lemon garlic pasta for dinner tonight", "hashtags": ["#pasta"]},
+        ]
+
+        _, safety, best = score(TRANSCRIPT, captions, "tiktok")
+
+        assert safety[0] < 0.5 <= safety[1]
+        assert best == 1
+
+    def test_relevant_caption_beats_off_topic(self):
+        captions = [
+            {"text": "My cat sleeps on the keyboard again today lol", "hashtags": ["#cat"]},
+            {"text": "Garlic lemon pasta is the easiest dinner hack", "hashtags": ["#pasta"]},
+        ]
+
+        quality, _, best = score(TRANSCRIPT, captions, "tiktok")
+
+        assert best == 1 and quality[1] > quality[0]
+
+
+class TestContract:
+    """Output follows the contract and platform rules."""
+
+    def test_output_contract_and_platform_limits(self):
+        with FakeModelServer() as server:
+            skill = make_skill(server)
+            result = skill.execute(request(platform="twitter", variations=5))
+            plain = skill.execute(request(include_hashtags=False, variations=1))
+
+        assert skill.validate_output(result)
+        assert len(result["captions"]) == 5
+        assert all(len(c["hashtags"]) <= 2 for c in result["captions"])
+        assert all(0.0 <= c["safety_score"] <= 1.0 for c in result["captions"])
+        assert plain["captions"][0]["hashtags"] == []
+
+    def test_long_text_is_trimmed_to_the_platform_limit(self):
+        caption = GenerateCaptionSkill.clean(
+            {"text": "x" * 400, "hashtags": ["pasta", "#Pasta", "bad tag!", "#fyp"]},
+            "twitter",
+            include_hashtags=True,
+        )
+
+        assert caption["hashtags"] == ["#pasta", "#fyp"]
+        assert len(caption["text"]) + sum(len(h) + 1 for h in caption["hashtags"]) <= 280
+
+    @pytest.mark.parametrize(
+        "bad",
+        [{"persona": "sarcastic"}, {"variations": 0}, {"platform": "myspace"}, {"transcript": ""}],
+    )
+    def test_invalid_input(self, bad):
+        result = GenerateCaptionSkill().execute(request(**bad))
+
+        assert result["error_code"] == "INVALID_INPUT"
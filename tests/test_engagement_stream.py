@@ -0,0 +1,271 @@
+"""
+Test Engagement Stream - Streaming triage of comments and mentions
+
+Validates that duplicates, empty and spam interactions are dropped before
+any model call, that priority follows reach and history, that worthwhile
+interactions are micro-batched highest priority first, and that unsafe
+messages and replies are escalated.
+
+Reference: research/SRS.md#4.4-action-system-fr-4.0-4.1
+"""
+
+import asyncio
+
+import pytest
+
+from chimera.engagement import (
+    ESCALATED,
+    PENDING,
+    DailyBudget,
+    Deduper,
+    EngagementStream,
+    Interaction,
+    TriagePolicy,
+    merge,
+    prefilter,
+)
+
+QUESTION = "Love this edit, which app did you use for the transitions?"
+
+
+def interaction(id, message=QUESTION, **fields):
+    fields.setdefault("agent_id", "agent_1")
+    fields.setdefault("author_id", f"user_{id}")
+    fields.setdefault("follower_count", 500)
+    return Interaction(id, message, **fields)
+
+
+async def feed(items, delay=0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+class RecordingModel:
+    """Reply model that records each batch it is called with."""
+
+    def __init__(self, text="Thank you so much! Glad you enjoyed it!", latency_s=0.0):
+        self.text = text
+        self.latency_s = latency_s
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, batch):
+        self.batches.append([i.id for i in batch])
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return [self.text for _ in batch]
+
+
+async def collect(stream, *sources):
+    return [reply async for reply in stream.run(*sources)]
+
+
+class TestTriage:
+    """Cheap checks that run on every interaction."""
+
+    def test_prefilter_reasons(self):
+        assert prefilter(interaction("1", "🔥🔥🔥")) == "no_text"
+        assert prefilter(interaction("2", "@nova https://x.co/abc")) == "no_text"
+        assert prefilter(interaction("3", "nice! check out my page")) == "spam"
+        assert prefilter(interaction("4", "my own post", author_id="agent_1")) == "self"
+        assert prefilter(interaction("5", QUESTION)) is None
+
+    def test_priority_follows_reach_and_history(self):
+        policy = TriagePolicy()
+        stranger = policy.priority(interaction("1", "great video", follower_count=10))
+        famous = policy.priority(interaction("2", "great video", follower_count=200_000))
+        regular = policy.priority(
+            interaction("3", "great video", follower_count=10, previous_interactions=8)
+        )
+
+        assert stranger < regular
+        assert stranger < famous
+        assert 0.0 <= stranger <= famous <= 1.0
+
+    def test_questions_and_dms_rank_higher(self):
+        policy = TriagePolicy()
+        comment = policy.priority(interaction("1", "great video"))
+
+        assert policy.priority(interaction("2", "great video?")) > comment
+        assert policy.priority(interaction("3", "great video", kind="dm")) > comment
+
+    def test_deduper_by_id_and_content(self):
+        deduper = Deduper()
+
+        assert not deduper.seen(interaction("1", "So good"))
+        assert deduper.seen(interaction("1", "different text"))
+        assert deduper.seen(interaction("2", "so   GOOD", author_id="user_1"))
+        assert not deduper.seen(interaction("3", "So good"))
+
+    def test_authorless_duplicates_dedupe_by_id_only(self):
+        deduper = Deduper()
+        text = "This is amazing! Love your content!"
+
+        assert not deduper.seen(interaction("int_001", text, author_id=""))
+        assert not deduper.seen(interaction("int_002", text, author_id=""))
+        assert deduper.seen(interaction("int_001", text, author_id=""))
+
+    def test_deduper_is_bounded(self):
+        deduper = Deduper(max_size=10)
+        for n in range(20):
+            deduper.seen(interaction(str(n), f"message {n}"))
+
+        assert len(deduper) == 10
+        assert not deduper.seen(interaction("0", "message 0"))
+
+    def test_daily_budget_rolls_over(self):
+        budget = DailyBudget(limit=2)
+        day = 86_400 * 20_000
+
+        assert budget.take("a", day) and budget.take("a", day)
+        assert not budget.take("a", day + 60)
+        assert budget.take("b", day + 60)
+        assert budget.take("a", day + 86_400)
+
+
+class TestStream:
+    """Worthwhile interactions are micro-batched into replies."""
+
+    async def test_low_value_interactions_never_reach_the_model(self):
+        model = RecordingModel()
+        stream = EngagementStream(model)
+        items = [
+            interaction("good", previous_interactions=5),
+            interaction("good", previous_interactions=5),
+            interaction("emoji", "😍😍"),
+            interaction("spam", "follow for follow"),
+            interaction("meh", "ok", follower_count=0),
+        ]
+
+        replies = await collect(stream, feed(items))
+
+        assert [r.interaction.id for r in replies] == ["good"]
+        assert replies[0].status == PENDING
+        assert model.batches == [["good"]]
+        report = stream.report()
+        assert report["duplicate"] == 1
+        assert report["filtered_no_text"] == 1
+        assert report["filtered_spam"] == 1
+        assert report["low_priority"] == 1
+        assert report["draft_rate"] == 0.2
+
+    async def test_interactions_share_model_calls(self):
+        model = RecordingModel()
+        stream = EngagementStream(model, batch_size=8, window_s=0.05)
+        items = [interaction(str(n)) for n in range(20)]
+
+        replies = await collect(stream, feed(items))
+
+        assert len(replies) == 20
+        assert [len(b) for b in model.batches] == [8, 8, 4]
+        assert stream.report()["model_calls"] == 3
+
+    async def test_batches_take_highest_priority_first(self):
+        model = RecordingModel(latency_s=0.02)
+        stream = EngagementStream(model, batch_size=2, window_s=0.0, concurrency=1)
+        # The first arrival is drafted alone; the rest queue up meanwhile.
+        items = [
+            interaction("first"),
+            interaction("small", follower_count=50),
+            interaction("big", follower_count=500_000),
+            interaction("loyal", follower_count=50, previous_interactions=10),
+        ]
+
+        await collect(stream, feed(items, delay=0.001))
+
+        assert model.batches[0] == ["first"]
+        assert model.batches[1] == ["big", "loyal"]
+        assert model.batches[2] == ["small"]
+
+    async def test_lowest_priority_shed_when_backlogged(self):
+        model = RecordingModel(latency_s=0.05)
+        stream = EngagementStream(
+            model, batch_size=1, window_s=0.0, concurrency=1, max_pending=2
+        )
+        items = [interaction(str(n), follower_count=100 * (n + 1)) for n in range(6)]
+
+        replies = await collect(stream, feed(items, delay=0.001))
+
+        assert stream.report()["shed"] >= 1
+        assert len(replies) == 6 - stream.report()["shed"]
+        assert "1" not in {r.interaction.id for r in replies}
+
+    async def test_budget_caps_replies_per_agent(self):
+        stream = EngagementStream(RecordingModel(), daily_limit=3)
+        items = [interaction(str(n)) for n in range(5)]
+        items += [interaction(f"b{n}", agent_id="agent_2") for n in range(2)]
+
+        replies = await collect(stream, feed(items))
+
+        per_agent = [r.interaction.agent_id for r in replies]
+        assert per_agent.count("agent_1") == 3
+        assert per_agent.count("agent_2") == 2
+        assert stream.report()["over_budget"] == 2
+
+    async def test_toxic_message_escalated_without_draft(self):
+        model = RecordingModel()
+        stream = EngagementStream(model)
+        items = [
+            interaction("rude", "you are an idiot, I hate you and your videos"),
+            interaction("kind"),
+        ]
+
+        replies = {r.interaction.id: r for r in await collect(stream, feed(items))}
+
+        assert replies["rude"].status == ESCALATED
+        assert replies["rude"].text == ""
+        assert any(f.startswith("toxicity") for f in replies["rude"].flags)
+        assert replies["kind"].status == PENDING
+        assert model.batches == [["kind"]]
+
+    async def test_unsafe_reply_escalated(self):
+        stream = EngagementStream(RecordingModel(text="Shut up, idiot. I hate you."))
+
+        [reply] = await collect(stream, feed([interaction("1")]))
+
+        assert reply.status == ESCALATED
+        assert reply.safety_score < 0.5
+
+    async def test_merge_interleaves_sources(self):
+        comments = feed([interaction(f"c{n}") for n in range(3)], delay=0.002)
+        mentions = feed([interaction(f"m{n}", kind="mention") for n in range(3)], delay=0.003)
+
+        ids = [i.id async for i in merge(comments, mentions)]
+
+        assert sorted(ids) == ["c0", "c1", "c2", "m0", "m1", "m2"]
+        assert ids != sorted(ids)
+
+    async def test_source_error_propagates(self):
+        async def broken():
+            yield interaction("1")
+            raise ConnectionError("feed dropped")
+
+        with pytest.raises(ConnectionError):
+            await collect(EngagementStream(RecordingModel()), broken())
+
+
+class TestSpecShapes:
+    """engagement/respond request and response from specs/technical.md §2.3."""
+
+    def test_request_and_response(self):
+        body = {
+            "interaction_id": "int_001",
+            "interaction_type": "comment",
+            "message": "This is amazing! Love your content!",
+            "context": {"previous_interactions": 5, "user_follower_count": 500},
+        }
+        parsed = Interaction.from_request(body, agent_id="agent_1")
+
+        assert parsed.previous_interactions == 5
+        assert parsed.follower_count == 500
+        assert parsed.agent_id == "agent_1"
+
+    async def test_reply_as_response(self):
+        stream = EngagementStream(RecordingModel())
+        [reply] = await collect(stream, feed([interaction("int_001")]))
+
+        response = reply.as_response()["response"]
+        assert response["id"] == "response_int_001"
+        assert response["status"] == "pending_approval"
+        assert response["safety_score"] == 1.0
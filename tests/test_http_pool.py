@@ -0,0 +1,112 @@
+"""
+Test HTTP Pool - Shared keep-alive transport
+
+Validates connection reuse, per-host limits, DNS caching and that skills
+pick the pool up from their config.
+"""
+
+import asyncio
+
+import httpcore
+
+from chimera.transport import HttpPool, default_pool
+from chimera.transport.dns import CachingNetworkBackend
+from chimera.transport.stats import PoolStats
+from skills.skill_fetch_trends import FetchTrendsSkill
+from skills.skill_fetch_trends.stub import FakePlatformServer
+
+
+class TestConnectionReuse:
+    """Repeated requests ride on keep-alive connections."""
+
+    async def test_sequential_requests_reuse_connection(self):
+        pool = HttpPool(http2=False)
+        with FakePlatformServer() as server:
+            for _ in range(5):
+                response = await pool.get(f"{server.url}/tiktok/trends")
+                assert response.status_code == 200
+            await pool.aclose()
+
+        stats = pool.stats.as_dict()
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["hits"] == 4
+        assert stats["hit_ratio"] == 0.8
+
+    async def test_dns_cached_across_connections(self):
+        pool = HttpPool(http2=False, max_keepalive=0)
+        with FakePlatformServer() as server:
+            url = server.url.replace("127.0.0.1", "localhost")
+            for _ in range(3):
+                await pool.get(f"{url}/tiktok/trends")
+            await pool.aclose()
+
+        assert pool.stats.dns_misses == 1
+        assert pool.stats.dns_hits == 2
+        assert pool.stats.connections_by_host["localhost"] == 3
+
+
+class TestDnsFallback:
+    """Every cached address is tried, and a failed connect drops the answer."""
+
+    async def test_unreachable_first_address_falls_back(self, monkeypatch):
+        class Backend(httpcore.AsyncNetworkBackend):
+            tried: list[str] = []
+
+            async def connect_tcp(self, host, port, **kwargs):
+                self.tried.append(host)
+                if host == "192.0.2.1":
+                    raise httpcore.ConnectError("unreachable")
+                return object()
+
+        async def getaddrinfo(host, port, **kwargs):
+            return [(0, 0, 0, "", (ip, port)) for ip in ("192.0.2.1", "192.0.2.1", "127.0.0.1")]
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+        inner = Backend()
+        backend = CachingNetworkBackend(PoolStats(), inner=inner)
+
+        await backend.connect_tcp("api.example", 443)
+        await backend.connect_tcp("api.example", 443)
+
+        assert inner.tried == ["192.0.2.1", "127.0.0.1"] * 2
+        assert backend.stats.dns_misses == 2 and backend.stats.dns_hits == 0
+
+
+class TestPerHostLimit:
+    """No more than max_connections_per_host requests in flight per host."""
+
+    async def test_requests_queue_behind_host_limit(self):
+        pool = HttpPool(http2=False, max_connections_per_host=2)
+        with FakePlatformServer(latency={"tiktok": 0.1}) as server:
+            url = f"{server.url}/tiktok/trends"
+            responses = await asyncio.gather(*(pool.get(url) for _ in range(6)))
+            await pool.aclose()
+
+        assert all(r.status_code == 200 for r in responses)
+        assert pool.stats.host_limit_waits >= 4
+        assert pool.stats.connections_opened <= 2
+
+
+class TestSkillIntegration:
+    """Skills share the pool handed to them in config."""
+
+    def test_skill_uses_configured_pool(self):
+        pool = HttpPool(http2=False)
+        with FakePlatformServer() as server:
+            skill = FetchTrendsSkill(config={"endpoints": server.endpoints(), "http_pool": pool})
+            request = {
+                "platforms": ["tiktok", "youtube"],
+                "category": "music",
+                "limit": 3,
+                "time_range": "24h",
+            }
+            skill.execute(request)
+            skill.execute(request)
+
+        assert skill.http_pool is pool
+        assert pool.stats.requests == 4
+        assert pool.stats.hits >= 2
+
+    def test_skills_default_to_process_wide_pool(self):
+        assert FetchTrendsSkill(config={}).http_pool is default_pool()
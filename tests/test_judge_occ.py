@@ -0,0 +1,201 @@
+"""
+Test Judge OCC - Versioned state and optimistic approval commits
+
+Runs the same scenarios against the in-process and SQLite backends:
+compare-and-swap commits that apply all or nothing, and Judges that commit
+decisions in parallel, each item exactly once, re-validating when a Worker
+or the Planner changed what they judged.
+
+Reference: research/SRS.md#3.1.3-the-judge-gatekeeper
+"""
+
+import asyncio
+import random
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from chimera.judge import PENDING, ApprovalJudge, Decision, Review
+from chimera.state import ConflictError, MemoryStateStore, SQLStateStore, Write
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStateStore()
+        return
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    sql = SQLStateStore.connect(f"sqlite+aiosqlite:///{tmp_path / 'state.db'}")
+    await sql.create_tables()
+    yield sql
+    await sql.close()
+
+
+def new_id():
+    return str(uuid.uuid4())
+
+
+async def pending(store, body="Easy lemon pasta tonight"):
+    [record] = await store.commit(
+        [Write.create("content", new_id(), {"body": body, "status": PENDING})]
+    )
+    return record
+
+
+async def approve_clean(content, campaign):
+    await asyncio.sleep(0)
+    if "idiot" in content.data["body"]:
+        return Review(Decision.REJECT, "toxic", 0.6)
+    return Review(Decision.APPROVE, safety_score=0.0)
+
+
+class TestStateStore:
+    """Commits are compare-and-swap and all-or-nothing."""
+
+    async def test_versions_start_at_one_and_bump_on_update(self, store):
+        created = await pending(store)
+
+        [updated] = await store.commit([Write.update(created, status="approved")])
+
+        assert (created.version, updated.version) == (1, 2)
+        assert updated.data["body"] == created.data["body"]
+        assert (await store.get("content", created.id)).data["status"] == "approved"
+
+    async def test_stale_write_fails_the_whole_commit(self, store):
+        record = await pending(store)
+        await store.commit([Write.update(record, body="revised")])
+        approval_id = new_id()
+
+        with pytest.raises(ConflictError) as conflict:
+            await store.commit(
+                [
+                    Write.create(
+                        "approval", approval_id, {"approver_id": "j", "decision": "approve"}
+                    ),
+                    Write.update(record, status="approved"),
+                ]
+            )
+
+        assert (conflict.value.expected, conflict.value.actual) == (1, 2)
+        assert await store.get("approval", approval_id) is None
+        assert (await store.get("content", record.id)).data["status"] == PENDING
+
+    async def test_validation_only_writes_check_without_writing(self, store):
+        record = await pending(store)
+
+        assert await store.commit([Write.unchanged(record)]) == []
+        await store.commit([Write.update(record, status="approved")])
+        with pytest.raises(ConflictError):
+            await store.commit([Write.unchanged(record)])
+
+    async def test_create_conflicts_with_an_existing_record(self, store):
+        record = await pending(store)
+
+        with pytest.raises(ConflictError) as conflict:
+            await store.commit([Write.create("content", record.id, {"body": "again"})])
+
+        assert conflict.value.actual == 1
+
+    async def test_bad_row_is_not_a_conflict(self, store):
+        if isinstance(store, MemoryStateStore):
+            pytest.skip("the in-process store has no foreign keys")
+
+        with pytest.raises(IntegrityError):
+            await store.commit([Write.create("content", new_id(), {"trend_id": new_id()})])
+
+    async def test_rejects_malformed_commits(self, store):
+        record = await pending(store)
+
+        with pytest.raises(ValueError):
+            await store.commit([Write.update(record, status="a"), Write.unchanged(record)])
+        with pytest.raises(ValueError):
+            await store.get("invoice", record.id)
+
+
+class TestApprovalJudge:
+    """Judges commit decisions optimistically and retry on conflict."""
+
+    async def test_commits_decision_and_approval_row(self, store):
+        clean, toxic = await pending(store), await pending(store, "you idiot")
+        judge = ApprovalJudge(store, approve_clean, judge_id="judge-7")
+
+        approved = await judge.review(clean.id)
+        rejected = await judge.review(toxic.id)
+
+        assert (approved.status, rejected.status) == ("approved", "rejected")
+        row = await store.get("approval", rejected.approval_id)
+        assert row.data["approver_id"] == "judge-7" and row.data["decision"] == "reject"
+        assert row.data["content_version"] == 1
+        assert (await store.get("content", toxic.id)).data["safety_score"] == 0.6
+
+    async def test_parallel_judges_decide_each_item_once(self, store):
+        items = [await pending(store, f"caption {i}") for i in range(20)]
+        judges = [ApprovalJudge(store, approve_clean, f"judge-{j}") for j in range(4)]
+
+        async def work(judge, seed):
+            order = [item.id for item in items]
+            random.Random(seed).shuffle(order)
+            return [await judge.review(content_id) for content_id in order]
+
+        outcomes = await asyncio.gather(*(work(j, n) for n, j in enumerate(judges)))
+
+        committed = [o for run in outcomes for o in run if not o.decided]
+        assert sorted(o.content_id for o in committed) == sorted(item.id for item in items)
+        approvals = await store.get_many("approval", [o.approval_id for o in committed])
+        assert len(approvals) == len(items)
+        assert sum(j.stats.commits for j in judges) == len(items)
+
+    async def test_worker_revision_forces_revalidation(self, store):
+        content = await pending(store, "lovely pasta")
+        revised = asyncio.Event()
+
+        async def slow_validate(record, campaign):
+            review = await approve_clean(record, campaign)
+            if not revised.is_set():
+                revised.set()
+                await store.commit([Write.update(record, body="lovely pasta, idiot")])
+            return review
+
+        judge = ApprovalJudge(store, slow_validate)
+        outcome = await judge.review(content.id)
+
+        assert outcome.status == "rejected" and outcome.attempts == 2
+        assert judge.stats.conflicts == 1 and judge.stats.revalidations == 1
+        row = await store.get("approval", outcome.approval_id)
+        assert row.data["content_version"] == 2
+
+    async def test_campaign_change_invalidates_the_review(self, store):
+        [campaign] = await store.commit([Write.create("campaign", new_id(), {"goal": "pasta"})])
+        content = await pending(store)
+        seen_goals = []
+
+        async def validate(record, snapshot):
+            seen_goals.append(snapshot.data["goal"])
+            if len(seen_goals) == 1:
+                await store.commit([Write.update(snapshot, goal="travel")])
+            return Review(Decision.APPROVE)
+
+        outcome = await ApprovalJudge(store, validate).review(content.id, campaign.id)
+
+        assert seen_goals == ["pasta", "travel"] and outcome.status == "approved"
+
+    async def test_gives_up_after_max_attempts(self, store):
+        [campaign] = await store.commit([Write.create("campaign", new_id(), {"goal": "x"})])
+        content = await pending(store)
+
+        async def always_stale(record, snapshot):
+            await store.commit([Write.update(snapshot, goal=new_id())])
+            return Review(Decision.APPROVE)
+
+        judge = ApprovalJudge(store, always_stale, max_attempts=3, backoff_base=0.0)
+
+        with pytest.raises(ConflictError):
+            await judge.review(content.id, campaign.id)
+        assert judge.stats.exhausted == 1 and judge.stats.conflicts == 3
+        assert (await store.get("content", content.id)).data["status"] == PENDING
+
+    async def test_missing_content_raises(self, store):
+        with pytest.raises(KeyError):
+            await ApprovalJudge(store, approve_clean).review(new_id())
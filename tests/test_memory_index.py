@@ -0,0 +1,169 @@
+"""
+Test Memory Index - Semantic memory on the in-process vector index
+
+Validates that int8 search agrees with float32 brute force, that metadata
+filters, upserts and deletes behave, that flushed indexes reopen
+memory-mapped and keep accepting writes, that IVF probing trades recall
+for work, and that SemanticMemory recall stays within one agent.
+
+Reference: research/SRS.md#4.1-cognitive-core-persona-management-fr-1.0-1.2
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from chimera.memory import HashingEmbedder, NumpyVectorIndex, SemanticMemory
+
+DIM = 32
+
+
+def clustered(n, rng, centers=20):
+    """Unit vectors around ``centers`` random directions, like real embeddings."""
+    anchors = rng.normal(size=(centers, DIM))
+    vectors = anchors[rng.integers(0, centers, n)] + 0.6 * rng.normal(size=(n, DIM))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def exact_top(vectors, queries, k):
+    return np.argsort(-(queries @ vectors.T), axis=1)[:, :k]
+
+
+def overlap(found, expected, k=10):
+    """Mean fraction of ``expected`` id lists present in ``found`` hit lists."""
+    return np.mean([len({h.id for h in a} & set(b)) / k for a, b in zip(found, expected)])
+
+
+async def filled(index, vectors, agents=10):
+    ids = [f"m{i}" for i in range(len(vectors))]
+    metadata = [{"agent_id": f"a{i % agents}", "n": i} for i in range(len(ids))]
+    await index.upsert(ids, vectors, metadata)
+    return ids
+
+
+class TestSearch:
+    """Exact search, filters and writes."""
+
+    async def test_int8_results_match_float_brute_force(self):
+        rng = np.random.default_rng(0)
+        vectors, queries = clustered(2000, rng), clustered(50, rng)
+        index = NumpyVectorIndex(DIM)
+        await filled(index, vectors)
+
+        hits = await index.search(queries, k=10)
+
+        truth = [[f"m{i}" for i in top] for top in exact_top(vectors, queries, 10)]
+        assert overlap(hits, truth) >= 0.95
+        scores = [h.score for h in hits[0]]
+        assert scores == sorted(scores, reverse=True) and -1.0 <= scores[-1] <= scores[0] <= 1.0
+
+    async def test_filters_restrict_candidates(self):
+        rng = np.random.default_rng(1)
+        index = NumpyVectorIndex(DIM, filterable=("agent_id", "kind"))
+        vectors = clustered(300, rng)
+        await filled(index, vectors)
+
+        [hits] = await index.search(vectors[:1], k=50, where={"agent_id": "a3"})
+
+        assert len(hits) == 30 and {h.metadata["agent_id"] for h in hits} == {"a3"}
+        assert await index.count({"agent_id": "a3"}) == 30
+        assert await index.count({"agent_id": "a3", "kind": "note"}) == 0
+        with pytest.raises(ValueError):
+            await index.search(vectors[:1], where={"n": 1})
+
+    async def test_upsert_replaces_and_delete_removes(self):
+        rng = np.random.default_rng(2)
+        index = NumpyVectorIndex(DIM, capacity=4)
+        vectors = clustered(20, rng)
+        await filled(index, vectors)
+
+        await index.upsert(["m0", "m0"], vectors[5:7], [{"agent_id": "a9"}, {"agent_id": "a8"}])
+        assert await index.delete(["m1", "missing"]) == 1
+
+        [hits] = await index.search(vectors[6:7], k=2)
+        assert {h.id for h in hits} == {"m0", "m6"}
+        assert len(index) == 19 and "m1" not in index
+        assert await index.count({"agent_id": "a0"}) == 1  # m10 only; m0 moved to a8
+
+
+class TestPersistence:
+    """flush() writes a generation that reopens memory-mapped."""
+
+    async def test_flush_and_reopen(self, tmp_path):
+        rng = np.random.default_rng(3)
+        vectors = clustered(500, rng)
+        index = NumpyVectorIndex(DIM, str(tmp_path))
+        await filled(index, vectors)
+        await index.flush()
+        before = await index.search(vectors[:5], k=5, where={"agent_id": "a2"})
+
+        reopened = NumpyVectorIndex(DIM, str(tmp_path))
+        after = await reopened.search(vectors[:5], k=5, where={"agent_id": "a2"})
+
+        assert isinstance(reopened._base, np.memmap)
+        assert [[h.id for h in row] for row in after] == [[h.id for h in row] for row in before]
+        assert after[0][0].metadata["n"] % 10 == 2
+
+        # Writes after reopening land in the delta; the next flush compacts.
+        await reopened.delete(["m0", "m1"])
+        await reopened.upsert(["new"], vectors[:1], [{"agent_id": "a2"}])
+        await reopened.flush()
+        assert len(NumpyVectorIndex(DIM, str(tmp_path))) == 499
+        assert sorted(os.listdir(tmp_path)) == ["CURRENT", "gen-000002"]
+
+        with pytest.raises(ValueError):
+            NumpyVectorIndex(DIM + 1, str(tmp_path))
+
+
+class TestIVF:
+    """IVF cells bound the scan; nprobe = nlist is exact."""
+
+    async def test_recall_rises_with_nprobe(self):
+        rng = np.random.default_rng(4)
+        vectors, queries = clustered(4000, rng), clustered(40, rng)
+        index = NumpyVectorIndex(DIM, nlist=16)
+        await filled(index, vectors)
+        exact = await index.search(queries, k=10)
+        index.train()
+
+        recalls = []
+        for nprobe in (1, 4, 16):
+            index.nprobe = nprobe
+            hits = await index.search(queries, k=10)
+            recalls.append(overlap(hits, [[h.id for h in row] for row in exact]))
+
+        assert recalls[0] <= recalls[1] <= recalls[2] == 1.0
+        assert recalls[0] < 1.0
+
+    async def test_rows_added_after_training_are_found(self):
+        rng = np.random.default_rng(5)
+        vectors = clustered(1000, rng)
+        index = NumpyVectorIndex(DIM, nlist=8, nprobe=2, exact_below=0)
+        await filled(index, vectors[:900])
+        index.train()
+
+        await index.upsert(["late"], vectors[950:951], [{"agent_id": "a1"}])
+
+        [hits] = await index.search(vectors[950:951], k=1, where={"agent_id": "a1"})
+        assert hits[0].id == "late"
+
+
+class TestSemanticMemory:
+    """Recall is scoped to one agent."""
+
+    async def test_recall_returns_the_agents_own_memories(self):
+        memory = SemanticMemory(embedder=HashingEmbedder(dim=64))
+        await memory.remember(
+            "nova",
+            ["I love hiking in the Alps", "My favourite food is sushi", "Mondays are hard"],
+        )
+        await memory.remember("echo", ["Sushi is overrated", "Favourite food: sushi rolls"])
+
+        [best] = await memory.recall("nova", "what is your favourite food?", k=1)
+        both = await memory.recall_many("echo", ["sushi", "hiking"], k=5)
+
+        assert best.metadata["text"] == "My favourite food is sushi"
+        assert best.metadata["agent_id"] == "nova"
+        assert all(h.metadata["agent_id"] == "echo" for row in both for h in row)
+        assert await memory.count("nova") == 3
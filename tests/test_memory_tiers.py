@@ -0,0 +1,141 @@
+"""
+Test Memory Tiers - Hierarchical short-term/long-term memory retrieval
+
+Validates that recall is served from the in-process buffer or Redis before
+the vector store, that writes invalidate cached recall, that the recent
+list is shared across workers through Redis, and that prefetching for
+leased tasks takes the vector search off the critical path.
+
+Reference: research/SRS.md#4.1-cognitive-core-persona-management-fr-1.0-1.2
+"""
+
+import pytest
+
+from chimera.memory import HashingEmbedder, HierarchicalMemory, MemoryRecord, SemanticMemory
+from chimera.tasks import Task
+
+
+class CountingSemantic(SemanticMemory):
+    """SemanticMemory that counts vector searches."""
+
+    def __init__(self):
+        super().__init__(embedder=HashingEmbedder(dim=64))
+        self.searches = 0
+
+    async def recall_many(self, agent_id, queries, k=5, where=None):
+        self.searches += 1
+        return await super().recall_many(agent_id, queries, k, where)
+
+
+FACTS = ["I love hiking in the Alps", "My favourite food is sushi", "Mondays are hard"]
+
+
+class TestRecord:
+    """MemoryRecord is slotted and round-trips through its row form."""
+
+    def test_slots_and_row_round_trip(self):
+        record = MemoryRecord("m1", "hello", 1.5, 0.25)
+
+        assert not hasattr(record, "__dict__")
+        assert MemoryRecord.from_row(record.to_row()) == record
+
+
+class TestTiers:
+    """The vector store is only searched when both caches miss."""
+
+    async def test_repeat_recall_skips_the_vector_store(self):
+        semantic = CountingSemantic()
+        memory = HierarchicalMemory(semantic)
+        await memory.remember("nova", FACTS)
+
+        first = await memory.recall("nova", "what is your favourite food?", k=1)
+        again = await memory.recall("nova", "What is your favourite food?", k=1)
+
+        assert first == again and first[0].text == "My favourite food is sushi"
+        assert semantic.searches == 1
+        assert memory.cache.stats.hits == 1
+
+    async def test_remember_invalidates_cached_recall(self):
+        semantic = CountingSemantic()
+        memory = HierarchicalMemory(semantic)
+        await memory.remember("nova", FACTS)
+        await memory.recall("nova", "favourite drink", k=1)
+
+        await memory.remember("nova", ["My favourite drink is matcha"])
+        [best] = await memory.recall("nova", "favourite drink", k=1)
+
+        assert best.text == "My favourite drink is matcha"
+        assert semantic.searches == 2
+
+    async def test_context_merges_relevant_and_recent(self):
+        memory = HierarchicalMemory(CountingSemantic(), recent=2)
+        await memory.remember("nova", FACTS)
+
+        context = await memory.context("nova", "hiking in the alps", k=1)
+
+        assert [r.text for r in context] == [
+            "I love hiking in the Alps",
+            "Mondays are hard",
+            "My favourite food is sushi",
+        ]
+        assert context[0].score > 0 and context[1].score == 0.0
+
+    async def test_forget_drops_memory_from_every_tier(self):
+        memory = HierarchicalMemory(CountingSemantic())
+        [hiking, *_] = await memory.remember("nova", FACTS)
+        await memory.recall("nova", "hiking", k=3)
+
+        assert await memory.forget("nova", [hiking.id]) == 1
+
+        assert hiking.id not in {r.id for r in await memory.recall("nova", "hiking", k=3)}
+        assert hiking.id not in {r.id for r in await memory.recent("nova")}
+
+
+class TestRedisTier:
+    """Workers share recent memories and recall results through Redis."""
+
+    async def test_second_worker_reads_redis_not_the_vector_store(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        semantic = CountingSemantic()
+        worker_a = HierarchicalMemory(semantic, fakeredis.FakeAsyncRedis(server=server))
+        worker_b = HierarchicalMemory(semantic, fakeredis.FakeAsyncRedis(server=server))
+        await worker_a.remember("nova", FACTS)
+        await worker_a.recall("nova", "sushi", k=2)
+
+        recent = await worker_b.recent("nova")
+        recalled = await worker_b.recall("nova", "sushi", k=2)
+
+        assert [r.text for r in recent] == FACTS[::-1]
+        assert recalled[0].text == "My favourite food is sushi"
+        assert semantic.searches == 1
+        assert worker_b.cache.stats.redis_hits == 1
+
+        # A write on worker A is visible to B once B reloads the agent.
+        await worker_a.remember("nova", ["Sushi on Fridays"])
+        worker_b._agents["nova"].loaded_at = 0.0
+        assert (await worker_b.recent("nova", 1))[0].text == "Sushi on Fridays"
+        await worker_b.recall("nova", "sushi", k=2)
+        assert semantic.searches == 2
+
+
+class TestPrefetch:
+    """Leased tasks warm recall before the skill asks for context."""
+
+    async def test_prefetch_tasks_fills_the_buffer(self):
+        semantic = CountingSemantic()
+        memory = HierarchicalMemory(semantic)
+        await memory.remember("nova", FACTS)
+        tasks = [
+            Task("generate_content", context={"agent_id": "nova", "goal_description": "food"}),
+            Task("generate_content", context={"goal_description": "no agent"}),
+        ]
+
+        memory.prefetch_tasks(tasks, k=2)
+        await memory.context("nova", "food", k=2)
+        await memory.wait_prefetched()
+
+        assert semantic.searches == 1
+        assert memory.stats.prefetches == 1
+        stats = memory.cache.stats
+        assert stats.misses == 1 and stats.hits + stats.coalesced == 1
@@ -0,0 +1,123 @@
+"""
+Test Persistence - Bulk writes and keyset pagination on the spec schema
+
+Validates chunked inserts, idempotent trend upserts keyed on (platform,
+external id), the COPY fallback, and keyset pages that visit every row once
+in created_at DESC, id DESC order, including rows that share a timestamp.
+Runs on SQLite.
+
+Reference: specs/technical.md#3-database-schema-postgresql
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from chimera.state import Database, Write
+from chimera.state.repository import decode_cursor, trend_id
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+
+@pytest.fixture
+async def db(tmp_path):
+    database = Database.connect(f"sqlite+aiosqlite:///{tmp_path / 'chimera.db'}", chunk_rows=7)
+    await database.create_tables()
+    yield database
+    await database.close()
+
+
+def trend(n, platform="tiktok", score=0.5):
+    return {
+        "id": f"{platform}_{n:03d}",
+        "title": f"Trend {n}",
+        "platform": platform,
+        "engagement_score": score,
+        "volume": 1000 + n,
+        "metadata": {"rank": n},
+    }
+
+
+async def everything(repository, **where):
+    rows, cursor = [], None
+    while True:
+        page = await repository.page(limit=4, after=cursor, **where)
+        rows.extend(page.rows)
+        if page.cursor is None:
+            return rows
+        cursor = page.cursor
+
+
+class TestBulkWrites:
+    """Chunked inserts and upserts."""
+
+    async def test_upsert_trends_is_idempotent_and_updates_scores(self, db):
+        assert await db.trends.upsert_trends(trend(n) for n in range(20)) == 20
+
+        await db.trends.upsert_trends([trend(3, score=0.9), trend(3, score=0.95), trend(99)])
+
+        rows = await everything(db.trends)
+        assert len(rows) == 21
+        third = next(row for row in rows if row["external_id"] == "tiktok_003")
+        assert third["engagement_score"] == 0.95 and third["volume"] == 1003
+        assert third["id"] == trend_id("tiktok", "tiktok_003")
+
+    async def test_same_external_id_on_two_platforms_are_two_rows(self, db):
+        youtube = {**trend(1, "youtube"), "id": "tiktok_001"}
+
+        await db.trends.upsert_trends([trend(1, "tiktok"), youtube])
+
+        assert len(await everything(db.trends)) == 2
+
+    async def test_insert_many_and_copy_stream_generators_in_chunks(self, db):
+        inserted = await db.trends.insert_many(
+            {**db.trends.row(trend(n)), "id": str(uuid.uuid4())} for n in range(30)
+        )
+        copied = await db.trends.copy(db.trends.row(trend(n, "twitter")) for n in range(16))
+
+        assert (inserted, copied) == (30, 16)
+        assert len(await everything(db.trends, platform="twitter")) == 16
+
+    async def test_repositories_share_the_engine_with_the_state_store(self, db):
+        [record] = await db.state.commit(
+            [Write.create("content", str(uuid.uuid4()), {"body": "hi", "status": "draft"})]
+        )
+
+        page = await db.content.page()
+
+        assert [row["id"] for row in page.rows] == [record.id]
+
+
+class TestKeysetPagination:
+    """Pages are stable, complete and ordered."""
+
+    async def test_visits_every_row_once_newest_first(self, db):
+        base = datetime(2025, 2, 4, tzinfo=UTC)
+        rows = [
+            {
+                **db.trends.row(trend(n)),
+                # Groups of three rows share a timestamp; id breaks the tie.
+                "created_at": base + timedelta(minutes=n // 3),
+            }
+            for n in range(25)
+        ]
+        await db.trends.insert_many(rows)
+
+        seen = await everything(db.trends)
+
+        assert len(seen) == 25 and len({row["id"] for row in seen}) == 25
+        keys = [(row["created_at"], row["id"]) for row in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    async def test_filters_and_cursor_round_trip(self, db):
+        await db.trends.upsert_trends(trend(n, "youtube" if n % 2 else "tiktok") for n in range(9))
+
+        first = await db.trends.page(limit=2, platform="youtube")
+        rest = await everything(db.trends, platform="youtube")
+
+        assert {row["platform"] for row in rest} == {"youtube"} and len(rest) == 4
+        assert decode_cursor(first.cursor)[1] == first.rows[-1]["id"]
+        with pytest.raises(ValueError):
+            await db.trends.page(after="not-a-cursor")
@@ -0,0 +1,148 @@
+"""
+Test Persona Registry - Compiled SOUL.md personas with hot reload
+
+Validates SOUL.md parsing and validation, the compiled prompt prefix and
+constraint set, mtime-based reloads that only re-parse changed files,
+last-good handling of broken edits, and warm starts from the pickled
+snapshot cache.
+
+Reference: research/SRS.md#4.1-cognitive-core-persona-management-fr-1.0-1.2
+"""
+
+import os
+import pickle
+
+import pytest
+
+from chimera.persona import PersonaError, PersonaRegistry, compile_soul
+from chimera.persona import registry as registry_module
+
+AGENTS = os.path.join(os.path.dirname(__file__), "..", "agents")
+
+
+def soul(persona_id, name="Nova", directive="Never discuss politics"):
+    return (
+        f"---\nname: {name}\nid: {persona_id}\nvoice_traits:\n  - Witty\n  - Warm\n"
+        f"directives:\n  - {directive}\nbackstory: |\n  Grew up online.\n---\n\nNotes.\n"
+    )
+
+
+def write(root, agent, text, bump=0):
+    path = root / agent / "SOUL.md"
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(text)
+    if bump:
+        # Guarantee a new mtime even on coarse-grained filesystems.
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+    return path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count SOUL.md compilations done by the registry."""
+    calls = []
+
+    def counting(text, source):
+        calls.append(source)
+        return compile_soul(text, source)
+
+    monkeypatch.setattr(registry_module, "compile_soul", counting)
+    return calls
+
+
+class TestCompile:
+    """Front matter is validated and compiled once."""
+
+    def test_repo_personas_compile(self):
+        registry = PersonaRegistry(AGENTS)
+
+        worker = registry["worker-0001"]
+        assert len(registry) == 3 and registry.errors == {}
+        assert worker.voice_traits == ("Clear", "Task-oriented", "Neutral")
+        assert worker.prompt_prefix.startswith("You are Worker Agent (agent worker-0001).\n")
+        assert "- Execute using MCP Tools only\n" in worker.prompt_prefix
+        assert worker.requires("execute using MCP tools only")
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("name: x\n", "missing front matter"),
+            ("---\nname: x\n", "not closed"),
+            ("---\nname: [\n---\n", "invalid YAML"),
+            ("---\nname: Nova\nid: n1\nvoice_traits: []\ndirectives: [a]\n---\n", "voice_traits"),
+            ("---\nid: n1\nvoice_traits: [a]\ndirectives: [a]\n---\n", "name"),
+        ],
+    )
+    def test_invalid_souls_are_rejected(self, text, message):
+        with pytest.raises(PersonaError, match=message):
+            compile_soul(text, "SOUL.md")
+
+    def test_personas_are_immutable_and_picklable(self):
+        persona = compile_soul(soul("n1"))
+
+        with pytest.raises(AttributeError):
+            persona.name = "Other"
+        assert pickle.loads(pickle.dumps(persona)) == persona
+
+
+class TestReload:
+    """Only files whose mtime or size changed are parsed again."""
+
+    def test_refresh_reparses_changed_files_only(self, tmp_path, parses):
+        for i in range(5):
+            write(tmp_path, f"agent{i}", soul(f"n{i}"))
+        registry = PersonaRegistry(str(tmp_path))
+        before = registry.snapshot
+        parses.clear()
+
+        assert registry.refresh() is False
+        write(tmp_path, "agent3", soul("n3", name="Nova Prime"), bump=10**9)
+        (tmp_path / "agent4" / "SOUL.md").unlink()
+        assert registry.refresh() is True
+
+        assert parses == [str(tmp_path / "agent3" / "SOUL.md")]
+        assert registry["n3"].name == "Nova Prime" and "n4" not in registry.snapshot
+        # Readers holding the old snapshot are unaffected.
+        assert before["n3"].name == "Nova" and len(before) == 5
+        assert registry.snapshot.version == before.version + 1
+
+    def test_broken_edit_keeps_last_good_persona(self, tmp_path, parses):
+        write(tmp_path, "nova", soul("n1"))
+        write(tmp_path, "other", soul("n1", name="Copycat"))
+        registry = PersonaRegistry(str(tmp_path))
+        assert registry["n1"].name == "Nova"
+        assert "duplicate id 'n1'" in registry.errors[str(tmp_path / "other" / "SOUL.md")]
+
+        other = write(tmp_path, "other", soul("n2"), bump=10**9)
+        path = write(tmp_path, "nova", "---\nname: [\n---\n", bump=10**9)
+        parses.clear()
+        registry.refresh()
+        registry.refresh()
+
+        # Each changed file is parsed once; the broken version is not retried.
+        assert sorted(parses) == sorted([str(path), str(other)])
+        assert registry["n1"].name == "Nova" and "n2" in registry.snapshot
+        assert list(registry.errors) == [str(path)]
+
+
+class TestSnapshotCache:
+    """A new process starts from the pickled snapshot."""
+
+    def test_warm_start_parses_nothing(self, tmp_path, parses):
+        root = tmp_path / "agents"
+        root.mkdir()
+        for i in range(20):
+            write(root, f"agent{i}", soul(f"n{i}"))
+        cache = str(tmp_path / "personas.pickle")
+        first = PersonaRegistry(str(root), cache_path=cache)
+        parses.clear()
+
+        warm = PersonaRegistry(str(root), cache_path=cache)
+
+        assert parses == []
+        assert len(warm) == 20 and warm["n7"] == first["n7"]
+
+        write(root, "agent7", soul("n7", directive="Always disclose AI"), bump=10**9)
+        PersonaRegistry(str(root), cache_path=cache)
+        assert parses == [str(root / "agent7" / "SOUL.md")]
@@ -0,0 +1,251 @@
+"""
+Test Planner DAG - Parallel branches, critical path and re-planning
+
+Validates graph construction (Ref edges, cycles), critical-path ranking,
+parallel execution with failure isolation and conditional nodes, and
+incremental re-runs after a node changes.
+
+Reference: research/SRS.md#3.1.1-the-planner-strategist
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from chimera.planner import (
+    DagScheduler,
+    GraphError,
+    NodeStatus,
+    Ref,
+    TaskGraph,
+    content_pipeline,
+)
+
+OUTPUTS = {
+    "fetch_trends": lambda i: {
+        "status": "success",
+        "trends": [{"title": f"t{n}"} for n in range(i["limit"])],
+    },
+    "generate_caption": lambda i: {
+        "status": "success",
+        "captions": [{"text": f"caption for {i['transcript']}", "hashtags": ["#x"]}],
+        "best_choice": 0,
+    },
+    "safety_check": lambda i: {"status": "success", "is_safe": "unsafe" not in i["content"]},
+    "post_content": lambda i: {"status": "success", "post_id": "p1", "text": i["content"]["text"]},
+}
+
+
+class FakeRunner:
+    """Sleeps ``delays[task_type]`` and returns a contract-shaped result."""
+
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, node, input_data):
+        self.calls.append(node.node_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(node.task_type, 0.0))
+        finally:
+            self.active -= 1
+        if node.node_id in self.fail:
+            raise RuntimeError("boom")
+        make = OUTPUTS.get(node.task_type, lambda i: {"status": "success", "input": i})
+        return make(input_data)
+
+
+class TestTaskGraph:
+    """Edges come from Refs and after=; cycles are rejected."""
+
+    def test_refs_create_dependencies(self):
+        graph = TaskGraph()
+        graph.add("a", "x")
+        graph.add("b", "x", {"value": Ref("a", "output.0")}, after=["a"])
+        graph.add("c", "x", when=Ref("b", "ok"))
+
+        assert graph.nodes["b"].depends_on == {"a"}
+        assert graph.nodes["c"].depends_on == {"b"}
+        assert graph.topological_order() == ["a", "b", "c"]
+        assert graph.downstream("a") == {"b", "c"}
+
+    def test_cycle_and_unknown_dependency_rejected(self):
+        cyclic = TaskGraph()
+        cyclic.add("a", "x", after=["b"])
+        cyclic.add("b", "x", after=["a"])
+        dangling = TaskGraph()
+        dangling.add("a", "x", after=["ghost"])
+
+        with pytest.raises(GraphError, match="cycle"):
+            cyclic.topological_order()
+        with pytest.raises(GraphError, match="unknown"):
+            dangling.topological_order()
+        with pytest.raises(GraphError, match="duplicate"):
+            dangling.add("a", "x")
+
+    def test_critical_path_follows_longest_chain(self):
+        graph = content_pipeline(
+            {"platforms": ["tiktok"], "category": "news", "time_range": "1h"},
+            persona="funny",
+            platform="tiktok",
+            branches=2,
+            video_urls=["https://tiktok.com/video/1"],
+        )
+
+        path = graph.critical_path()
+        rank = graph.rank()
+
+        assert path == ["download:0", "transcribe:0", "caption:0", "safety:0", "post:0"]
+        assert rank["download:0"] == pytest.approx(5 + 8 + 1.5 + 0.5 + 1)
+
+
+class TestDagScheduler:
+    """Independent branches overlap; failures only skip their subgraph."""
+
+    async def test_branches_run_in_parallel(self):
+        runner = FakeRunner({"generate_caption": 0.1, "safety_check": 0.05, "post_content": 0.05})
+        graph = content_pipeline(
+            {"platforms": ["tiktok"], "category": "news", "time_range": "1h"},
+            persona="funny",
+            platform="tiktok",
+            branches=3,
+        )
+
+        run = await DagScheduler(runner).run(graph)
+
+        assert run.ok
+        assert runner.peak == 3
+        assert run.elapsed < 0.35
+        assert run.result("post:2")["text"] == "caption for t2"
+
+    async def test_ready_nodes_ordered_by_critical_path(self):
+        graph = TaskGraph()
+        graph.add("short", "x", estimate=0.1)
+        graph.add("long_head", "x", estimate=1.0)
+        graph.add("long_tail", "x", after=["long_head"], estimate=5.0)
+
+        run = await DagScheduler(FakeRunner(), max_parallel=1).run(graph)
+
+        assert run.executed == ["long_head", "long_tail", "short"]
+
+    async def test_failure_skips_only_downstream(self):
+        graph = content_pipeline(
+            {"platforms": ["tiktok"], "category": "news", "time_range": "1h"},
+            persona="funny",
+            platform="tiktok",
+            branches=2,
+        )
+
+        run = await DagScheduler(FakeRunner(fail={"caption:0"})).run(graph)
+
+        assert not run.ok
+        assert run.failed() == ["caption:0"]
+        assert run.nodes["post:0"].status is NodeStatus.SKIPPED
+        assert run.nodes["post:1"].status is NodeStatus.SUCCESS
+
+    async def test_condition_false_skips_node(self):
+        graph = TaskGraph()
+        graph.add("safety", "safety_check", {"content": "unsafe text"})
+        graph.add("post", "post_content", {"content": {"text": "x"}}, when=Ref("safety", "is_safe"))
+
+        run = await DagScheduler(FakeRunner()).run(graph)
+
+        assert run.ok
+        assert run.nodes["post"].status is NodeStatus.SKIPPED
+        assert "condition" in run.result("post")["reason"]
+
+    async def test_estimates_learn_observed_durations(self):
+        graph = TaskGraph()
+        graph.add("a", "generate_caption", {"transcript": "x"})
+        scheduler = DagScheduler(FakeRunner({"generate_caption": 0.05}))
+
+        await scheduler.run(graph)
+
+        assert 0.04 < scheduler.estimates["generate_caption"] < 0.5
+
+    async def test_end_to_end_under_latency_target(self):
+        delays = {"fetch_trends": 0.02, "generate_caption": 0.03, "safety_check": 0.01}
+        graph = content_pipeline(
+            {"platforms": ["tiktok"], "category": "news", "time_range": "1h"},
+            persona="funny",
+            platform="tiktok",
+            branches=10,
+            variations=3,
+        )
+
+        start = time.perf_counter()
+        run = await DagScheduler(FakeRunner(delays)).run(graph)
+
+        assert run.ok
+        # Ten branches cost about one branch's latency, not ten.
+        assert time.perf_counter() - start < 0.2
+
+    async def test_pipeline_posts_the_best_caption(self):
+        def captions(i):
+            return {
+                "status": "success",
+                "captions": [
+                    {"text": "unsafe first draft", "hashtags": ["#a"]},
+                    {"text": f"best for {i['transcript']}", "hashtags": ["#b"]},
+                ],
+                "best_choice": 1,
+            }
+
+        outputs = {**OUTPUTS, "generate_caption": captions}
+
+        async def runner(node, input_data):
+            return outputs[node.task_type](input_data)
+
+        graph = content_pipeline(
+            {"platforms": ["tiktok"], "category": "news", "time_range": "1h"},
+            persona="funny",
+            platform="tiktok",
+            variations=2,
+        )
+        run = await DagScheduler(runner).run(graph)
+
+        assert run.ok
+        assert run.result("post:0")["text"] == "best for t0"
+
+
+class TestReplanning:
+    """A changed node re-runs only itself and its downstream subgraph."""
+
+    async def test_update_reruns_downstream_only(self):
+        graph = content_pipeline(
+            {"platforms": ["tiktok"], "category": "news", "time_range": "1h"},
+            persona="funny",
+            platform="tiktok",
+            branches=3,
+        )
+        scheduler = DagScheduler(FakeRunner())
+        first = await scheduler.run(graph)
+
+        new_input = {**graph.nodes["caption:1"].input, "persona": "serious"}
+        dirty = graph.update("caption:1", input=new_input)
+        runner = scheduler.runner = FakeRunner()
+        second = await scheduler.run(graph, previous=first)
+
+        assert dirty == {"caption:1", "safety:1", "post:1"}
+        assert sorted(runner.calls) == sorted(dirty)
+        assert second.nodes["trends"].reused
+        assert second.nodes["post:0"].reused
+
+    async def test_failed_nodes_are_retried_on_rerun(self):
+        graph = TaskGraph()
+        graph.add("a", "x")
+        graph.add("b", "x", after=["a"])
+        scheduler = DagScheduler(FakeRunner(fail={"a"}))
+        first = await scheduler.run(graph)
+
+        runner = scheduler.runner = FakeRunner()
+        second = await scheduler.run(graph, previous=first)
+
+        assert runner.calls == ["a", "b"]
+        assert second.ok
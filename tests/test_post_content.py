@@ -0,0 +1,400 @@
+"""
+Test Post Content - Publish pipeline with idempotency, batching and scheduling
+
+Validates that a retried post is published once, that concurrent posts to
+a batching platform share one call without one bad post failing the rest,
+that media uploads run concurrently, and that scheduled posts are held on
+the calendar until due and then published.
+
+Reference: research/tooling_strategy.md#5-skill_post_content
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from chimera.ratelimit import RateLimit, RateLimiter
+from skills.skill_post_content import (
+    DryRunPublisher,
+    HttpPublisher,
+    IdempotencyStore,
+    PostContentSkill,
+    PostScheduler,
+)
+from skills.skill_post_content.idempotency import Claim
+from skills.skill_post_content.publishers import Post
+
+
+def request(text="Pasta night", platform="tiktok", **overrides):
+    return {
+        "content": {"text": text, "media": [], "hashtags": ["#food"]},
+        "platform": platform,
+        "schedule": None,
+        **overrides,
+    }
+
+
+def in_seconds(seconds: float) -> str:
+    return (datetime.now(UTC) + timedelta(seconds=seconds)).isoformat()
+
+
+class RejectingPublisher(DryRunPublisher):
+    """Dry-run publisher that rejects posts containing "spam"."""
+
+    async def publish(self, posts):
+        results = await super().publish(posts)
+        return [
+            {"error": "rejected by platform"} if "spam" in post.text else result
+            for post, result in zip(posts, results, strict=True)
+        ]
+
+
+class SlowUploadPublisher(DryRunPublisher):
+    """Dry-run publisher that records how many uploads overlap."""
+
+    def __init__(self, platform):
+        super().__init__(platform)
+        self.active = 0
+        self.peak = 0
+
+    async def upload(self, path, key):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return f"media-{path}"
+
+
+class TestPublish:
+    """Immediate posts and the output contract."""
+
+    async def test_dry_run_publish(self):
+        skill = PostContentSkill({})
+        result = await skill.execute_async(request())
+
+        assert result["status"] == "success"
+        assert result["post_id"].startswith("dry_")
+        assert result["url"] == f"dry-run://tiktok/{result['post_id']}"
+        assert result["dry_run"] is True
+        assert result["duplicate"] is False
+
+    async def test_hashtags_appended_once(self):
+        publisher = DryRunPublisher("twitter", max_batch=1)
+        sent = []
+        original = publisher.publish
+
+        async def publish(posts):
+            sent.extend(p.text for p in posts)
+            return await original(posts)
+
+        publisher.publish = publish
+        skill = PostContentSkill({"publishers": {"twitter": publisher}})
+        content = {"text": "Love #Food", "hashtags": ["#food", "pasta"]}
+        await skill.execute_async({"content": content, "platform": "twitter", "schedule": None})
+
+        assert sent == ["Love #Food #pasta"]
+
+    async def test_invalid_input_rejected(self):
+        skill = PostContentSkill({})
+        result = await skill.execute_async(request(platform="myspace"))
+
+        assert result["status"] == "error"
+        assert result["error_code"] == "INVALID_INPUT"
+        assert result["post_id"] == ""
+
+
+class TestIdempotency:
+    """A key is published once, however often it is retried."""
+
+    async def test_retry_returns_original_post(self):
+        publisher = DryRunPublisher("tiktok")
+        skill = PostContentSkill({"publishers": {"tiktok": publisher}})
+
+        first = await skill.execute_async(request(idempotency_key="campaign-1"))
+        second = await skill.execute_async(request(idempotency_key="campaign-1"))
+
+        assert second["post_id"] == first["post_id"]
+        assert second["duplicate"] is True
+        assert publisher.stats["posts"] == 1
+
+    async def test_derived_key_deduplicates_same_content(self):
+        publisher = DryRunPublisher("tiktok")
+        skill = PostContentSkill({"publishers": {"tiktok": publisher}})
+
+        first = await skill.execute_async(request())
+        second = await skill.execute_async(request())
+        other = await skill.execute_async(request(text="Taco night"))
+
+        assert first["idempotency_key"] == second["idempotency_key"]
+        assert other["idempotency_key"] != first["idempotency_key"]
+        assert publisher.stats["posts"] == 2
+
+    async def test_concurrent_calls_share_one_attempt(self):
+        publisher = DryRunPublisher("tiktok", latency_s=0.02)
+        skill = PostContentSkill({"publishers": {"tiktok": publisher}})
+
+        results = await asyncio.gather(*[skill.execute_async(request()) for _ in range(5)])
+
+        assert len({r["post_id"] for r in results}) == 1
+        assert publisher.stats["posts"] == 1
+
+    async def test_failed_publish_can_be_retried(self):
+        publisher = RejectingPublisher("tiktok")
+        skill = PostContentSkill({"publishers": {"tiktok": publisher}})
+        req = request(text="spam", idempotency_key="k1")
+
+        failed = await skill.execute_async(req)
+        publisher.publish = DryRunPublisher.publish.__get__(publisher)
+        retried = await skill.execute_async(req)
+
+        assert failed["status"] == "error"
+        assert retried["status"] == "success"
+        assert retried["duplicate"] is False
+
+    async def test_local_store_claims(self):
+        store = IdempotencyStore()
+
+        assert await store.begin("k") == (Claim.NEW, None)
+        assert await store.begin("k") == (Claim.BUSY, None)
+        await store.complete("k", {"post_id": "p1"})
+        assert await store.begin("k") == (Claim.DONE, {"post_id": "p1"})
+
+    async def test_busy_key_fails_execution(self):
+        store = IdempotencyStore()
+        await store.begin("held")
+        skill = PostContentSkill({"idempotency": store})
+
+        result = await skill.execute_async(request(idempotency_key="held"))
+
+        assert result["status"] == "error"
+        assert result["error_code"] == "EXECUTION_FAILED"
+        assert result["details"]["exception"] == "PostInProgress"
+
+
+class TestRedisIdempotency:
+    """A Redis-backed store is shared by every worker."""
+
+    @pytest.fixture
+    def server(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeServer()
+
+    def client(self, server):
+        from fakeredis import FakeAsyncRedis
+
+        return FakeAsyncRedis(server=server)
+
+    async def test_workers_share_published_posts(self, server):
+        publisher = DryRunPublisher("tiktok")
+        workers = [
+            PostContentSkill(
+                {
+                    "publishers": {"tiktok": publisher},
+                    "idempotency": IdempotencyStore(self.client(server)),
+                }
+            )
+            for _ in range(2)
+        ]
+
+        first = await workers[0].execute_async(request(idempotency_key="shared"))
+        second = await workers[1].execute_async(request(idempotency_key="shared"))
+
+        assert second["post_id"] == first["post_id"]
+        assert second["duplicate"] is True
+        assert publisher.stats["posts"] == 1
+
+    async def test_claim_blocks_other_worker_until_released(self, server):
+        a = IdempotencyStore(self.client(server))
+        b = IdempotencyStore(self.client(server))
+
+        assert (await a.begin("k"))[0] is Claim.NEW
+        assert (await b.begin("k"))[0] is Claim.BUSY
+        await a.release("k")
+        assert (await b.begin("k"))[0] is Claim.NEW
+
+
+class TestBatching:
+    """Posts to a batching platform share calls."""
+
+    async def test_concurrent_posts_share_one_call(self):
+        publisher = DryRunPublisher("twitter", max_batch=20)
+        skill = PostContentSkill({"publishers": {"twitter": publisher}})
+
+        results = await asyncio.gather(
+            *[skill.execute_async(request(f"post {i}", "twitter")) for i in range(12)]
+        )
+
+        assert all(r["status"] == "success" for r in results)
+        assert len({r["post_id"] for r in results}) == 12
+        assert publisher.stats["calls"] == 1
+        assert skill.report()["batching"]["twitter"]["posts_per_call"] == 12
+
+    async def test_batches_respect_max_batch(self):
+        publisher = DryRunPublisher("instagram", max_batch=4)
+        skill = PostContentSkill({"publishers": {"instagram": publisher}})
+
+        await asyncio.gather(
+            *[skill.execute_async(request(f"post {i}", "instagram")) for i in range(10)]
+        )
+
+        assert publisher.stats["calls"] == 3
+
+    async def test_rejected_post_fails_alone(self):
+        publisher = RejectingPublisher("twitter", max_batch=20)
+        skill = PostContentSkill({"publishers": {"twitter": publisher}})
+
+        texts = ["fine 1", "spam", "fine 2"]
+        results = await asyncio.gather(
+            *[skill.execute_async(request(t, "twitter")) for t in texts]
+        )
+
+        assert [r["status"] for r in results] == ["success", "error", "success"]
+        assert "rejected by platform" in results[1]["message"]
+        assert publisher.stats["calls"] == 1
+
+
+class TestUploads:
+    """Media files upload concurrently, under a cap."""
+
+    async def test_media_uploaded_concurrently_in_order(self):
+        publisher = SlowUploadPublisher("tiktok")
+        skill = PostContentSkill({"publishers": {"tiktok": publisher}, "upload_concurrency": 3})
+        media = [f"/tmp/clip{i}.mp4" for i in range(6)]
+
+        ids = await skill.upload_all("tiktok", "k", media)
+
+        assert ids == tuple(f"media-{p}" for p in media)
+        assert publisher.peak == 3
+
+
+class TestScheduling:
+    """Future posts wait on the calendar."""
+
+    async def test_scheduled_post_published_when_due(self):
+        published = []
+
+        async def on_published(result):
+            published.append(result)
+
+        publisher = DryRunPublisher("tiktok")
+        skill = PostContentSkill(
+            {"publishers": {"tiktok": publisher}, "on_published": on_published}
+        )
+
+        scheduled = request(schedule=in_seconds(1.2))
+        result = await skill.execute_async(scheduled)
+        assert result["status"] == "scheduled"
+        assert result["post_id"] == ""
+        assert publisher.stats["posts"] == 0
+
+        again = await skill.execute_async(scheduled)
+        assert again["duplicate"] is True
+
+        await asyncio.sleep(1.4)
+        await skill.scheduler.drain()
+
+        assert publisher.stats["posts"] == 1
+        assert [r["status"] for r in published] == ["success"]
+        assert published[0]["idempotency_key"] == result["idempotency_key"]
+
+    async def test_past_schedule_publishes_now(self):
+        skill = PostContentSkill({})
+        result = await skill.execute_async(request(schedule=in_seconds(-60)))
+
+        assert result["status"] == "success"
+
+    async def test_scheduler_runs_jobs_in_due_order(self):
+        scheduler = PostScheduler()
+        ran = []
+
+        def job(name):
+            async def run():
+                ran.append(name)
+
+            return run
+
+        now = time.time()
+        scheduler.add(now + 0.06, "late", job("late"))
+        scheduler.add(now + 0.02, "early", job("early"))
+        scheduler.add(now + 0.04, "cancelled", job("cancelled"))
+        assert scheduler.cancel("cancelled")
+
+        await asyncio.sleep(0.1)
+        await scheduler.drain()
+
+        assert ran == ["early", "late"]
+        assert scheduler.report()["completed"] == 2
+        assert scheduler.pending() == []
+
+    async def test_close_keeps_pending_jobs(self):
+        scheduler = PostScheduler()
+
+        async def never():
+            raise AssertionError("should not run")
+
+        due = time.time() + 60
+        scheduler.add(due, "k", never)
+        scheduler.close()
+
+        assert scheduler.pending() == [(due, "k")]
+        assert scheduler.next_due() == due
+
+
+class FakePool:
+    """Records requests and answers like the publish endpoints."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def post(self, url, json=None, content=None, headers=None, timeout=None):
+        body = b"".join([chunk async for chunk in content]) if content is not None else None
+        self.requests.append((url, headers, json if body is None else body))
+        if url.endswith("/media"):
+            payload = {"media_id": f"m{len(body)}"}
+        elif url.endswith("/posts/batch"):
+            payload = {
+                "results": [{"post_id": p["idempotency_key"], "url": "u"} for p in json["posts"]]
+            }
+        else:
+            payload = {"post_id": "p1", "url": "https://example.com/p1"}
+        return httpx.Response(200, json=payload, request=httpx.Request("POST", url))
+
+
+class TestHttpPublisher:
+    """Requests carry the idempotency key."""
+
+    def publisher(self, pool, max_batch=None):
+        limiter = RateLimiter(limits={"twitter": RateLimit(rate=1000, burst=1000)})
+        return HttpPublisher("twitter", "https://api.test/", pool, limiter, "tok", max_batch)
+
+    async def test_upload_streams_file(self, tmp_path):
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(b"x" * 3000)
+        pool = FakePool()
+
+        media_id = await self.publisher(pool).upload(str(path), "k:0")
+
+        url, headers, body = pool.requests[0]
+        assert media_id == "m3000"
+        assert url == "https://api.test/media"
+        assert headers["Idempotency-Key"] == "k:0"
+        assert body == b"x" * 3000
+
+    async def test_single_and_batch_publish(self):
+        pool = FakePool()
+        publisher = self.publisher(pool)
+
+        [single] = await publisher.publish([Post("k1", "hello")])
+        batch = await publisher.publish([Post("a", "one"), Post("b", "two", ("m1",))])
+
+        assert single["post_id"] == "p1"
+        assert [r["post_id"] for r in batch] == ["a", "b"]
+        assert [r[0] for r in pool.requests] == [
+            "https://api.test/posts",
+            "https://api.test/posts/batch",
+        ]
+        assert pool.requests[0][1]["Idempotency-Key"] == "k1"
+        assert pool.requests[1][2]["posts"][1]["media_ids"] == ["m1"]
@@ -0,0 +1,167 @@
+"""
+Test Rate Limiter - Token buckets and adaptive backoff
+
+Validates per-platform/per-key buckets, FIFO pacing of waiters, Retry-After
+handling, jittered backoff and the shared Redis backend.
+
+Reference: specs/functional.md#3.3-security
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from chimera.ratelimit import LocalBackend, RateLimit, RateLimiter, RateLimitExceeded, RedisBackend
+from chimera.ratelimit.limiter import parse_retry_after
+from skills.skill_fetch_trends import FetchTrendsSkill
+from skills.skill_fetch_trends.stub import FakePlatformServer
+
+
+class FakeResponse:
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+
+
+class TestTokenBucket:
+    """Buckets allow bursts, then pace callers at the sustained rate."""
+
+    async def test_burst_then_paced(self):
+        limiter = RateLimiter(limits={"tiktok": RateLimit(rate=20, burst=3)})
+
+        start = time.perf_counter()
+        waits = [await limiter.acquire("tiktok") for _ in range(5)]
+        elapsed = time.perf_counter() - start
+
+        assert waits[:3] == [0, 0, 0]
+        assert all(w > 0 for w in waits[3:])
+        assert 0.08 <= elapsed < 0.3
+
+    async def test_buckets_are_per_api_key(self):
+        limiter = RateLimiter(limits={"youtube": RateLimit(rate=1, burst=1)})
+
+        await limiter.acquire("youtube", "key-a")
+        wait = await limiter.acquire("youtube", "key-b")
+
+        assert wait == 0
+        assert "key-a" not in RateLimiter.bucket_key("youtube", "key-a")
+
+    async def test_concurrent_waiters_spaced_at_rate(self):
+        limiter = RateLimiter(limits={"twitter": RateLimit(rate=50, burst=1)})
+        done = []
+
+        async def worker(i):
+            await limiter.acquire("twitter")
+            done.append((i, time.perf_counter()))
+
+        await asyncio.gather(*(worker(i) for i in range(5)))
+
+        times = [t for _, t in done]
+        assert [i for i, _ in done] == list(range(5))
+        assert times[-1] - times[0] >= 0.07
+
+    async def test_max_wait_fails_fast(self):
+        limiter = RateLimiter(limits={"tiktok": RateLimit(rate=1, burst=1)}, max_wait=0.5)
+        await limiter.acquire("tiktok")
+
+        with pytest.raises(RateLimitExceeded):
+            await limiter.acquire("tiktok", cost=5)
+
+        # The rejected reservation was handed back: only the first token is owed.
+        patient = RateLimiter(limiter.backend, limiter.limits)
+        assert await patient.acquire("tiktok") <= 1.0
+        assert limiter.stats["rejected"] == 1
+
+    async def test_cancelled_waiter_hands_tokens_back(self):
+        limiter = RateLimiter(limits={"tiktok": RateLimit(rate=1, burst=1)})
+        await limiter.acquire("tiktok")
+        queued = asyncio.create_task(limiter.acquire("tiktok", cost=3))
+        await asyncio.sleep(0.05)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        assert await limiter.acquire("tiktok") <= 1.0
+        assert limiter.stats["waiting"] == 0
+
+
+class TestBackoff:
+    """429/503 responses block the bucket and are retried."""
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_jittered_exponential_backoff(self):
+        limiter = RateLimiter(rng=random.Random(7), backoff_base=1, backoff_cap=8)
+
+        delays = [limiter.backoff_delay(strikes, None) for strikes in range(1, 8)]
+
+        assert all(0 <= d <= 8 for d in delays)
+        assert len(set(delays)) == len(delays)
+        assert 2 <= limiter.backoff_delay(1, 2.0) <= 3
+
+    async def test_call_retries_after_429(self):
+        limiter = RateLimiter(limits={"tiktok": RateLimit(rate=100, burst=10)})
+        responses = [FakeResponse(429, "0.05"), FakeResponse(200)]
+
+        async def send():
+            return responses.pop(0)
+
+        start = time.perf_counter()
+        response = await limiter.call("tiktok", None, send)
+
+        assert response.status_code == 200
+        assert time.perf_counter() - start >= 0.05
+        assert limiter.stats["throttled"] == 1
+        assert limiter.stats["retries"] == 1
+
+    def test_skill_recovers_from_throttled_platform(self):
+        limiter = RateLimiter()
+        with FakePlatformServer(throttle={"tiktok": 1}, retry_after=0.05) as server:
+            skill = FetchTrendsSkill(
+                config={"endpoints": server.endpoints(), "rate_limiter": limiter}
+            )
+            result = skill.execute(
+                {"platforms": ["tiktok"], "category": "news", "limit": 3, "time_range": "1h"}
+            )
+
+        assert result["status"] == "success"
+        assert len(result["data"]["trends"]) == 3
+        assert limiter.stats["throttled"] == 1
+
+
+class TestSharedBackends:
+    """Bucket state is shared by every limiter on the same backend."""
+
+    async def test_local_backend_shared_between_limiters(self):
+        backend = LocalBackend()
+        limits = {"tiktok": RateLimit(rate=1, burst=1)}
+        first = RateLimiter(backend, limits)
+        second = RateLimiter(backend, limits)
+
+        await first.acquire("tiktok")
+        with pytest.raises(RateLimitExceeded):
+            await RateLimiter(backend, limits, max_wait=0.1).acquire("tiktok")
+        assert second.bucket_key("tiktok", None) == first.bucket_key("tiktok", None)
+
+    async def test_redis_backend_paces_across_clients(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        server = fakeredis.FakeServer()
+        limits = {"youtube": RateLimit(rate=10, burst=2)}
+        worker_a = RateLimiter(RedisBackend(fakeredis.FakeAsyncRedis(server=server)), limits)
+        worker_b = RateLimiter(RedisBackend(fakeredis.FakeAsyncRedis(server=server)), limits)
+
+        assert await worker_a.acquire("youtube") == 0
+        assert await worker_b.acquire("youtube") == 0
+        wait = await worker_a.acquire("youtube")
+        await worker_b.throttled("youtube", retry_after=0.2)
+        blocked_wait = await worker_a.acquire("youtube")
+
+        assert 0.05 < wait <= 0.1
+        assert blocked_wait >= 0.2
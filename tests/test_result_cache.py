@@ -0,0 +1,156 @@
+"""
+Test Result Cache - TTL + LRU cache in front of FetchTrendsSkill
+
+Validates LRU bounds, TTL expiry, stale-while-revalidate, request
+coalescing, the optional Redis tier and the FetchTrendsSkill integration.
+
+Reference: research/SRS.md#2.2-data-persistence-layer
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from chimera.cache import LRUCache, ResultCache
+from chimera.cache.lru import CacheEntry
+from skills.skill_fetch_trends import FetchTrendsSkill
+from skills.skill_fetch_trends.config import cache_ttl
+
+
+class CountingFetch:
+    """Upstream stand-in that counts calls and returns the call number."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"call": self.calls}
+
+
+def entry(value, ttl=60.0):
+    now = time.time()
+    return CacheEntry(value, now + ttl, now + ttl)
+
+
+class TestLRUCache:
+    """The in-process tier is bounded by entries and bytes."""
+
+    def test_evicts_least_recently_used(self):
+        lru = LRUCache(max_entries=2)
+        lru.set("a", entry(b"1"))
+        lru.set("b", entry(b"2"))
+        lru.get("a")
+        lru.set("c", entry(b"3"))
+
+        assert lru.get("b") is None
+        assert lru.get("a") is not None
+        assert len(lru) == 2
+
+    def test_bounded_by_bytes(self):
+        lru = LRUCache(max_entries=100, max_bytes=25)
+        for key in "abc":
+            lru.set(key, entry(b"x" * 10))
+
+        assert len(lru) == 2
+        assert lru.memory_bytes == 22
+
+    def test_expired_entries_dropped(self):
+        lru = LRUCache()
+        lru.set("a", entry(b"1", ttl=-1))
+
+        assert lru.get("a") is None
+        assert lru.memory_bytes == 0
+
+
+class TestResultCache:
+    """TTL, stale-while-revalidate and coalescing."""
+
+    async def test_fresh_hit_skips_upstream(self):
+        cache = ResultCache()
+        fetch = CountingFetch()
+
+        first = await cache.get_or_fetch("k", fetch, ttl=60)
+        second = await cache.get_or_fetch("k", fetch, ttl=60)
+
+        assert first == second == {"call": 1}
+        assert fetch.calls == 1
+        assert cache.report()["hit_ratio"] == 0.5
+
+    async def test_concurrent_requests_coalesced(self):
+        cache = ResultCache()
+        fetch = CountingFetch(delay=0.05)
+
+        results = await asyncio.gather(*(cache.get_or_fetch("k", fetch, ttl=60) for _ in range(10)))
+
+        assert fetch.calls == 1
+        assert all(r == {"call": 1} for r in results)
+        assert cache.stats.coalesced == 9
+
+    async def test_stale_while_revalidate(self):
+        cache = ResultCache()
+        fetch = CountingFetch()
+        await cache.get_or_fetch("k", fetch, ttl=0.01, stale_ttl=60)
+        await asyncio.sleep(0.02)
+
+        stale = await cache.get_or_fetch("k", fetch, ttl=60, stale_ttl=60)
+        await asyncio.sleep(0.01)
+        refreshed = await cache.get_or_fetch("k", fetch, ttl=60, stale_ttl=60)
+
+        assert stale == {"call": 1}
+        assert refreshed == {"call": 2}
+        assert cache.stats.stale_hits == 1
+        assert cache.stats.refreshes == 1
+
+    async def test_uncacheable_results_not_stored(self):
+        cache = ResultCache()
+        fetch = CountingFetch()
+
+        await cache.get_or_fetch("k", fetch, ttl=60, cacheable=lambda v: False)
+        await cache.get_or_fetch("k", fetch, ttl=60, cacheable=lambda v: False)
+
+        assert fetch.calls == 2
+        assert cache.report()["entries"] == 0
+
+    async def test_redis_tier_shared_between_caches(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        worker_a = ResultCache(redis=fakeredis.FakeAsyncRedis(server=server))
+        worker_b = ResultCache(redis=fakeredis.FakeAsyncRedis(server=server))
+        fetch = CountingFetch()
+
+        await worker_a.get_or_fetch("k", fetch, ttl=60)
+        value = await worker_b.get_or_fetch("k", fetch, ttl=60)
+
+        assert value == {"call": 1}
+        assert fetch.calls == 1
+        assert worker_b.stats.redis_hits == 1
+
+
+class TestFetchTrendsCaching:
+    """FetchTrendsSkill serves repeated requests from the cache."""
+
+    def test_repeated_request_hits_cache(self):
+        calls = []
+
+        class Source:
+            async def fetch(self, category, limit, time_range):
+                calls.append(category)
+                return [{"id": "t1", "title": "#t1", "engagement_score": 0.5, "volume": 1}]
+
+        cache = ResultCache()
+        skill = FetchTrendsSkill(config={"sources": {"tiktok": Source()}, "cache": cache})
+        request = {"platforms": ["tiktok"], "category": "music", "limit": 5, "time_range": "24h"}
+
+        first = skill.execute(request)
+        second = skill.execute(dict(request, platforms=["tiktok", "tiktok"]))
+
+        assert first == second
+        assert len(calls) == 1
+        assert cache.report()["memory_bytes"] > 0
+
+    def test_ttl_scales_with_time_range(self):
+        assert cache_ttl("1h") < cache_ttl("24h") < cache_ttl("7d") < cache_ttl("90d")
@@ -0,0 +1,157 @@
+"""
+Test Safety Check - Vectorised batch scoring for the Judge
+
+Validates that the compiled keyword automaton matches whole words and
+folded leetspeak, that execute_batch() scores a mixed batch in one pass with
+the same results as per-item execute(), that invalid items fail closed
+without affecting the rest of the batch, and that context-driven policy
+rules apply.
+
+Reference: research/tooling_strategy.md#6-skill_safety_check
+"""
+
+import random
+
+from skills.skill_safety_check import KeywordAutomaton, SafetyCheckSkill
+from skills.skill_safety_check.automaton import normalize
+
+ALL_CHECKS = ["toxicity", "spam", "policy"]
+
+
+def item(content, checks=ALL_CHECKS, **context):
+    return {"content": content, "context": context, "check_types": list(checks)}
+
+
+class TestKeywordAutomaton:
+    """One DFA matches every term list in lockstep."""
+
+    def test_matches_whole_words_and_overlaps(self):
+        automaton = KeywordAutomaton({"a": ["he", "she", "hers"], "b": ["his"]})
+
+        hits = automaton.scan(["she sells hers", "ushers his", "he he he"])
+
+        by_term = [dict(zip(automaton.terms, row.tolist(), strict=True)) for row in hits]
+        assert by_term[0] == {"he": 0, "she": 1, "hers": 1, "his": 0}
+        assert by_term[1] == {"he": 0, "she": 0, "hers": 0, "his": 1}
+        assert by_term[2]["he"] == 3
+        assert automaton.category_hits(hits)[:, 1].tolist() == [0, 1, 0]
+
+    def test_normalisation_folds_case_punctuation_and_leetspeak(self):
+        assert normalize("FR33   m0ney!!!") == " free money "
+        automaton = KeywordAutomaton({"spam": ["free money"]})
+
+        hits = automaton.scan(["Get FR33...m0ney now", "freemoney", "free moneys"])
+
+        assert hits[:, 0].tolist() == [1, 0, 0]
+
+    def test_matches_a_naive_scan_on_random_text(self):
+        rng = random.Random(3)
+        vocabulary = ["ab", "abc", "bca", "cab", "b", "ca", "ab ca", "b ca b"]
+        automaton = KeywordAutomaton({"x": vocabulary})
+        texts = [
+            " ".join(rng.choice(["ab", "abc", "b", "ca", "zz"]) for _ in range(rng.randint(0, 30)))
+            for _ in range(200)
+        ]
+
+        hits = automaton.scan(texts)
+
+        for text, row in zip(texts, hits, strict=True):
+            padded = f" {text} "
+            expected = [
+                sum(padded.startswith(f" {t} ", i) for i in range(len(padded))) for t in vocabulary
+            ]
+            assert row.tolist() == expected
+
+
+class TestScoring:
+    """Scores, flags and is_safe per check type."""
+
+    def test_clean_content_is_safe(self):
+        result = SafetyCheckSkill().execute(item("Easy lemon garlic pasta for dinner tonight"))
+
+        assert result["status"] == "success"
+        assert result["is_safe"] is True
+        assert result["scores"] == {"toxicity": 0.0, "spam": 0.0, "policy": 0.0}
+        assert result["flags"] == []
+
+    def test_each_check_fails_on_its_own_signals(self):
+        skill = SafetyCheckSkill()
+        toxic, spam, policy = skill.execute_batch(
+            [
+                item("you are such an 1d10t, loser"),
+                item("FREE MONEY!!!!!!!! click here www.win.xyz http://x.io bit.ly/abc"),
+                item("this miracle cure works overnight"),
+            ]
+        )
+
+        assert toxic["scores"]["toxicity"] >= 0.5 and not toxic["is_safe"]
+        assert {"toxicity:idiot", "toxicity:loser"} <= set(toxic["flags"])
+        assert spam["scores"]["spam"] > 0.9
+        assert {"spam:free money", "spam:click here", "spam:links"} <= set(spam["flags"])
+        assert policy["flags"] == ["policy:miracle cure"] and not policy["is_safe"]
+
+    def test_only_requested_checks_are_reported(self):
+        result = SafetyCheckSkill().execute(item("click here, idiot", checks=["toxicity"]))
+
+        assert list(result["scores"]) == ["toxicity"]
+        assert result["flags"] == ["toxicity:idiot"]
+
+    def test_sponsored_content_needs_disclosure(self):
+        skill = SafetyCheckSkill()
+        missing, disclosed, lookalike = skill.execute_batch(
+            [
+                item("Loving this serum", sponsored=True),
+                item("Loving this serum #ad", sponsored=True),
+                item("Loving this serum #adorable", sponsored=True),
+            ]
+        )
+
+        assert missing["flags"] == ["policy:missing_disclosure"] and not missing["is_safe"]
+        assert disclosed["is_safe"]
+        assert not lookalike["is_safe"]
+
+    def test_config_terms_and_thresholds(self):
+        skill = SafetyCheckSkill(
+            {"terms": {"policy": ["rival brand"]}, "thresholds": {"spam": 0.9}}
+        )
+
+        rival, spam = skill.execute_batch([item("better than Rival-Brand"), item("dm me")])
+
+        assert rival["flags"] == ["policy:rival brand"]
+        assert spam["scores"]["spam"] == 0.5 and spam["is_safe"]
+
+
+class TestBatch:
+    """execute_batch() is equivalent to per-item execute()."""
+
+    def test_batch_matches_single_calls_in_order(self):
+        rng = random.Random(11)
+        pieces = ["great pasta", "click here", "LOOK AT THIS NOW", "idiot", "#a #b", "www.x.com"]
+        items = [
+            item(" ".join(rng.choices(pieces, k=rng.randint(1, 8))), rng.sample(ALL_CHECKS, 2))
+            for _ in range(60)
+        ]
+        skill = SafetyCheckSkill({"block_rows": 7})
+
+        batch = skill.execute_batch(items)
+        single = [skill.execute(i) for i in items]
+
+        strip = [{k: v for k, v in r.items() if k != "timestamp"} for r in batch]
+        assert strip == [{k: v for k, v in r.items() if k != "timestamp"} for r in single]
+
+    def test_invalid_items_fail_closed_without_breaking_the_batch(self):
+        skill = SafetyCheckSkill()
+
+        ok, bad_type, bad_checks = skill.execute_batch(
+            [item("hello"), {"content": 42, "check_types": ["spam"]}, item("hi", ["vibes"])]
+        )
+
+        assert ok["is_safe"] is True
+        for result in (bad_type, bad_checks):
+            assert result["error_code"] == "INVALID_INPUT"
+            assert result["is_safe"] is False
+            assert result["scores"] == {} and result["flags"] == []
+            assert skill.validate_output(result)
+
+    def test_empty_batch(self):
+        assert SafetyCheckSkill().execute_batch([]) == []
@@ -0,0 +1,182 @@
+"""
+Test Skill Contracts - Compiled input/output validation for every skill
+
+Validates that each skill's compiled contract accepts its documented input
+and rejects bad input with one INVALID_INPUT message per field, without
+coercing types. Cross-field rules and config-dependent rules still apply.
+Output is checked unless the skill is trusted.
+
+Reference: skills/README.md#skill-contracts-reference
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from skills.base import BaseSkill
+from skills.contracts import Contract
+from skills.skill_download_video import DownloadVideoSkill
+from skills.skill_fetch_trends import FetchTrendsSkill
+from skills.skill_fetch_trends.config import SUPPORTED_PLATFORMS
+from skills.skill_fetch_trends.contract import INPUT_CONTRACT as TRENDS_INPUT
+from skills.skill_fetch_trends.contract import OUTPUT_CONTRACT as TRENDS_OUTPUT
+from skills.skill_generate_caption import GenerateCaptionSkill
+from skills.skill_post_content import PostContentSkill
+from skills.skill_safety_check import SafetyCheckSkill
+from skills.skill_transcribe_audio import TranscribeAudioSkill
+
+TRENDS = {"platforms": ["tiktok"], "category": "food", "limit": 10, "time_range": "24h"}
+
+
+def trend(**overrides):
+    return {
+        "id": "tiktok_food_000",
+        "title": "#Pasta",
+        "platform": "tiktok",
+        "engagement_score": 0.5,
+        "volume": 10,
+        "metadata": {},
+        **overrides,
+    }
+
+
+def post(**content):
+    return {"platform": "twitter", "content": content, "schedule": None}
+
+
+class TestInputContracts:
+    """Shapes, enums and ranges are checked by the compiled schema."""
+
+    def test_valid_input_passes(self):
+        assert TRENDS_INPUT.errors(TRENDS) == []
+
+    def test_one_message_per_field(self):
+        errors = TRENDS_INPUT.errors(
+            {"platforms": ["myspace"], "category": 1, "limit": 0, "time_range": "1w"}
+        )
+
+        assert [e.split(":")[0] for e in errors] == [
+            "platforms.0",
+            "category",
+            "limit",
+            "time_range",
+        ]
+
+    def test_types_are_not_coerced(self):
+        for limit in ("10", True, 10.0):
+            assert TRENDS_INPUT.errors({**TRENDS, "limit": limit}) != []
+
+    def test_missing_fields_and_non_dict(self):
+        assert TRENDS_INPUT.errors({"category": "food"}) == [
+            "platforms: Field required",
+            "limit: Field required",
+            "time_range: Field required",
+        ]
+        assert TRENDS_INPUT.errors(["not", "a", "dict"]) == ["Input should be a valid dictionary"]
+
+    def test_unknown_keys_are_ignored(self):
+        assert TRENDS_INPUT.errors({**TRENDS, "trace_id": "abc"}) == []
+
+    def test_enum_tuples_follow_the_contract_literals(self):
+        assert SUPPORTED_PLATFORMS == ("tiktok", "youtube", "twitter")
+
+    @pytest.mark.parametrize(
+        "skill, bad",
+        [
+            (DownloadVideoSkill, {"url": "ftp://x", "platform": "tiktok", "output_path": "/tmp/"}),
+            (TranscribeAudioSkill, {"filepath": "a.mp4", "language": "English", "model": "base"}),
+            (SafetyCheckSkill, {"content": "hi", "check_types": []}),
+        ],
+    )
+    def test_each_skill_rejects_bad_input(self, skill, bad):
+        errors = skill().input_errors(bad)
+
+        assert errors and not skill().validate_input(bad)
+
+
+class TestContextAndCrossFieldRules:
+    """Rules that need config or span several fields."""
+
+    def test_configured_personas_are_accepted(self):
+        request = {
+            "transcript": "pasta night",
+            "persona": "pirate",
+            "platform": "tiktok",
+            "include_hashtags": True,
+            "variations": 1,
+        }
+
+        assert not GenerateCaptionSkill().validate_input(request)
+        assert GenerateCaptionSkill({"personas": {"pirate": "Talk like a pirate."}}).validate_input(
+            request
+        )
+
+    def test_post_needs_something_to_post(self):
+        errors = PostContentSkill().input_errors(post(text="  ", hashtags=[]))
+
+        assert errors == ["content needs text, hashtags or media"]
+
+    def test_post_text_limit_counts_hashtags(self):
+        errors = PostContentSkill().input_errors(post(text="x" * 275, hashtags=["#pasta"]))
+
+        assert errors == ["text with hashtags exceeds 280 characters"]
+
+    def test_schedule_must_parse_and_be_near(self):
+        skill = PostContentSkill()
+        far = (datetime.now(UTC) + timedelta(days=365)).isoformat()
+
+        assert skill.input_errors({**post(text="hi"), "schedule": "tomorrow"}) == [
+            "schedule: schedule must be an ISO 8601 timestamp or null"
+        ]
+        assert skill.input_errors({**post(text="hi"), "schedule": far}) == [
+            "schedule: schedule is too far in the future"
+        ]
+
+
+class Echo(BaseSkill):
+    """Returns whatever trends it is handed, valid or not."""
+
+    name = "echo"
+    input_contract = Contract(dict)
+    output_contract = TRENDS_OUTPUT
+
+    async def run(self, input_data):
+        return {"status": "success", "trends": input_data["trends"], "timestamp": "now"}
+
+
+class TestOutputContracts:
+    """Output checks and the trusted mode that skips them."""
+
+    def test_error_results_use_the_shared_format(self):
+        assert TRENDS_OUTPUT.errors({"status": "error", "error_code": "X", "message": "m"}) == []
+        assert TRENDS_OUTPUT.errors({"status": "error"}) != []
+
+    async def test_invalid_output_is_an_error(self):
+        result = await Echo().execute_async({"trends": [trend(engagement_score=1.5)]})
+
+        assert result["error_code"] == "INVALID_OUTPUT"
+        assert result["validation_errors"] == [
+            "success.trends.0.engagement_score: Input should be less than or equal to 1"
+        ]
+
+    async def test_trusted_skill_skips_output_check(self):
+        result = await Echo({"trusted": True}).execute_async(
+            {"trends": [trend(engagement_score=1.5)]}
+        )
+
+        assert result["status"] == "success"
+
+    async def test_valid_output_passes_through(self):
+        result = await Echo().execute_async({"trends": [trend()]})
+
+        assert result["trends"] == [trend()]
+
+    def test_skills_without_contracts_must_override(self):
+        with pytest.raises(NotImplementedError):
+            BaseSkill().input_errors({})
+
+    def test_fetch_trends_output_is_checked(self):
+        skill = FetchTrendsSkill({})
+
+        assert skill.validate_output({"status": "success", "trends": [trend()], "timestamp": "t"})
+        assert not skill.validate_output({"status": "success", "trends": [{"id": 1}]})
@@ -0,0 +1,183 @@
+"""
+Test Skill Registry - Manifest discovery, lazy imports and warm workers
+
+Validates that skills are found from their manifests without importing them,
+that entry points cover skills no manifest declares, that contracts compile
+on first use or on warm-up, and that hot skills are warmed before the first
+task, in process workers too.
+
+Reference: research/SRS.md#3.1.2-the-worker-executor
+"""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+from chimera.runtime import (
+    DEFAULT_MODES,
+    ExecutionMode,
+    SkillDispatcher,
+    SkillRegistry,
+    UnknownSkill,
+    default_registry,
+)
+from chimera.runtime import registry as registry_module
+from skills.base import BaseSkill
+from skills.contracts import Contract
+
+MODULE = "registry_probe_skill"
+
+
+@pytest.fixture
+def skill_root(tmp_path, monkeypatch):
+    """A skills root with one manifest whose module is importable but not imported."""
+    package = tmp_path / "skill_probe"
+    package.mkdir()
+    (package / "skill.toml").write_text(
+        textwrap.dedent(f"""\
+            name = "probe"
+            entry = "{MODULE}:ProbeSkill"
+            mode = "thread"
+        """)
+    )
+    (tmp_path / f"{MODULE}.py").write_text(
+        textwrap.dedent("""\
+            from skills.base import BaseSkill
+
+            class ProbeSkill(BaseSkill):
+                name = "probe"
+        """)
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    sys.modules.pop(MODULE, None)
+
+
+class TestDiscovery:
+    """Manifests are read; skill modules are not imported until loaded."""
+
+    def test_builtin_manifests(self):
+        specs = default_registry().specs()
+
+        assert set(specs) == {
+            "fetch_trends",
+            "download_video",
+            "transcribe_audio",
+            "generate_caption",
+            "post_content",
+            "safety_check",
+        }
+        assert DEFAULT_MODES["safety_check"] is ExecutionMode.PROCESS
+        assert DEFAULT_MODES["fetch_trends"] is ExecutionMode.ASYNC
+
+    def test_discovery_does_not_import(self, skill_root):
+        registry = SkillRegistry([skill_root])
+
+        assert registry.spec("skill_probe").mode == "thread"
+        assert MODULE not in sys.modules
+
+        cls = registry.load("probe")
+
+        assert cls.__name__ == "ProbeSkill" and MODULE in sys.modules
+        assert registry.load("probe") is cls
+
+    def test_unknown_and_broken_entries(self, tmp_path):
+        (tmp_path / "skill_ghost").mkdir()
+        (tmp_path / "skill_ghost" / "skill.toml").write_text(
+            'name = "ghost"\nentry = "no_such_module:Ghost"\n'
+        )
+        registry = SkillRegistry([tmp_path])
+
+        with pytest.raises(UnknownSkill):
+            registry.load("ghost")
+        with pytest.raises(UnknownSkill):
+            registry.spec("does_not_exist")
+
+    def test_manifest_needs_an_entry(self, tmp_path):
+        (tmp_path / "skill_bad").mkdir()
+        (tmp_path / "skill_bad" / "skill.toml").write_text('name = "bad"\n')
+
+        with pytest.raises(ValueError, match="entry"):
+            SkillRegistry([tmp_path]).specs()
+
+    def test_entry_points_fill_in_missing_names(self, skill_root, tmp_path_factory, monkeypatch):
+        class Point:
+            value = f"{MODULE}:ProbeSkill"
+
+        def entry_points(group, name):
+            return [Point()] if (group, name) == ("chimera.skills", "plugin") else []
+
+        monkeypatch.setattr(registry_module, "entry_points", entry_points)
+        registry = SkillRegistry([tmp_path_factory.mktemp("empty")])
+
+        assert registry.load("plugin").__name__ == "ProbeSkill"
+        assert registry.spec("plugin").mode is None
+        with pytest.raises(UnknownSkill):
+            registry.spec("other")
+
+
+class Counted(BaseSkill):
+    """Records the pid it was warmed in."""
+
+    name = "counted"
+    input_contract = Contract(dict)
+    output_contract = Contract(dict)
+    warmed: list[int] = []
+
+    def warm(self):
+        super().warm()
+        Counted.warmed.append(os.getpid())
+
+    async def run(self, input_data):
+        return {"status": "success", "pid": os.getpid(), "warmed": Counted.warmed}
+
+
+class TestWarmUp:
+    """Contracts compile lazily; warm-up moves the cost ahead of traffic."""
+
+    def test_contract_compiles_on_first_check(self):
+        contract = Contract(int)
+
+        assert not contract.compiled
+        assert contract.errors("one") != []
+        assert contract.compiled
+
+    def test_trusted_skill_skips_output_contract(self):
+        class Fresh(BaseSkill):
+            input_contract = Contract(dict)
+            output_contract = Contract(dict)
+
+        Fresh({"trusted": True}).warm()
+
+        assert Fresh.input_contract.compiled and not Fresh.output_contract.compiled
+
+    async def test_async_skill_is_warmed_and_kept(self):
+        Counted.warmed.clear()
+        dispatcher = SkillDispatcher(
+            skills={"counted": Counted}, modes={"counted": ExecutionMode.ASYNC}
+        )
+
+        await dispatcher.warm(["counted"])
+        result = await dispatcher.run("counted", {})
+
+        assert result["warmed"] == [os.getpid()]
+
+    async def test_unknown_hot_skill_fails_fast(self):
+        with pytest.raises(UnknownSkill):
+            await SkillDispatcher().warm(["does_not_exist"])
+
+    async def test_process_workers_start_warm(self):
+        dispatcher = SkillDispatcher(
+            skills={"counted": Counted}, modes={"counted": ExecutionMode.PROCESS}
+        )
+        dispatcher.executors.process_workers = 2
+        try:
+            await dispatcher.warm(["counted"])
+            result = await dispatcher.run("counted", {})
+        finally:
+            dispatcher.executors.shutdown()
+
+        assert result["pid"] != os.getpid()
+        assert result["warmed"] == [result["pid"]]
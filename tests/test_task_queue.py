@@ -0,0 +1,163 @@
+"""
+Test Task Queue - Priority lanes, leases and dead-lettering
+
+Runs the same scenarios against the in-process and Redis backends: strict
+lane order, batch dequeue, visibility-timeout re-queue, ack/nack/extend and
+the dead-letter list.
+
+Reference: research/SRS.md#6.1-data-models (Task Schema)
+"""
+
+import asyncio
+
+import pytest
+
+from chimera.tasks import MemoryTaskQueue, Priority, RedisTaskQueue, Task, TaskStatus
+
+
+@pytest.fixture(params=["memory", "redis"])
+def make_queue(request):
+    if request.param == "memory":
+        return MemoryTaskQueue
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeAsyncRedis()
+    return lambda **kwargs: RedisTaskQueue(client, **kwargs)
+
+
+class TestTaskSchema:
+    """Tasks round-trip through JSON with the SRS field names."""
+
+    def test_round_trip(self):
+        task = Task("generate_content", Priority.HIGH, context={"goal_description": "x"})
+
+        restored = Task.from_json(task.to_json())
+
+        assert restored == task
+        assert set(task.to_dict()) == {
+            "task_id",
+            "task_type",
+            "priority",
+            "context",
+            "assigned_worker_id",
+            "created_at",
+            "status",
+        }
+        assert task.to_dict()["priority"] == "high"
+
+    def test_rejects_unknown_priority(self):
+        with pytest.raises(ValueError):
+            Task("reply_comment", priority="urgent")
+
+
+class TestPriorityLanes:
+    """Higher lanes always drain first; FIFO within a lane."""
+
+    async def test_dequeue_in_priority_order(self, make_queue):
+        queue = make_queue()
+        low = Task("t", Priority.LOW)
+        medium = Task("t", Priority.MEDIUM)
+        high_a = Task("t", Priority.HIGH)
+        high_b = Task("t", Priority.HIGH)
+        await queue.enqueue_many([low, medium, high_a, high_b])
+
+        leased = await queue.dequeue("w1", max_tasks=3)
+
+        assert [t.task_id for t in leased] == [high_a.task_id, high_b.task_id, medium.task_id]
+        assert all(t.status == TaskStatus.IN_PROGRESS for t in leased)
+        assert all(t.assigned_worker_id == "w1" for t in leased)
+        assert await queue.counts() == {"high": 0, "medium": 0, "low": 1, "in_flight": 3, "dead": 0}
+
+    async def test_empty_dequeue_waits_then_returns(self, make_queue):
+        queue = make_queue()
+
+        async def late_enqueue():
+            await asyncio.sleep(0.05)
+            await queue.enqueue(Task("t"))
+
+        producer = asyncio.create_task(late_enqueue())
+        assert await queue.dequeue("w1") == []
+        leased = await queue.dequeue("w1", wait=1.0)
+        await producer
+
+        assert len(leased) == 1
+
+
+class TestLeases:
+    """Leases expire, can be extended, and end with ack or nack."""
+
+    async def test_ack_removes_task(self, make_queue):
+        queue = make_queue()
+        task_id = await queue.enqueue(Task("t"))
+        await queue.dequeue("w1")
+
+        assert await queue.ack(task_id) is True
+        assert await queue.ack(task_id) is False
+        assert (await queue.counts())["in_flight"] == 0
+
+    async def test_nack_returns_to_front_of_lane(self, make_queue):
+        queue = make_queue()
+        first, second = Task("t"), Task("t")
+        await queue.enqueue_many([first, second])
+        [leased] = await queue.dequeue("w1")
+
+        await queue.nack(leased.task_id)
+        [again] = await queue.dequeue("w2")
+
+        assert again.task_id == first.task_id
+        assert again.assigned_worker_id == "w2"
+
+    async def test_expired_lease_is_requeued(self, make_queue):
+        queue = make_queue(visibility_timeout=0.05)
+        task_id = await queue.enqueue(Task("t"))
+        await queue.dequeue("w1")
+
+        assert await queue.dequeue("w2") == []
+        await asyncio.sleep(0.08)
+        [again] = await queue.dequeue("w2")
+
+        assert again.task_id == task_id
+        assert await queue.ack(task_id) is True
+
+    async def test_extend_keeps_lease(self, make_queue):
+        queue = make_queue(visibility_timeout=0.05)
+        task_id = await queue.enqueue(Task("t"))
+        await queue.dequeue("w1")
+
+        assert await queue.extend(task_id, 1.0) is True
+        await asyncio.sleep(0.08)
+
+        assert await queue.requeue_expired() == 0
+        assert await queue.dequeue("w2") == []
+        assert await queue.extend("missing", 1.0) is False
+
+
+class TestDeadLetters:
+    """Tasks leased max_attempts times without an ack are parked."""
+
+    async def test_dead_letter_after_max_attempts(self, make_queue):
+        queue = make_queue(max_attempts=2)
+        task_id = await queue.enqueue(Task("t", context={"n": 1}))
+
+        for _ in range(2):
+            [leased] = await queue.dequeue("w1")
+            await queue.nack(leased.task_id)
+
+        assert await queue.dequeue("w1") == []
+        [dead] = await queue.dead_letters()
+        assert dead.task_id == task_id
+        assert dead.context == {"n": 1}
+        assert (await queue.counts())["dead"] == 1
+
+    async def test_shared_between_clients(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        server = fakeredis.FakeServer()
+        producer = RedisTaskQueue(fakeredis.FakeAsyncRedis(server=server))
+        consumer = RedisTaskQueue(fakeredis.FakeAsyncRedis(server=server))
+
+        await producer.enqueue_many(Task("t") for _ in range(5))
+        batch = await consumer.dequeue("w1", max_tasks=10)
+
+        assert len(batch) == 5
+        assert (await producer.counts())["in_flight"] == 5
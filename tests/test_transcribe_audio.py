@@ -0,0 +1,204 @@
+"""
+Test Transcribe Audio - Silence-aligned chunking and streaming partials
+
+Validates that long audio is cut only inside silences, that chunked and
+parallel transcription reproduces the single-pass transcript, and that
+partial transcripts stream out in order before later chunks finish.
+
+Reference: research/tooling_strategy.md#3-skill_transcribe_audio
+"""
+
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from skills.skill_transcribe_audio import TranscribeAudioSkill
+from skills.skill_transcribe_audio.audio import read_wav, write_wav
+from skills.skill_transcribe_audio.backends import BACKENDS, LocalBackend
+from skills.skill_transcribe_audio.config import SAMPLE_RATE
+from skills.skill_transcribe_audio.segment import silent_frames, split_on_silence
+from skills.skill_transcribe_audio.stub import synthesize, write_speech
+
+SENTENCES = [
+    "hello world",
+    "check out this new video",
+    "wait for the end",
+    "we really love this trend",
+    "how to make the best video ever",
+    "look at my first time",
+    "just try it now",
+] * 3
+
+SHORT_CHUNKS = {"chunk_target_s": 4.0, "chunk_min_s": 2.0, "chunk_max_s": 6.0}
+
+
+def request(path):
+    return {"filepath": str(path), "language": "en-US", "model": "base"}
+
+
+def split(samples, target_s=4.0, min_s=2.0, max_s=6.0):
+    return split_on_silence(
+        samples,
+        SAMPLE_RATE,
+        target_s=target_s,
+        min_s=min_s,
+        max_s=max_s,
+        frame_s=0.02,
+        threshold_db=-40.0,
+        min_silence_s=0.3,
+    )
+
+
+class TestSegmentation:
+    """Cuts land in silences and respect the chunk bounds."""
+
+    def test_cuts_fall_inside_silences(self):
+        samples = synthesize(SENTENCES)
+        chunks = split(samples)
+        silent = silent_frames(samples, SAMPLE_RATE, 0.02, -40.0)
+
+        assert len(chunks) > 3
+        assert chunks[0].start == 0 and chunks[-1].end == len(samples)
+        for before, after in zip(chunks, chunks[1:], strict=False):
+            assert before.end == after.start
+            assert silent[after.start // 320]
+        assert all((c.end - c.start) / SAMPLE_RATE <= 6.0 for c in chunks)
+
+    def test_audio_without_silence_is_cut_at_max(self):
+        t = np.arange(20 * SAMPLE_RATE) / SAMPLE_RATE
+        tone = (0.3 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+        chunks = split(tone)
+
+        assert [round((c.end - c.start) / SAMPLE_RATE, 2) for c in chunks] == [6, 6, 6, 2]
+
+    def test_silent_chunks_are_marked_unvoiced(self):
+        samples = np.concatenate([synthesize(["hello world"]), np.zeros(8 * SAMPLE_RATE)])
+
+        chunks = split(samples.astype(np.int16))
+
+        assert chunks[0].voiced and not chunks[-1].voiced
+        assert split(np.zeros(0, dtype=np.int16)) == []
+
+
+class TestTranscription:
+    """Chunked transcription matches a single pass."""
+
+    def test_chunked_transcript_matches_single_pass(self, tmp_path):
+        path = tmp_path / "speech.wav"
+        expected = write_speech(str(path), SENTENCES)
+
+        whole = TranscribeAudioSkill({"workers": 1}).execute(request(path))
+        chunked = TranscribeAudioSkill({"workers": 1, **SHORT_CHUNKS}).execute(request(path))
+
+        assert whole["transcript"] == chunked["transcript"] == expected
+        assert whole["chunks"] == 1 and chunked["chunks"] > 3
+        samples = read_wav(str(path), SAMPLE_RATE)
+        assert chunked["duration"] == pytest.approx(len(samples) / SAMPLE_RATE)
+
+    def test_process_pool_transcribes_in_parallel(self, tmp_path):
+        path = tmp_path / "speech.wav"
+        expected = write_speech(str(path), SENTENCES)
+        skill = TranscribeAudioSkill({"workers": 2, **SHORT_CHUNKS})
+        try:
+            result = skill.execute(request(path))
+        finally:
+            skill.close()
+
+        assert result["status"] == "success"
+        assert result["transcript"] == expected
+        assert all(segment["text"] for segment in result["segments"])
+
+    def test_stereo_wav_is_downmixed_and_resampled(self, tmp_path):
+        mono = synthesize(["hello world"], rate=44_100)
+        path = tmp_path / "stereo.wav"
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(2)
+            wav.setsampwidth(2)
+            wav.setframerate(44_100)
+            wav.writeframes(np.repeat(mono, 2).astype("<i2").tobytes())
+
+        samples = read_wav(str(path), SAMPLE_RATE)
+
+        assert len(samples) == pytest.approx(len(mono) * SAMPLE_RATE / 44_100, abs=1)
+        assert LocalBackend().transcribe(samples, SAMPLE_RATE, "en", "base") == "hello world"
+
+
+class GatedBackend(LocalBackend):
+    """Holds every chunk after the first until ``gate`` is set."""
+
+    gate = threading.Event()
+
+    def transcribe(self, samples, rate, language, model):
+        text = super().transcribe(samples, rate, language, model)
+        if not text.startswith("hello"):
+            assert self.gate.wait(10)
+        return text
+
+
+class TestStreaming:
+    """Partials stream out in order while later chunks are running."""
+
+    async def test_first_partial_arrives_before_later_chunks_finish(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(BACKENDS, "gated", GatedBackend)
+        GatedBackend.gate.clear()
+        path = tmp_path / "speech.wav"
+        write_speech(str(path), SENTENCES)
+        executor = ThreadPoolExecutor(4)
+        skill = TranscribeAudioSkill({"backend": "gated", "executor": executor, **SHORT_CHUNKS})
+
+        partials = []
+        async for partial in skill.stream(request(path)):
+            if not partials:
+                assert partial.text.startswith("hello world")
+                GatedBackend.gate.set()
+            partials.append(partial)
+        executor.shutdown()
+
+        assert [p.index for p in partials] == list(range(len(partials)))
+        assert all(a.end == b.start for a, b in zip(partials, partials[1:], strict=False))
+
+    async def test_closing_the_stream_cancels_pending_chunks(self, tmp_path):
+        path = tmp_path / "speech.wav"
+        write_speech(str(path), SENTENCES)
+        executor = ThreadPoolExecutor(1)
+        skill = TranscribeAudioSkill({"executor": executor, **SHORT_CHUNKS})
+
+        stream = skill.stream(request(path))
+        first = await anext(stream)
+        await stream.aclose()
+        executor.shutdown()
+
+        assert first.index == 0 and first.text
+
+
+class TestContract:
+    """Inputs are validated and errors keep the contract fields."""
+
+    def test_output_contract(self, tmp_path):
+        path = tmp_path / "speech.wav"
+        write_wav(str(path), synthesize(["hello world"]), SAMPLE_RATE)
+        skill = TranscribeAudioSkill({"workers": 1})
+
+        result = skill.execute(request(path))
+
+        assert skill.validate_output(result)
+        assert result["language"] == "en-US"
+
+    def test_missing_file_keeps_contract_fields(self, tmp_path):
+        result = TranscribeAudioSkill().execute(request(tmp_path / "missing.mp4"))
+
+        assert result["error_code"] == "EXECUTION_FAILED"
+        assert result["transcript"] == "" and result["duration"] == 0.0
+        assert result["language"] == "en-US"
+
+    def test_invalid_input(self):
+        result = TranscribeAudioSkill().execute(
+            {"filepath": "", "language": "English", "model": "huge"}
+        )
+
+        assert result["error_code"] == "INVALID_INPUT"
+        assert len(result["validation_errors"]) == 3
@@ -0,0 +1,141 @@
+"""
+Test Trend Clusters - Cross-platform trend deduplication
+
+Validates hashtag normalization, that hashtag and title-similarity links
+merge one trend across platforms through union-find with a stable cluster
+id, that unrelated trends and generic tags stay apart, and that
+FetchTrendsSkill returns one trend per cluster.
+
+Reference: research/SRS.md#4.2-perception-system-fr-2.0-2.2
+"""
+
+import pytest
+
+from chimera.trends import TrendClusters, normalize_hashtag
+from skills.skill_fetch_trends import FetchTrendsSkill
+
+T0 = 1_738_663_200.0
+
+
+def trend(key, title, volume=1000, score=0.5, tags=()):
+    platform, trend_id = key.split(":")
+    return {
+        "id": trend_id,
+        "title": title,
+        "platform": platform,
+        "engagement_score": score,
+        "volume": volume,
+        "metadata": {"hashtags": list(tags)},
+    }
+
+
+VIRAL = [
+    trend("tiktok:t1", "#ViralChallenge2024", 1_500_000, 0.95, ["#ViralChallenge2024"]),
+    trend("youtube:y1", "Viral Challenge 2024 compilation", 30_000, 0.7),
+    trend("twitter:w1", "everyone is doing the #viral_challenge_2024 lol", 5_000, 0.4),
+]
+
+
+class TestNormalization:
+    """Hashtags reduce to case-folded alphanumerics."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "#ViralChallenge2024",
+            "viralchallenge2024",
+            "#Viral_Challenge-2024",
+            "#ＶｉｒａｌChallenge2024",  # fullwidth
+        ],
+    )
+    def test_spellings_normalize_alike(self, raw):
+        assert normalize_hashtag(raw) == "viralchallenge2024"
+
+
+class TestClustering:
+    """Links merge across platforms; unrelated trends stay apart."""
+
+    def test_one_trend_across_three_platforms_is_one_cluster(self):
+        clusters = TrendClusters()
+
+        ids = clusters.add(VIRAL + [trend("tiktok:t2", "#CatDance", 100, tags=["#fyp"])], T0)
+
+        assert ids == ["tiktok:t1"] * 3 + ["tiktok:t2"]
+        cluster = clusters.cluster("twitter:w1")
+        assert cluster.members == ("tiktok:t1", "youtube:y1", "twitter:w1")
+        assert cluster.platform_volumes == {
+            "tiktok": 1_500_000,
+            "youtube": 30_000,
+            "twitter": 5_000,
+        }
+        assert cluster.title == "#ViralChallenge2024"
+
+    def test_generic_tags_do_not_link(self):
+        clusters = TrendClusters()
+
+        ids = clusters.add(
+            [
+                trend("tiktok:a", "Cat dance", tags=["#fyp", "#viral"]),
+                trend("tiktok:b", "Sourdough starter tips", tags=["#FYP", "#Viral"]),
+            ],
+            T0,
+        )
+
+        assert ids == ["tiktok:a", "tiktok:b"]
+
+    def test_cluster_id_is_stable_as_clusters_merge(self):
+        clusters = TrendClusters()
+        clusters.add([trend("tiktok:t1", "Cat dance", tags=["#catdance"])], T0)
+        clusters.add([trend("youtube:y1", "Dog agility course", tags=["#dogsport"])], T0 + 1)
+
+        # A later trend carrying both tags bridges the two clusters.
+        [bridge] = clusters.add(
+            [trend("twitter:w1", "Pets compilation", tags=["#dogsport", "#catdance"])], T0 + 2
+        )
+
+        assert bridge == clusters.cluster_id("youtube:y1") == "tiktok:t1"
+        assert len(clusters.clusters()) == 1
+
+    def test_refreshed_volumes_and_eviction(self):
+        clusters = TrendClusters()
+        clusters.add(VIRAL, T0)
+        clusters.add([{**VIRAL[1], "volume": 90_000}], T0 + 3600)
+
+        assert clusters.evict(older_than=T0 + 60) == 2
+
+        assert len(clusters) == 1
+        assert clusters.cluster_id("youtube:y1") == "youtube:y1"
+        assert clusters.clusters()[0].platform_volumes == {"youtube": 90_000}
+
+
+class StaticSource:
+    """In-process source returning fixed trends."""
+
+    def __init__(self, trends):
+        self.trends = trends
+
+    async def fetch(self, category, limit, time_range):
+        return self.trends[:limit]
+
+
+class TestFetchTrendsCollapse:
+    """FetchTrendsSkill returns one trend per cluster."""
+
+    def test_skill_collapses_cross_platform_duplicates_before_limit(self):
+        other = trend("youtube:y2", "World Cup final highlights", 800, 0.6)
+        sources = {
+            "tiktok": StaticSource([VIRAL[0]]),
+            "youtube": StaticSource([VIRAL[1], other]),
+            "twitter": StaticSource([VIRAL[2]]),
+        }
+        skill = FetchTrendsSkill({"sources": sources, "clusters": TrendClusters()})
+
+        result = skill.execute(
+            {"platforms": list(sources), "category": "x", "limit": 2, "time_range": "24h"}
+        )
+
+        assert result["status"] == "success"
+        assert [t["id"] for t in result["trends"]] == ["t1", "y2"]
+        metadata = result["trends"][0]["metadata"]
+        assert metadata["cluster_id"] == "tiktok:t1"
+        assert metadata["platform_volumes"]["youtube"] == 30_000
@@ -0,0 +1,142 @@
+"""
+Test Trend Fan-out - Concurrent multi-platform fetching
+
+Validates that FetchTrendsSkill queries platforms concurrently, enforces
+per-platform timeouts and merges results by engagement_score.
+
+Reference: specs/technical.md#2.1-trend-fetcher-service
+Reference: specs/functional.md#3.1-performance
+"""
+
+import asyncio
+import time
+
+from skills.skill_fetch_trends import FetchTrendsSkill
+from skills.skill_fetch_trends.stub import FakePlatformServer
+
+
+class SleepySource:
+    """In-process source that sleeps before returning fixed trends."""
+
+    def __init__(self, platform, delay, scores):
+        self.platform = platform
+        self.delay = delay
+        self.scores = scores
+        self.calls = 0
+
+    async def fetch(self, category, limit, time_range):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return [
+            {
+                "id": f"{self.platform}_{i}",
+                "title": f"#{self.platform}{i}",
+                "engagement_score": score,
+                "volume": 100,
+                "metadata": {},
+            }
+            for i, score in enumerate(self.scores[:limit])
+        ]
+
+
+def make_request(platforms, limit=10):
+    return {
+        "platforms": platforms,
+        "category": "entertainment",
+        "limit": limit,
+        "time_range": "24h",
+    }
+
+
+class TestConcurrentFanOut:
+    """Wall-clock time is bounded by the slowest platform."""
+
+    def test_platforms_fetched_concurrently(self):
+        sources = {
+            "tiktok": SleepySource("tiktok", 0.2, [0.5]),
+            "youtube": SleepySource("youtube", 0.2, [0.6]),
+            "twitter": SleepySource("twitter", 0.2, [0.7]),
+        }
+        skill = FetchTrendsSkill(config={"sources": sources})
+
+        start = time.perf_counter()
+        result = skill.execute(make_request(["tiktok", "youtube", "twitter"]))
+        elapsed = time.perf_counter() - start
+
+        assert result["status"] == "success"
+        assert len(result["data"]["trends"]) == 3
+        assert elapsed < 0.5
+
+    def test_results_merged_by_engagement_score(self):
+        sources = {
+            "tiktok": SleepySource("tiktok", 0, [0.9, 0.2]),
+            "youtube": SleepySource("youtube", 0, [0.5, 0.4]),
+        }
+        skill = FetchTrendsSkill(config={"sources": sources})
+
+        result = skill.execute(make_request(["tiktok", "youtube"], limit=3))
+
+        scores = [t["engagement_score"] for t in result["data"]["trends"]]
+        assert scores == [0.9, 0.5, 0.4]
+        assert result["trends"] == result["data"]["trends"]
+        assert skill.validate_output(result) is True
+
+    def test_slow_platform_times_out_without_failing_request(self):
+        sources = {
+            "tiktok": SleepySource("tiktok", 0, [0.8]),
+            "youtube": SleepySource("youtube", 5, [0.9]),
+        }
+        skill = FetchTrendsSkill(config={"sources": sources, "timeouts": {"youtube": 0.1}})
+
+        result = skill.execute(make_request(["tiktok", "youtube"]))
+
+        assert result["status"] == "success"
+        assert [t["platform"] for t in result["data"]["trends"]] == ["tiktok"]
+        assert "youtube" in result["data"]["errors"]
+
+    def test_unconfigured_platform_reported(self):
+        skill = FetchTrendsSkill(config={})
+
+        result = skill.execute(make_request(["twitter"]))
+
+        assert result["status"] == "success"
+        assert result["data"]["trends"] == []
+        assert "twitter" in result["data"]["errors"]
+
+    def test_every_platform_failing_is_an_error(self):
+        sources = {"youtube": SleepySource("youtube", 5, [0.9])}
+        skill = FetchTrendsSkill(config={"sources": sources, "timeouts": {"youtube": 0.05}})
+
+        result = skill.execute(make_request(["twitter", "youtube"]))
+
+        assert result["status"] == "error"
+        assert result["error_code"] == "PLATFORMS_UNAVAILABLE"
+        assert set(result["details"]["errors"]) == {"twitter", "youtube"}
+        assert skill.validate_output(result) is True
+
+    async def test_execute_async_twin(self):
+        sources = {"tiktok": SleepySource("tiktok", 0, [0.3])}
+        skill = FetchTrendsSkill(config={"sources": sources})
+
+        result = await skill.execute_async(make_request(["tiktok"]))
+
+        assert result["status"] == "success"
+        assert result["data"]["trends"][0]["id"] == "tiktok_0"
+
+
+class TestFakePlatformStub:
+    """The local HTTP stub serves contract-shaped trends."""
+
+    def test_fetch_through_http_stub(self):
+        latency = {"tiktok": 0.2, "youtube": 0.2, "twitter": 0.2}
+        with FakePlatformServer(latency=latency, fail={"twitter"}) as server:
+            skill = FetchTrendsSkill(config={"endpoints": server.endpoints()})
+            start = time.perf_counter()
+            result = skill.execute(make_request(["tiktok", "youtube", "twitter"], limit=5))
+            elapsed = time.perf_counter() - start
+
+        assert result["status"] == "success"
+        assert len(result["data"]["trends"]) == 5
+        assert set(result["data"]["errors"]) == {"twitter"}
+        assert elapsed < 0.55
+        assert skill.validate_output(result) is True
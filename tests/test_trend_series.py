@@ -0,0 +1,169 @@
+"""
+Test Trend Series - Rolling windows, velocity and decayed heat
+
+Validates that incrementally maintained velocity and acceleration match a
+least-squares fit over the window, that heat halves every half-life, that
+rising-trend queries rank live trends correctly, and that rows grow,
+evict and ignore stale snapshots.
+
+Reference: research/SRS.md#4.2-perception-system-fr-2.0-2.2
+"""
+
+import numpy as np
+import pytest
+
+from chimera.trends import TrendSeries
+from skills.skill_fetch_trends import FetchTrendsSkill
+
+HOUR = 3600.0
+T0 = 1_738_663_200.0  # 2025-02-04T10:00:00Z
+
+
+def trend(n, volume, score=0.5, platform="tiktok"):
+    return {"id": f"t{n}", "platform": platform, "volume": volume, "engagement_score": score}
+
+
+class TestSignals:
+    """Incremental signals agree with batch computations."""
+
+    def test_velocity_matches_least_squares_over_the_window(self):
+        rng = np.random.default_rng(1)
+        series = TrendSeries(window=8)
+        times = T0 + np.cumsum(rng.uniform(0.1, 2.0, 30)) * HOUR
+        volumes = np.cumsum(rng.uniform(0, 500, 30))
+
+        for at, volume in zip(times, volumes, strict=True):
+            series.record([trend(1, volume)], at)
+            window_t, window_v = series.history("tiktok:t1")
+            expected = np.polyfit(window_t / HOUR, window_v, 1)[0] if len(window_t) > 1 else 0.0
+            assert series.stats("tiktok:t1")["velocity"] == pytest.approx(expected, rel=1e-6)
+
+        assert len(series.history("tiktok:t1")[0]) == 8
+
+    def test_acceleration_separates_linear_from_accelerating_growth(self):
+        series = TrendSeries(window=6)
+        for hour in range(10):
+            series.record([trend(1, 100 * hour), trend(2, 10 * hour * hour)], T0 + hour * HOUR)
+
+        steady, speeding_up = series.stats("tiktok:t1"), series.stats("tiktok:t2")
+
+        assert steady["velocity"] == pytest.approx(100.0)
+        assert steady["acceleration"] == pytest.approx(0.0, abs=1e-6)
+        assert speeding_up["acceleration"] > 10
+
+    def test_heat_accumulates_growth_and_halves_per_half_life(self):
+        series = TrendSeries(half_life=HOUR)
+        series.record([trend(1, 0)], T0)
+        series.record([trend(1, 1000)], T0 + HOUR)
+        series.record([trend(1, 900)], T0 + 2 * HOUR)  # a drop adds no heat
+
+        assert series.stats("tiktok:t1", now=T0 + 2 * HOUR)["heat"] == pytest.approx(500.0)
+        assert series.stats("tiktok:t1", now=T0 + 3 * HOUR)["heat"] == pytest.approx(250.0)
+
+
+class TestRanking:
+    """top() and rising() rank every live trend."""
+
+    def test_rising_prefers_growing_heat_and_skips_decliners(self):
+        series = TrendSeries()
+        for hour in range(4):
+            series.record(
+                [
+                    trend(1, 1000 + 50 * hour),
+                    trend(2, 1000 + 400 * hour),
+                    trend(3, 5000 - 300 * hour),
+                    trend(4, 1000 + 400 * hour, platform="youtube"),
+                ],
+                T0 + hour * HOUR,
+            )
+
+        rising = [row["key"] for row in series.rising(k=3)]
+        by_volume = [row["key"] for row in series.top(k=1, by="volume")]
+
+        assert set(rising[:2]) == {"tiktok:t2", "youtube:t4"} and rising[2] == "tiktok:t1"
+        assert by_volume == ["tiktok:t3"]
+        with pytest.raises(ValueError):
+            series.top(by="vibes")
+
+    def test_top_matches_a_full_sort(self):
+        rng = np.random.default_rng(7)
+        series = TrendSeries(capacity=16)
+        keys = [f"k{i}" for i in range(500)]
+        for step in range(5):
+            series.record_arrays(keys, rng.uniform(0, 1e6, 500), rng.uniform(0, 1, 500), T0 + step)
+
+        velocities = {key: series.stats(key)["velocity"] for key in keys}
+        expected = sorted(keys, key=velocities.__getitem__, reverse=True)[:20]
+
+        assert [row["key"] for row in series.top(k=20, by="velocity")] == expected
+        assert len(series) == 500
+
+
+class TestLifecycle:
+    """Rows are recycled and stale snapshots ignored."""
+
+    def test_stale_snapshots_are_ignored(self):
+        series = TrendSeries()
+        series.record([trend(1, 10)], T0 + HOUR)
+
+        applied = series.record([trend(1, 99)], T0)
+
+        assert applied == 0 and series.stats("tiktok:t1")["volume"] == 10
+
+    def test_evict_frees_rows_for_new_trends(self):
+        series = TrendSeries(capacity=2)
+        series.record([trend(1, 10), trend(2, 10)], T0)
+        series.record([trend(2, 20)], T0 + HOUR)
+
+        assert series.evict(older_than=T0 + 30 * 60) == 1
+        series.record([trend(3, 5)], T0 + 2 * HOUR)
+
+        assert "tiktok:t1" not in series and len(series) == 2
+        assert series.stats("tiktok:t3") == {
+            "key": "tiktok:t3",
+            "heat": 0.0,
+            "velocity": 0.0,
+            "acceleration": 0.0,
+            "volume": 5.0,
+            "engagement_score": 0.5,
+            "snapshots": 1,
+        }
+
+
+class GrowingSource:
+    """In-process source whose trend volumes grow on every fetch."""
+
+    def __init__(self, platform, growth):
+        self.platform = platform
+        self.growth = growth
+        self.calls = 0
+
+    async def fetch(self, category, limit, time_range):
+        self.calls += 1
+        return [
+            {
+                "id": f"{self.platform}_{i}",
+                "title": f"#{self.platform}{i}",
+                "engagement_score": 0.5,
+                "volume": 1000 + rate * self.calls,
+                "metadata": {},
+            }
+            for i, rate in enumerate(self.growth[:limit])
+        ]
+
+
+class TestFetchTrendsRecording:
+    """FetchTrendsSkill records every upstream fetch into the series."""
+
+    def test_skill_records_snapshots(self):
+        series = TrendSeries()
+        sources = {"tiktok": GrowingSource("tiktok", [10, 500, 0])}
+        skill = FetchTrendsSkill({"sources": sources, "series": series})
+        request = {"platforms": ["tiktok"], "category": "x", "limit": 3, "time_range": "24h"}
+
+        for _ in range(3):
+            assert skill.execute(request)["status"] == "success"
+
+        assert len(series) == 3
+        assert series.stats("tiktok:tiktok_1")["snapshots"] == 3
+        assert series.rising(k=1)[0]["key"] == "tiktok:tiktok_1"
@@ -0,0 +1,189 @@
+"""
+Test Verdict Cache - Memoised safety verdicts keyed on content fingerprints
+
+Validates canonical-text folding and MinHash near-duplicate lookup, that
+SafetyCheckSkill reuses verdicts for repeated and folded-equal content,
+that near-duplicates only inherit unsafe verdicts by default, and that the
+cache honours its bounds, TTL and policy-version invalidation.
+
+Reference: research/tooling_strategy.md#6-skill_safety_check
+"""
+
+import random
+import time
+
+from chimera.cache.fingerprint import MinHashLSH, canonical_text, minhash, similarity
+from skills.skill_safety_check import SafetyCheckSkill, VerdictCache
+
+SPAM = "FREE MONEY click here to win big prizes today"
+
+
+def item(content, checks=("toxicity", "spam", "policy"), **context):
+    return {"content": content, "context": context, "check_types": list(checks)}
+
+
+def cached_skill(**options):
+    return SafetyCheckSkill({"verdict_cache": VerdictCache(**options)})
+
+
+class TestFingerprints:
+    """Canonical text and MinHash behave as cache keys."""
+
+    def test_canonical_text_folds_case_emoji_width_and_spacing(self):
+        assert canonical_text("  Ｈｅｌｌｏ\tWORLD 😂😂👍🏽  ok ") == "hello world ok"
+        assert canonical_text("I ❤️ pasta") == canonical_text("i pasta")
+
+    def test_minhash_estimates_similarity(self):
+        base, edit, other = minhash(
+            [
+                canonical_text(SPAM),
+                canonical_text("free money!! click here to win big prize today"),
+                canonical_text("lemon garlic pasta for a quick dinner tonight"),
+            ]
+        )
+
+        assert similarity(base, edit) >= 0.7 > similarity(base, other)
+
+    def test_lsh_finds_similar_signatures_only(self):
+        rng = random.Random(9)
+        words = ["pasta", "money", "click", "travel", "river", "chess", "bread", "lemon", "run"]
+        texts = [" ".join(rng.choices(words, k=10)) for _ in range(200)]
+        index = MinHashLSH(threshold=0.7)
+        for key, signature in enumerate(minhash(texts)):
+            index.add(key, signature)
+        probe = minhash([texts[17] + " pasta"])[0]
+
+        assert index.near(probe)[0][1] == 17
+        index.discard(17)
+        assert all(key != 17 for _, key in index.near(probe))
+        assert len(index) == 199
+
+
+class TestSkillMemoisation:
+    """SafetyCheckSkill scores each canonical content once."""
+
+    def test_repeats_and_folded_variants_hit_the_cache(self):
+        skill = cached_skill()
+
+        first = skill.execute_batch([item("Great pasta 😂"), item("great   PASTA")])
+        again = skill.execute(item("Great pasta"))
+
+        stats = skill.verdicts.stats
+        assert stats.misses == 1 and stats.hits == 1
+        assert again["is_safe"] and first[0]["scores"] == first[1]["scores"]
+
+    def test_shouting_is_not_folded_away(self):
+        skill = cached_skill()
+        quiet = "this is a perfectly normal caption"
+
+        calm, loud = skill.execute_batch([item(quiet), item(quiet.upper())])
+
+        assert skill.verdicts.stats.misses == 2
+        assert loud["scores"]["toxicity"] > calm["scores"]["toxicity"] == 0.0
+
+    def test_compatibility_forms_cannot_poison_the_cache(self):
+        skill = cached_skill()
+        plain = "you are a total idiot and a loser"
+
+        fullwidth = skill.execute(item("you are a total ｉｄｉｏｔ and a ｌｏｓｅｒ"))
+        cached = skill.execute(item(plain))
+
+        assert not fullwidth["is_safe"] and not cached["is_safe"]
+        assert cached["scores"] == SafetyCheckSkill().execute(item(plain))["scores"]
+
+    def test_padding_cannot_poison_the_cache(self):
+        skill = cached_skill()
+        plain = "s" + "o" * 80 + " good" + " ok!" * 7
+        padded = "s" + "o" * 80 + " " * 600 + " good" + " ok!" * 7
+
+        first = skill.execute(item(padded))
+        cached = skill.execute(item(plain))
+
+        assert skill.content_key(plain) == skill.content_key(padded)
+        assert not first["is_safe"] and not cached["is_safe"]
+        assert "spam:repetition" in cached["flags"]
+        assert cached["scores"] == SafetyCheckSkill().execute(item(plain))["scores"]
+
+    def test_scope_separates_check_types_and_context(self):
+        skill = cached_skill()
+
+        spam_only, toxic_only, sponsored = skill.execute_batch(
+            [item("dm me", ["spam"]), item("dm me", ["toxicity"]), item("dm me", sponsored=True)]
+        )
+
+        assert skill.verdicts.stats.misses == 3
+        assert not spam_only["is_safe"] and toxic_only["is_safe"]
+        assert "policy:missing_disclosure" in sponsored["flags"]
+
+    def test_near_duplicates_inherit_unsafe_verdicts_only(self):
+        skill = cached_skill()
+        clean = "lemon garlic pasta for a quick dinner tonight"
+        skill.execute_batch([item(SPAM), item(clean)])
+
+        spam_variant = skill.execute(item("free money!! click here to win big prize today"))
+        clean_variant = skill.execute(item("lemon garlic pasta for a quick dinner tonite"))
+
+        assert skill.verdicts.stats.near_hits == 1
+        assert spam_variant["is_safe"] is False
+        assert clean_variant["is_safe"] is True and skill.verdicts.stats.misses == 3
+
+    def test_cached_results_match_uncached_scoring(self):
+        rng = random.Random(4)
+        pieces = ["pasta night", "CLICK HERE", "idiot", "www.x.com", "😂", "#ad", "wow"]
+        items = [
+            item(" ".join(rng.choices(pieces, k=rng.randint(1, 5))), sponsored=rng.random() < 0.3)
+            for _ in range(80)
+        ]
+        plain = SafetyCheckSkill()
+        cached = cached_skill(near_threshold=None)
+
+        expected = [r["is_safe"] for r in plain.execute_batch(items)]
+
+        assert [r["is_safe"] for r in cached.execute_batch(items)] == expected
+        assert [r["is_safe"] for r in cached.execute_batch(items)] == expected
+        assert cached.verdicts.stats.hits >= len(items)
+
+
+class TestBoundsAndInvalidation:
+    """The cache stays bounded, expires and follows the policy version."""
+
+    def test_entry_bound_evicts_and_unindexes(self):
+        cache = VerdictCache(max_entries=5)
+        skill = SafetyCheckSkill({"verdict_cache": cache})
+
+        # Spam verdicts are indexed for near lookup, so eviction must unindex them.
+        skill.execute_batch([item(f"click here for offer {i} " * (i + 1)) for i in range(12)])
+
+        assert len(cache) == 5
+        assert cache.stats.evictions == 7
+        assert sum(len(index) for index in cache._near.values()) == 5
+
+    def test_ttl_expires_verdicts(self):
+        skill = cached_skill(ttl=0.05)
+        skill.execute(item("hello there"))
+        time.sleep(0.1)
+
+        skill.execute(item("hello there"))
+
+        assert skill.verdicts.stats.misses == 2
+
+    def test_policy_change_drops_the_cache(self):
+        cache = VerdictCache()
+        old = SafetyCheckSkill({"verdict_cache": cache})
+        new = SafetyCheckSkill({"verdict_cache": cache, "terms": {"policy": ["rival brand"]}})
+        old.execute(item("better than rival brand"))
+
+        result = new.execute(item("better than rival brand"))
+
+        assert old.policy_version != new.policy_version
+        assert cache.stats.invalidations == 1 and cache.stats.hits == 0
+        assert result["flags"] == ["policy:rival brand"]
+
+    def test_dict_config_builds_a_private_cache(self):
+        skill = SafetyCheckSkill({"verdict_cache": {"max_entries": 10, "ttl": 60}})
+
+        skill.execute(item("hi"))
+        skill.execute(item("HI"))
+
+        assert skill.verdicts.memory.max_entries == 10
+        assert skill.verdicts.report()["hits"] == 1
@@ -0,0 +1,166 @@
+"""
+Test Video Download - Streaming, segmented and resumable downloads
+
+Validates chunked streaming to disk with flat memory, parallel range
+segments, retry/resume after dropped connections and crashes, content-hash
+dedup, and MP4 metadata probing.
+
+Reference: research/tooling_strategy.md#2-skill_download_video
+"""
+
+import os
+import struct
+import tracemalloc
+
+import pytest
+
+from skills.skill_download_video import DedupIndex, DownloadVideoSkill
+from skills.skill_download_video.dedup import file_sha256
+from skills.skill_download_video.mp4 import probe_mp4
+from skills.skill_download_video.stub import FakeMediaServer, media_sha256
+
+MB = 1024 * 1024
+
+
+def box(kind, payload):
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def tiny_mp4(seconds=12.5, width=1080, height=1920):
+    """ftyp + moov(mvhd, trak(tkhd)) + mdat, enough for probe_mp4."""
+    mvhd = bytes(4) + struct.pack(">IIII", 0, 0, 1000, int(seconds * 1000)) + bytes(80)
+    tkhd = bytes(4) + bytes(20) + bytes(52) + struct.pack(">II", width << 16, height << 16)
+    moov = box(b"moov", box(b"mvhd", mvhd) + box(b"trak", box(b"tkhd", tkhd)))
+    return box(b"ftyp", b"isom" + bytes(4)) + moov + box(b"mdat", bytes(4096))
+
+
+def download(skill, server, name, path):
+    return skill.execute(
+        {"url": server.media_url(name), "platform": "tiktok", "output_path": str(path)}
+    )
+
+
+class TestStreaming:
+    """Media streams to disk without buffering whole files."""
+
+    def test_single_stream_download(self, tmp_path):
+        with FakeMediaServer(sizes={"clip.mp4": 3 * MB}) as server:
+            result = download(DownloadVideoSkill(), server, "clip.mp4", tmp_path / "clip.mp4")
+
+        assert result["status"] == "success"
+        assert result["metadata"]["size"] == 3 * MB
+        assert result["metadata"]["segments"] == 1
+        assert file_sha256(result["filepath"]) == media_sha256("clip.mp4", 3 * MB)
+        assert not os.path.exists(tmp_path / "clip.mp4.part")
+
+    def test_large_file_downloads_in_parallel_segments(self, tmp_path):
+        skill = DownloadVideoSkill({"segment_threshold": 4 * MB, "segments": 4})
+        with FakeMediaServer(sizes={"big.mp4": 10 * MB + 7}) as server:
+            result = download(skill, server, "big.mp4", tmp_path / "big.mp4")
+            ranges = server.gets("big.mp4")
+
+        assert result["metadata"]["segments"] == 4
+        assert len(ranges) == 4 and all(r.startswith("bytes=") for r in ranges)
+        assert file_sha256(result["filepath"]) == media_sha256("big.mp4", 10 * MB + 7)
+
+    def test_no_range_support_falls_back_to_one_stream(self, tmp_path):
+        skill = DownloadVideoSkill({"segment_threshold": MB})
+        with FakeMediaServer(sizes={"clip.mp4": 2 * MB}, ranges=False) as server:
+            result = download(skill, server, "clip.mp4", tmp_path / "clip.mp4")
+
+        assert result["metadata"]["segments"] == 1
+        assert file_sha256(result["filepath"]) == media_sha256("clip.mp4", 2 * MB)
+
+    def test_memory_stays_flat_for_large_files(self, tmp_path):
+        skill = DownloadVideoSkill({"segment_threshold": 16 * MB})
+        with FakeMediaServer(sizes={"huge.mp4": 64 * MB}) as server:
+            tracemalloc.start()
+            result = download(skill, server, "huge.mp4", tmp_path / "huge.mp4")
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        assert result["metadata"]["size"] == 64 * MB
+        assert peak < 8 * MB
+
+
+class TestResume:
+    """Dropped connections and crashes resume from the last byte written."""
+
+    def test_dropped_connection_retries_with_range(self, tmp_path):
+        skill = DownloadVideoSkill({"retry_backoff": 0.01})
+        with FakeMediaServer(sizes={"clip.mp4": 3 * MB}, drop_after={"clip.mp4": MB}) as server:
+            result = download(skill, server, "clip.mp4", tmp_path / "clip.mp4")
+            ranges = server.gets("clip.mp4")
+
+        assert result["metadata"]["retries"] == 1
+        assert ranges[0] is None
+        assert ranges[1].startswith("bytes=") and int(ranges[1][6:].split("-")[0]) >= MB // 2
+        assert file_sha256(result["filepath"]) == media_sha256("clip.mp4", 3 * MB)
+
+    def test_failed_call_resumes_on_next_call(self, tmp_path):
+        target = tmp_path / "clip.mp4"
+        with FakeMediaServer(sizes={"clip.mp4": 4 * MB}, drop_after={"clip.mp4": MB}) as server:
+            failed = download(DownloadVideoSkill({"max_retries": 0}), server, "clip.mp4", target)
+            assert os.path.exists(f"{target}.part.json")
+            result = download(DownloadVideoSkill(), server, "clip.mp4", target)
+
+        assert failed["status"] == "error"
+        assert "filepath" in failed and "metadata" in failed
+        assert result["metadata"]["resumed"] is True
+        assert result["metadata"]["bytes_downloaded"] < 4 * MB
+        assert file_sha256(str(target)) == media_sha256("clip.mp4", 4 * MB)
+        assert not os.path.exists(f"{target}.part.json")
+
+
+class TestDedup:
+    """Known sources and known content are not stored twice."""
+
+    def test_known_source_skips_transfer(self, tmp_path):
+        skill = DownloadVideoSkill({"dedup": DedupIndex(str(tmp_path / "index.json"))})
+        with FakeMediaServer(sizes={"clip.mp4": MB}) as server:
+            first = download(skill, server, "clip.mp4", tmp_path / "a.mp4")
+            second = download(skill, server, "clip.mp4", tmp_path / "b.mp4")
+            gets = server.gets("clip.mp4")
+
+        assert first["metadata"]["deduplicated"] is None
+        assert second["metadata"]["deduplicated"] == "source"
+        assert len(gets) == 1
+        assert os.path.samefile(first["filepath"], second["filepath"])
+        assert DedupIndex(str(tmp_path / "index.json")).by_hash(first["metadata"]["sha256"])
+
+    def test_same_content_under_new_url_is_linked(self, tmp_path):
+        body = os.urandom(256 * 1024)
+        skill = DownloadVideoSkill({"dedup": DedupIndex()})
+        with FakeMediaServer(files={"a.mp4": body, "b.mp4": body}) as server:
+            first = download(skill, server, "a.mp4", tmp_path / "a.mp4")
+            second = download(skill, server, "b.mp4", tmp_path / "b.mp4")
+
+        assert second["metadata"]["deduplicated"] == "content"
+        assert os.path.samefile(first["filepath"], second["filepath"])
+
+
+class TestContract:
+    """Inputs are validated and metadata follows the contract."""
+
+    def test_metadata_from_mp4_headers(self, tmp_path):
+        with FakeMediaServer(files={"clip.mp4": tiny_mp4()}) as server:
+            result = download(DownloadVideoSkill(), server, "clip.mp4", tmp_path / "clip.mp4")
+
+        skill = DownloadVideoSkill()
+        assert result["metadata"]["duration"] == pytest.approx(12.5)
+        assert result["metadata"]["resolution"] == "1080x1920"
+        assert skill.validate_output(result)
+
+    def test_probe_rejects_non_mp4(self, tmp_path):
+        path = tmp_path / "noise.bin"
+        path.write_bytes(os.urandom(1000))
+
+        assert probe_mp4(str(path)) is None
+
+    def test_invalid_input(self):
+        result = DownloadVideoSkill().execute(
+            {"url": "ftp://x", "platform": "myspace", "output_path": ""}
+        )
+
+        assert result["error_code"] == "INVALID_INPUT"
+        assert len(result["validation_errors"]) == 3
@@ -0,0 +1,219 @@
+"""
+Test Worker Pool - Concurrent skill execution from the TaskQueue
+
+Validates the concurrency cap and backpressure, asyncio/thread/process
+dispatch, ack/nack outcomes, lease heartbeats and graceful drain.
+
+Reference: research/SRS.md#3.1.2-the-worker-executor
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from chimera.__main__ import build_pool
+from chimera.runtime import ExecutionMode, UnknownSkill, WorkerPool, load_skill
+from chimera.tasks import MemoryTaskQueue, Task
+from skills.base import BaseSkill
+from skills.skill_fetch_trends import FetchTrendsSkill
+
+
+class SleepSkill(BaseSkill):
+    name = "sleep"
+
+    def input_errors(self, input_data):
+        return [] if isinstance(input_data.get("delay"), int | float) else ["delay is required"]
+
+    def output_errors(self, output_data):
+        return []
+
+    async def run(self, input_data):
+        await asyncio.sleep(input_data["delay"])
+        return {"status": "success", "pid": os.getpid(), "thread": threading.get_ident()}
+
+
+class FlakySkill(SleepSkill):
+    name = "flaky"
+    calls = 0
+
+    async def run(self, input_data):
+        FlakySkill.calls += 1
+        if FlakySkill.calls == 1:
+            raise RuntimeError("upstream hiccup")
+        return await super().run(input_data)
+
+
+def sleep_tasks(n, delay, task_type="sleep"):
+    return [Task(task_type, context={"input": {"delay": delay}}) for _ in range(n)]
+
+
+def make_pool(queue, **kwargs):
+    kwargs.setdefault("poll_interval", 0.02)
+    skills = {"sleep": SleepSkill, "flaky": FlakySkill}
+    modes = {"sleep": ExecutionMode.ASYNC, "flaky": ExecutionMode.ASYNC, **kwargs.pop("modes", {})}
+    return WorkerPool(queue, skills=skills, modes=modes, **kwargs)
+
+
+class TestConcurrency:
+    """In-flight work is capped and leasing follows free slots."""
+
+    async def test_runs_fifty_tasks_concurrently(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(100, 0.1))
+        pool = make_pool(queue, concurrency=50, batch_size=50)
+
+        start = time.perf_counter()
+        await pool.run(stop_when_idle=True)
+        elapsed = time.perf_counter() - start
+
+        assert pool.stats["completed"] == 100
+        assert pool.peak_in_flight == 50
+        assert elapsed < 1.0
+
+    async def test_backpressure_leaves_work_in_queue(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(20, 0.02))
+        leased = []
+
+        async def observe(task, result):
+            leased.append((await queue.counts())["in_flight"])
+
+        pool = make_pool(queue, concurrency=4, batch_size=10, on_result=observe)
+        await pool.run(stop_when_idle=True)
+
+        assert pool.peak_in_flight == 4
+        assert max(leased) <= 4
+        assert pool.stats["completed"] == 20
+
+    async def test_on_lease_sees_each_batch_before_it_runs(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(10, 0.01))
+        batches = []
+        pool = make_pool(
+            queue, concurrency=4, batch_size=4, on_lease=lambda tasks: batches.append(len(tasks))
+        )
+
+        await pool.run(stop_when_idle=True)
+
+        assert sum(batches) == 10 and max(batches) <= 4
+
+
+class TestExecutionModes:
+    """Each task_type runs in its configured executor."""
+
+    async def test_thread_mode_runs_off_the_event_loop(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(4, 0.01))
+        results = []
+
+        async def collect(task, result):
+            results.append(result)
+
+        pool = make_pool(queue, modes={"sleep": ExecutionMode.THREAD}, on_result=collect)
+        await pool.run(stop_when_idle=True)
+
+        assert pool.stats["thread_tasks"] == 4
+        assert all(r["thread"] != threading.get_ident() for r in results)
+
+    async def test_process_mode_runs_in_child_process(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(2, 0))
+        results = []
+
+        async def collect(task, result):
+            results.append(result)
+
+        pool = make_pool(
+            queue, modes={"sleep": ExecutionMode.PROCESS}, process_workers=1, on_result=collect
+        )
+        await pool.run(stop_when_idle=True)
+
+        assert pool.stats["completed"] == 2
+        assert {r["pid"] for r in results} != {os.getpid()}
+
+    def test_load_skill_by_name_and_path(self):
+        assert load_skill("fetch_trends") is FetchTrendsSkill
+        assert load_skill("skill_fetch_trends") is FetchTrendsSkill
+        assert load_skill("skills.skill_fetch_trends:FetchTrendsSkill") is FetchTrendsSkill
+        with pytest.raises(UnknownSkill):
+            load_skill("does_not_exist")
+
+    def test_build_pool_from_config(self):
+        pool = build_pool(
+            {"concurrency": 8, "modes": {"fetch_trends": "thread"}, "warm": ["fetch_trends"]},
+            MemoryTaskQueue(),
+        )
+
+        assert pool.concurrency == 8
+        assert pool.warm == ("fetch_trends",)
+        assert pool.mode_for("fetch_trends") is ExecutionMode.THREAD
+        assert pool.mode_for("safety_check") is ExecutionMode.PROCESS
+        assert pool.mode_for("transcribe_audio") is ExecutionMode.ASYNC
+
+
+class TestOutcomes:
+    """Results decide between ack, retry and dead-letter."""
+
+    async def test_invalid_input_and_unknown_skill_are_not_retried(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many([Task("sleep", context={"input": {}}), Task("nope")])
+        pool = make_pool(queue)
+
+        await pool.run(stop_when_idle=True)
+
+        assert pool.stats["failed"] == 2
+        assert await queue.counts() == {"high": 0, "medium": 0, "low": 0, "in_flight": 0, "dead": 0}
+
+    async def test_execution_failure_is_retried(self):
+        FlakySkill.calls = 0
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(1, 0, task_type="flaky"))
+        pool = make_pool(queue)
+
+        await pool.run(stop_when_idle=True)
+
+        assert pool.stats["retried"] == 1
+        assert pool.stats["completed"] == 1
+
+    async def test_heartbeat_keeps_long_task_leased(self):
+        queue = MemoryTaskQueue(visibility_timeout=0.06)
+        await queue.enqueue_many(sleep_tasks(1, 0.2))
+        pool = make_pool(queue, concurrency=2)
+
+        await pool.run(stop_when_idle=True)
+
+        assert pool.stats["async_tasks"] == 1
+        assert pool.stats["completed"] == 1
+
+
+class TestGracefulDrain:
+    """stop() finishes in-flight work, or hands it back on timeout."""
+
+    async def test_stop_waits_for_in_flight_tasks(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(3, 0.1))
+        pool = make_pool(queue)
+
+        runner = asyncio.create_task(pool.run())
+        await asyncio.sleep(0.03)
+        pool.stop()
+        await runner
+
+        assert pool.stats["completed"] == 3
+        assert pool.in_flight == 0
+
+    async def test_drain_timeout_returns_tasks_to_queue(self):
+        queue = MemoryTaskQueue()
+        await queue.enqueue_many(sleep_tasks(2, 5))
+        pool = make_pool(queue, drain_timeout=0.05)
+
+        runner = asyncio.create_task(pool.run())
+        await asyncio.sleep(0.03)
+        pool.stop()
+        await runner
+
+        assert pool.stats["abandoned"] == 2
+        assert (await queue.counts())["medium"] == 2